@@ -16,6 +16,8 @@ from mission_tools import (
     KIND_DYNAMIC_TEMPLATE,
     KIND_SPAWNABLE,
     DcsMission,
+    InMemoryMission,
+    as_read_back,
     classify_aircraft_group,
     read_miz,
     write_miz,
@@ -23,6 +25,7 @@ from mission_tools import (
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
+from veaf_libs import resident_cache
 from veaf_libs.base_worker import BaseWorker
 from veaf_libs.dcs_countries import country_id_for_name
 from veaf_libs.dcs_units_parser import parse_dcs_units
@@ -158,8 +161,7 @@ class AircraftGroupsYAMLValidator:
             True if loading succeeded, False otherwise
         """
         try:
-            with open(self.yaml_file, encoding="utf-8") as f:
-                self.data = yaml.safe_load(f)
+            self.data = resident_cache.load_yaml(self.yaml_file)
 
             if self.data is None:
                 self.errors.append(
@@ -494,7 +496,13 @@ class AircraftGroupsInjectorWorker(BaseWorker):
     Automatically validates YAML before injection.
     """
 
-    def __init__(self, input_yaml: Path, target_mission: Path, output_mission: Path):
+    def __init__(
+        self,
+        input_yaml: Path,
+        target_mission: Path,
+        output_mission: Path,
+        in_memory: InMemoryMission | None = None,
+    ):
         """
         Initialize the injector.
 
@@ -502,10 +510,13 @@ class AircraftGroupsInjectorWorker(BaseWorker):
             input_yaml: Path to the YAML file containing aircraft groups
             target_mission: Path to the target .miz mission file
             output_mission: Path where to save the modified mission
+            in_memory: A mission to edit in place instead of reading and writing the .miz files;
+                its owner writes it
         """
         self.input_yaml = input_yaml
         self.target_mission = target_mission
         self.output_mission = output_mission
+        self.in_memory = in_memory
         self.yaml_data: dict | None = None
         self.dcs_mission: DcsMission | None = None
         self.injection_log: list[str] = []
@@ -550,8 +561,7 @@ class AircraftGroupsInjectorWorker(BaseWorker):
             if not silent:
                 logger.info(t("aircraft_injector.loading_yaml", path=self.input_yaml))
 
-            with open(self.input_yaml, encoding="utf-8") as f:
-                self.yaml_data = yaml.safe_load(f)
+            self.yaml_data = resident_cache.load_yaml(self.input_yaml)
 
             if self.yaml_data is None:
                 logger.error(t("aircraft_injector.yaml_empty"), exception_type=ValueError)
@@ -582,7 +592,10 @@ class AircraftGroupsInjectorWorker(BaseWorker):
             if not silent:
                 logger.info(t("aircraft_injector.reading_mission", path=self.target_mission))
 
-            self.dcs_mission = read_miz(self.target_mission)
+            if self.in_memory is not None:
+                self.dcs_mission = self.in_memory.mission
+            else:
+                self.dcs_mission = read_miz(self.target_mission)
 
             if not self.dcs_mission.mission_content:
                 logger.error(t("aircraft_injector.mission_read_error"), exception_type=ValueError)
@@ -723,9 +736,10 @@ class AircraftGroupsInjectorWorker(BaseWorker):
             group: The group dict to inject.
 
         Returns:
-            A hardened deep copy (the source dict is not mutated).
+            A hardened deep copy (the source dict is not mutated). In memory it is shaped as it
+            will be once written, since the steps after this one see it without a write + read.
         """
-        prepared = copy.deepcopy(group)
+        prepared = as_read_back(group) if self.in_memory is not None else copy.deepcopy(group)
         prepared["hiddenOnPlanner"] = True
         prepared["hiddenOnMFD"] = True
         prepared["password"] = _TEMPLATE_SLOT_PASSWORD
@@ -828,6 +842,10 @@ class AircraftGroupsInjectorWorker(BaseWorker):
                 self.injection_log.append(error_msg)
                 logger.warning(error_msg)
 
+        # The groups were appended/replaced in place: an index built by an earlier step
+        # (the presets) would not see them, and the warehouses would miss the templates.
+        self.dcs_mission.invalidate_group_index()
+
         # Prepare result
         if total_injected > 0:
             message = f"Successfully injected {total_injected} group(s)"
@@ -868,6 +886,8 @@ class AircraftGroupsInjectorWorker(BaseWorker):
         if not self.dcs_mission:
             logger.error(t("aircraft_injector.no_mission_to_write"), exception_type=ValueError)
             return False
+        if self.in_memory is not None:
+            return True
 
         try:
             if not silent:
@@ -1139,6 +1159,8 @@ class AircraftGroupsExtractorWorker(BaseWorker):
 
                         country_entry[aircraft_type]["group"].append(group_copy)
 
+        self.dcs_mission.invalidate_group_index()
+
     def read_mission(self, silent: bool = False) -> None:
         """Load the mission from either a .miz file or a Lua file."""
         if self.input_lua:
@@ -1,4 +1,4 @@
-from luadata.serializer.serialize import serialize
+from luadata.serializer.serialize import serialize, iter_serialize, dump
 from luadata.serializer.unserialize import unserialize
 from luadata.io.read import read
 from luadata.io.write import write
@@ -58,113 +58,118 @@ def _sort_by_id(list_to_sort: list):
     # sort the list by the "id" value of each of its entries
     return sorted(list_to_sort, key=_key_by_id)
 
-def __serialize(var, encoding, indent, level, always_provide_keyname=False, sort=False, parent_key=None):
-    parts = []
+#: A string key that can be written bare (``a = val``) instead of as ``["a"] = val``.
+_SIMPLE_KEY_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+#: Default size, in characters, of the chunks ``iter_serialize`` hands out.
+CHUNK_SIZE = 64 * 1024
+
+
+def __serialize_scalar(var, encoding):
     if var is None:
-        parts.append("nil")
-    elif isinstance(var, bool):
-        if var:
-            parts.append("true")
-        else:
-            parts.append("false")
-    elif isinstance(var, (int, float)):
-        parts.append(str(var))
-    elif isinstance(var, str):
-        parts.extend(
-            (
-                '"',
-                var.encode(encoding).replace(b"\\", b"\\\\").replace(b'"', b'\\"').replace(b"\n", b"\\\n").decode(encoding),
-                '"',
-            )
-        )
-    elif isinstance(var, (list, dict)):
-        # calc lua table entries
-        entries = []
-        if isinstance(var, list):
-            if parent_key in ["country"] and sort:
-                sorted_var = _sort_by_id(var)
-                entries.extend([i + 1, sorted_var[i]] for i in range(len(sorted_var)))
-            else:
-                entries.extend([i + 1, var[i]] for i in range(len(var)))
-        elif isinstance(var, dict):
-            sorted_keys = _sort(list_to_sort=list(var.keys())) if sort else var.keys()
-            entries.extend([k, var[k]] for k in sorted_keys)
-        # build lua table parts
-        parts.append("{")
-        s_tab_equ = "="
-
-        # process indent
+        return "nil"
+    if isinstance(var, bool):
+        return "true" if var else "false"
+    if isinstance(var, (int, float)):
+        return str(var)
+    if isinstance(var, str):
+        return '"' + var.encode(encoding).replace(b"\\", b"\\\\").replace(b'"', b'\\"').replace(b"\n", b"\\\n").decode(encoding) + '"'
+    return ""
+
+
+def __table_entries(var, sort, parent_key):
+    if isinstance(var, list):
+        if parent_key in ["country"] and sort:
+            sorted_var = _sort_by_id(var)
+            return [(i + 1, sorted_var[i]) for i in range(len(sorted_var))]
+        return [(i + 1, var[i]) for i in range(len(var))]
+    sorted_keys = _sort(list_to_sort=list(var.keys())) if sort else var.keys()
+    return [(k, var[k]) for k in sorted_keys]
+
+
+def __iter_parts(var, encoding, indent, level, always_provide_keyname=False, sort=False, parent_key=None):
+    """Yield the Lua text of *var* as a stream of small string parts.
+
+    Walks the tables with an explicit stack instead of recursing, so no part is
+    copied through the join of every enclosing table: the text of a mission
+    nested ten levels deep is produced once, in order, and can be written out
+    as it comes.
+    """
+    s_tab_equ = "=" if indent is None else " = "
+    if not isinstance(var, (list, dict)):
+        yield __serialize_scalar(var, encoding)
+        return
+    # frame: [entries iterator, level, has entries, nohash, lastkey, lastval, hasval]
+    stack = []
+    entries = __table_entries(var, sort, parent_key)
+    yield "{"
+    if indent is not None and entries:
+        yield "\n"
+    stack.append([iter(entries), level, bool(entries), not always_provide_keyname, None, None, False])
+    while stack:
+        frame = stack[-1]
+        kv = next(frame[0], None)
+        if kv is None:
+            # insert `}` with indent
+            stack.pop()
+            if indent is not None and frame[2]:
+                yield indent * frame[1]
+            yield "}"
+            if stack and indent is not None:
+                yield ",\n"
+            continue
+        key, val = kv
+        frame_level = frame[1]
+        # judge if this is a pure list table
+        if frame[3] and (
+            not isinstance(key, int)
+            or (frame[5] is None and key != 1)  # first loop and index is not 1 : hash table
+            or (frame[4] is not None and frame[4] + 1 != key)  # key is not continuously
+        ):
+            frame[3] = False
+        # separate from the previous entry (with indent, every entry ends with `,\n`)
+        if indent is None and frame[6]:
+            yield ","
+        frame[4] = key
+        frame[5] = val
+        frame[6] = True
+        # insert indent
         if indent is not None:
-            s_tab_equ = " = "
-            if entries:
-                parts.append("\n")
-
-        # prepare for iterator
-        nohash = not always_provide_keyname
-        lastkey = None
-        lastval = None
-        hasval = False
-        for kv in entries:
-            key = kv[0]
-            val = kv[1]
-            # judge if this is a pure list table
-            if nohash and (
-                not isinstance(key, int)
-                or (
-                    lastval is None and key != 1
-                )  # first loop and index is not 1 : hash table
-                or (
-                    lastkey is not None and lastkey + 1 != key  # type: ignore[operator]
-                )  # key is not continuously
-            ):
-                nohash = False
-            # process to insert to table
-            # insert indent
-            if indent is not None:
-                parts.append(indent * (level + 1))
-            # insert key
-            if nohash:  # pure list: do not need a key
-                pass
-            elif isinstance(key, str) and key not in KEY_WORDS and re.match(
-                r"^[a-zA-Z_][a-zA-Z0-9_]*$", key
-            ):  # -> a = val
-                parts.extend(
-                    (
-                        key, 
-                        s_tab_equ
-                    )
-                )
-            else:  # -> [10010] = val # [".start with or contains special char"] = val
-                parts.extend(
-                    (
-                        "[",
-                        __serialize(key, encoding, indent, level + 1, always_provide_keyname=always_provide_keyname, sort=sort),
-                        "]",
-                        s_tab_equ,
-                    )
-                )
-            parts.extend(
-                (
-                    __serialize(val, encoding, indent, level + 1, always_provide_keyname=always_provide_keyname,sort=sort, parent_key=key),
-                    ",",
-                )
-            )
+            yield indent * (frame_level + 1)
+        # insert key
+        if frame[3]:  # pure list: do not need a key
+            pass
+        elif isinstance(key, str) and key not in KEY_WORDS and _SIMPLE_KEY_RE.match(key):  # -> a = val
+            yield key
+            yield s_tab_equ
+        else:  # -> [10010] = val # [".start with or contains special char"] = val
+            yield "["
+            yield __serialize_scalar(key, encoding)
+            yield "]"
+            yield s_tab_equ
+        # insert value
+        if isinstance(val, (list, dict)):
+            entries = __table_entries(val, sort, key)
+            yield "{"
+            if indent is not None and entries:
+                yield "\n"
+            stack.append([iter(entries), frame_level + 1, bool(entries), not always_provide_keyname, None, None, False])
+        else:
+            yield __serialize_scalar(val, encoding)
             if indent is not None:
-                parts.append("\n")
-            lastkey = key
-            lastval = val
-            hasval = True
+                yield ",\n"
 
-        # remove last `,` if no indent
-        if indent is None and hasval:
-            parts.pop()
 
-        # insert `}` with indent
-        if indent is not None and entries:
-            parts.append(indent * level)
-        parts.append("}")
-
-    return "".join(parts)
+def __iter_tuple_parts(var, encoding, indent, indent_level, always_provide_keyname, sort):
+    if not isinstance(var, tuple):
+        yield from __iter_parts(var, encoding, indent, indent_level, always_provide_keyname=always_provide_keyname, sort=sort)
+        return
+    spliter = ","
+    if indent is not None:
+        spliter = spliter + "\n" + indent * indent_level
+    for index, item in enumerate(var):
+        if index:
+            yield spliter
+        yield from __iter_parts(item, encoding, indent, indent_level, always_provide_keyname=always_provide_keyname, sort=sort)
 
 
 def serialize(var, encoding="utf-8", indent=None, indent_level=0, always_provide_keyname=False, sort=False):
@@ -179,11 +184,49 @@ def serialize(var, encoding="utf-8", indent=None, indent_level=0, always_provide
     Returns:
         string: serialized lua formatted data string
     """
-    if isinstance(var, tuple):
-        res = []
-        res.extend(__serialize(item,encoding,indent,indent_level,always_provide_keyname=always_provide_keyname,sort=sort) for item in var)
-        spliter = ","
-        if indent is not None:
-            spliter = spliter + "\n" + indent * indent_level
-        return spliter.join(res)
-    return __serialize(var, encoding, indent, indent_level, always_provide_keyname=always_provide_keyname, sort=sort)
+    return "".join(__iter_tuple_parts(var, encoding, indent, indent_level, always_provide_keyname, sort))
+
+
+def iter_serialize(var, encoding="utf-8", indent=None, indent_level=0, always_provide_keyname=False, sort=False, chunk_size=CHUNK_SIZE):
+    """Serialize variable to lua formatted data, as a stream of string chunks.
+
+    Joining the chunks gives exactly what ``serialize`` returns, but the full text
+    never has to sit in memory: write each chunk out as it comes.
+
+    Args:
+        var (number, int, float, str, dict, list, tuple): variable you want to serialize
+        encoding (str, optional): target encoding, will affect string components escaping logic. Defaults to "utf-8".
+        indent (str, optional): indent string, such as '\\t'. Defaults to None, means no indention.
+        indent_level (int, optional): current indent level. Defaults to 0.
+        chunk_size (int, optional): approximate size, in characters, of each chunk. Defaults to ``CHUNK_SIZE``.
+
+    Yields:
+        string: consecutive pieces of the serialized lua formatted data
+    """
+    buffer = []
+    size = 0
+    for part in __iter_tuple_parts(var, encoding, indent, indent_level, always_provide_keyname, sort):
+        buffer.append(part)
+        size += len(part)
+        if size >= chunk_size:
+            yield "".join(buffer)
+            buffer.clear()
+            size = 0
+    if buffer:
+        yield "".join(buffer)
+
+
+def dump(var, fp, encoding="utf-8", indent=None, indent_level=0, always_provide_keyname=False, sort=False, chunk_size=CHUNK_SIZE):
+    """Serialize variable to lua formatted data, written chunk by chunk to a text stream.
+
+    Args:
+        var (number, int, float, str, dict, list, tuple): variable you want to serialize
+        fp (TextIO): writable text stream, such as ``io.TextIOWrapper(zip_file.open(name, "w"))``
+        encoding (str, optional): target encoding, will affect string components escaping logic. Defaults to "utf-8".
+        indent (str, optional): indent string, such as '\\t'. Defaults to None, means no indention.
+        indent_level (int, optional): current indent level. Defaults to 0.
+        chunk_size (int, optional): approximate size, in characters, of each write. Defaults to ``CHUNK_SIZE``.
+    """
+    write = fp.write
+    for chunk in iter_serialize(var, encoding=encoding, indent=indent, indent_level=indent_level, always_provide_keyname=always_provide_keyname, sort=sort, chunk_size=chunk_size):
+        write(chunk)
@@ -1,5 +1,6 @@
 import math
 import re
+from collections.abc import Iterable
 
 from veaf_libs.logger import logger
 
@@ -20,6 +21,68 @@ _WS_SKIP_STATES = frozenset(
 )
 
 
+def _sorter(kv):
+    if isinstance(kv[0], int):
+        return kv[0]
+    return math.inf
+
+
+class _Node:
+    """One Lua table being parsed: its entries in arrival order, and what they make it.
+
+    A mission opens hundreds of thousands of small tables, so the bookkeeping is
+    kept to the minimum: ``__slots__``, ``(key, value)`` tuples, and no set of
+    integer keys while they arrive as ``1, 2, 3…`` — the array length then grows
+    in O(1). The set is only built when a key breaks that run (sparse, duplicate,
+    out of order), and the close-time sort only runs when entries did not already
+    arrive in sorted order.
+    """
+
+    __slots__ = ("entries", "lualen", "int_keys", "last", "ordered", "is_root")
+
+    def __init__(self, is_root: bool = False):
+        self.entries: list[tuple] = []
+        #: Length of the ``1..n`` run of integer keys (Lua's ``#t``).
+        self.lualen = 0
+        #: Every integer key seen, or ``None`` while they are exactly ``1..lualen``.
+        self.int_keys: set[int] | None = None
+        #: Sort key (see ``_sorter``) of the last entry, to tell whether entries are in order.
+        self.last: float = 0
+        self.ordered = True
+        self.is_root = is_root
+
+    def append(self, key, val) -> None:
+        # Performance: do NOT sort the whole list on every append (that made this
+        # O(n^2 log n) per table — crippling on large DCS arrays like route points).
+        # Keep entries in append order and sort once, lazily, in to_table.
+        self.entries.append((key, val))
+        if isinstance(key, int):
+            if key < self.last:
+                self.ordered = False
+            self.last = key
+            lualen = self.lualen
+            int_keys = self.int_keys
+            if int_keys is None:
+                if key == lualen + 1:
+                    self.lualen = key
+                    return
+                int_keys = self.int_keys = set(range(1, lualen + 1))
+            int_keys.add(key)
+            while (lualen + 1) in int_keys:
+                lualen += 1
+            self.lualen = lualen
+        else:
+            self.last = math.inf
+
+    def to_table(self) -> list | dict:
+        # Single sort at table close (was previously done on every append), skipped
+        # when the entries already arrived in order.
+        entries = self.entries if self.ordered else sorted(self.entries, key=_sorter)
+        if len(entries) == self.lualen:
+            return [kv[1] for kv in entries]
+        return {kv[0]: kv[1] for kv in entries}
+
+
 def _unserialize(raw: str, encoding: str = "utf-8", multival: bool = False, verbose: bool = False) -> tuple:
     """Unserialize stringified lua data to python data
 
@@ -36,7 +99,7 @@ def _unserialize(raw: str, encoding: str = "utf-8", multival: bool = False, verb
         tuple([*]): unserialized data
     """
     sbins = raw.encode(encoding)
-    root = {"entries": [], "lualen": 0, "is_root": True, "int_keys": set()}
+    root = _Node(is_root=True)
     node = root
     stack = []
     state = "SEEK_CHILD"
@@ -49,32 +112,6 @@ def _unserialize(raw: str, encoding: str = "utf-8", multival: bool = False, verb
     component_name = None
     errmsg = None
 
-    def sorter(kv):
-        if isinstance(kv[0], int):
-            return kv[0]
-        return math.inf
-
-    def node_entries_append(node, key, val):
-        # Performance: do NOT sort the whole list on every append (that made this
-        # O(n^2 log n) per table — crippling on large DCS arrays like route points).
-        # Keep entries in append order; track the array length incrementally via a
-        # set of integer keys (amortised O(1)); sort once, lazily, in node_to_table.
-        node["entries"].append([key, val])
-        if isinstance(key, int):
-            int_keys = node["int_keys"]
-            int_keys.add(key)
-            lualen = node["lualen"]
-            while (lualen + 1) in int_keys:
-                lualen += 1
-            node["lualen"] = lualen
-
-    def node_to_table(node):
-        # Single sort at table close (was previously done on every append).
-        entries = sorted(node["entries"], key=sorter)
-        if len(entries) == node["lualen"]:
-            return [kv[1] for kv in entries]
-        return {kv[0]: kv[1] for kv in entries}
-
     while pos <= slen:
         byte_current = None
         byte_current_is_space = False
@@ -112,14 +149,14 @@ def _unserialize(raw: str, encoding: str = "utf-8", multival: bool = False, verb
             elif byte_current == b"-" and sbins[pos: pos + 2] == b"--":
                 comment = "INLINE"
                 pos = pos + 1
-            elif not node["is_root"] and (
+            elif not node.is_root and (
                 (b"A" <= byte_current <= b"Z")
                 or (b"a" <= byte_current <= b"z")
                 or byte_current == b"_"
             ):
                 state = "KEY_SIMPLE"
                 pos1 = pos
-            elif not node["is_root"] and byte_current == b"[":
+            elif not node.is_root and byte_current == b"[":
                 state = "KEY_EXPRESSION_OPEN"
             elif byte_current == b"}":
                 if len(stack) == 0:
@@ -129,19 +166,15 @@ def _unserialize(raw: str, encoding: str = "utf-8", multival: bool = False, verb
                     break
                 prev_env = stack.pop()
                 if prev_env["state"] == "KEY_EXPRESSION_OPEN":
-                    key = node_to_table(node)
+                    key = node.to_table()
                     state = "KEY_END"
                 elif prev_env["state"] == "VALUE":
-                    node_entries_append(
-                        prev_env["node"],
-                        prev_env["key"],
-                        node_to_table(node),
-                    )
+                    prev_env["node"].append(prev_env["key"], node.to_table())
                     state = "VALUE_END"
                     key = None
                 node = prev_env["node"]
             elif not byte_current_is_space:
-                key = node["lualen"] + 1
+                key = node.lualen + 1
                 state = "VALUE"
                 pos = pos - 1
         elif state == "VALUE":
@@ -168,12 +201,12 @@ def _unserialize(raw: str, encoding: str = "utf-8", multival: bool = False, verb
                 component_name = "VALUE"
                 pos1 = pos
             elif byte_current == b"t" and sbins[pos: pos + 4] == b"true":
-                node_entries_append(node, key, True)
+                node.append(key, True)
                 state = "VALUE_END"
                 key = None
                 pos = pos + 3
             elif byte_current == b"f" and sbins[pos: pos + 5] == b"false":
-                node_entries_append(node, key, False)
+                node.append(key, False)
                 state = "VALUE_END"
                 key = None
                 pos = pos + 4
@@ -187,7 +220,7 @@ def _unserialize(raw: str, encoding: str = "utf-8", multival: bool = False, verb
             elif byte_current == b"{":
                 stack.append({"node": node, "state": state, "key": key})
                 state = "SEEK_CHILD"
-                node = {"entries": [], "lualen": 0, "is_root": False, "int_keys": set()}
+                node = _Node()
         elif state == "TEXT":
             if byte_current is None:
                 errmsg = "unexpected string ending: missing close quote."
@@ -214,7 +247,7 @@ def _unserialize(raw: str, encoding: str = "utf-8", multival: bool = False, verb
                     key = data
                     state = "KEY_EXPRESSION_FINISH"
                 elif component_name == "VALUE":
-                    node_entries_append(node, key, data)
+                    node.append(key, data)
                     state = "VALUE_END"
                     key = None
         elif state == "INT":
@@ -227,7 +260,7 @@ def _unserialize(raw: str, encoding: str = "utf-8", multival: bool = False, verb
                     state = "KEY_EXPRESSION_FINISH"
                     pos = pos - 1
                 elif component_name == "VALUE":
-                    node_entries_append(node, key, data)
+                    node.append(key, data)
                     state = "VALUE_END"
                     key = None
                     pos = pos - 1
@@ -245,7 +278,7 @@ def _unserialize(raw: str, encoding: str = "utf-8", multival: bool = False, verb
                         state = "KEY_EXPRESSION_FINISH"
                         pos = pos - 1
                     elif component_name == "VALUE":
-                        node_entries_append(node, key, data)
+                        node.append(key, data)
                         state = "VALUE_END"
                         key = None
                         pos = pos - 1
@@ -350,12 +383,12 @@ def _unserialize(raw: str, encoding: str = "utf-8", multival: bool = False, verb
                 state = "VALUE"
             elif byte_current == b"," or byte_current == b"}":
                 if key == "true":
-                    node_entries_append(node, node["lualen"] + 1, True)
+                    node.append(node.lualen + 1, True)
                     state = "VALUE_END"
                     key = None
                     pos = pos - 1
                 elif key == "false":
-                    node_entries_append(node, node["lualen"] + 1, False)
+                    node.append(node.lualen + 1, False)
                     state = "VALUE_END"
                     key = None
                     pos = pos - 1
@@ -370,7 +403,7 @@ def _unserialize(raw: str, encoding: str = "utf-8", multival: bool = False, verb
     # check if there is any errors
     if errmsg is None and len(stack) != 0:
         errmsg = 'unexpected end of table, "}" expected.'
-    if errmsg is None and root["lualen"] == 0:
+    if errmsg is None and root.lualen == 0:
         errmsg = "nothing can be unserialized from input string."
     if errmsg is not None:
         pos = min(pos, slen)
@@ -381,13 +414,300 @@ def _unserialize(raw: str, encoding: str = "utf-8", multival: bool = False, verb
         logger.error(message=f"Unserialize luadata failed on pos {pos}:\n    {err_parts}\n    {err_indent}^\n    {errmsg}", exception_type=ValueError)
 
     res = []
-    for kv in root["entries"]:
+    for kv in root.entries:
         res.append(kv[1])
     if multival:
         return tuple(res)
     return res[0]
 
 
+#: One token of Lua table data, led by any run of insignificant whitespace. Each
+#: alternative consumes exactly what the ``_unserialize`` state machine consumes for
+#: the same construct, so both engines agree token for token:
+#: ``--[[ … ]]`` / ``-- …`` comments, quoted strings with backslash escapes, numbers
+#: (``INT``/``FLOAT`` states: ``-`` or a digit, digits, then ``.``/``e`` and
+#: ``[0-9e+-]``), identifiers, the table punctuation, and the end of input.
+_TOKEN_RE = re.compile(
+    r"[ \t\r\n]*(?:"
+    r"(?P<comment>--(?:\[\[.*?(?:\]\]|\Z)|[^\n]*))"
+    r"|(?P<string>\"[^\"\\]*(?:\\.[^\"\\]*)*\"|'[^'\\]*(?:\\.[^'\\]*)*')"
+    r"|(?P<number>[-0-9][0-9]*(?:[.e][0-9e+\-]*)?|\.[0-9e+\-]*)"
+    r"|(?P<name>[A-Za-z_][A-Za-z0-9_]*)"
+    r"|(?P<punct>[{}\[\]=,])"
+    r"|(?P<end>\Z)"
+    r")",
+    re.S,
+)
+#: The next brace, string or comment — what ``_Tokenizer.skip_table`` needs to find
+#: the end of a table it does not parse. A lone ``-`` (a negative number) is passed over.
+_SKIP_RE = re.compile(
+    r"(?:[^{}\"'\-]+|-(?!-))*"
+    r"(?:(?P<open>\{)|(?P<close>\})"
+    r"|(?P<string>\"[^\"\\]*(?:\\.[^\"\\]*)*\"|'[^'\\]*(?:\\.[^'\\]*)*')"
+    r"|(?P<comment>--(?:\[\[.*?(?:\]\]|\Z)|[^\n]*)))",
+    re.S,
+)
+#: Encodings in which every token byte is ASCII and never part of a multi-byte
+#: character — the scanner then works on ``str`` directly and skips the encode.
+_SCANNER_ENCODINGS = frozenset({"utf-8", "utf8", "utf_8"})
+#: Parser engines accepted by :func:`unserialize`.
+ENGINES = ("scanner", "state")
+DEFAULT_ENGINE = "scanner"
+#: Version of what :func:`unserialize` returns. Part of every persisted parse-cache key
+#: (``veaf_libs.parse_cache``): bump it whenever a change alters the parsed data, so the
+#: cache stops serving results of the old parser.
+PARSER_VERSION = 1
+
+
+class _ScannerBailout(Exception):
+    """Raised when the scanner meets input it does not handle exactly like the state machine."""
+
+
+def _unescape(text: str) -> str:
+    """Decode a quoted string body the way the ``TEXT`` state does (same replacements, same order)."""
+    if "\\" not in text:
+        return text
+    return (
+        text.replace("\\\r\n", "\n")
+        .replace("\\\r", "\n")
+        .replace("\\\n", "\n")
+        .replace('\\"', '"')
+        .replace("\\\\", "\\")
+    )
+
+
+def _number(text: str) -> int | float:
+    """Convert a number token the way the ``INT`` / ``FLOAT`` states do."""
+    if "." in text or "e" in text:
+        if text == ".":
+            raise _ScannerBailout(text)
+        return float(text)
+    return int(text)
+
+
+def _harmless_root_name(name: str) -> bool:
+    """Tell whether the state machine skips *name* byte by byte before a root value.
+
+    At the root, the state machine has no keys: ``mission = {`` is read by skipping
+    every byte up to the ``{``. A name is skipped verbatim only when none of its
+    bytes starts a value (a digit, or a ``true``/``false``/``nil`` prefix).
+    """
+    return not any(c.isdigit() for c in name) and "true" not in name and "false" not in name and "nil" not in name
+
+
+class _Tokenizer:
+    """Hand out the ``(kind, token)`` pairs of a text, comments dropped."""
+
+    __slots__ = ("text", "pos")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.pos = 0
+
+    def next(self) -> tuple[str, str]:
+        """Return the next token.
+
+        Raises:
+            _ScannerBailout: on a byte no token starts with.
+        """
+        text = self.text
+        match = _TOKEN_RE.match
+        while True:
+            m = match(text, self.pos)
+            if m is None:
+                raise _ScannerBailout(self.pos)
+            kind = m.lastgroup
+            self.pos = m.end()
+            if kind != "comment":
+                return kind, m.group(kind)  # type: ignore[return-value]
+
+    def skip_table(self) -> None:
+        """Jump past the table whose ``{`` was just read, without building anything.
+
+        Only braces, strings and comments are looked at — enough to find the
+        matching ``}`` — so the skipped text is not validated.
+
+        Raises:
+            _ScannerBailout: when the table is never closed.
+        """
+        text = self.text
+        match = _SKIP_RE.match
+        pos = self.pos
+        depth = 1
+        while depth:
+            m = match(text, pos)
+            if m is None:
+                raise _ScannerBailout("unclosed table")
+            pos = m.end()
+            kind = m.lastgroup
+            if kind == "open":
+                depth += 1
+            elif kind == "close":
+                depth -= 1
+        self.pos = pos
+
+
+def _scan(text: str, only: frozenset | None = None) -> list:
+    """Parse *text* token by token and return the root values.
+
+    Table bookkeeping goes through the same ``_Node`` as the state machine, so list/dict shape, key order
+    and duplicate-key handling are identical.
+
+    With *only*, the entries of a root table whose key is not in it are jumped
+    over by ``_Tokenizer.skip_table`` instead of being parsed.
+
+    Raises:
+        _ScannerBailout: on anything outside the well-formed grammar — the caller
+            then reruns the state machine, which owns every quirk and error message.
+    """
+    tokenizer = _Tokenizer(text)
+    nxt = tokenizer.next
+    root = _Node(is_root=True)
+    node = root
+    stack: list[tuple[dict, object]] = []
+    pending = None
+    while True:
+        # --- start of a field, or the close of the current table ---
+        kind, tok = pending or nxt()
+        pending = None
+        if kind == "end":
+            if stack:
+                raise _ScannerBailout("unclosed table")
+            break
+        if tok == "}" and kind == "punct":
+            if not stack:
+                raise _ScannerBailout("unexpected }")
+            value = node.to_table()
+            node, key = stack.pop()
+            node.append(key, value)
+        else:
+            if node is root:
+                key = root.lualen + 1
+                while kind == "name" and _harmless_root_name(tok) or tok == "=" and kind == "punct":
+                    kind, tok = nxt()
+            elif kind == "name":
+                key = tok
+                kind, tok = nxt()
+                if kind == "punct" and tok == "=":
+                    kind, tok = nxt()
+                elif kind == "punct" and tok in (",", "}") and key in ("true", "false"):
+                    node.append(node.lualen + 1, key == "true")
+                    pending = kind, tok
+                    kind = None
+                else:
+                    raise _ScannerBailout(key)
+            elif kind == "punct" and tok == "[":
+                kind, tok = nxt()
+                if kind == "string":
+                    key = _unescape(tok[1:-1])
+                elif kind == "number":
+                    key = _number(tok)
+                else:
+                    raise _ScannerBailout(tok)
+                if nxt() != ("punct", "]") or nxt() != ("punct", "="):
+                    raise _ScannerBailout("key expression")
+                kind, tok = nxt()
+            else:
+                key = node.lualen + 1
+            # --- the value ---
+            if kind is None:
+                pass
+            elif only is not None and len(stack) == 1 and key not in only:
+                if kind == "punct" and tok == "{":
+                    tokenizer.skip_table()
+                elif kind not in ("string", "number", "name"):
+                    raise _ScannerBailout(tok)
+            elif kind == "string":
+                node.append(key, _unescape(tok[1:-1]))
+            elif kind == "number":
+                node.append(key, _number(tok))
+            elif kind == "name" and tok == "true":
+                node.append(key, True)
+            elif kind == "name" and tok == "false":
+                node.append(key, False)
+            elif kind == "name" and tok == "nil":
+                pass
+            elif kind == "punct" and tok == "{":
+                stack.append((node, key))
+                node = _Node()
+                continue
+            else:
+                raise _ScannerBailout(tok)
+        # --- after a value: a separator, the close of the table, or the end ---
+        kind, tok = pending or nxt()
+        pending = None
+        if kind == "punct" and tok == ",":
+            continue
+        if kind == "punct" and tok == "}" and stack:
+            pending = kind, tok
+            continue
+        if kind == "end" and not stack:
+            break
+        raise _ScannerBailout(tok)
+    if root.lualen == 0:
+        raise _ScannerBailout("empty")
+    return [kv[1] for kv in root.entries]
+
+
+def _project(values: tuple | list, only: frozenset | None) -> tuple | list:
+    """Keep, in each root table of *values*, only the entries whose key is in *only*.
+
+    The fallback for ``only`` when the whole text had to be parsed: the kept entries
+    go back through ``_Node``, exactly as the scanner would have built them.
+    """
+    if only is None:
+        return values
+    projected = []
+    for value in values:
+        if isinstance(value, (dict, list)):
+            node = _Node()
+            for key, item in value.items() if isinstance(value, dict) else enumerate(value, start=1):
+                if key in only:
+                    node.append(key, item)
+            value = node.to_table()
+        projected.append(value)
+    return type(values)(projected)
+
+
+def _unserialize_scanner(raw: str, encoding: str = "utf-8", multival: bool = False, only: frozenset | None = None) -> tuple:
+    """Unserialize stringified lua data with the token-level regex scanner.
+
+    Matches whole tokens with one compiled regex instead of stepping the
+    ``_unserialize`` state machine once per byte. Its output is identical to the
+    state machine's; on any input it does not parse exactly the same way (a
+    syntax error, an exotic encoding, a quirk the state machine tolerates), it
+    hands the whole input to the state machine, which then returns or reports.
+
+    Args:
+        raw (str): raw lua data string
+        encoding (str, optional): string encoding. Defaults to "utf-8".
+        multival (bool, optional): returns tuple for supporting multiple lua values likes "return 1, 2". Defaults to False.
+        only (frozenset, optional): keys to keep in each root table; the others are skipped unparsed. Defaults to None (keep all).
+
+    Returns:
+        tuple([*]): unserialized data
+    """
+    try:
+        if encoding.lower() not in _SCANNER_ENCODINGS:
+            raise _ScannerBailout(encoding)
+        res = _scan(raw, only)
+    except (_ScannerBailout, ValueError):
+        return _unserialize_state(raw, encoding=encoding, multival=multival, only=only)
+    if multival:
+        return tuple(res)
+    return res[0]
+
+
+def _unserialize_state(raw: str, encoding: str = "utf-8", multival: bool = False, only: frozenset | None = None) -> tuple:
+    """Run the ``_unserialize`` state machine, then keep only the root keys in *only*."""
+    parsed = _unserialize(raw, encoding=encoding, multival=multival)
+    if only is None:
+        return parsed
+    if multival:
+        return _project(parsed, only)
+    return _project([parsed], only)[0]
+
+
 def _apply_dict_policy(value: object, keep_as_dict: list[str] | None, all_is_dict: bool) -> object:
     """Apply the ``keep_as_dict`` / ``all_is_dict`` policy to a parsed Lua value.
 
@@ -426,7 +746,15 @@ def _apply_dict_policy(value: object, keep_as_dict: list[str] | None, all_is_dic
     return value
 
 
-def unserialize(raw: str, encoding: str = "utf-8", multival: bool = False, keep_as_dict: list[str] | None = None, all_is_dict: bool = False) -> dict | list:
+def unserialize(
+    raw: str,
+    encoding: str = "utf-8",
+    multival: bool = False,
+    keep_as_dict: list[str] | None = None,
+    all_is_dict: bool = False,
+    engine: str = DEFAULT_ENGINE,
+    only: Iterable[str] | None = None,
+) -> dict | list:
     """Deserialize stringified Lua data to Python data, without executing Lua.
 
     Routes parsing through the pure-Python ``_unserialize`` state machine instead
@@ -440,11 +768,25 @@ def unserialize(raw: str, encoding: str = "utf-8", multival: bool = False, keep_
         multival: Return a tuple for multiple top-level values. Defaults to ``False``.
         keep_as_dict: Keys whose subtree must remain a dict even if list-shaped.
         all_is_dict: When ``True``, force every table to a dict.
+        engine: ``"scanner"`` (default) matches whole tokens with one compiled regex;
+            ``"state"`` runs the byte-by-byte state machine. Both return the same data.
+        only: When given, keep only these keys of the root table (``mission = {…}``'s
+            ``coalition``, ``triggers``…). With the scanner the other branches are skipped
+            without being parsed, or validated; the result must not be written back.
 
     Returns:
         The parsed Python structure (a tuple when ``multival`` is ``True``).
+
+    Raises:
+        ValueError: when *engine* is not one of ``ENGINES``, or the input cannot be parsed.
     """
-    parsed = _unserialize(raw, encoding=encoding, multival=multival)
+    keys = None if only is None else frozenset(only)
+    if engine == "scanner":
+        parsed = _unserialize_scanner(raw, encoding=encoding, multival=multival, only=keys)
+    elif engine == "state":
+        parsed = _unserialize_state(raw, encoding=encoding, multival=multival, only=keys)
+    else:
+        logger.error(message=f"Unknown luadata engine '{engine}' (expected one of {', '.join(ENGINES)})", exception_type=ValueError)
     if multival:
         return tuple(_apply_dict_policy(value, keep_as_dict, all_is_dict) for value in parsed)  # type: ignore[return-value]
     return _apply_dict_policy(parsed, keep_as_dict, all_is_dict)  # type: ignore[return-value]
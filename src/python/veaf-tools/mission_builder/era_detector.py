@@ -23,6 +23,9 @@ ERA_WW2 = "WW2"
 ERA_COLD_WAR = "COLD_WAR"
 ERA_MODERN = "MODERN"
 
+#: The only ``mission`` keys :func:`detect_era` reads — a caller may parse just these.
+ERA_MISSION_KEYS: frozenset[str] = frozenset({"coalition", "date"})
+
 #: Inclusive upper year bounds for each era.
 _WW2_MAX_YEAR = 1945
 _COLD_WAR_MAX_YEAR = 1991
@@ -11,34 +11,20 @@ from __future__ import annotations
 
 from typing import Any
 
-#: DCS unit-group categories carried under each country in the mission table.
-_GROUP_CATEGORIES: tuple[str, ...] = ("plane", "helicopter", "vehicle", "ship", "static")
+from mission_tools.group_index import GroupIndex
 
 #: veafCombatMission.addCapMission() prefixes this to the cap_missions group name
 #: at runtime (since v5), so the maker's DCS group is named "OnDemand-<group_name>".
 ONDEMAND_CAP_PREFIX = "OnDemand-"
 
 
-def collect_mission_group_names(mission_content: dict[str, Any]) -> set[str]:
-    """Return every group name present in the mission (all coalitions/countries/categories)."""
-    names: set[str] = set()
-    coalitions = mission_content.get("coalition") or {}
-    if not isinstance(coalitions, dict):
-        return names
-    for coalition in coalitions.values():
-        if not isinstance(coalition, dict):
-            continue
-        for country in coalition.get("country") or []:
-            if not isinstance(country, dict):
-                continue
-            for category in _GROUP_CATEGORIES:
-                container = country.get(category) or {}
-                if not isinstance(container, dict):
-                    continue
-                for group in container.get("group") or []:
-                    if isinstance(group, dict) and (name := group.get("name")):
-                        names.add(str(name))
-    return names
+def collect_mission_group_names(mission_content: dict[str, Any] | GroupIndex) -> set[str]:
+    """Return every group name present in the mission (all coalitions/countries/categories).
+
+    Takes the mission table, or its :class:`GroupIndex` when the caller already has one.
+    """
+    index = mission_content if isinstance(mission_content, GroupIndex) else GroupIndex(mission_content)
+    return {name for name in index.group_names() if name}
 
 
 def _module_cfg(modules: dict[str, Any], key: str) -> dict[str, Any]:
@@ -140,29 +126,13 @@ def collect_mission_zone_names(mission_content: dict[str, Any]) -> set[str]:
     return names
 
 
-def collect_mission_unit_names(mission_content: dict[str, Any]) -> set[str]:
-    """Return every unit name present in the mission (all coalitions/countries/categories)."""
-    names: set[str] = set()
-    coalitions = mission_content.get("coalition") or {}
-    if not isinstance(coalitions, dict):
-        return names
-    for coalition in coalitions.values():
-        if not isinstance(coalition, dict):
-            continue
-        for country in coalition.get("country") or []:
-            if not isinstance(country, dict):
-                continue
-            for category in _GROUP_CATEGORIES:
-                container = country.get(category) or {}
-                if not isinstance(container, dict):
-                    continue
-                for group in container.get("group") or []:
-                    if not isinstance(group, dict):
-                        continue
-                    for unit in group.get("units") or []:
-                        if isinstance(unit, dict) and (name := unit.get("name")):
-                            names.add(str(name))
-    return names
+def collect_mission_unit_names(mission_content: dict[str, Any] | GroupIndex) -> set[str]:
+    """Return every unit name present in the mission (all coalitions/countries/categories).
+
+    Takes the mission table, or its :class:`GroupIndex` when the caller already has one.
+    """
+    index = mission_content if isinstance(mission_content, GroupIndex) else GroupIndex(mission_content)
+    return index.unit_names()
 
 
 def find_missing_trigger_zone_refs(
@@ -214,7 +184,8 @@ def find_missing_sanctuary_units(
     ``Sanctuary_Kutaisi_Polygon #NNN`` with a unit ``Ground-1-1`` inside) are valid, and a
     unit-names-only check flagged 16 real, working references as errors.
     """
-    present = collect_mission_unit_names(mission_content) | collect_mission_group_names(mission_content)
+    index = GroupIndex(mission_content)
+    present = collect_mission_unit_names(index) | collect_mission_group_names(index)
     modules = mission_yaml.get("modules") or {}
     issues: list[tuple[str, str, str]] = []
     for zone in _module_cfg(modules, "SANCTUARY").get("sanctuary_zones") or []:
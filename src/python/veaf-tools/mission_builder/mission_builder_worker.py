@@ -16,16 +16,15 @@ import yaml
 from mission_tools import (
     DEFAULT_SCRIPTS_LOCATION,
     DcsMission,
+    FileIndex,
+    InMemoryMission,
     collect_files_from_globs,
-    create_miz,
     get_community_script_files,
     get_community_sound_files,
     get_mission_data_files,
     get_mission_script_files,
     get_optin_community_script_ids,
     is_community_script_enabled_by_default,
-    read_miz,
-    write_miz,
 )
 from veaf_libs import user_config as _user_config
 from veaf_libs.base_worker import BaseWorker
@@ -52,7 +51,7 @@ from veaf_libs.progress import spinner_context
 from veaf_libs.yaml_validator import validate_modules_semantics, validate_yaml_file
 
 from mission_builder.coalition_placeholder import ensure_coalitions_populated
-from mission_builder.era_detector import detect_era
+from mission_builder.era_detector import ERA_MISSION_KEYS, detect_era
 from mission_builder.third_party_mods import strip_third_party_mods
 from mission_builder.warehouses_bootstrap import ensure_airports_populated
 
@@ -614,11 +613,17 @@ class MissionBuilderWorker(BaseWorker):
         self.migrate_from_v5: bool = migrate_from_v5
         self.no_veaf_triggers: bool = no_veaf_triggers
         self.dcs_mission: DcsMission | None = None
+        #: The built mission, parsed from the collected files and written once (see :meth:`write_mission`).
+        self.in_memory: InMemoryMission | None = None
+        self.mission_files: dict[str, bytes] | None = None
         self.collected_community_script_files: dict[str, bytes] | None = None
         self.collected_community_sound_files: dict[str, bytes] | None = None
         self.collected_veaf_script_files: dict[str, bytes] | None = None
         self.collected_mission_script_files: dict[str, bytes] | None = None
         self.collected_mission_data_files: dict[str, bytes] | None = None
+        #: The folder listings every collection of this build matches its patterns against. Only read
+        #: from :meth:`create_mission` on, once the generated scripts are written.
+        self.file_index = FileIndex()
 
         # Make sure mission.yaml is present BEFORE we read it: if the user has no
         # mission.yaml, copy the default (which ships an active modules block) now.
@@ -845,6 +850,7 @@ class MissionBuilderWorker(BaseWorker):
         self.collected_veaf_script_files = collect_files_from_globs(
             base_folder=scripts_folder,
             file_patterns=[veaf_script_pattern],
+            index=self.file_index,
         )
 
         if len(self.collected_veaf_script_files) < 1:
@@ -898,7 +904,7 @@ class MissionBuilderWorker(BaseWorker):
 
         scripts_folder: Path = self.scripts_path or (self.mission_folder / "published")
         self.collected_community_script_files = collect_files_from_globs(
-            base_folder=scripts_folder, file_patterns=file_patterns
+            base_folder=scripts_folder, file_patterns=file_patterns, index=self.file_index
         )
         if len(self.collected_community_script_files) < len(file_patterns):
             self.signal_missing_required_files_after_collection(
@@ -988,9 +994,10 @@ class MissionBuilderWorker(BaseWorker):
         CTLD and CSAR play their sounds by filename, so the files must sit in the
         mission's ``l10n/DEFAULT/``. The tool ships them under
         ``src/scripts/community/sounds/``; this returns the ones for enabled
-        modules, keyed for ``l10n/DEFAULT``. Sounds the mission already provides
-        win on merge (see :meth:`create_mission`). A required sound shipped by
-        neither the tool nor the mission is reported so the maker can add it.
+        modules, keyed for ``l10n/DEFAULT``, but for those the mission already
+        provides: its own copy wins on merge (see :meth:`create_mission`), so the
+        tool's is not read. A required sound shipped by neither the tool nor the
+        mission is reported so the maker can add it.
 
         Returns:
             Mapping of ``l10n/DEFAULT/<name>`` to file bytes (empty when no
@@ -1009,10 +1016,15 @@ class MissionBuilderWorker(BaseWorker):
             return self.collected_community_sound_files
 
         scripts_folder: Path = self.scripts_path or (self.mission_folder / "published")
+        provided = set(self.get_collected_mission_data_files())
         file_patterns = [
-            (f"src/scripts/community/sounds/{name}", DEFAULT_SCRIPTS_LOCATION) for name in sorted(required)
+            (f"src/scripts/community/sounds/{name}", DEFAULT_SCRIPTS_LOCATION)
+            for name in sorted(required)
+            if f"{DEFAULT_SCRIPTS_LOCATION}/{name}" not in provided
         ]
-        collected = collect_files_from_globs(base_folder=scripts_folder, file_patterns=file_patterns)
+        collected = collect_files_from_globs(
+            base_folder=scripts_folder, file_patterns=file_patterns, index=self.file_index
+        )
 
         self._warn_missing_community_sounds(required, collected)
         self.collected_community_sound_files = collected
@@ -1049,6 +1061,7 @@ class MissionBuilderWorker(BaseWorker):
             base_folder=self.mission_folder,
             file_patterns=get_mission_script_files(),
             alternative_folder=defaults_folder,
+            index=self.file_index,
         )
         return self.collected_mission_script_files
 
@@ -1061,7 +1074,10 @@ class MissionBuilderWorker(BaseWorker):
             (self.scripts_path or (self.mission_folder / "published")) / "src" / "defaults" / "mission-folder"
         )
         self.collected_mission_data_files = collect_files_from_globs(
-            base_folder=self.mission_folder, file_patterns=get_mission_data_files(), alternative_folder=defaults_folder
+            base_folder=self.mission_folder,
+            file_patterns=get_mission_data_files(),
+            alternative_folder=defaults_folder,
+            index=self.file_index,
         )
         return self.collected_mission_data_files
 
@@ -1125,7 +1141,7 @@ class MissionBuilderWorker(BaseWorker):
         at the earliest possible point in mission startup.
 
         Also stores the bridge file bytes in self.dcs_bridge_bytes so that
-        write_mission() can pass them to write_miz() as additional_files.
+        write_mission() can add them to the archive.
 
         Args:
             bridge_file: Path to the dcs-bridge.lua file, or None (no-op).
@@ -1284,9 +1300,14 @@ class MissionBuilderWorker(BaseWorker):
                     pass
 
     def create_mission(self) -> None:
-        """Creates the initial mission file from the mission folder."""
+        """Collects the files of the mission from the mission folder and the scripts.
+
+        They are kept in memory: :meth:`read_mission` parses the mission tables from there and
+        :meth:`write_mission` zips them, so the archive is written once, already holding the edited
+        mission.
+        """
 
-        logger.debug("Create the initial mission file from the mission folder")
+        logger.debug("Collect the files of the mission from the mission folder")
 
         files = (
             self.get_collected_community_sound_files()
@@ -1296,17 +1317,16 @@ class MissionBuilderWorker(BaseWorker):
             | self.get_collected_mission_data_files()
         )
         logger.debug(f"Preprocessed {len(files)} files")
-
-        logger.debug("Creating the mission file")
-        self.output_mission = create_miz(self.output_mission, files)
-        logger.debug(f"Mission file created at {self.output_mission}")
+        self.mission_files = files
 
     def read_mission(self) -> None:
-        """Load the mission from the .miz file (unzip it) and process aircraft groups."""
+        """Parse the mission tables from the collected files."""
 
-        logger.debug(f"Reading mission file {self.output_mission}")
+        logger.debug(f"Reading mission for {self.output_mission}")
+        assert self.mission_files is not None
         try:
-            self.dcs_mission = read_miz(self.output_mission)
+            self.in_memory = InMemoryMission.from_members(self.output_mission, self.mission_files)
+            self.dcs_mission = self.in_memory.mission
             # A holed sequence table is closed on load; say which, since the same silence cost three
             # debugging rounds on 2026-08-18 (FIX-GROUP-CONTAINER-SHAPE).
             for hole in self.dcs_mission.sequence_holes:
@@ -2281,10 +2301,10 @@ class MissionBuilderWorker(BaseWorker):
         self.dcs_mission.mission_content["trigrules"] = result_trigrules  # type: ignore[index]
 
     def write_mission(self) -> None:
-        """Write the mission file."""
+        """Write the mission file: the collected files, with the mission tables as edited."""
 
         logger.debug("Writing mission file")
-        assert self.dcs_mission is not None
+        assert self.in_memory is not None
         additional_files: dict[str, bytes] = {}
         if self.dcs_bridge_bytes is not None or self.checklist_images:
             from mission_tools import DEFAULT_SCRIPTS_LOCATION
@@ -2294,7 +2314,8 @@ class MissionBuilderWorker(BaseWorker):
             for entry in self.checklist_images:
                 for filename, payload in entry.files.items():
                     additional_files[f"{DEFAULT_SCRIPTS_LOCATION}/{filename}"] = payload
-        write_miz(mission=self.dcs_mission, miz_file_path=self.output_mission, additional_files=additional_files)
+        self.in_memory.add_files(additional_files)
+        self.in_memory.write()
         logger.debug("Writing mission file done")
 
     def _detect_era_from_base(self) -> str | None:
@@ -2312,7 +2333,9 @@ class MissionBuilderWorker(BaseWorker):
         if not mission_file.exists():
             return None
         try:
-            content = luadata.unserialize(mission_file.read_text(encoding="utf-8"), keep_as_dict=["trig", "trigrules"])
+            content = luadata.unserialize(
+                mission_file.read_text(encoding="utf-8"), keep_as_dict=["trig", "trigrules"], only=ERA_MISSION_KEYS
+            )
         except Exception as exc:  # noqa: BLE001 - era detection must never break the build
             logger.debug(f"era auto-detect: could not parse base mission {mission_file}: {exc}")
             return None
@@ -2455,11 +2478,11 @@ class MissionBuilderWorker(BaseWorker):
             self.generate_veaf_dynamic_config()
             self.generate_ctld_user_config()
 
-        # Create the initial mission file
+        # Collect the files of the mission
         with spinner_context(t("builder.creating_mission", output=self.output_mission), silent=silent):
             self.create_mission()
 
-        # Load the mission from the .miz file (unzip it) and process aircraft groups
+        # Parse the mission tables from the collected files
         with spinner_context(t("builder.reading_mission", output=self.output_mission), silent=silent):
             self.read_mission()
 
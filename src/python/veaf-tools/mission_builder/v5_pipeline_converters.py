@@ -15,10 +15,8 @@ convert_pipeline_file(step, v5_path, v6_path, *, icao_callback=None)
 from __future__ import annotations
 
 import copy
-import importlib.resources
 import json
 import re
-import sys
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -29,6 +27,7 @@ import yaml
 from mission_tools import KIND_DYNAMIC_TEMPLATE, KIND_SPAWNABLE, classify_aircraft_group
 from presets_injector.freq_alias import apply_aliasing
 from presets_injector.presets_manager import PresetDefinition, pack_preset_for_type, parse_channel_lists
+from veaf_libs.bundled_data import load_bundled_data
 from veaf_libs.i18n import t, tn
 from veaf_libs.logger import logger
 
@@ -780,13 +779,7 @@ def _parse_custom_preset_table(content: str, table_name: str) -> list[float]:
 
 def _load_helicopter_types() -> set[str]:
     """Return the set of DCS unit type names classified as helicopters in dcs-radio-specs.yaml."""
-    bundle_path = Path(getattr(sys, "_MEIPASS", "")) / "presets_injector" / "data" / "dcs-radio-specs.yaml"
-    if bundle_path.exists():
-        raw = bundle_path.read_text(encoding="utf-8")
-    else:
-        pkg = importlib.resources.files("presets_injector.data")
-        raw = (pkg / "dcs-radio-specs.yaml").read_text(encoding="utf-8")  # type: ignore[arg-type]
-    specs: dict[str, Any] = yaml.safe_load(raw) or {}
+    specs: dict[str, Any] = load_bundled_data("presets_injector", "data", "dcs-radio-specs.yaml") or {}
     return {name for name, info in specs.items() if isinstance(info, dict) and info.get("category") == "helicopter"}
 
 
@@ -10,6 +10,8 @@ from .aircraft_group_sort import (
     SPAWNABLE_NAME_PREFIX,
     classify_aircraft_group,
 )
+from .file_index import FileIndex
+from .group_index import GroupIndex, IndexedGroup
 from .mission_constants import (
     DEFAULT_SCRIPTS_LOCATION,
     collect_files_from_globs,
@@ -26,9 +28,12 @@ from .mission_constants import (
 from .miz_tools import (
     DcsMission,
     Group,
+    InMemoryMission,
+    as_read_back,
     create_miz,
     extract_miz,
     extract_resources,
+    read_members,
     read_mission_folder,
     read_miz,
     write_miz,
@@ -40,6 +45,7 @@ __all__ = [
     "KIND_DYNAMIC_TEMPLATE",
     "SPAWNABLE_NAME_PREFIX",
     "read_miz",
+    "read_members",
     "read_mission_folder",
     "write_miz",
     "create_miz",
@@ -47,6 +53,8 @@ __all__ = [
     "extract_resources",
     "DcsMission",
     "Group",
+    "InMemoryMission",
+    "as_read_back",
     "DEFAULT_SCRIPTS_LOCATION",
     "get_community_script_files",
     "get_optin_community_script_ids",
@@ -58,4 +66,7 @@ __all__ = [
     "get_mission_files_to_cleanup_on_extract",
     "get_legacy_script_files",
     "collect_files_from_globs",
+    "FileIndex",
+    "GroupIndex",
+    "IndexedGroup",
 ]
@@ -0,0 +1,100 @@
+"""An in-memory index of the folders a build collects its files from.
+
+:func:`~mission_tools.mission_constants.collect_files_from_globs` used to run one ``glob`` or
+``rglob`` per pattern, and the builder calls it five times per build with some forty patterns
+between them, most of which look in the same few folders of ``published/`` and of the mission
+folder. On a network drive every one of those listings is a round trip.
+
+A :class:`FileIndex` lists each folder at most once, with :func:`os.scandir`, the first time a
+pattern needs it, and matches every pattern against the listing it keeps. It knows names and kinds
+only, never content: reading the matched files is the caller's.
+
+An index is a snapshot. Keep one for one build (a :class:`~mission_builder.MissionBuilderWorker`
+does), not across builds: a file added after its folder was listed is not seen.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from pathlib import Path
+
+
+class FileIndex:
+    """The files and sub-folders of each folder listed so far, listed on first use."""
+
+    def __init__(self) -> None:
+        self._listings: dict[str, _Listing] = {}
+        self.scans = 0
+        """How many folders were listed so far."""
+
+    def _listing(self, folder: str) -> _Listing:
+        listing = self._listings.get(folder)
+        if listing is None:
+            listing = self._listings[folder] = _Listing()
+            self.scans += 1
+            try:
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_file():
+                                listing.files[entry.name] = entry.path
+                            elif entry.is_dir():
+                                listing.folders[entry.name] = entry.path
+                                if entry.is_symlink():
+                                    listing.linked.add(entry.name)
+                        except OSError:
+                            continue  # a broken link, or an entry gone meanwhile: skipped, as glob does
+            except OSError:
+                pass  # no such folder, or not one that can be read: it holds nothing
+        return listing
+
+    def glob(self, folder: Path, pattern: str) -> Iterator[Path]:
+        """Yield the files below *folder* matching the relative *pattern*, as ``Path.glob`` would.
+
+        Each ``/``-separated part of *pattern* is an :mod:`fnmatch` pattern matching one name (case
+        folded on Windows only, as there), and a ``**`` part matches any number of folders but
+        symlinked ones. Only files are yielded, each once, in listing order.
+        """
+        parts = [part for part in Path(pattern).parts if part != "."]
+        if not parts:
+            return
+        seen: set[str] = set()
+        for path in self._match(os.fspath(folder), parts):
+            if path not in seen:
+                seen.add(path)
+                yield Path(path)
+
+    def _match(self, folder: str, parts: list[str]) -> Iterator[str]:
+        listing = self._listing(folder)
+        part, rest = parts[0], parts[1:]
+        if part == "**":
+            # Folders in the order Path.rglob walks them (each one's entries, then its last
+            # sub-folder first), so a collection keeps the order it had. A trailing ** is every file
+            # below, as Path.rglob("**") has been since Python 3.13.
+            stack = [folder]
+            while stack:
+                current = stack.pop()
+                listing = self._listing(current)
+                yield from self._match(current, rest) if rest else listing.files.values()
+                stack.extend(path for name, path in listing.folders.items() if name not in listing.linked)
+        elif not rest:
+            yield from (path for name, path in listing.files.items() if fnmatch(name, part))
+        else:
+            for name, subfolder in listing.folders.items():
+                if fnmatch(name, part):
+                    yield from self._match(subfolder, rest)
+
+
+@dataclass
+class _Listing:
+    """One folder's entries, by name, in :func:`os.scandir` order."""
+
+    files: dict[str, str] = field(default_factory=dict)
+    """File name → path."""
+    folders: dict[str, str] = field(default_factory=dict)
+    """Sub-folder name → path."""
+    linked: set[str] = field(default_factory=set)
+    """Those of :attr:`folders` that are symbolic links, which ``**`` does not descend into."""
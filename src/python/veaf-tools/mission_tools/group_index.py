@@ -0,0 +1,247 @@
+"""An index of the groups and units of a parsed DCS mission table.
+
+Finding a group in a mission means walking coalition → country → category → group → units, and
+the build, the validator and the MCP actions each did it from scratch, several times per mission:
+every ``iter_groups`` call, every ``max_ids`` before a group is added, every name check. A
+:class:`GroupIndex` walks the table once and answers the lookups they need from dictionaries: by
+group name, groupId, unitId, unit name and unit type, by coalition and country, and the
+``dynSpawnTemplate`` groups.
+
+An index is **live** only for the changes made through it: :func:`mission_tools.group_insertion.add_group`
+updates the index it is given, and :meth:`GroupIndex.remove` drops a group from the table and the
+index together. Any other change to the groups or units of the table (a rename, a group appended by
+hand) leaves the index stale; the code making it discards the index instead
+(:meth:`mission_tools.miz_tools.DcsMission.invalidate_group_index`).
+
+The walk reads the table as the other readers do: a 1-based table may arrive as a dict or a list,
+and an entry that is not a table is skipped.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from veaf_libs.mission_table import CATEGORIES, indexed
+
+#: Unit ``skill`` values of a slot flown by a pilot rather than the AI.
+HUMAN_SKILLS = ("Client", "Player")
+
+#: The categories of aircraft groups.
+AIR_CATEGORIES = ("plane", "helicopter")
+
+
+@dataclass(frozen=True, eq=False)
+class IndexedGroup:
+    """One group of the mission and where it sits. ``group`` and ``country`` are the mission's own tables."""
+
+    group: dict[str, Any]
+    coalition: str
+    country: dict[str, Any]
+    category: str
+    """``plane``, ``helicopter``, ``vehicle``, ``ship`` or ``static``."""
+
+    @property
+    def name(self) -> str:
+        return str(self.group.get("name", ""))
+
+    @property
+    def country_name(self) -> str:
+        return str(self.country.get("name", ""))
+
+    @property
+    def units(self) -> list[dict[str, Any]]:
+        return [unit for unit in indexed(self.group.get("units")) if isinstance(unit, dict)]
+
+    @property
+    def human_pilot(self) -> bool:
+        """Whether a unit of the group is a client or player slot."""
+        return any(unit.get("skill", "") in HUMAN_SKILLS for unit in self.units)
+
+    @property
+    def unit_type(self) -> str | None:
+        """The group's aircraft type: its first human-flown unit's, else its last typed unit's."""
+        unit_type = None
+        for unit in self.units:
+            unit_type = unit.get("type", "") or unit_type
+            if unit.get("skill", "") in HUMAN_SKILLS:
+                break
+        return unit_type
+
+
+def _int_id(value: Any) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class GroupIndex:
+    """The groups of *mission_content* (the parsed ``mission`` table), in table order.
+
+    Where several groups or units share a name, the lookups by name return the first one in table
+    order, as a walk would.
+    """
+
+    def __init__(self, mission_content: dict[str, Any]) -> None:
+        self.mission_content = mission_content
+        self.coalitions = mission_content.get("coalition")
+        """The ``coalition`` table indexed, to tell when it was replaced."""
+        self._reset()
+        if not isinstance(self.coalitions, dict):
+            return
+        for coalition_name, coalition in self.coalitions.items():
+            if not isinstance(coalition, dict):
+                continue
+            for country in indexed(coalition.get("country")):
+                if not isinstance(country, dict):
+                    continue
+                for category in CATEGORIES:
+                    container = country.get(category)
+                    if not isinstance(container, dict):
+                        continue
+                    for group in indexed(container.get("group")):
+                        if isinstance(group, dict):
+                            self._index(IndexedGroup(group, str(coalition_name), country, category))
+
+    def _reset(self) -> None:
+        self.groups: list[IndexedGroup] = []
+        """Every group: coalition by coalition, country by country, category by category."""
+        self._by_name: dict[str, IndexedGroup] = {}
+        self._by_group_id: dict[int, IndexedGroup] = {}
+        self._units_by_id: dict[int, tuple[dict[str, Any], IndexedGroup]] = {}
+        self._units_by_name: dict[str, tuple[dict[str, Any], IndexedGroup]] = {}
+        self._by_unit_type: dict[str, list[IndexedGroup]] = {}
+        self._by_country: dict[int, list[IndexedGroup]] = {}
+        self._templates: list[IndexedGroup] = []
+        self._max_group_id = 0
+        self._max_unit_id = 0
+
+    def _index(self, entry: IndexedGroup) -> None:
+        self.groups.append(entry)
+        self._by_name.setdefault(entry.name, entry)
+        self._by_country.setdefault(id(entry.country), []).append(entry)
+        group_id = _int_id(entry.group.get("groupId"))
+        if group_id is not None:
+            self._by_group_id.setdefault(group_id, entry)
+            self._max_group_id = max(self._max_group_id, group_id)
+        if entry.group.get("dynSpawnTemplate") is True:
+            self._templates.append(entry)
+        types_seen = set()
+        for unit in entry.units:
+            unit_id = _int_id(unit.get("unitId"))
+            if unit_id is not None:
+                self._units_by_id.setdefault(unit_id, (unit, entry))
+                self._max_unit_id = max(self._max_unit_id, unit_id)
+            if name := unit.get("name"):
+                self._units_by_name.setdefault(str(name), (unit, entry))
+            unit_type = unit.get("type")
+            if unit_type and unit_type not in types_seen:
+                types_seen.add(unit_type)
+                self._by_unit_type.setdefault(str(unit_type), []).append(entry)
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def group(self, name: str) -> IndexedGroup | None:
+        """Return the group named exactly *name*, or ``None``."""
+        return self._by_name.get(name)
+
+    def group_by_id(self, group_id: int) -> IndexedGroup | None:
+        """Return the group whose ``groupId`` is *group_id*, or ``None``."""
+        return self._by_group_id.get(group_id)
+
+    def unit(self, unit_id: int) -> tuple[dict[str, Any], IndexedGroup] | None:
+        """Return the unit whose ``unitId`` is *unit_id* and its group, or ``None``."""
+        return self._units_by_id.get(unit_id)
+
+    def unit_by_name(self, name: str) -> tuple[dict[str, Any], IndexedGroup] | None:
+        """Return the unit named exactly *name* and its group, or ``None``."""
+        return self._units_by_name.get(name)
+
+    def groups_of_type(self, unit_type: str) -> list[IndexedGroup]:
+        """Return the groups holding at least one unit of *unit_type* (exact DCS type name)."""
+        return list(self._by_unit_type.get(unit_type, ()))
+
+    def groups_in(self, coalition: str, country_name: str | None = None) -> list[IndexedGroup]:
+        """Return the groups of *coalition*, of its country *country_name* only when one is given."""
+        return [
+            entry
+            for entry in self.groups
+            if entry.coalition == coalition and (country_name is None or entry.country_name == country_name)
+        ]
+
+    def by_country(self) -> Iterator[list[IndexedGroup]]:
+        """Yield the groups of each country in turn, countries in table order."""
+        yield from self._by_country.values()
+
+    def templates(self) -> list[IndexedGroup]:
+        """Return the dynamic-spawn template groups (``dynSpawnTemplate = true``), in table order."""
+        return list(self._templates)
+
+    def group_names(self) -> list[str]:
+        """Return every group name in table order, duplicates included."""
+        return [entry.name for entry in self.groups]
+
+    def unit_names(self) -> set[str]:
+        """Return every (non-empty) unit name."""
+        return set(self._units_by_name)
+
+    # ------------------------------------------------------------------
+    # Ids and changes
+    # ------------------------------------------------------------------
+
+    def max_ids(self) -> tuple[int, int]:
+        """Return the highest groupId and unitId in use, as :func:`group_insertion.max_ids` does."""
+        return self._max_group_id, self._max_unit_id
+
+    def allocate_ids(self, unit_count: int) -> tuple[int, int]:
+        """Reserve a fresh groupId and *unit_count* consecutive unitIds.
+
+        Returns:
+            ``(group_id, first_unit_id)``.
+        """
+        group_id, first_unit_id = self._max_group_id + 1, self._max_unit_id + 1
+        self._max_group_id = group_id
+        self._max_unit_id += unit_count
+        return group_id, first_unit_id
+
+    def add(self, coalition: str, country: dict[str, Any], category: str, group: dict[str, Any]) -> IndexedGroup:
+        """Index *group*, just appended to the *category* of *country* in *coalition*."""
+        entry = IndexedGroup(group, coalition, country, category)
+        self._index(entry)
+        return entry
+
+    def remove(self, entry: IndexedGroup) -> int:
+        """Remove *entry*'s group from the mission table and from the index.
+
+        The category's ``group`` table is rebuilt as a contiguous ``1..n``, survivors in table order;
+        when nothing is left the ``group`` key goes, rather than holding an empty table a reader
+        would mistake for a list. Ids are not given back: the next one allocated is still past them.
+
+        Returns:
+            How many groups the category still holds.
+        """
+        container = entry.country.get(entry.category)
+        survivors = [
+            group
+            for group in (indexed(container.get("group")) if isinstance(container, dict) else [])
+            if group is not entry.group
+        ]
+        if isinstance(container, dict):
+            if survivors:
+                container["group"] = {index: group for index, group in enumerate(survivors, start=1)}
+            else:
+                container.pop("group", None)
+
+        # A removal is rare, and another group may own a name the removed one shadowed: the lookups
+        # are rebuilt from the remaining entries (no walk of the table), the highest ids kept.
+        groups = [other for other in self.groups if other is not entry]
+        max_ids = self.max_ids()
+        self._reset()
+        for other in groups:
+            self._index(other)
+        self._max_group_id, self._max_unit_id = max_ids
+        return len(survivors)
@@ -13,6 +13,8 @@ from veaf_libs.i18n import t
 from veaf_libs.logger import logger
 from veaf_libs.mission_table import indexed
 
+from mission_tools.group_index import GroupIndex
+
 GROUP_CATEGORIES: tuple[str, ...] = ("vehicle", "plane", "helicopter", "ship", "static")
 
 
@@ -174,6 +176,7 @@ def add_group(
     country_name: str,
     category: str,
     group: dict[str, Any],
+    index: GroupIndex | None = None,
 ) -> int:
     """Insert `group` into the mission, allocating a fresh groupId/unitId.
 
@@ -191,6 +194,9 @@ def add_group(
         group: The group dict to insert (`name`, `units`, `route`, ...). Only
             `groupId` and each unit's `unitId` are overwritten; everything else is
             taken as-is.
+        index: The mission's group index (`DcsMission.group_index()`), if it has one: the ids
+            are then allocated from it instead of a walk of every group, and the group is
+            indexed as it is inserted.
 
     Returns:
         The freshly-assigned `groupId`.
@@ -206,13 +212,15 @@ def add_group(
         raise KeyError(f"Unknown coalition: {coalition!r}")
     coalition_dict = coalitions[coalition]
 
-    next_group_id, next_unit_id = (n + 1 for n in max_ids(mission_content))
-
     group = copy.deepcopy(group)
-    group["groupId"] = next_group_id
     units = group.get("units") or []
     if isinstance(units, dict):
         units = list(units.values())
+    if index is not None:
+        group_id, next_unit_id = index.allocate_ids(len(units))
+    else:
+        group_id, next_unit_id = (n + 1 for n in max_ids(mission_content))
+    group["groupId"] = group_id
     for unit in units:
         unit["unitId"] = next_unit_id
         next_unit_id += 1
@@ -230,4 +238,6 @@ def add_group(
     # leaves the mission unloadable (DCS opens CHANGING COALITIONS with every country unassigned).
     assign_country_to_side(mission_content, coalition, country_id)
 
-    return next_group_id
+    if index is not None:
+        index.add(coalition, country, category, group)
+    return group_id
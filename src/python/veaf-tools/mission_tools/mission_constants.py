@@ -1,7 +1,11 @@
+from glob import has_magic
 from pathlib import Path
 
+from veaf_libs import resident_cache
 from veaf_libs.i18n import t
 
+from .file_index import FileIndex
+
 DEFAULT_SCRIPTS_LOCATION: str = "l10n/DEFAULT"
 
 
@@ -144,72 +148,56 @@ def get_mission_files_to_cleanup_on_extract() -> list[tuple[str, bool]]:
 
 
 def collect_files_from_globs(
-    base_folder: Path, file_patterns: list[tuple[str, str]], alternative_folder: Path | None = None, logger=None
+    base_folder: Path,
+    file_patterns: list[tuple[str, str]],
+    alternative_folder: Path | None = None,
+    logger=None,
+    index: FileIndex | None = None,
 ) -> dict[str, bytes]:
     """
     Collect files from a base folder using file paths and glob patterns.
     Falls back to alternative_folder if files cannot be found in base_folder.
 
+    The patterns are matched against the folder listings of *index*, and only the files that end up
+    in the result are read, once each, whatever the number of patterns matching them.
+
     Args:
         base_folder: The base directory to search from
         file_patterns: List of file paths or glob patterns (e.g., "src/scripts/*.lua", "src/mission/*")
         alternative_folder: Optional fallback folder to search if no files are found in base_folder
+        index: The listings to match against; pass the build's own to share them between calls.
+            A fresh one by default.
 
     Returns:
         Dictionary with:
             - key: relative file path from base_folder (with subfolders)
             - value: file contents as bytes
     """
+    index = index or FileIndex()
 
-    def _add_file_to_results(results: dict[str, bytes], file_path: Path, base_folder: Path) -> None:
-        relative_path = file_path.relative_to(base_folder).parent.as_posix()
-        key = (dest_location / relative_path / file_path.name).as_posix()
-        if logger:
-            logger.debug(f"Processing file {key}")
-        results[key] = file_path.read_bytes()
-
-    def _search_pattern_in_folder(search_folder: Path, pattern: str) -> dict[str, bytes]:
+    def _search_pattern_in_folder(search_folder: Path, pattern: str, dest_location: Path) -> dict[str, Path]:
         """Search for files matching pattern in the given folder."""
-        if not search_folder.exists():
-            return {}
-
-        pattern_path = search_folder / pattern
-        folder = pattern_path.parent
-        glob_pattern = pattern_path.name
-
-        if not folder.exists():
-            return {}
-
-        matched_files: dict[str, bytes] = {}
-
-        if "**" in pattern:
-            parts = Path(pattern).parts
-            if "**" in parts:
-                glob_start_index = parts.index("**")
-                pattern_search_folder = (
-                    search_folder / Path(*parts[:glob_start_index]) if glob_start_index > 0 else search_folder
-                )
-                remaining_pattern = str(Path(*parts[glob_start_index:]))
-                if pattern_search_folder.exists():
-                    for f in pattern_search_folder.rglob(remaining_pattern):
-                        if f.is_file():
-                            _add_file_to_results(matched_files, f, folder)
-        else:
-            matched_files = {}
-            for f in folder.glob(glob_pattern):
-                if f.is_file():
-                    _add_file_to_results(matched_files, f, folder)
-
+        # Keys are relative to the folder the pattern names before its first wildcard.
+        parts = Path(pattern).parts
+        literal = next((i for i, part in enumerate(parts[:-1]) if has_magic(part)), len(parts) - 1)
+        key_folder = search_folder.joinpath(*parts[:literal])
+
+        matched_files: dict[str, Path] = {}
+        for file_path in index.glob(search_folder, pattern):
+            key = (dest_location / file_path.relative_to(key_folder)).as_posix()
+            if logger:
+                logger.debug(f"Processing file {key}")
+            matched_files[key] = file_path
         return matched_files
 
-    files_dict: dict[str, bytes] = {}
+    files: dict[str, Path] = {}
 
     for file_info in file_patterns:
         pattern = file_info[0]
         dest_location = Path(file_info[1])
 
         # Try to find files in base_folder first
-        matched_files = _search_pattern_in_folder(base_folder, pattern)
+        matched_files = _search_pattern_in_folder(base_folder, pattern, dest_location)
 
         # If no files found and alternative_folder is provided, try there
         if not matched_files and alternative_folder is not None:
@@ -217,13 +205,13 @@ def collect_files_from_globs(
                 logger.debug(
                     f"No files found in {base_folder} for pattern {pattern}, trying alternative folder {alternative_folder}"
                 )
-            matched_files = _search_pattern_in_folder(alternative_folder, pattern)
+            matched_files = _search_pattern_in_folder(alternative_folder, pattern, dest_location)
             if matched_files and logger:
                 logger.warning(
                     t("mission_tools.alternative_folder", alt=alternative_folder, file=pattern, orig=base_folder)
                 )
 
-        # Add matched files to result
-        files_dict = files_dict | matched_files
+        # Add matched files to result; a later pattern's match replaces an earlier one's
+        files |= matched_files
 
-    return files_dict
+    return {key: resident_cache.read_bytes(file_path) for key, file_path in files.items()}
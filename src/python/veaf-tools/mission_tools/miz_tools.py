@@ -3,21 +3,29 @@ This module provides classes for reading and writing missions to and from .miz f
 """
 
 import contextlib
+import copy
 import dataclasses
+import hashlib
 import io
+import marshal
 import os
+import shutil
+import struct
 import tempfile
+import time
 import zipfile
-from collections.abc import Iterator
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import IO, Any
 
 import luadata
+from veaf_libs import parse_cache
 from veaf_libs.atomic_replace import atomic_replace
 from veaf_libs.logger import logger
 from veaf_libs.safe_zip import safe_extract_all, safe_read_member
 
+from mission_tools.group_index import GroupIndex
 from mission_tools.sequence_normalisation import HoleClosed, normalise_mission_sequences
 
 from .mission_constants import DEFAULT_SCRIPTS_LOCATION
@@ -53,6 +61,48 @@ def normalize_warehouses_airports(warehouses_content: dict[str, Any] | None) ->
         warehouses_content["airports"] = dict(enumerate(airports, start=1))
 
 
+#: The tables a mission is made of: component name (the Lua variable) → (archive member, attribute).
+MISSION_COMPONENTS: dict[str, tuple[str, str]] = {
+    "mission": ("mission", "mission_content"),
+    "options": ("options", "options_content"),
+    "theatre": ("theatre", "theatre_content"),
+    "warehouses": ("warehouses", "warehouses_content"),
+    "dictionary": (f"{DEFAULT_SCRIPTS_LOCATION}/dictionary", "dictionary_content"),
+    "mapResource": (f"{DEFAULT_SCRIPTS_LOCATION}/mapResource", "map_resource_content"),
+}
+
+
+def _fingerprint(content: Any) -> bytes | None:
+    """Return a structural hash of a parsed table, or ``None`` when it holds something not plain data.
+
+    ``marshal`` format 2 writes no back-references, so equal structures give equal bytes whatever
+    objects they share; dict order is part of it, as it is of the serialized text.
+    """
+    try:
+        data = marshal.dumps(content, 2)
+    except ValueError:
+        return None
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _file_stamp(path: Path) -> tuple[int, int] | None:
+    """Return ``(size, mtime_ns)`` of *path*, or ``None`` when it cannot be read."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+@dataclass(frozen=True)
+class _LoadedComponent:
+    """What a component looked like when it was read, and from which file."""
+
+    fingerprint: bytes
+    source: Path
+    stamp: tuple[int, int] | None
+
+
 @dataclass
 class Group:
     """Canonical representation of a DCS aircraft/helicopter group."""
@@ -101,43 +151,186 @@ class DcsMission:
     sequence_holes: list[HoleClosed] = dataclasses.field(default_factory=list)
     """Sequence tables whose keys were not a contiguous ``1..N`` and had to be closed on load."""
     missing_components: list = field(default_factory=list)
+    projection: frozenset[str] | None = None
+    """The only ``mission`` keys that were parsed (``read_miz(only=...)``), or ``None`` for all of them.
+
+    A projected mission is read-only: writing it back would drop every branch that was skipped."""
+    _loaded: dict[str, _LoadedComponent] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _dirty: set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    _group_index: GroupIndex | None = field(default=None, init=False, repr=False, compare=False)
+
+    # ------------------------------------------------------------------
+    # Dirty tracking: which tables changed since they were read
+    # ------------------------------------------------------------------
+
+    def mark_dirty(self, *components: str) -> None:
+        """Record that these components (all of them when none is named) changed since they were read.
+
+        Writers re-serialize a dirty component and copy a clean one from the file it was read from.
+        Marking is an optimisation and a safeguard, not a duty: a component nobody marked is still
+        compared with its fingerprint from load time, so an unmarked change is never lost.
+
+        Args:
+            components: Names from :data:`MISSION_COMPONENTS` — ``"mission"``, ``"warehouses"``…
+
+        Raises:
+            ValueError: on a name that is not a mission component.
+        """
+        unknown = sorted(set(components) - MISSION_COMPONENTS.keys())
+        if unknown:
+            raise ValueError(f"Unknown mission component(s) {unknown} (expected one of {list(MISSION_COMPONENTS)})")
+        self._dirty.update(components or MISSION_COMPONENTS)
+
+    def is_dirty(self, component: str) -> bool:
+        """Return whether *component* must be re-serialized to be written.
+
+        It is clean only when it was read from a file that has not changed since, nobody marked it,
+        and its content still has the fingerprint it had then.
+        """
+        loaded = self._loaded.get(component)
+        return loaded is None or not self._unchanged_in(component, loaded.source)
+
+    def is_unchanged(self) -> bool:
+        """Return whether the mission still is what its files hold, so it can stand for a fresh read.
+
+        Every table must be unchanged in memory since it was read or written, and every file it came
+        from unchanged on disk since; a member that was missing must still be missing. A projected
+        mission (``only``) is never a fresh read.
+        """
+        if self.projection is not None:
+            return False
+        root = _find_mission_root(self.file_path) if self.file_path.is_dir() else None
+        for component, (member, attribute) in MISSION_COMPONENTS.items():
+            loaded = self._loaded.get(component)
+            if loaded is None:
+                # Only a member that was missing is never recorded; any other table went unfingerprinted.
+                if getattr(self, attribute) is not None or (root is not None and (root / member).exists()):
+                    return False
+            elif _file_stamp(loaded.source) != loaded.stamp or loaded.stamp is None:
+                return False
+            elif not self._unchanged_since_read(component):
+                return False
+        return True
+
+    def _unchanged_in(self, component: str, source: Path) -> bool:
+        """Return whether *component* can be copied verbatim from *source* instead of being serialized."""
+        loaded = self._loaded.get(component)
+        if loaded is None or loaded.source != source:
+            return False
+        if loaded.stamp is None or _file_stamp(source) != loaded.stamp:
+            return False
+        return self._unchanged_since_read(component)
+
+    def _unchanged_since_read(self, component: str) -> bool:
+        """Return whether *component* still holds what was read, wherever it was read from."""
+        loaded = self._loaded.get(component)
+        if loaded is None or component in self._dirty:
+            return False
+        return _fingerprint(getattr(self, MISSION_COMPONENTS[component][1])) == loaded.fingerprint
+
+    def _record_all_loaded(
+        self, source_of: Callable[[str], Path], stamp_of: Callable[[str], tuple[int, int] | None]
+    ) -> None:
+        """Record every component as just read, each from the file *source_of* its archive member.
+
+        Called after the sequence normalisation: turning a contiguous table into a list serializes the
+        same, but closing a hole does not, so a mission that had holes stays dirty.
+        """
+        for component, (member, _attribute) in MISSION_COMPONENTS.items():
+            self._record_loaded(component, source_of(member), stamp_of(member))
+        if self.sequence_holes:
+            self.mark_dirty("mission")
+
+    def _record_loaded(self, component: str, source: Path, stamp: tuple[int, int] | None) -> None:
+        """Fingerprint *component* as it now stands, as the content of *source* when it had *stamp*."""
+        self._dirty.discard(component)
+        content = getattr(self, MISSION_COMPONENTS[component][1])
+        fingerprint = _fingerprint(content)
+        if content is None or fingerprint is None:
+            self._loaded.pop(component, None)
+            return
+        self._loaded[component] = _LoadedComponent(fingerprint, source, stamp)
+
+    def branch(self, mission_keys: Iterable[str] = (), components: Iterable[str] = ()) -> "DcsMission":
+        """Return a copy to edit that shares every table with this mission but the ones named.
+
+        The copy owns the top level of ``mission_content``, so replacing a key there (``start_time``, a
+        briefing field) never reaches this mission; the ``mission`` branches in *mission_keys* and the
+        whole *components* are deep-copied, and they are the only ones it may change in place. A
+        weather variant thus costs a copy of the weather, not of the mission. The load-time
+        fingerprints come along: whatever the copy leaves alone is still written verbatim.
+
+        Args:
+            mission_keys: Keys of ``mission_content`` the copy will edit in place — ``"weather"``…
+            components: Names from :data:`MISSION_COMPONENTS` the copy will edit in place.
+
+        Raises:
+            ValueError: on a name that is not a mission component.
+        """
+        components = set(components)
+        unknown = sorted(components - MISSION_COMPONENTS.keys())
+        if unknown:
+            raise ValueError(f"Unknown mission component(s) {unknown} (expected one of {list(MISSION_COMPONENTS)})")
+        result = copy.copy(self)
+        result.sequence_holes = list(self.sequence_holes)
+        result.missing_components = list(self.missing_components)
+        result._loaded = dict(self._loaded)
+        result._dirty = set(self._dirty)
+        result._group_index = None
+        if self.mission_content is not None:
+            result.mission_content = dict(self.mission_content)
+            for key in mission_keys:
+                if key in result.mission_content:
+                    result.mission_content[key] = copy.deepcopy(result.mission_content[key])
+        for component in components:
+            attribute = MISSION_COMPONENTS[component][1]
+            setattr(result, attribute, copy.deepcopy(getattr(self, attribute)))
+        return result
+
+    # ------------------------------------------------------------------
+    # Groups and units
+    # ------------------------------------------------------------------
+
+    def group_index(self) -> GroupIndex:
+        """Return the index of the mission's groups and units, built on first use and kept.
+
+        The index follows the groups added through :func:`mission_tools.group_insertion.add_group`
+        (given this index) and removed through :meth:`GroupIndex.remove`. Code changing the groups in
+        any other way calls :meth:`invalidate_group_index`; replacing ``mission_content`` or its
+        ``coalition`` table is noticed without it.
+        """
+        content = self.mission_content or {}
+        index = self._group_index
+        if index is None or index.mission_content is not content or index.coalitions is not content.get("coalition"):
+            index = self._group_index = GroupIndex(content)
+        return index
+
+    def invalidate_group_index(self) -> None:
+        """Forget the group index: the next :meth:`group_index` call walks the mission again."""
+        self._group_index = None
 
     def iter_groups(self) -> Iterator[Group]:
         """Iterate over all aircraft/helicopter groups in the mission.
 
         Yields Group instances for every group found under
-        coalition → country → {helicopter,plane} → group.
+        coalition → country → {helicopter,plane} → group, from :meth:`group_index`.
         """
         if not self.mission_content:
             return
-        coalitions = self.mission_content.get("coalition")
-        if not coalitions:
-            return
-        for coalition_name, coalition_data in coalitions.items():
-            countries = coalition_data.get("country") or []
-            for country_dict in countries:
-                country_name = country_dict.get("name", "")
-                for aircraft_type in ("helicopter", "plane"):
-                    aircraft_data = country_dict.get(aircraft_type)
-                    if not aircraft_data:
+        for country_groups in self.group_index().by_country():
+            for aircraft_type in ("helicopter", "plane"):
+                for entry in country_groups:
+                    if entry.category != aircraft_type:
                         continue
-                    groups_list = aircraft_data.get("group") or []
-                    for group_dict in groups_list:
-                        group = Group(
-                            group_dcs=group_dict,
-                            aircraft_type=aircraft_type,
-                            country=country_name,
-                            coalition=coalition_name,
-                        )
-                        group.name = group_dict.get("name")
-                        units_list = group_dict.get("units") or []
-                        for unit in units_list:
-                            if unit_type := unit.get("type", ""):
-                                group.unit_type = unit_type
-                            if unit.get("skill", "") in ("Client", "Player"):
-                                group.human_pilot = True
-                                break
-                        yield group
+                    yield Group(
+                        group_dcs=entry.group,
+                        aircraft_type=aircraft_type,
+                        country=entry.country.get("name", ""),
+                        coalition=entry.coalition,
+                        human_pilot=entry.human_pilot,
+                        name=entry.group.get("name"),
+                        unit_type=entry.unit_type,
+                    )
 
     # ------------------------------------------------------------------
     # Convenience accessors (DEEP-002)
@@ -151,6 +344,7 @@ class DcsMission:
         """Replace the weather dict in mission_content."""
         if self.mission_content is not None:
             self.mission_content["weather"] = data
+            self.mark_dirty("mission")
 
     def get_options(self) -> dict | None:
         """Return options_content."""
@@ -159,63 +353,89 @@ class DcsMission:
     def set_options(self, data: dict) -> None:
         """Replace options_content."""
         self.options_content = data
+        self.mark_dirty("options")
 
 
-def read_miz(miz_file_path: Path) -> DcsMission:
-    """Load the mission from the .miz file (unzip it and parse the lua files)."""
+def read_miz(miz_file_path: Path, only: Iterable[str] | None = None) -> DcsMission:
+    """Load the mission from the .miz file (unzip it and parse the lua files).
 
-    def unserialize(
-        file: IO[bytes], keep_as_dict: list[str] | None = None, all_is_dict: bool = False
-    ) -> dict[str, Any]:
-        with io.TextIOWrapper(file, encoding="utf-8") as wrapper:  # type: ignore[arg-type]
-            return luadata.unserialize(wrapper.read(), keep_as_dict=keep_as_dict, all_is_dict=all_is_dict)  # type: ignore[return-value]
+    Each Lua member is parsed through :mod:`veaf_libs.parse_cache`, so with the cache enabled a
+    member whose bytes were already parsed is loaded from VEAF_HOME instead.
 
-    def read_file_in_archive(
-        zip_file: zipfile.ZipFile,
-        file_name: str,
-        missing_components: list[str],
-        keep_as_dict: list[str] | None = None,
-        not_lua: bool = False,
-    ) -> dict[str, Any] | str | None:
-        if file_name in zip_file.namelist():
-            # VMR-009: capped read. A `.miz` is untrusted input, and this path pulls the
-            # member straight into memory, so an unbounded `.read()` here is a zip bomb
-            # that never has to touch the disk `safe_extract_all` protects.
-            raw = safe_read_member(zip_file, file_name)
-            if not_lua:
-                return raw.decode("utf-8")
-            return unserialize(io.BytesIO(raw), keep_as_dict=keep_as_dict)
-        else:
-            missing_components.append(file_name)
-            return None
+    Args:
+        miz_file_path: The ``.miz`` to read.
+        only: When given, parse only these keys of the ``mission`` table (e.g. ``["coalition",
+            "triggers"]``) and skip the rest unparsed — for read-only queries. The mission is then
+            flagged in :attr:`DcsMission.projection` and cannot be written back.
+    """
 
-    result = DcsMission(file_path=miz_file_path)
+    projection = None if only is None else frozenset(only)
+    result = DcsMission(file_path=miz_file_path, projection=projection)
 
+    # Taken before reading, so a file replaced while it is being read never passes for unchanged.
+    stamp = _file_stamp(miz_file_path)
     with zipfile.ZipFile(miz_file_path, "r") as miz:
-        result.mission_content = read_file_in_archive(  # type: ignore[assignment]
-            miz, "mission", result.missing_components, keep_as_dict=["trig", "trigrules"]
-        )
-        result.options_content = read_file_in_archive(  # type: ignore[assignment]
-            miz, "options", result.missing_components
-        )
-        result.theatre_content = read_file_in_archive(  # type: ignore[assignment]
-            miz, "theatre", result.missing_components, not_lua=True
-        )
-        result.warehouses_content = read_file_in_archive(  # type: ignore[assignment]
-            miz, "warehouses", result.missing_components
-        )
-        normalize_warehouses_airports(result.warehouses_content)
-        result.dictionary_content = read_file_in_archive(  # type: ignore[assignment]
-            miz, f"{DEFAULT_SCRIPTS_LOCATION}/dictionary", result.missing_components
-        )
-        result.map_resource_content = read_file_in_archive(  # type: ignore[assignment]
-            miz, f"{DEFAULT_SCRIPTS_LOCATION}/mapResource", result.missing_components
-        )
+        names = set(miz.namelist())
+        # VMR-009: capped read. A `.miz` is untrusted input, and this path pulls the
+        # member straight into memory, so an unbounded `.read()` here is a zip bomb
+        # that never has to touch the disk `safe_extract_all` protects.
+        _read_components(result, lambda name: safe_read_member(miz, name) if name in names else None)
+
+    if projection is None:
+        result._record_all_loaded(lambda _member: miz_file_path, lambda _member: stamp)
+    return result
 
-    result.sequence_holes = normalise_mission_sequences(result.mission_content)
+
+def read_members(files: Mapping[str, bytes], miz_file_path: Path) -> DcsMission:
+    """Parse a mission from archive members held in memory, ``arcname -> bytes``.
+
+    What :func:`read_miz` would return for a ``.miz`` holding *files*, without the archive: the
+    mission builder collects its members in memory and parses them from there, instead of zipping
+    them only to unzip them straight away. Nothing on disk holds the mission yet, so :func:`write_miz`
+    serializes every table; :func:`create_miz` writes the member of a table nobody changed as it came.
+
+    Args:
+        files: The archive members, as :func:`create_miz` takes them.
+        miz_file_path: The ``.miz`` the mission is meant for (:attr:`DcsMission.file_path`).
+    """
+    result = DcsMission(file_path=miz_file_path)
+    _read_components(result, files.get)
+    # No stamp: nothing on disk holds these tables yet, but create_miz can still tell the ones
+    # nobody changed and write their members as they came.
+    result._record_all_loaded(lambda _member: miz_file_path, lambda _member: None)
     return result
 
 
+def _read_components(result: DcsMission, read_member: Callable[[str], bytes | None]) -> None:
+    """Parse every table of a mission into *result*, each from what *read_member* returns for its member.
+
+    A member *read_member* returns ``None`` for is listed in :attr:`DcsMission.missing_components`.
+    """
+
+    def read_component(
+        file_name: str, keep_as_dict: list[str] | None = None, only: frozenset[str] | None = None
+    ) -> Any:
+        raw = read_member(file_name)
+        if raw is None:
+            result.missing_components.append(file_name)
+            return None
+        return parse_cache.unserialize(raw, keep_as_dict=keep_as_dict, only=only)
+
+    result.mission_content = read_component("mission", keep_as_dict=["trig", "trigrules"], only=result.projection)
+    result.options_content = read_component("options")
+    theatre = read_member("theatre")
+    if theatre is None:
+        result.missing_components.append("theatre")
+        result.theatre_content = None
+    else:
+        result.theatre_content = theatre.decode("utf-8")
+    result.warehouses_content = read_component("warehouses")
+    normalize_warehouses_airports(result.warehouses_content)
+    result.dictionary_content = read_component(f"{DEFAULT_SCRIPTS_LOCATION}/dictionary")
+    result.map_resource_content = read_component(f"{DEFAULT_SCRIPTS_LOCATION}/mapResource")
+    result.sequence_holes = normalise_mission_sequences(result.mission_content)
+
+
 def _find_mission_root(folder_path: Path) -> Path | None:
     """Locate the directory holding the loose ``mission`` file.
 
@@ -234,7 +454,7 @@ def _find_mission_root(folder_path: Path) -> Path | None:
     return None
 
 
-def read_mission_folder(folder_path: Path) -> DcsMission:
+def read_mission_folder(folder_path: Path, only: Iterable[str] | None = None) -> DcsMission:
     """Load a mission from an extracted folder (no zip, no Lua execution).
 
     Reads the loose ``mission`` / ``options`` / ``warehouses`` / ``theatre`` /
@@ -245,6 +465,7 @@ def read_mission_folder(folder_path: Path) -> DcsMission:
     Args:
         folder_path: A directory holding the loose mission files, either at its root or under
             ``src/mission/``.
+        only: When given, parse only these keys of the ``mission`` table, as :func:`read_miz` does.
 
     Returns:
         The parsed :class:`DcsMission`.
@@ -256,17 +477,27 @@ def read_mission_folder(folder_path: Path) -> DcsMission:
     if root is None:
         raise FileNotFoundError(f"No 'mission' file found under {folder_path} (looked in '.' and 'src/mission')")
 
-    result = DcsMission(file_path=folder_path)
+    projection = None if only is None else frozenset(only)
+    result = DcsMission(file_path=folder_path, projection=projection)
+    stamps: dict[str, tuple[int, int] | None] = {}
 
-    def read_loose_file(rel_path: str, *, keep_as_dict: list[str] | None = None, not_lua: bool = False) -> Any:
+    def read_loose_file(
+        rel_path: str,
+        *,
+        keep_as_dict: list[str] | None = None,
+        not_lua: bool = False,
+        only: frozenset[str] | None = None,
+    ) -> Any:
         path = root / rel_path
         if not path.is_file():
             result.missing_components.append(rel_path)
             return None
-        text = path.read_text(encoding="utf-8")
-        return text if not_lua else luadata.unserialize(text, keep_as_dict=keep_as_dict)
+        stamps[rel_path] = _file_stamp(path)
+        if not_lua:
+            return path.read_text(encoding="utf-8")
+        return parse_cache.unserialize(path.read_bytes(), keep_as_dict=keep_as_dict, only=only)
 
-    result.mission_content = read_loose_file("mission", keep_as_dict=["trig", "trigrules"])
+    result.mission_content = read_loose_file("mission", keep_as_dict=["trig", "trigrules"], only=projection)
     result.options_content = read_loose_file("options")
     result.theatre_content = read_loose_file("theatre", not_lua=True)
     result.warehouses_content = read_loose_file("warehouses")
@@ -275,9 +506,165 @@ def read_mission_folder(folder_path: Path) -> DcsMission:
     result.map_resource_content = read_loose_file(f"{DEFAULT_SCRIPTS_LOCATION}/mapResource")
 
     result.sequence_holes = normalise_mission_sequences(result.mission_content)
+    if projection is None:
+        result._record_all_loaded(lambda member: root / member, stamps.get)
     return result
 
 
+def _dump_lua(stream: IO[str], content: Any, variable_name: str | None = None) -> None:
+    """Stream ``<variable_name> = \n<lua>`` into *stream*, chunk by chunk.
+
+    The Lua text of a mission runs to megabytes; ``luadata.dump`` writes it out as it is produced
+    instead of building the whole string first, so it never sits in memory next to the archive.
+    """
+    if variable_name:
+        stream.write(f"{variable_name} = \n")
+    luadata.dump(content, stream, indent="  ", indent_level=0, always_provide_keyname=True, sort=True)
+
+
+def _dump_lua_file(path: Path, content: Any, variable_name: str) -> None:
+    """Write ``<variable_name> = <lua>`` to *path* through a temp file beside it.
+
+    The file is only replaced once the table is fully serialized: streaming into the file itself
+    would truncate the mission's source first, and a failing dump would leave it half written.
+    """
+    fd, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    path_to_clean_up: str | None = temp_name
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as stream:
+            _dump_lua(stream, content, variable_name)
+        if path.exists():
+            shutil.copymode(path, temp_name)  # mkstemp creates it 0600
+        atomic_replace(temp_name, path)
+        path_to_clean_up = None
+    finally:
+        if path_to_clean_up:
+            with contextlib.suppress(OSError):
+                os.unlink(path_to_clean_up)
+
+
+def as_read_back(value: Any) -> Any:
+    """Return a copy of *value* in the shape ``read_miz`` gives it back once it has been written.
+
+    Tables keyed ``1..N`` come back as lists and keys come back sorted. A step that adds a table
+    built elsewhere (from YAML, say) to an :class:`InMemoryMission` passes it through here, so the
+    steps after it see what they would have read from the file.
+    """
+    return luadata.unserialize(f"__value = {luadata.serialize(value, always_provide_keyname=True, sort=True)}")
+
+
+def _open_text_member(zip_file: zipfile.ZipFile, file_name: str) -> IO[str]:
+    """Open a new archive member for text writing, with the metadata ``ZipFile.writestr`` would give it."""
+    zinfo = zipfile.ZipInfo(file_name, date_time=time.localtime(time.time())[:6])
+    zinfo.compress_type = zip_file.compression
+    zinfo.external_attr = 0o600 << 16
+    return io.TextIOWrapper(zip_file.open(zinfo, "w"), encoding="utf-8", newline="")
+
+
+#: Layout of a zip local file header; fields 10 and 11 are the file-name and extra-field lengths.
+#: ``None`` on a ``zipfile`` that no longer exposes it, which turns the raw copy off.
+_FILE_HEADER_FORMAT: str | None = getattr(zipfile, "structFileHeader", None)
+_LOCAL_FILE_HEADER = struct.Struct(_FILE_HEADER_FORMAT) if _FILE_HEADER_FORMAT else None
+#: The ``ZipFile`` internals the raw copy drives, as CPython 3.11 to 3.14 name them.
+_RAW_COPY_INTERNALS = ("_lock", "_seekable", "_writecheck", "_didModify", "start_dir")
+_FLAG_ENCRYPTED = 0x01
+_FLAG_DATA_DESCRIPTOR = 0x08
+_FLAG_UTF8_NAME = 0x800
+_COPY_CHUNK = 1024 * 1024
+
+
+def _copy_member(zip_read: zipfile.ZipFile, zip_write: zipfile.ZipFile, file_name: str) -> None:
+    """Copy one member from *zip_read* to *zip_write* as it is stored: compressed bytes, CRC and sizes.
+
+    The members a write does not touch — community scripts, sounds, kneeboard PNGs, megabytes of
+    them — used to go through ``writestr(name, read(name))``, inflated and deflated again on every
+    write of every build. Copying the stored bytes costs a read and a write, and leaves the member
+    exactly as it was, down to its date and compression.
+
+    ``zipfile`` has no public call for this, so :func:`_copy_member_raw` relies on its internals.
+    Where they are missing (a Python that renamed them), or for an encrypted member (which ``read``
+    cannot decrypt either, so it fails the way it always has), the member goes through the public
+    ``writestr`` with the source's metadata: slower, same content.
+    """
+    info = zip_read.getinfo(file_name)
+    if info.flag_bits & _FLAG_ENCRYPTED or not _can_copy_raw(zip_write):
+        zip_write.writestr(_copied_info(info), zip_read.read(file_name))
+        return
+    _copy_member_raw(zip_read, zip_write, info)
+
+
+def _can_copy_raw(zip_write: zipfile.ZipFile) -> bool:
+    """Tell whether this ``zipfile`` still has everything :func:`_copy_member_raw` uses."""
+    return (
+        _LOCAL_FILE_HEADER is not None
+        and hasattr(zipfile, "stringFileHeader")
+        and all(hasattr(zip_write, name) for name in _RAW_COPY_INTERNALS)
+    )
+
+
+def _copied_info(info: zipfile.ZipInfo) -> zipfile.ZipInfo:
+    """Return a new :class:`zipfile.ZipInfo` carrying *info*'s name, date, compression and attributes."""
+    zinfo = zipfile.ZipInfo(info.filename, info.date_time)
+    zinfo.compress_type = info.compress_type
+    zinfo.create_system = info.create_system
+    zinfo.internal_attr = info.internal_attr
+    zinfo.external_attr = info.external_attr
+    zinfo.comment = info.comment
+    return zinfo
+
+
+def _copy_member_raw(zip_read: zipfile.ZipFile, zip_write: zipfile.ZipFile, info: zipfile.ZipInfo) -> None:
+    """Copy *info*'s stored bytes from *zip_read* into *zip_write*; only called once :func:`_can_copy_raw`.
+
+    The destination side mirrors ``ZipFile.mkdir``: a header from a :class:`zipfile.ZipInfo`
+    carrying the source's CRC and sizes, then the data. The source side reads the local header the
+    way ``ZipFile.open`` does, and refuses a header whose name disagrees with the central directory,
+    as ``ZipFile.open`` would.
+    """
+    assert _LOCAL_FILE_HEADER is not None
+    file_name = info.filename
+    source = zip_read.fp
+    assert source is not None
+    source.seek(info.header_offset)
+    header = _LOCAL_FILE_HEADER.unpack(source.read(_LOCAL_FILE_HEADER.size))
+    if header[0] != zipfile.stringFileHeader:  # type: ignore[attr-defined]
+        raise zipfile.BadZipFile(f"Bad magic number for file header of {file_name}")
+    local_name = source.read(header[10]).decode(
+        "utf-8" if header[3] & _FLAG_UTF8_NAME else (getattr(zip_read, "metadata_encoding", None) or "cp437")
+    )
+    if local_name != info.orig_filename:
+        raise zipfile.BadZipFile(f"File name in directory {info.orig_filename!r} and header {local_name!r} differ.")
+    source.seek(header[11], os.SEEK_CUR)
+
+    zinfo = _copied_info(info)
+    # The sizes and CRC go in the local header, so no data descriptor follows the data.
+    zinfo.flag_bits = info.flag_bits & ~_FLAG_DATA_DESCRIPTOR
+    zinfo.CRC = info.CRC
+    zinfo.compress_size = info.compress_size
+    zinfo.file_size = info.file_size
+    zip64 = zinfo.file_size > zipfile.ZIP64_LIMIT or zinfo.compress_size > zipfile.ZIP64_LIMIT
+
+    with zip_write._lock:  # type: ignore[attr-defined]
+        target = zip_write.fp
+        assert target is not None
+        if zip_write._seekable:  # type: ignore[attr-defined]
+            target.seek(zip_write.start_dir)
+        zinfo.header_offset = target.tell()
+        zip_write._writecheck(zinfo)  # type: ignore[attr-defined]
+        zip_write._didModify = True  # type: ignore[attr-defined]
+        target.write(zinfo.FileHeader(zip64))
+        remaining = info.compress_size
+        while remaining:
+            chunk = source.read(min(remaining, _COPY_CHUNK))
+            if not chunk:
+                raise zipfile.BadZipFile(f"Truncated data for {file_name}")
+            target.write(chunk)
+            remaining -= len(chunk)
+        zip_write.filelist.append(zinfo)
+        zip_write.NameToInfo[zinfo.filename] = zinfo
+        zip_write.start_dir = target.tell()
+
+
 def write_mission_folder(mission: DcsMission, folder_path: Path) -> Path:
     """Serialize ``mission_content`` back to a folder's loose ``mission`` file.
 
@@ -290,7 +677,8 @@ def write_mission_folder(mission: DcsMission, folder_path: Path) -> Path:
     the table, called this, and reported ``durable: True`` while the file on disk never changed —
     an airfield's coalition lives in ``warehouses``, not in ``mission`` (FIX-EMPTY-WAREHOUSES). The
     file is only rewritten when the folder already has one, so this never invents a member the
-    mission did not carry.
+    mission did not carry. A table unchanged since it was read from that same file (see
+    :meth:`DcsMission.mark_dirty`) is not rewritten at all.
 
     Args:
         mission: The mission whose tables to write.
@@ -301,49 +689,101 @@ def write_mission_folder(mission: DcsMission, folder_path: Path) -> Path:
 
     Raises:
         FileNotFoundError: when no ``mission`` file can be located under *folder_path*.
-        ValueError: when `mission.mission_content` is ``None``.
+        ValueError: when `mission.mission_content` is ``None``, or the mission was read with ``only``.
     """
     root = _find_mission_root(folder_path)
     if root is None:
         raise FileNotFoundError(f"No 'mission' file found under {folder_path} (looked in '.' and 'src/mission')")
     if mission.mission_content is None:
         raise ValueError("mission_content is None — nothing to write")
-    lua_content = luadata.serialize(
-        mission.mission_content, indent="  ", indent_level=0, always_provide_keyname=True, sort=True
-    )
+    _refuse_projection(mission)
     mission_file = root / "mission"
-    mission_file.write_text(f"mission = \n{lua_content}", encoding="utf-8")
+    if not mission._unchanged_in("mission", mission_file):
+        _dump_lua_file(mission_file, mission.mission_content, "mission")
+        mission._record_loaded("mission", mission_file, _file_stamp(mission_file))
 
     warehouses_file = root / "warehouses"
-    if mission.warehouses_content is not None and warehouses_file.is_file():
-        warehouses_lua = luadata.serialize(
-            mission.warehouses_content, indent="  ", indent_level=0, always_provide_keyname=True, sort=True
-        )
-        warehouses_file.write_text(f"warehouses = \n{warehouses_lua}", encoding="utf-8")
+    if (
+        mission.warehouses_content is not None
+        and warehouses_file.is_file()
+        and not mission._unchanged_in("warehouses", warehouses_file)
+    ):
+        _dump_lua_file(warehouses_file, mission.warehouses_content, "warehouses")
+        mission._record_loaded("warehouses", warehouses_file, _file_stamp(warehouses_file))
 
     return mission_file
 
 
-def create_miz(miz_file_path: Path, files: dict[str, bytes]) -> Path:
-    """Create an mission in a .miz file with new data (zip it)."""
+def create_miz(miz_file_path: Path, files: dict[str, bytes], mission: DcsMission | None = None) -> Path:
+    """Create an mission in a .miz file with new data (zip it).
+
+    When *mission* is given — parsed from these same *files* by :func:`read_members`, then edited —
+    its tables are written in place of the members they came from, so the archive is zipped once,
+    already holding the final mission. The mission is then recorded as read from it: a later
+    :func:`write_miz` copies the tables nobody changed since instead of serializing them again.
+    """
 
     # Normalize files to avoid None errors
     files = files or {}
 
     if miz_file_path:
-        with zipfile.ZipFile(miz_file_path, "w") as zip_write:
+        components = _components_by_member() if mission is not None else {}
+        with zipfile.ZipFile(miz_file_path, "w", zipfile.ZIP_DEFLATED) as zip_write:
             for file_name, file_content in files.items():
-                zip_write.writestr(zinfo_or_arcname=str(file_name), data=file_content)
+                component = components.get(file_name)
+                if (
+                    mission is not None
+                    and component
+                    and getattr(mission, MISSION_COMPONENTS[component][1])
+                    and not mission._unchanged_since_read(component)
+                ):
+                    _write_component(zip_write, mission, component)
+                else:
+                    zip_write.writestr(zinfo_or_arcname=str(file_name), data=file_content)
+        if mission is not None:
+            mission.file_path = miz_file_path
+            stamp = _file_stamp(miz_file_path)
+            for component in MISSION_COMPONENTS:
+                mission._record_loaded(component, miz_file_path, stamp)
 
     return miz_file_path
 
 
+def _components_by_member() -> dict[str, str]:
+    """Return the archive member → component name map of :data:`MISSION_COMPONENTS`."""
+    return {member: component for component, (member, _attribute) in MISSION_COMPONENTS.items()}
+
+
+def _write_component(zip_file: zipfile.ZipFile, mission: DcsMission, component: str) -> None:
+    """Serialize one table of *mission* into its archive member; ``theatre`` is plain text."""
+    member, attribute = MISSION_COMPONENTS[component]
+    content = getattr(mission, attribute)
+    if component == "theatre":
+        zip_file.writestr(member, content)
+        return
+    with _open_text_member(zip_file, member) as stream:
+        _dump_lua(stream, content, component)
+
+
+def _refuse_projection(mission: DcsMission) -> None:
+    """Refuse to write a mission read with ``only``: the branches it skipped would be lost."""
+    if mission.projection is not None:
+        raise ValueError(
+            f"{mission.file_path} was read with only={sorted(mission.projection)}; "
+            "a projected mission is read-only and cannot be written back"
+        )
+
+
 def write_miz(mission: DcsMission, miz_file_path: Path | None, additional_files: dict | None = None) -> DcsMission:
-    """Update an existing mission in a .miz file with new data (zip it)."""
+    """Update an existing mission in a .miz file with new data (zip it).
 
-    def serialize(zip_file: zipfile.ZipFile, content: Any, file_name: str, variable_name: str | None = None) -> None:
-        lua_content = luadata.serialize(content, indent="  ", indent_level=0, always_provide_keyname=True, sort=True)  # type: ignore[arg-type]
-        zip_file.writestr(file_name, f"{variable_name} = \n{lua_content}" if variable_name else lua_content)
+    A component that is unchanged since it was read from ``mission.file_path`` (see
+    :meth:`DcsMission.mark_dirty`) is copied from that archive as-is instead of being serialized again.
+
+    Raises:
+        ValueError: when the mission was read with ``only`` (see :attr:`DcsMission.projection`).
+    """
+    _refuse_projection(mission)
 
     if not miz_file_path:
         miz_file_path = mission.file_path
@@ -368,6 +808,11 @@ def write_miz(mission: DcsMission, miz_file_path: Path | None, additional_files:
     # something on disk that we own and must remove?
     path_to_clean_up: str | None = temp_name
 
+    # Clean tables are what the source archive already holds: copying them is byte-identical to the
+    # read, and spares the serializer the bulk of a write.
+    clean = {component for component in MISSION_COMPONENTS if mission._unchanged_in(component, mission.file_path)}
+    components = _components_by_member()
+
     try:
         try:
             # Read all files from the original mission file
@@ -377,67 +822,18 @@ def write_miz(mission: DcsMission, miz_file_path: Path | None, additional_files:
                 # Copy all files except the ones we're updating
                 with zipfile.ZipFile(temp_zip_path, "w", zipfile.ZIP_DEFLATED) as zip_write:
                     for file_name in file_list:
-                        if file_name == "mission":
-                            if mission.mission_content:
-                                serialize(
-                                    zip_file=zip_write,
-                                    content=mission.mission_content,
-                                    file_name="mission",
-                                    variable_name="mission",
-                                )
-                            else:
-                                zip_write.writestr(file_name, zip_read.read(file_name))
-                        elif file_name == "options":
-                            if mission.options_content:
-                                serialize(
-                                    zip_file=zip_write,
-                                    content=mission.options_content,
-                                    file_name="options",
-                                    variable_name="options",
-                                )
-                            else:
-                                zip_write.writestr(file_name, zip_read.read(file_name))
-                        elif file_name == "theatre":
-                            if mission.theatre_content:
-                                zip_write.writestr("theatre", mission.theatre_content)
+                        component = components.get(file_name)
+                        if component:
+                            if getattr(mission, MISSION_COMPONENTS[component][1]) and component not in clean:
+                                _write_component(zip_write, mission, component)
                             else:
-                                zip_write.writestr(file_name, zip_read.read(file_name))
-                        elif file_name == "warehouses":
-                            if mission.warehouses_content:
-                                serialize(
-                                    zip_file=zip_write,
-                                    content=mission.warehouses_content,
-                                    file_name="warehouses",
-                                    variable_name="warehouses",
-                                )
-                            else:
-                                zip_write.writestr(file_name, zip_read.read(file_name))
-                        elif file_name == f"{DEFAULT_SCRIPTS_LOCATION}/dictionary":
-                            if mission.dictionary_content:
-                                serialize(
-                                    zip_file=zip_write,
-                                    content=mission.dictionary_content,
-                                    file_name=f"{DEFAULT_SCRIPTS_LOCATION}/dictionary",
-                                    variable_name="dictionary",
-                                )
-                            else:
-                                zip_write.writestr(file_name, zip_read.read(file_name))
-                        elif file_name == f"{DEFAULT_SCRIPTS_LOCATION}/mapResource":
-                            if mission.map_resource_content:
-                                serialize(
-                                    zip_file=zip_write,
-                                    content=mission.map_resource_content,
-                                    file_name=f"{DEFAULT_SCRIPTS_LOCATION}/mapResource",
-                                    variable_name="mapResource",
-                                )
-                            else:
-                                zip_write.writestr(file_name, zip_read.read(file_name))
+                                _copy_member(zip_read, zip_write, file_name)
                         elif file_name in additional_files:
                             # Skip it - will be added from additional_files
                             pass
                         else:
-                            # Copy existing file as-is
-                            zip_write.writestr(file_name, zip_read.read(file_name))
+                            # Copy existing file as-is, still compressed
+                            _copy_member(zip_read, zip_write, file_name)
 
                     # Add the additional files
                     for additional_file_name, additional_file_content in additional_files.items():
@@ -462,9 +858,71 @@ def write_miz(mission: DcsMission, miz_file_path: Path | None, additional_files:
             with contextlib.suppress(OSError):
                 os.unlink(path_to_clean_up)
 
+    if miz_file_path == mission.file_path:
+        # The archive now holds exactly what the mission holds.
+        stamp = _file_stamp(miz_file_path)
+        for component in MISSION_COMPONENTS:
+            mission._record_loaded(component, miz_file_path, stamp)
     return mission
 
 
+@dataclass
+class InMemoryMission:
+    """A ``.miz`` held in memory while several build steps edit it, and written once at the end.
+
+    In file mode every injector reads the ``.miz``, changes it and writes it back: six steps are six
+    full unzip + parse + serialize + zip round trips of the same file. A worker given an
+    ``InMemoryMission`` edits :attr:`mission` in place and hands the archive members it would have
+    added to :meth:`add_files`; :meth:`write` then produces the ``.miz`` in one pass.
+    """
+
+    mission: DcsMission
+    additional_files: dict[str, bytes] = field(default_factory=dict)
+    """Archive members to add (or replace) on :meth:`write`, ``arcname -> bytes``."""
+    pending_members: dict[str, bytes] | None = None
+    """The members of a ``.miz`` not written yet (see :meth:`from_members`), or ``None`` once it is."""
+
+    @classmethod
+    def read(cls, miz_file_path: Path) -> "InMemoryMission":
+        """Parse *miz_file_path* once, for the steps that follow."""
+        return cls(mission=read_miz(miz_file_path))
+
+    @classmethod
+    def from_members(cls, miz_file_path: Path, files: dict[str, bytes]) -> "InMemoryMission":
+        """Parse the mission of a ``.miz`` that is not written yet, from its members collected in memory.
+
+        The first :meth:`write` zips *files* with the edited tables in place of the ones they held.
+        """
+        return cls(mission=read_members(files, miz_file_path), pending_members=dict(files))
+
+    @property
+    def file_path(self) -> Path:
+        """The ``.miz`` the mission was read from, and is written back to by default."""
+        return self.mission.file_path
+
+    def add_files(self, files: dict[str, bytes]) -> None:
+        """Queue archive members for :meth:`write`; a later step's member wins over an earlier one's."""
+        self.additional_files.update(files)
+
+    def write(self, miz_file_path: Path | None = None) -> Path:
+        """Write the mission and the queued members to *miz_file_path* (default: where it was read).
+
+        Returns:
+            The path of the ``.miz`` written.
+        """
+        target = miz_file_path or self.file_path
+        if self.pending_members is not None:
+            create_miz(target, self.pending_members | self.additional_files, mission=self.mission)
+            self.pending_members = None
+            self.additional_files = {}
+            return target
+        write_miz(mission=self.mission, miz_file_path=target, additional_files=self.additional_files)
+        if target == self.file_path:
+            # They are in the archive now: a second write must not need them again.
+            self.additional_files = {}
+        return target
+
+
 def extract_miz(miz_file_path: Path, extracted_folder_path: Path):
     """Extract the mission from the .miz file (unzip it)."""
 
@@ -512,7 +970,7 @@ def rewrite_miz_members(miz_file_path: Path, replacements: dict[str, bytes]) ->
                         if name in replacements:
                             zip_write.writestr(name, replacements[name])
                         else:
-                            zip_write.writestr(name, zip_read.read(name))
+                            _copy_member(zip_read, zip_write, name)
                     for name, content in replacements.items():
                         if name not in existing:
                             zip_write.writestr(name, content)
@@ -17,8 +17,7 @@ from __future__ import annotations
 
 from typing import Any
 
-import yaml
-from veaf_libs.bundled_data import read_bundled_text
+from veaf_libs.bundled_data import load_bundled_data
 
 _BANDS = ("uhf", "vhf", "fm")
 
@@ -71,10 +70,9 @@ def load_airfield_catalog(theatre: str | None) -> dict[str, dict[str, Any]]:
     if not theatre:
         return {}
     try:
-        raw = read_bundled_text("veaf_libs", "data", "airfield-frequencies.yaml")
+        data = load_bundled_data("veaf_libs", "data", "airfield-frequencies.yaml") or {}
     except (FileNotFoundError, OSError):
         return {}
-    data = yaml.safe_load(raw) or {}
     airfields = (data.get("theatres") or {}).get(theatre) or {}
     return {
         name: {"title": name, "freqs": {b: v for b, v in bands.items() if b in _BANDS}}
@@ -7,7 +7,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from mission_tools import Group, write_miz
+from mission_tools import Group, InMemoryMission, as_read_back, write_miz
 from veaf_libs.group_injector_worker import GroupInjectorWorker
 from veaf_libs.i18n import t, tn
 from veaf_libs.logger import logger
@@ -84,6 +84,7 @@ class PresetsInjectorWorker(GroupInjectorWorker):
         input_mission: Path | None,
         output_mission: Path | None,
         generate_kneeboards: bool = True,
+        in_memory: InMemoryMission | None = None,
     ):
         self.presets_file = presets_file
         # When False, radio presets are still injected but no kneeboard PNG is
@@ -101,7 +102,9 @@ class PresetsInjectorWorker(GroupInjectorWorker):
         # unit_type → channel-1 frequency that was *not* promoted to the group's primary
         # because it falls outside the airframe's HumanRadio range; reported once per type.
         self._skipped_primary_promotions: dict[str, float] = {}
-        super().__init__(config_file=presets_file, input_mission=input_mission, output_mission=output_mission)
+        super().__init__(
+            config_file=presets_file, input_mission=input_mission, output_mission=output_mission, in_memory=in_memory
+        )
 
     def load_config(self) -> Any:
         """Load configuration from YAML file."""
@@ -170,7 +173,10 @@ class PresetsInjectorWorker(GroupInjectorWorker):
         if units := group.group_dcs.get("units", {}):
             for unit in [u for u in units if u.get("skill", "") in ["Client", "Player"]]:
                 nb_units_processed += 1
-                unit["Radio"] = inject_preset.to_dict()
+                radio = inject_preset.to_dict()
+                # In memory, no write + read will turn the channel tables into the lists the next
+                # steps (and the final serialization) expect.
+                unit["Radio"] = as_read_back(radio) if self.in_memory is not None else radio
                 if inject_preset == PresetDefinition.EMPTY:
                     if "frequency" in group.group_dcs:
                         del group.group_dcs["frequency"]
@@ -476,8 +482,11 @@ class PresetsInjectorWorker(GroupInjectorWorker):
         return len(issues)
 
     def write_mission(self, silent: bool = False) -> None:
-        """Write the mission file, including kneeboard pages if generated."""
-        if not silent:
+        """Write the mission file, including kneeboard pages if generated.
+
+        For an in-memory mission the pages are queued on it instead, for its owner's single write.
+        """
+        if not silent and self.in_memory is None:
             logger.info(t("group_injector.writing_mission"))
 
         additional_files = {}
@@ -489,6 +498,9 @@ class PresetsInjectorWorker(GroupInjectorWorker):
             if not silent:
                 logger.info(tn("presets_injector.kneeboard_pages", len(self.presets_manager.presets_images)))
 
+        if self.in_memory is not None:
+            self.in_memory.add_files(additional_files)
+            return
         assert self.dcs_mission is not None
         write_miz(mission=self.dcs_mission, miz_file_path=self.output_mission, additional_files=additional_files)
 
@@ -25,10 +25,12 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, ClassVar, cast
 
+import PIL
 import yaml
 from PIL import Image, ImageColor, ImageDraw, ImageFont
 from PIL.ImageFont import FreeTypeFont
-from veaf_libs.bundled_data import read_bundled_text
+from veaf_libs import image_cache
+from veaf_libs.bundled_data import load_bundled_data
 from veaf_libs.i18n import t, tn
 from veaf_libs.logger import logger
 
@@ -661,6 +663,9 @@ class PresetAssignmentCollection:
 
     def __init__(self):
         self.preset_assignments_dict: dict[str, dict[str, dict[str, PresetAssignment]]] = {}
+        self._compiled: dict[str, dict[str, _CompiledUnitTypes]] | None = None
+        self._compiled_from: dict[str, dict[str, dict[str, PresetAssignment]]] | None = None
+        self._resolved: dict[tuple[str, str, str], PresetAssignment | None] = {}
 
     @classmethod
     def from_dict(
@@ -727,44 +732,81 @@ class PresetAssignmentCollection:
                         preset_assignments_coalition_dict[aircraft_type] = {}
                     preset_assignments_aircraft_type_dict = preset_assignments_coalition_dict.get(aircraft_type, {})
                     preset_assignments_aircraft_type_dict[unit_type] = preset_assignment
+        result.compile()
         return result
 
-    @staticmethod
-    def _match_unit_type(d: dict[str, "PresetAssignment"], unit_type: str) -> "PresetAssignment | None":
-        """Look up *unit_type* in *d* with exact-match priority, then regex pattern fallback.
+    def compile(self) -> None:
+        """Compile the unit-type patterns of :attr:`preset_assignments_dict`, and forget past lookups.
 
-        Args:
-            d: Mapping of unit_type key → PresetAssignment (may contain regex patterns).
-            unit_type: DCS aircraft type string to look up.
+        :meth:`get_preset_for` compiles on first use, and again whenever ``preset_assignments_dict``
+        is replaced; code changing the table in place after a lookup calls this.
+        """
+        self._compiled = {
+            coalition: {aircraft_type: _CompiledUnitTypes(d) for aircraft_type, d in coalition_dict.items()}
+            for coalition, coalition_dict in self.preset_assignments_dict.items()
+        }
+        self._compiled_from = self.preset_assignments_dict
+        self._resolved = {}
 
-        Returns:
-            The matching :class:`PresetAssignment`, or ``None`` if no key matches.
-            The ``"all"`` wildcard key is intentionally excluded — callers handle it separately.
+    def get_preset_for(
+        self, coalition: str = "all", aircraft_type: str = "all", unit_type: str = "all"
+    ) -> PresetAssignment | None:
+        """Return the assignment of an aircraft, or ``None`` when nothing is assigned to it.
+
+        The most specific block wins: the coalition's category, then its ``all``, then the ``all``
+        coalition's category and its ``all``. Within a block an exact unit type wins over a pattern
+        (matched in full, in file order), and a pattern over ``all``. Each (coalition, category, unit
+        type) is resolved once, then served from memory.
         """
-        if unit_type in d:
-            return d[unit_type]
+        if self._compiled is None or self._compiled_from is not self.preset_assignments_dict:
+            self.compile()
+        key = (coalition, aircraft_type, unit_type)
+        if key in self._resolved:
+            return self._resolved[key]
+        compiled = self._compiled or {}
+        result = None
+        for coalition_key, aircraft_type_key in (
+            (coalition, aircraft_type),
+            (coalition, "all"),
+            ("all", aircraft_type),
+            ("all", "all"),
+        ):
+            table = compiled.get(coalition_key, {}).get(aircraft_type_key)
+            if table is not None and (result := table.match(unit_type)):
+                break
+        self._resolved[key] = result
+        return result
+
+
+class _CompiledUnitTypes:
+    """The unit-type keys of one (coalition, category) of the assignments, patterns compiled.
+
+    Each key is compiled once, instead of going through :func:`re.fullmatch` (and its cache of
+    compiled patterns) for every key and every group. A key that is not a valid regular expression
+    only ever matches exactly.
+    """
+
+    def __init__(self, d: dict[str, PresetAssignment]) -> None:
+        self.exact = d
+        self.fallback = d.get("all")
+        self.patterns: list[tuple[re.Pattern[str], PresetAssignment]] = []
         for key, assignment in d.items():
             if key == "all":
                 continue
             try:
-                if re.fullmatch(key, unit_type):
-                    return assignment
+                self.patterns.append((re.compile(key), assignment))
             except re.error:
                 pass
-        return None
 
-    def get_preset_for(
-        self, coalition: str = "all", aircraft_type: str = "all", unit_type: str = "all"
-    ) -> PresetAssignment | None:
-        def _unit(d: dict[str, "PresetAssignment"]) -> "PresetAssignment | None":
-            return self._match_unit_type(d, unit_type) or d.get("all")
-
-        return (
-            _unit(self.preset_assignments_dict.get(coalition, {}).get(aircraft_type, {}))
-            or _unit(self.preset_assignments_dict.get(coalition, {}).get("all", {}))
-            or _unit(self.preset_assignments_dict.get("all", {}).get(aircraft_type, {}))
-            or _unit(self.preset_assignments_dict.get("all", {}).get("all", {}))
-        )
+    def match(self, unit_type: str) -> PresetAssignment | None:
+        """Return the assignment of *unit_type*: exact key, else the first pattern matching it in full, else ``all``."""
+        found = self.exact.get(unit_type)
+        if found is not None:
+            return found
+        for pattern, assignment in self.patterns:
+            if pattern.fullmatch(unit_type):
+                return assignment
+        return self.fallback
 
 
 def parse_channel_lists(
@@ -1193,15 +1235,16 @@ def _load_radio_layouts() -> dict[str, RadioLayoutEntry]:
     """Load and cache the bundled ``dcs-radio-layouts.yaml``."""
     global _RADIO_LAYOUTS
     if _RADIO_LAYOUTS is None:
-        raw = read_bundled_text("presets_injector", "data", "dcs-radio-layouts.yaml")
-        _RADIO_LAYOUTS = parse_radio_layouts(yaml.safe_load(raw) or {})
+        _RADIO_LAYOUTS = parse_radio_layouts(
+            load_bundled_data("presets_injector", "data", "dcs-radio-layouts.yaml") or {}
+        )
     return _RADIO_LAYOUTS
 
 
 def get_radio_layout(layouts: dict[str, RadioLayoutEntry], unit_type: str) -> RadioLayoutEntry | None:
     """Resolve *unit_type* to its Radio layout entry: exact match, then regex fallback.
 
-    Mirrors ``PresetAssignmentCollection._match_unit_type``'s resolution order.
+    Mirrors the resolution order of the unit-type keys of ``presets_assignments``.
 
     Args:
         layouts: Mapping of unit_type key (exact or regex) -> RadioLayoutEntry.
@@ -1717,6 +1760,10 @@ class PresetsManager:
         # block, and channels dropped because they lacked a role's band (reporting hook).
         self.channel_lists: dict[str, dict[str, RadioDefinition]] = {}
         self.channel_lists_dropped: dict[str, dict[str, list[str]]] = {}
+        # What get_radios_for returned per (coalition, category, unit type), and the assignments and
+        # channel lists it was resolved from.
+        self._radios_for: dict[tuple[str, str, str], PresetDefinition | None] = {}
+        self._radios_for_sources: tuple[Any, Any] | None = None
 
     @staticmethod
     def _check_sections(data: Any) -> None:
@@ -1818,6 +1865,21 @@ class PresetsManager:
         pass
 
     def get_radios_for(self, coalition: str, aircraft_type: str, unit_type: str):
+        """Return the preset of an aircraft: its assignment, else its type's packed channel lists.
+
+        Resolved and packed once per (coalition, category, unit type): every group of a type gets the
+        same :class:`PresetDefinition`, until the assignments or the channel lists are replaced.
+        """
+        sources = self._radios_for_sources
+        if sources is None or sources[0] is not self.preset_assignments or sources[1] is not self.channel_lists:
+            self._radios_for = {}
+            self._radios_for_sources = (self.preset_assignments, self.channel_lists)
+        key = (coalition, aircraft_type, unit_type)
+        if key not in self._radios_for:
+            self._radios_for[key] = self._resolve_radios_for(coalition, aircraft_type, unit_type)
+        return self._radios_for[key]
+
+    def _resolve_radios_for(self, coalition: str, aircraft_type: str, unit_type: str) -> PresetDefinition | None:
         # An explicit assignment (including an explicit "none") always wins over
         # the packer (ADR 0010: manual override). Only fall back to packing
         # `channel_lists` when NO assignment at all matched this aircraft.
@@ -1847,6 +1909,17 @@ _PRIORITY_HIGHLIGHT = (255, 165, 0)  # orange "highlighter"
 _COLUMN_SPLIT_THRESHOLD = 25
 
 
+#: Bump whenever a change to RadioPresetsImageGenerator changes the pages it draws: the pages cached
+#: by earlier builds (see veaf_libs.image_cache) are then drawn again instead of served.
+KNEEBOARD_RENDER_VERSION = 1
+
+
+def _render_kneeboard_page(job: tuple[int, int | None, PresetDefinition]) -> bytes:
+    """Draw one kneeboard page in a pool process: ``(width, height, render-ready preset)`` → PNG bytes."""
+    width, height, render_preset = job
+    return RadioPresetsImageGenerator({}, width=width, height=height).render_page(render_preset)
+
+
 def _radio_max_slot(radio: RadioDefinition) -> int:
     """Highest slot a radio occupies, counting labelled-but-empty slots (ADR 0012)."""
     slots = [channel.number for channel in radio.channels if channel.number]
@@ -1910,6 +1983,7 @@ class RadioPresetsImageGenerator:
         self.height = height
         self.preset_collections = preset_collections
         self._cached_fonts: tuple[FreeTypeFont, FreeTypeFont, FreeTypeFont] | None = None
+        self._cached_fonts_fingerprint: list[Any] | None = None
         # Layout state shared between draw_* methods (set in draw_preset_image /
         # draw_radios_in_preset_image, read in draw_channels_in_preset_image).
         self.table_x: float = 0
@@ -2184,21 +2258,64 @@ class RadioPresetsImageGenerator:
         for coalition, unit_type in injected:
             coalitions_by_type.setdefault(unit_type, set()).add(coalition)
 
-        images: dict[str, io.BytesIO] = {}
+        pages: dict[str, PresetDefinition] = {}
         for (coalition, unit_type), preset in injected.items():
             if not preset.radios:
                 continue
-            render_preset = self._prepare_render_preset(preset, title=f"{unit_type} ({coalition})")
-            self.radio_count = len(render_preset.radios)
-            self.draw_preset_image(render_preset)
-            self.draw_radios_in_preset_image(render_preset)
-            img_buffer = io.BytesIO()
-            self.image.save(img_buffer, format="PNG", optimize=True)
-            img_buffer.seek(0)
             safe_type = unit_type.replace("/", "_").replace("\\", "_")
             suffix = f"-{coalition}" if len(coalitions_by_type[unit_type]) > 1 else ""
-            images[f"KNEEBOARD/{safe_type}/IMAGES/presets{suffix}.png"] = img_buffer
-        return images
+            pages[f"KNEEBOARD/{safe_type}/IMAGES/presets{suffix}.png"] = self._prepare_render_preset(
+                preset, title=f"{unit_type} ({coalition})"
+            )
+
+        # A page drawn from the same content, fonts and drawing code as an earlier build's is that
+        # build's page: it comes from the image cache, and Pillow is not even called.
+        keys = {path: self._page_key(render_preset) for path, render_preset in pages.items()}
+        rendered = image_cache.render_through(
+            _render_kneeboard_page,
+            {keys[path]: (self.width, self.height, render_preset) for path, render_preset in pages.items()},
+        )
+        return {path: io.BytesIO(rendered[keys[path]]) for path in pages}
+
+    def render_page(self, render_preset: PresetDefinition) -> bytes:
+        """Draw the kneeboard page of the render-ready *render_preset* and return it as PNG bytes."""
+        self.radio_count = len(render_preset.radios)
+        self.draw_preset_image(render_preset)
+        self.draw_radios_in_preset_image(render_preset)
+        img_buffer = io.BytesIO()
+        self.image.save(img_buffer, format="PNG", optimize=True)
+        return img_buffer.getvalue()
+
+    def _page_key(self, render_preset: PresetDefinition) -> str:
+        """Return the image-cache key of *render_preset*'s page: all that drawing it reads."""
+        radios = [
+            [
+                radio.name,
+                radio.title,
+                sorted(radio.display_labels.items()),
+                [
+                    [channel.number, channel.title, channel.freq, channel.priority, channel.color]
+                    for channel in radio.channels
+                ],
+            ]
+            for radio in render_preset.radios.values()
+        ]
+        return image_cache.image_key(
+            "kneeboard-presets",
+            KNEEBOARD_RENDER_VERSION,
+            PIL.__version__,
+            self.width,
+            self.height,
+            self._fonts_fingerprint(),
+            render_preset.title,
+            radios,
+        )
+
+    def _fonts_fingerprint(self) -> list[Any]:
+        """Identify the fonts pages are drawn with (see :func:`image_cache.fonts_fingerprint`)."""
+        if self._cached_fonts_fingerprint is None:
+            self._cached_fonts_fingerprint = image_cache.fonts_fingerprint(self.get_fonts())
+        return self._cached_fonts_fingerprint
 
     def _prepare_render_preset(self, preset: PresetDefinition, title: str) -> PresetDefinition:
         """Return a render-ready copy of *preset* with the given *title*.
@@ -10,8 +10,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
-import yaml
-from veaf_libs.bundled_data import read_bundled_text
+from veaf_libs.bundled_data import load_bundled_data
 from veaf_libs.i18n import t
 from veaf_libs.logger import logger
 
@@ -23,8 +22,7 @@ def _load_specs() -> dict[str, Any]:
     if _SPECS is not None:
         return _SPECS
 
-    raw = read_bundled_text("presets_injector", "data", "dcs-radio-specs.yaml")
-    _SPECS = yaml.safe_load(raw) or {}
+    _SPECS = load_bundled_data("presets_injector", "data", "dcs-radio-specs.yaml") or {}
     return _SPECS
 
 
@@ -27,8 +27,7 @@ from __future__ import annotations
 
 from typing import Any
 
-import yaml
-from veaf_libs.bundled_data import read_bundled_text
+from veaf_libs.bundled_data import load_bundled_data
 from veaf_libs.i18n import t
 from veaf_libs.lua_literals import lua_quoted_string
 
@@ -47,7 +46,7 @@ def load_framework_spawn_data() -> dict[str, Any]:
     Returns:
         A dict ``{"units": [...], "groups": [...]}`` (missing keys default to ``[]``).
     """
-    raw = yaml.safe_load(read_bundled_text("veaf_libs", "data", "veaf-units.yaml")) or {}
+    raw = load_bundled_data("veaf_libs", "data", "veaf-units.yaml") or {}
     return {"units": raw.get("units") or [], "groups": raw.get("groups") or []}
 
 
@@ -20,7 +20,7 @@ from pathlib import Path
 from typing import Any
 
 import yaml
-from mission_tools import DEFAULT_SCRIPTS_LOCATION, read_miz, write_miz
+from mission_tools import DEFAULT_SCRIPTS_LOCATION, InMemoryMission, read_miz, write_miz
 from mission_tools.miz_tools import DcsMission
 from veaf_libs.base_worker import BaseWorker
 from veaf_libs.i18n import t, tn
@@ -145,6 +145,7 @@ class SpawnDataInjectorWorker(BaseWorker):
         input_mission: Path,
         output_mission: Path,
         mission_data_file: Path | None = None,
+        in_memory: InMemoryMission | None = None,
     ) -> None:
         """Initialize the worker.
 
@@ -153,10 +154,13 @@ class SpawnDataInjectorWorker(BaseWorker):
             output_mission: Destination ``.miz`` (may equal the source).
             mission_data_file: Optional per-mission spawn YAML to merge over the
                 framework data (SPAWN-EXTERNALIZE-004).
+            in_memory: A mission to edit in place instead of the two files; the
+                embedded module is queued on it, and its owner writes it.
         """
         self.input_mission = input_mission
         self.output_mission = output_mission
         self.mission_data_file = mission_data_file
+        self.in_memory = in_memory
 
     def work(self) -> SpawnDataResult:
         """Render the merged spawn data and inject it into the mission.
@@ -171,9 +175,12 @@ class SpawnDataInjectorWorker(BaseWorker):
         data = merge_spawn_data(framework, mission_data)
         lua_text = render_spawn_data_lua(data)
 
-        mission = read_miz(self.input_mission)
-        additional_files = inject_spawn_data(mission, lua_text)
-        write_miz(mission=mission, miz_file_path=self.output_mission, additional_files=additional_files)
+        if self.in_memory is not None:
+            self.in_memory.add_files(inject_spawn_data(self.in_memory.mission, lua_text))
+        else:
+            mission = read_miz(self.input_mission)
+            additional_files = inject_spawn_data(mission, lua_text)
+            write_miz(mission=mission, miz_file_path=self.output_mission, additional_files=additional_files)
 
         result = SpawnDataResult(units=len(data["units"]), groups=len(data["groups"]))
         logger.info(
@@ -1,3 +1,4 @@
+import multiprocessing
 import sys
 
 from veaf_libs.i18n import set_language, t
@@ -20,6 +21,8 @@ from veaf_tools.app import VERSION, app  # noqa: E402
 from veaf_tools.helpers import should_auto_pause  # noqa: E402
 
 if __name__ == "__main__":
+    # A frozen executable must dispatch `build --jobs` worker processes before anything else.
+    multiprocessing.freeze_support()
     console.print(f"[bold]veaf-tools[/bold] v{VERSION}")
 
     # CLI ↔ TUI bridge (CLI-TUI-BRIDGE): a bare invocation, `--tui`, or a command
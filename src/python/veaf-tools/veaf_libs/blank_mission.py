@@ -16,9 +16,8 @@ from functools import lru_cache
 from typing import Any
 
 import luadata  # type: ignore[import-untyped]
-import yaml
 
-from veaf_libs.bundled_data import read_bundled_text
+from veaf_libs.bundled_data import load_bundled_data
 
 #: DCS mission format version emitted in the skeleton (matches current-era ME saves).
 _MISSION_VERSION = 23
@@ -35,7 +34,7 @@ _THEATRE_ALIASES: dict[str, str] = {"sinai": "sinaimap", "germanycoldwar": "germ
 @lru_cache(maxsize=1)
 def _theatre_table() -> dict[str, dict[str, Any]]:
     """Load the per-theatre constants table (lowercased keys). Cached — the data is static."""
-    raw = yaml.safe_load(read_bundled_text("veaf_libs", "data", "theatre-defaults.yaml")) or {}
+    raw = load_bundled_data("veaf_libs", "data", "theatre-defaults.yaml") or {}
     return {str(k).lower(): v for k, v in raw.items()}
 
 
@@ -175,9 +174,19 @@ def _mission_skeleton(theatre: dict[str, Any]) -> dict[str, Any]:
 
 
 def _serialize(content: dict[str, Any], variable_name: str) -> bytes:
-    """Serialize a Lua table to ``<name> = \\n<lua>`` bytes (mirrors ``write_miz``)."""
-    lua = luadata.serialize(content, indent="  ", indent_level=0, always_provide_keyname=True, sort=True)
-    return f"{variable_name} = \n{lua}".encode()
+    """Serialize a Lua table to ``<name> = \\n<lua>`` bytes (mirrors ``write_miz``).
+
+    The chunks ``luadata.iter_serialize`` streams are encoded as they come, so the text is never
+    held both as one ``str`` and as its ``bytes``.
+    """
+    chunks = [f"{variable_name} = \n".encode()]
+    chunks.extend(
+        chunk.encode()
+        for chunk in luadata.iter_serialize(
+            content, indent="  ", indent_level=0, always_provide_keyname=True, sort=True
+        )
+    )
+    return b"".join(chunks)
 
 
 def generate_blank_mission(theatre: str) -> dict[str, bytes]:
@@ -0,0 +1,151 @@
+"""The record of what a build consumed and produced, kept next to its ``.miz``.
+
+``veaf-tools build`` used to rebuild from scratch every time, even when nothing had changed since the
+last run. The build now writes ``<output>.miz.manifest.json`` beside its output, holding:
+
+- per **stage**, in pipeline order, one hash of the stage's settings and of the content of every
+  input file it reads. ``build`` is everything up to the mission ``.miz``; ``weather`` is its
+  variants, and is re-run alone when only its own inputs changed;
+- per stage, the hash of every file it wrote, so a deleted or hand-edited output is rebuilt;
+- a stat cache: every hashed file's size and mtime with its hash. A file whose size and mtime are
+  unchanged is trusted, not read again, which is what lets an up-to-date check cost milliseconds —
+  the same bargain ``git status`` strikes with its index.
+
+A manifest that is missing, unreadable or of another :data:`MANIFEST_VERSION` is no manifest: the
+build runs in full. It can only ever skip work, never change what a build produces.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from veaf_libs.atomic_replace import atomic_replace
+from veaf_libs.logger import Logger
+
+logger = Logger("build-manifest")
+
+#: Bumped whenever the manifest format or what goes into a stage hash changes.
+MANIFEST_VERSION = 1
+
+MANIFEST_SUFFIX = ".manifest.json"
+
+_CHUNK = 1024 * 1024
+
+
+def manifest_path(output: Path) -> Path:
+    """Return where the manifest of the build producing *output* lives: ``Foo.miz`` → ``Foo.miz.manifest.json``."""
+    return output.with_name(output.name + MANIFEST_SUFFIX)
+
+
+class FileHashes:
+    """Content hashes of files, trusting a known hash while a file's size and mtime are unchanged.
+
+    Args:
+        known: The stat cache of a previous manifest, ``path -> [size, mtime_ns, sha256]``.
+    """
+
+    def __init__(self, known: Mapping[str, list] | None = None) -> None:
+        self._known = dict(known or {})
+        self.entries: dict[str, list] = {}
+        """Every file hashed so far, in the same form as *known*: the stat cache of the next manifest."""
+
+    def digest(self, path: Path) -> str | None:
+        """Return the SHA-256 of *path*'s content, or ``None`` when it does not exist or cannot be read."""
+        key = str(path)
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        known = self._known.get(key)
+        if known and known[0] == stat.st_size and known[1] == stat.st_mtime_ns:
+            digest = known[2]
+        else:
+            sha = hashlib.sha256()
+            try:
+                with path.open("rb") as stream:
+                    while chunk := stream.read(_CHUNK):
+                        sha.update(chunk)
+            except OSError:
+                return None
+            digest = sha.hexdigest()
+        self.entries[key] = self._known[key] = [stat.st_size, stat.st_mtime_ns, digest]
+        return digest
+
+    def stage(self, settings: Mapping[str, Any], files: Iterable[Path]) -> str:
+        """Return the hash of a stage: its *settings* and the path and content of each of its *files*.
+
+        A missing file is part of the hash too, so creating one makes the stage stale.
+        """
+        sha = hashlib.sha256(json.dumps(settings, sort_keys=True, default=str).encode())
+        for path in sorted(set(files)):
+            sha.update(f"\0{path}\0{self.digest(path)}".encode())
+        return sha.hexdigest()
+
+    def outputs(self, files: Iterable[Path]) -> dict[str, str]:
+        """Return ``path -> sha256`` for the files a stage wrote (those that exist)."""
+        return {str(path): digest for path in files if (digest := self.digest(path))}
+
+
+@dataclass
+class BuildManifest:
+    """What one build consumed and produced (see the module docstring)."""
+
+    stages: dict[str, str] = field(default_factory=dict)
+    """Stage name → hash of its settings and inputs, in pipeline order."""
+    outputs: dict[str, dict[str, str]] = field(default_factory=dict)
+    """Stage name → ``path -> sha256`` of every file it wrote."""
+    files: dict[str, list] = field(default_factory=dict)
+    """The stat cache, ``path -> [size, mtime_ns, sha256]``."""
+
+    @classmethod
+    def load(cls, path: Path) -> BuildManifest | None:
+        """Read the manifest at *path*, or return ``None`` when there is none usable."""
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return None
+        try:
+            return cls(stages=dict(data["stages"]), outputs=dict(data["outputs"]), files=dict(data["files"]))
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def save(self, path: Path) -> None:
+        """Write the manifest to *path* atomically. Failing to is not an error: the next build runs in full."""
+        data = {"version": MANIFEST_VERSION, "stages": self.stages, "outputs": self.outputs, "files": self.files}
+        try:
+            fd, temp_name = tempfile.mkstemp(suffix=MANIFEST_SUFFIX, dir=path.parent)
+        except OSError as error:
+            logger.debug(f"build manifest: could not write {path}: {error}")
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as stream:
+                json.dump(data, stream, indent=1)
+            atomic_replace(temp_name, path)
+        except OSError as error:
+            with contextlib.suppress(OSError):
+                os.unlink(temp_name)
+            logger.debug(f"build manifest: could not write {path}: {error}")
+
+    def first_stale_stage(self, stages: Mapping[str, str], hashes: FileHashes) -> str | None:
+        """Return the first of *stages* that must run again, or ``None`` when the build is up to date.
+
+        A stage is stale when its hash changed or a file it wrote is gone or was changed since. Every
+        stage after a stale one runs again too: it is the caller's to run the pipeline from there.
+        """
+        for stage, digest in stages.items():
+            if self.stages.get(stage) != digest:
+                return stage
+            for output, output_digest in self.outputs.get(stage, {}).items():
+                if hashes.digest(Path(output)) != output_digest:
+                    return stage
+        return None
@@ -0,0 +1,228 @@
+"""Where a build's time, memory and I/O go: ``veaf-tools build --timings``.
+
+A build is a tree of **stages**: the pipeline steps ``build.py`` names (``build``, ``presets``,
+``weather``…) and, below them, every :func:`~veaf_libs.progress.spinner_context` and
+:func:`~veaf_libs.progress.progress_context` block, which already delimit the work (reading the
+mission, writing it, rendering kneeboards…). While :func:`profiling` is active, each stage records:
+
+- its wall time and the process CPU time it used;
+- the peak of Python's traced memory while it ran (:mod:`tracemalloc`, so allocations by the Python
+  code and the C extensions it calls through Python's allocator, not the process RSS);
+- the bytes the process read and wrote meanwhile, from ``/proc/self/io`` on Linux and
+  ``GetProcessIoCounters`` on Windows (left empty elsewhere). They count every read and write,
+  cached or not.
+
+The result is a table for the console and a Chrome trace-event file, which ``chrome://tracing`` and
+https://ui.perfetto.dev open, to compare two builds or two releases side by side. Profiling costs
+time — tracemalloc slows every allocation down, so an allocation-heavy stage such as parsing YAML
+runs several times slower — so compare profiled builds with profiled builds only.
+
+Stages are only recorded on the thread that started profiling; any other thread runs unrecorded.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from rich.table import Table
+
+from veaf_libs.i18n import t
+
+#: ``Foo.miz`` → ``Foo.miz.trace.json``: the trace of the build producing ``Foo.miz``.
+TRACE_SUFFIX = ".trace.json"
+
+_MB = 1024 * 1024
+
+
+def trace_path(output: Path) -> Path:
+    """Return where ``--timings`` writes the trace of the build producing *output*."""
+    return output.with_name(output.name + TRACE_SUFFIX)
+
+
+def _io_counters() -> tuple[int, int] | None:
+    """Return the bytes this process has read and written so far, or ``None`` where unknown."""
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class IO_COUNTERS(ctypes.Structure):
+            _fields_ = [
+                (name, ctypes.c_ulonglong)
+                for name in (
+                    "ReadOperationCount",
+                    "WriteOperationCount",
+                    "OtherOperationCount",
+                    "ReadTransferCount",
+                    "WriteTransferCount",
+                    "OtherTransferCount",
+                )
+            ]
+
+        counters = IO_COUNTERS()
+        kernel32 = ctypes.windll.kernel32
+        kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+        if not kernel32.GetProcessIoCounters(kernel32.GetCurrentProcess(), ctypes.byref(counters)):
+            return None
+        return counters.ReadTransferCount, counters.WriteTransferCount
+    try:
+        with open("/proc/self/io", encoding="ascii") as stream:
+            fields = dict(line.split(":", 1) for line in stream if ":" in line)
+        return int(fields["rchar"]), int(fields["wchar"])
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+@dataclass
+class StageRecord:
+    """What one stage used."""
+
+    name: str
+    depth: int
+    """0 for a top-level stage, 1 for a stage within it, and so on."""
+    start: float
+    """Seconds from the start of profiling."""
+    wall: float = 0.0
+    cpu: float = 0.0
+    peak_bytes: int = 0
+    read_bytes: int | None = None
+    written_bytes: int | None = None
+    failed: bool = False
+
+
+@dataclass
+class BuildProfiler:
+    """The stages recorded by one :func:`profiling` block, in the order they started."""
+
+    records: list[StageRecord] = field(default_factory=list)
+    _stack: list[StageRecord] = field(default_factory=list)
+    _origin: float = field(default_factory=time.perf_counter)
+    _thread: int = field(default_factory=threading.get_ident)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Record the block as a stage named *name*, nested in the current one."""
+        if threading.get_ident() != self._thread:
+            yield
+            return
+        parent = self._stack[-1] if self._stack else None
+        if parent is not None:
+            # tracemalloc keeps one peak: bank the parent's so far before it is reset for this stage.
+            parent.peak_bytes = max(parent.peak_bytes, tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+        record = StageRecord(name=name, depth=len(self._stack), start=time.perf_counter() - self._origin)
+        self.records.append(record)
+        self._stack.append(record)
+        io_before = _io_counters()
+        cpu_before = time.process_time()
+        try:
+            yield
+        except BaseException:
+            record.failed = True
+            raise
+        finally:
+            record.wall = time.perf_counter() - self._origin - record.start
+            record.cpu = time.process_time() - cpu_before
+            io_after = _io_counters()
+            if io_before and io_after:
+                record.read_bytes = io_after[0] - io_before[0]
+                record.written_bytes = io_after[1] - io_before[1]
+            record.peak_bytes = max(record.peak_bytes, tracemalloc.get_traced_memory()[1])
+            self._stack.pop()
+            if parent is not None:
+                parent.peak_bytes = max(parent.peak_bytes, record.peak_bytes)
+            tracemalloc.reset_peak()
+
+    def table(self, title: str) -> Table:
+        """Return the stages as a console table, nested stages indented under theirs."""
+        table = Table(title=title, title_justify="left")
+        table.add_column(t("profiler.column.stage"), no_wrap=True, overflow="ellipsis")
+        for key in ("wall", "cpu", "peak", "read", "written"):
+            table.add_column(t(f"profiler.column.{key}"), justify="right")
+
+        def megabytes(size: int | None) -> str:
+            return "" if size is None else f"{size / _MB:.1f}"
+
+        for record in self.records:
+            name = "  " * record.depth + record.name
+            if record.failed:
+                name += " " + t("profiler.failed")
+            table.add_row(
+                name,
+                f"{record.wall:.2f}",
+                f"{record.cpu:.2f}",
+                megabytes(record.peak_bytes),
+                megabytes(record.read_bytes),
+                megabytes(record.written_bytes),
+            )
+        return table
+
+    def trace(self, metadata: Mapping[str, Any] | None = None) -> dict[str, Any]:
+        """Return the stages in the Chrome trace-event format, one complete (``X``) event each."""
+        pid = os.getpid()
+        events: list[dict[str, Any]] = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": "build"}},
+        ]
+        for record in self.records:
+            args: dict[str, Any] = {"cpu_ms": round(record.cpu * 1000, 3), "peak_bytes": record.peak_bytes}
+            if record.read_bytes is not None:
+                args["read_bytes"] = record.read_bytes
+                args["written_bytes"] = record.written_bytes
+            if record.failed:
+                args["failed"] = True
+            events.append(
+                {
+                    "name": record.name,
+                    "cat": "build",
+                    "ph": "X",
+                    "ts": round(record.start * 1_000_000),
+                    "dur": round(record.wall * 1_000_000),
+                    "pid": pid,
+                    "tid": 0,
+                    "args": args,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": dict(metadata or {})}
+
+    def write_trace(self, path: Path, metadata: Mapping[str, Any] | None = None) -> None:
+        """Write :meth:`trace` to *path*."""
+        path.write_text(json.dumps(self.trace(metadata), indent=1, default=str), encoding="utf-8")
+
+
+_active: BuildProfiler | None = None
+
+
+@contextmanager
+def profiling() -> Iterator[BuildProfiler]:
+    """Record the stages run in the block; the profiler yielded holds them once it is over."""
+    global _active
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    profiler = BuildProfiler()
+    previous, _active = _active, profiler
+    try:
+        yield profiler
+    finally:
+        _active = previous
+        if started_tracing:
+            tracemalloc.stop()
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Record the block as a stage when a :func:`profiling` block is active; do nothing otherwise."""
+    if _active is None:
+        yield
+    else:
+        with _active.stage(name):
+            yield
@@ -4,13 +4,45 @@ PyInstaller extracts ``--add-data`` files under ``sys._MEIPASS`` keyed by their
 declared destination, while a source/editable install keeps them inside the
 package directory. This helper resolves either case so callers do not each
 reimplement the lookup.
+
+Bundled YAML is read through :func:`load_bundled_data`. PyYAML parses it in pure
+Python — 1.6 s for the shipped files, 0.76 s of it for ``dcsUnits.yaml`` alone —
+so the release build compiles each file into a marshal **sidecar** next to it
+(:func:`compile_bundled_yaml`), which loads in milliseconds. A sidecar is used
+only when it was compiled from the very text it sits beside, by the same
+format and Python version; anything else — a dev tree has no sidecars at all —
+falls back to parsing the YAML.
 """
 
 from __future__ import annotations
 
+import hashlib
 import importlib.resources
+import marshal
 import sys
+from importlib.resources.abc import Traversable
 from pathlib import Path
+from typing import Any
+
+import yaml
+
+#: Suffix of the compiled form of a bundled YAML file (``dcsUnits.yaml.marshal``).
+COMPILED_SUFFIX = ".marshal"
+
+#: Bumped whenever the layout of a compiled file changes; a file of another version is ignored.
+COMPILED_FORMAT = 1
+
+_COMPILED_MAGIC = "veaf-bundled-data"
+
+
+def _bundled_resource(package: str, *parts: str) -> Path | Traversable:
+    bundle_path = Path(getattr(sys, "_MEIPASS", "")) / package / Path(*parts)
+    if bundle_path.exists():
+        return bundle_path
+    resource = importlib.resources.files(package)
+    for part in parts:
+        resource = resource / part
+    return resource
 
 
 def read_bundled_text(package: str, *parts: str) -> str:
@@ -23,13 +55,60 @@ def read_bundled_text(package: str, *parts: str) -> str:
     Returns:
         The file contents.
     """
-    bundle_path = Path(getattr(sys, "_MEIPASS", "")) / package / Path(*parts)
-    if bundle_path.exists():
-        return bundle_path.read_text(encoding="utf-8")
-    resource = importlib.resources.files(package)
-    for part in parts:
-        resource = resource / part
-    return resource.read_text(encoding="utf-8")
+    return _bundled_resource(package, *parts).read_text(encoding="utf-8")
+
+
+def _compiled_header(text: str) -> tuple[str, int, tuple[int, int], str]:
+    """What a sidecar compiled from *text*, here and now, starts with."""
+    return (
+        _COMPILED_MAGIC,
+        COMPILED_FORMAT,
+        (sys.version_info[0], sys.version_info[1]),
+        hashlib.sha256(text.encode("utf-8")).hexdigest(),
+    )
+
+
+def compile_bundled_yaml(source: Path, target: Path) -> Path:
+    """Write the compiled sidecar of the YAML file *source* to *target*.
+
+    Args:
+        source: The YAML file, as it will ship.
+        target: Where to write the sidecar; its name must be ``source.name + COMPILED_SUFFIX``
+            and it must ship to the same directory as *source*.
+
+    Returns:
+        *target*.
+
+    Raises:
+        ValueError: when the YAML holds a value marshal cannot store (a timestamp, say).
+    """
+    text = source.read_text(encoding="utf-8")
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_bytes(marshal.dumps((*_compiled_header(text), yaml.safe_load(text))))
+    return target
+
+
+def load_bundled_data(package: str, *parts: str) -> Any:
+    """Load a packaged YAML file: from its compiled sidecar when one matches it, else parsed.
+
+    Args:
+        package: Top-level package the data ships under (e.g. ``"veaf_libs"``).
+        *parts: Path components under the package (e.g. ``"data"``, ``"x.yaml"``).
+
+    Returns:
+        The data, as ``yaml.safe_load`` returns it (``None`` for an empty file). Each call returns
+        a fresh object.
+    """
+    text = read_bundled_text(package, *parts)
+    *directory, name = parts
+    try:
+        compiled = marshal.loads(_bundled_resource(package, *directory, name + COMPILED_SUFFIX).read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        compiled = None
+    header = _compiled_header(text)
+    if isinstance(compiled, tuple) and len(compiled) == len(header) + 1 and compiled[:-1] == header:
+        return compiled[-1]
+    return yaml.safe_load(text)
 
 
 def bundled_dir(package: str, *parts: str) -> Path:
@@ -12,6 +12,10 @@ events (see the PRD).
 
 Boxes, ticks and the current-step marker are **drawn**, never typed: Arial does not
 guarantee ``☐`` or ``✓`` and a missing glyph renders as a blank or a tofu box.
+
+A state is drawn from its title, labels and index, the fonts and this module's code, nothing
+else, so the build draws it once: :func:`render_all` keys every state by those in
+:mod:`veaf_libs.image_cache`, and draws only the states no earlier build drew, in a process pool.
 """
 
 from __future__ import annotations
@@ -22,9 +26,11 @@ import re
 from dataclasses import dataclass
 from typing import cast
 
+import PIL
 from PIL import Image, ImageDraw, ImageFont
 from PIL.ImageFont import FreeTypeFont
 
+from veaf_libs import image_cache
 from veaf_libs.checklists import Checklist, resolve_text
 from veaf_libs.i18n import tn
 from veaf_libs.logger import logger
@@ -62,6 +68,10 @@ _TICK_COLOR = (0, 140, 0)
 #: Progress states of a line, in the order a pilot walks through them.
 _DONE, _CURRENT, _PENDING = "done", "current", "pending"
 
+#: Bump whenever a change to this module changes the pictures it draws: the states cached by
+#: earlier builds are then drawn again instead of served.
+CHECKLIST_RENDER_VERSION = 1
+
 #: Characters kept in a checklist id when it becomes a DCS resource key.
 _KEY_SAFE_RE = re.compile(r"[^A-Za-z0-9]+")
 
@@ -308,6 +318,53 @@ def _encode(image: Image.Image) -> bytes:
     return buffer.getvalue()
 
 
+def _render_job(job: tuple[str, list[str], int]) -> bytes:
+    """Draw and encode one state in a pool process: ``(title, labels, state)`` → PNG bytes."""
+    title, labels, state = job
+    return _encode(render_state(title, labels, state))
+
+
+def _render(
+    checklists: list[Checklist],
+    catalog: dict[str, dict[str, str]],
+    language: str,
+) -> list[ChecklistImages]:
+    """Render every progress state of every checklist as one batch through the image cache.
+
+    One batch rather than one per checklist, so the pool drawing the misses is started once
+    and kept busy by the states of all of them.
+    """
+    fonts = image_cache.fonts_fingerprint(_fonts())
+    state_keys: list[list[str]] = []
+    jobs: dict[str, tuple[str, list[str], int]] = {}
+    for checklist in checklists:
+        title = resolve_text(checklist.title, catalog, language)
+        labels = [resolve_text(step.label, catalog, language) for step in checklist.steps]
+        cache_keys = []
+        for state in range(len(checklist.steps) + 1):
+            cache_key = image_cache.image_key(
+                "checklist", CHECKLIST_RENDER_VERSION, PIL.__version__, fonts, title, labels, state
+            )
+            jobs[cache_key] = (title, labels, state)
+            cache_keys.append(cache_key)
+        state_keys.append(cache_keys)
+    rendered = image_cache.render_through(_render_job, jobs)
+
+    result = []
+    for checklist, cache_keys in zip(checklists, state_keys, strict=True):
+        files: dict[str, bytes] = {}
+        keys: list[str] = []
+        names: list[str] = []
+        for state, cache_key in enumerate(cache_keys):
+            payload = rendered[cache_key]
+            name = image_filename(checklist.id, state, payload)
+            files[name] = payload
+            names.append(name)
+            keys.append(resource_key(checklist.id, state))
+        result.append(ChecklistImages(checklist_id=checklist.id, resource_keys=keys, file_names=names, files=files))
+    return result
+
+
 def render_checklist_images(
     checklist: Checklist,
     catalog: dict[str, dict[str, str]],
@@ -326,19 +383,7 @@ def render_checklist_images(
     Returns:
         One image per progress state, keys and file names included.
     """
-    title = resolve_text(checklist.title, catalog, language)
-    labels = [resolve_text(step.label, catalog, language) for step in checklist.steps]
-
-    files: dict[str, bytes] = {}
-    keys: list[str] = []
-    names: list[str] = []
-    for state in range(len(checklist.steps) + 1):
-        payload = _encode(render_state(title, labels, state))
-        name = image_filename(checklist.id, state, payload)
-        files[name] = payload
-        names.append(name)
-        keys.append(resource_key(checklist.id, state))
-    return ChecklistImages(checklist_id=checklist.id, resource_keys=keys, file_names=names, files=files)
+    return _render([checklist], catalog, language)[0]
 
 
 def render_all(
@@ -349,7 +394,8 @@ def render_all(
     """Render every activated checklist, reporting what the images cost.
 
     A mission maker adding a sixty-step checklist should read the price at build time
-    rather than discover a fatter ``.miz``.
+    rather than discover a fatter ``.miz``. The states of all checklists are drawn as one
+    batch, cached states skipped (see the module docstring).
 
     Args:
         checklists: The checklists the mission activates.
@@ -359,7 +405,7 @@ def render_all(
     Returns:
         One entry per checklist, in the order given.
     """
-    rendered = [render_checklist_images(checklist, catalog, language) for checklist in checklists]
+    rendered = _render(checklists, catalog, language)
     count = sum(len(entry.files) for entry in rendered)
     if count:
         total_kb = sum(entry.total_bytes for entry in rendered) / 1024
@@ -28,7 +28,7 @@ from typing import Any
 import yaml
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, ValidationError, field_validator, model_validator
 
-from veaf_libs.bundled_data import bundled_dir, read_bundled_text
+from veaf_libs.bundled_data import bundled_dir, load_bundled_data
 from veaf_libs.i18n import t
 from veaf_libs.logger import logger
 from veaf_libs.lua_i18n import RUNTIME_DEFAULT_LANGUAGE, translate
@@ -320,7 +320,7 @@ def _known_unit_types() -> frozenset[str]:
         case type validation is skipped rather than rejecting every checklist.
     """
     try:
-        raw = yaml.safe_load(read_bundled_text("veaf_libs", "data", "dcsUnits.yaml")) or {}
+        raw = load_bundled_data("veaf_libs", "data", "dcsUnits.yaml") or {}
         catalogued = frozenset(str(entry["type"]) for entry in (raw.get("units") or []) if entry.get("type"))
     except (OSError, ModuleNotFoundError, yaml.YAMLError):
         logger.warning(t("checklist.units_catalogue_unavailable"))
@@ -19,7 +19,7 @@ from pathlib import Path
 
 import yaml
 
-from veaf_libs.bundled_data import read_bundled_text
+from veaf_libs.bundled_data import load_bundled_data
 
 _PROFILE_DATA_PARTS = ("data", "convert-profiles")
 
@@ -111,10 +111,10 @@ def load_profile(name_or_path: str) -> ConversionProfile:
         return _parse_profile(raw, candidate.stem)
 
     try:
-        text = read_bundled_text("veaf_libs", *_PROFILE_DATA_PARTS, f"{name_or_path}.yaml")
+        raw = load_bundled_data("veaf_libs", *_PROFILE_DATA_PARTS, f"{name_or_path}.yaml")
     except (FileNotFoundError, ModuleNotFoundError) as exc:
         raise FileNotFoundError(f"unknown conversion profile: {name_or_path}") from exc
-    return _parse_profile(yaml.safe_load(text) or {}, name_or_path)
+    return _parse_profile(raw or {}, name_or_path)
 
 
 def _module_enabled(modules_block: dict, module_id: str) -> bool:
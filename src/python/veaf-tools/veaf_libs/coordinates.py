@@ -13,9 +13,7 @@ its data. See ``docs/adr/0015-coordinate-projection-port.md``.
 import math
 from functools import lru_cache
 
-import yaml
-
-from veaf_libs.bundled_data import read_bundled_text
+from veaf_libs.bundled_data import load_bundled_data
 
 # WGS84 ellipsoid + UTM scale, as in the source.
 _A = 6378137.0
@@ -37,7 +35,7 @@ def _load() -> tuple[dict[str, dict[str, float]], dict[str, str]]:
     Each params entry carries ``lon0``/``x0``/``y0`` (from ``lon_0``/``x_0``/``y_0``); ``k_0`` is
     0.9996 across all DCS theatres (== :data:`_K0`), so it is not stored per theatre.
     """
-    raw = yaml.safe_load(read_bundled_text("veaf_libs", "data", "dcs-maps.yaml")) or {}
+    raw = load_bundled_data("veaf_libs", "data", "dcs-maps.yaml") or {}
     params: dict[str, dict[str, float]] = {}
     names: dict[str, str] = {}
     for name, entry in raw.items():
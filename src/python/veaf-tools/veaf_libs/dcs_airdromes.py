@@ -16,15 +16,13 @@ from __future__ import annotations
 
 import functools
 
-import yaml
-
-from veaf_libs.bundled_data import read_bundled_text
+from veaf_libs.bundled_data import load_bundled_data
 
 
 @functools.lru_cache(maxsize=1)
 def _table() -> dict[str, dict[str, int]]:
     """Load (and cache) the ``{theatre_lower: {name_lower: id}}`` table."""
-    raw = yaml.safe_load(read_bundled_text("veaf_libs", "data", "airdromes.yaml")) or {}
+    raw = load_bundled_data("veaf_libs", "data", "airdromes.yaml") or {}
     table: dict[str, dict[str, int]] = {}
     for theatre, airfields in (raw.get("theatres") or {}).items():
         table[theatre.strip().lower()] = {
@@ -17,15 +17,13 @@ from __future__ import annotations
 
 import functools
 
-import yaml
-
-from veaf_libs.bundled_data import read_bundled_text
+from veaf_libs.bundled_data import load_bundled_data
 
 
 @functools.lru_cache(maxsize=1)
 def _name_to_id() -> dict[str, int]:
     """Build (and cache) the case-insensitive name/alias -> id mapping."""
-    raw = yaml.safe_load(read_bundled_text("veaf_libs", "data", "dcs-countries.yaml"))
+    raw = load_bundled_data("veaf_libs", "data", "dcs-countries.yaml")
     mapping: dict[str, int] = {}
     for entry in raw.get("countries", []):
         country_id = int(entry["id"])
@@ -49,7 +47,7 @@ def all_country_ids() -> frozenset[int]:
     Returns:
         The frozen set of known ``country.id`` values.
     """
-    raw = yaml.safe_load(read_bundled_text("veaf_libs", "data", "dcs-countries.yaml"))
+    raw = load_bundled_data("veaf_libs", "data", "dcs-countries.yaml")
     return frozenset(int(entry["id"]) for entry in raw.get("countries", []))
 
 
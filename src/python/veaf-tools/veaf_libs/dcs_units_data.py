@@ -8,33 +8,167 @@ file marks it as wrong, because the category is structural rather than a validat
 Backed by the generated ``data/dcsUnits.yaml`` — the same database the build ships and the MCP
 oracle's ``list_unit_types`` serves — so a caller's notion of "is this a helicopter" cannot drift
 from what the tooling actually knows about (see ``veaf-build update-dcs-data``).
+
+The file is parsed once per process into a :class:`UnitCatalog` (:func:`unit_catalog`), indexed by
+type, category, kind and attribute, with a trigram index for the oracle's substring search: the
+lookups here and the oracle's queries answer from memory instead of re-reading 11 000 lines of YAML.
 """
 
 from __future__ import annotations
 
 import functools
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
 
 import yaml
 
-from veaf_libs.bundled_data import read_bundled_text
-
-
-@functools.lru_cache(maxsize=1)
-def _categories() -> dict[str, str]:
-    """Load (and cache) the ``{type_lower: category}`` table from ``dcsUnits.yaml``."""
-    raw = yaml.safe_load(read_bundled_text("veaf_libs", "data", "dcsUnits.yaml"))
-    # A malformed or reshaped file yields an empty table rather than an AttributeError mid-build:
+from veaf_libs.bundled_data import load_bundled_data
+
+
+@dataclass(frozen=True)
+class DcsUnitType:
+    """One entry of ``dcsUnits.yaml``."""
+
+    type: str
+    name: str
+    kind: str
+    """``air``, ``vehicle``, ``infantry``, ``naval`` or ``static``."""
+    category: str
+    description: str
+    attributes: tuple[str, ...]
+    fuel_capacity: float | None
+    """Maximum internal fuel in kg; only air units carry one."""
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the entry as the oracle lists it (a fresh dict, safe to modify)."""
+        return {
+            "type": self.type,
+            "name": self.name,
+            "category": self.category,
+            "kind": self.kind,
+            "description": self.description,
+            "attributes": list(self.attributes),
+        }
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[start : start + 3] for start in range(len(text) - 2)}
+
+
+class UnitCatalog:
+    """The DCS unit types, in file order, indexed for the lookups the tools make."""
+
+    def __init__(self, units: Iterable[DcsUnitType]) -> None:
+        self.units: tuple[DcsUnitType, ...] = tuple(units)
+        self._by_type: dict[str, DcsUnitType] = {}
+        self._by_category: dict[str, list[int]] = {}
+        self._by_kind: dict[str, list[int]] = {}
+        self._by_attribute: dict[str, list[int]] = {}
+        self._by_trigram: dict[str, set[int]] = {}
+        self._search_text: list[str] = []
+        for position, unit in enumerate(self.units):
+            self._by_type[unit.type.lower()] = unit  # a type listed twice: the last entry wins
+            self._by_category.setdefault(unit.category, []).append(position)
+            self._by_kind.setdefault(unit.kind, []).append(position)
+            for attribute in dict.fromkeys(unit.attributes):
+                self._by_attribute.setdefault(attribute, []).append(position)
+            # Type and name run together, as the oracle has always matched them.
+            text = f"{unit.type}{unit.name}".lower()
+            self._search_text.append(text)
+            for trigram in _trigrams(text):
+                self._by_trigram.setdefault(trigram, set()).add(position)
+
+    def get(self, unit_type: str) -> DcsUnitType | None:
+        """Return the entry for *unit_type* (case-insensitive, surrounding spaces ignored), or ``None``."""
+        return self._by_type.get(unit_type.strip().lower()) if unit_type else None
+
+    def search(
+        self,
+        *,
+        category: str | None = None,
+        kind: str | None = None,
+        attribute: str | None = None,
+        name_contains: str | None = None,
+    ) -> list[DcsUnitType]:
+        """Return the entries matching every filter given, in file order.
+
+        Args:
+            category: Exact category (``"Plane"``, ``"Armor"``…).
+            kind: Exact kind (``"air"``, ``"vehicle"``…).
+            attribute: Exact DCS attribute (``"SAM"``, ``"Tankers"``…).
+            name_contains: Case-insensitive substring of the type id and name run together.
+        """
+        candidates: set[int] | None = None
+        for index, key in ((self._by_category, category), (self._by_kind, kind), (self._by_attribute, attribute)):
+            if key is not None:
+                found = set(index.get(key, ()))
+                candidates = found if candidates is None else candidates & found
+        needle = name_contains.lower() if name_contains else None
+        if needle is not None and len(needle) >= 3:
+            # Every trigram of the needle occurs in a text holding it: the index narrows the
+            # candidates, the substring test below settles them.
+            for trigram in _trigrams(needle):
+                found = self._by_trigram.get(trigram, set())
+                candidates = set(found) if candidates is None else candidates & found
+                if not candidates:
+                    return []
+        positions = range(len(self.units)) if candidates is None else sorted(candidates)
+        return [
+            self.units[position] for position in positions if needle is None or needle in self._search_text[position]
+        ]
+
+    def categories(self) -> list[str]:
+        """Return the categories in use, sorted."""
+        return sorted(self._by_category)
+
+    def kinds(self) -> list[str]:
+        """Return the kinds in use, sorted."""
+        return sorted(self._by_kind)
+
+    def attributes(self) -> list[str]:
+        """Return the attributes in use, sorted."""
+        return sorted(self._by_attribute)
+
+
+def _number(value: Any) -> float | None:
+    return float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+
+
+def parse_unit_catalog(text: str) -> UnitCatalog:
+    """Build a :class:`UnitCatalog` from the text of ``dcsUnits.yaml``."""
+    return _catalog_from(yaml.safe_load(text))
+
+
+def _catalog_from(raw: Any) -> UnitCatalog:
+    # A malformed or reshaped file yields an empty catalog rather than an AttributeError mid-build:
     # every caller already handles "type not found", and that is the safer of the two failures.
-    units = raw.get("units") if isinstance(raw, dict) else None
-    table: dict[str, str] = {}
-    for entry in units or []:
+    entries = raw.get("units") if isinstance(raw, dict) else None
+    units = []
+    for entry in entries or []:
         if not isinstance(entry, dict):
             continue
         unit_type = str(entry.get("type") or "").strip()
-        category = str(entry.get("category") or "").strip()
-        if unit_type and category:
-            table[unit_type.lower()] = category
-    return table
+        if not unit_type:
+            continue
+        units.append(
+            DcsUnitType(
+                type=unit_type,
+                name=str(entry.get("name") or ""),
+                kind=str(entry.get("kind") or ""),
+                category=str(entry.get("category") or "").strip(),
+                description=str(entry.get("description") or ""),
+                attributes=tuple(str(attribute) for attribute in entry.get("attributes") or ()),
+                fuel_capacity=_number(entry.get("fuel_capacity")),
+            )
+        )
+    return UnitCatalog(units)
+
+
+@functools.lru_cache(maxsize=1)
+def unit_catalog() -> UnitCatalog:
+    """Return the catalog of the bundled ``dcsUnits.yaml``, parsed on first use."""
+    return _catalog_from(load_bundled_data("veaf_libs", "data", "dcsUnits.yaml"))
 
 
 def get_unit_category(unit_type: str) -> str | None:
@@ -48,25 +182,8 @@ def get_unit_category(unit_type: str) -> str | None:
         ``None`` for a type the database does not carry — which includes third-party mods, so an
         unknown type is a normal outcome and not an error.
     """
-    if not unit_type:
-        return None
-    return _categories().get(unit_type.strip().lower())
-
-
-@functools.lru_cache(maxsize=1)
-def _fuel_capacities() -> dict[str, float]:
-    """Load (and cache) the ``{type_lower: fuel_capacity}`` table from ``dcsUnits.yaml``."""
-    raw = yaml.safe_load(read_bundled_text("veaf_libs", "data", "dcsUnits.yaml"))
-    units = raw.get("units") if isinstance(raw, dict) else None
-    table: dict[str, float] = {}
-    for entry in units or []:
-        if not isinstance(entry, dict):
-            continue
-        unit_type = str(entry.get("type") or "").strip()
-        capacity = entry.get("fuel_capacity")
-        if unit_type and isinstance(capacity, (int, float)) and not isinstance(capacity, bool):
-            table[unit_type.lower()] = float(capacity)
-    return table
+    unit = unit_catalog().get(unit_type)
+    return (unit.category or None) if unit is not None else None
 
 
 def get_unit_fuel_capacity(unit_type: str) -> float | None:
@@ -83,6 +200,5 @@ def get_unit_fuel_capacity(unit_type: str) -> float | None:
     Returns:
         The capacity in kg, or ``None``.
     """
-    if not unit_type:
-        return None
-    return _fuel_capacities().get(unit_type.strip().lower())
+    unit = unit_catalog().get(unit_type)
+    return unit.fuel_capacity if unit is not None else None
@@ -0,0 +1,128 @@
+"""The on-disk side of VEAF_HOME's caches: one directory of ``<key><suffix>`` files, bounded by size.
+
+:mod:`veaf_libs.parse_cache` (parsed Lua tables) and :mod:`veaf_libs.image_cache` (rendered
+images) keep their entries the same way; what differs between them — what a key is made of, how a
+value becomes bytes, when the cache is on — stays in each. Here is only the storage:
+
+- An entry is written to a temp file in its directory, then renamed over its name, so a reader never
+  sees half an entry.
+- A hit refreshes the entry's mtime, and eviction deletes the oldest mtimes first: least recently
+  used, without an index to keep.
+- Only the files carrying the cache's suffix are entries: the temp files, and anything else in the
+  directory, are neither counted nor evicted.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+from veaf_libs.atomic_replace import atomic_replace
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """What ``veaf-tools cache stats`` reports."""
+
+    directory: Path
+    entries: int
+    size_bytes: int
+    max_bytes: int
+    enabled: bool
+
+
+def load(directory: Path, suffix: str, key: str) -> bytes | None:
+    """Return the bytes stored under *key*, or ``None`` when there are none or they cannot be read."""
+    entry = directory / f"{key}{suffix}"
+    try:
+        data = entry.read_bytes()
+    except OSError:
+        return None
+    # A hit makes the entry the most recently used one.
+    with contextlib.suppress(OSError):
+        os.utime(entry)
+    return data
+
+
+def store(directory: Path, suffix: str, key: str, data: bytes, limit: int) -> None:
+    """Store *data* under *key* atomically, then evict down to *limit* bytes.
+
+    Raises:
+        OSError: when the directory or the entry cannot be written; no temp file is left behind.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        atomic_replace(tmp_name, directory / f"{key}{suffix}")
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
+    evict(directory, suffix, limit)
+
+
+def discard(directory: Path, suffix: str, key: str) -> None:
+    """Delete the entry stored under *key*, if there is one."""
+    with contextlib.suppress(OSError):
+        os.unlink(directory / f"{key}{suffix}")
+
+
+def _entries(directory: Path, suffix: str) -> list[os.DirEntry[str]]:
+    try:
+        with os.scandir(directory) as scan:
+            return [item for item in scan if item.name.endswith(suffix) and item.is_file()]
+    except OSError:
+        return []
+
+
+def evict(directory: Path, suffix: str, limit: int) -> int:
+    """Delete least recently used entries until *directory* holds at most *limit* bytes of them.
+
+    Returns:
+        The number of entries deleted.
+    """
+    sized = []
+    for item in _entries(directory, suffix):
+        with contextlib.suppress(OSError):
+            stat = item.stat()
+            sized.append((stat.st_mtime, stat.st_size, item.path))
+    total = sum(size for _, size, _ in sized)
+    removed = 0
+    for _, size, path in sorted(sized):
+        if total <= limit:
+            break
+        with contextlib.suppress(OSError):
+            os.unlink(path)
+            total -= size
+            removed += 1
+    return removed
+
+
+def stats(directory: Path, suffix: str, max_bytes: int, enabled: bool) -> CacheStats:
+    """Return the size of the entries in *directory*, with the bound and state the caller gives."""
+    sizes = []
+    for item in _entries(directory, suffix):
+        with contextlib.suppress(OSError):
+            sizes.append(item.stat().st_size)
+    return CacheStats(
+        directory=directory, entries=len(sizes), size_bytes=sum(sizes), max_bytes=max_bytes, enabled=enabled
+    )
+
+
+def clear(directory: Path, suffix: str) -> int:
+    """Delete every entry in *directory*.
+
+    Returns:
+        The number of entries deleted.
+    """
+    removed = 0
+    for item in _entries(directory, suffix):
+        with contextlib.suppress(OSError):
+            os.unlink(item.path)
+            removed += 1
+    return removed
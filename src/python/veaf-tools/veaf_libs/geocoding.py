@@ -15,9 +15,8 @@ from functools import lru_cache
 from typing import Any, Protocol
 
 import requests
-import yaml
 
-from veaf_libs.bundled_data import read_bundled_text
+from veaf_libs.bundled_data import load_bundled_data
 
 #: Descriptive User-Agent required by the Nominatim usage policy.
 _USER_AGENT = "veaf-tools (+https://github.com/VEAF/VEAF-Mission-Creation-Tools)"
@@ -93,7 +92,7 @@ class GoogleGeocoder:
 @lru_cache(maxsize=1)
 def _bounds_table() -> dict[str, dict[str, Any]]:
     """Load the per-theatre bounding-box table (lowercased keys). Cached — static data."""
-    raw = yaml.safe_load(read_bundled_text("veaf_libs", "data", "theatre-bounds.yaml")) or {}
+    raw = load_bundled_data("veaf_libs", "data", "theatre-bounds.yaml") or {}
     return {str(k).lower(): v for k, v in raw.items()}
 
 
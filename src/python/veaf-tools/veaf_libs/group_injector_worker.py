@@ -4,7 +4,7 @@ from abc import abstractmethod
 from pathlib import Path
 from typing import Any
 
-from mission_tools import DcsMission, Group, read_miz, write_miz
+from mission_tools import DcsMission, Group, InMemoryMission, read_miz, write_miz
 
 from veaf_libs.base_worker import BaseWorker
 from veaf_libs.i18n import t
@@ -16,7 +16,8 @@ class GroupInjectorWorker(BaseWorker):
     """Abstract base worker for injectors that iterate over aircraft/helicopter groups.
 
     Subclasses implement :meth:`load_config` and :meth:`process_group`.
-    :meth:`work` handles the full read → iterate → write pipeline.
+    :meth:`work` handles the full read → iterate → write pipeline. Given an *in_memory* mission, the
+    worker edits it instead of reading ``input_mission``, and leaves the write to its owner.
     """
 
     def __init__(
@@ -24,10 +25,12 @@ class GroupInjectorWorker(BaseWorker):
         config_file: Path | None,
         input_mission: Path | None,
         output_mission: Path | None,
+        in_memory: InMemoryMission | None = None,
     ) -> None:
         self.config_file = config_file
         self.input_mission = input_mission
         self.output_mission = output_mission
+        self.in_memory = in_memory
         self.dcs_mission: DcsMission | None = None
         self.load_config()
 
@@ -40,14 +43,19 @@ class GroupInjectorWorker(BaseWorker):
         """Apply injection logic to a single group (mutates group.group_dcs in place)."""
 
     def read_mission(self, silent: bool = False) -> None:
-        """Load the mission from the .miz file."""
+        """Load the mission from the .miz file, or take the in-memory one."""
+        if self.in_memory is not None:
+            self.dcs_mission = self.in_memory.mission
+            return
         if not silent:
             logger.info(t("group_injector.reading_mission", path=self.input_mission))
         assert self.input_mission is not None
         self.dcs_mission = read_miz(self.input_mission)
 
     def write_mission(self, silent: bool = False) -> None:
-        """Write the modified mission to output_mission."""
+        """Write the modified mission to output_mission (nothing to do for an in-memory mission)."""
+        if self.in_memory is not None:
+            return
         if not silent:
             logger.info(t("group_injector.writing_mission"))
         assert self.dcs_mission is not None
@@ -0,0 +1,164 @@
+"""On-disk cache of rendered kneeboard images, keyed by what they are drawn from.
+
+Every ``veaf-tools build`` that injects presets draws one kneeboard page per (coalition, aircraft type)
+with Pillow and saves it with ``optimize=True``, which tries several PNG encodings: on the demo
+mission it is the slowest part of the presets step, and it redraws the same pages build after build.
+This module keeps each page in VEAF_HOME (``cache/images/``), named by the SHA-256 of everything it is
+drawn from, and hands the bytes back on the next build that would draw the same page.
+
+What goes into a key is the caller's: all of it, or a change would go unseen. A renderer passes the
+content it draws, its fonts (:func:`fonts_fingerprint`), the Pillow version and a version number of
+its own, bumped whenever its drawing code changes so that every entry drawn by the old code is
+orphaned instead of served. The checklist images of ``veaf_libs.checklist_images`` go through the
+same cache, under keys of their own.
+
+:func:`render_through` is the whole round trip for a batch of images: hits are loaded, misses are
+drawn (in a process pool when there are enough of them to pay for it) and stored.
+
+The cache is on unless ``VEAF_IMAGE_CACHE=0``; a hit returns the bytes the render produced, so it
+cannot change a build's output. Any cache failure (unreadable directory, full disk) degrades to
+rendering. After each store the least recently used entries (a hit refreshes an entry's mtime) are
+evicted until the directory is under :data:`MAX_BYTES` — the storage of :mod:`veaf_libs.disk_cache`,
+as for the parse cache.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import math
+import multiprocessing
+import os
+import time
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from veaf_libs import disk_cache
+from veaf_libs.logger import Logger
+
+logger = Logger("image-cache")
+
+_ENV_SWITCH = "VEAF_IMAGE_CACHE"
+_CACHE_DIR = Path("cache") / "images"
+_SUFFIX = ".png"
+
+#: Size bound of the cache directory: a kneeboard page is 20 to 100 KB, so a few thousand pages.
+MAX_BYTES = 128 * 1024 * 1024
+
+
+def is_enabled() -> bool:
+    """Return whether renders go through the cache: unless ``VEAF_IMAGE_CACHE`` is ``0``."""
+    return os.environ.get(_ENV_SWITCH, "").strip().lower() not in ("0", "false", "no", "off")
+
+
+def cache_dir() -> Path:
+    """Return the cache directory under VEAF_HOME (not created)."""
+    from veaf_libs.veaf_home import get_veaf_home
+
+    return get_veaf_home() / _CACHE_DIR
+
+
+def image_key(*parts: Any) -> str:
+    """Return the cache key of an image drawn from *parts* (plain data: JSON-able, or printable)."""
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def fonts_fingerprint(fonts: Iterable[Any]) -> list[Any]:
+    """Identify Pillow *fonts* for a key: each one's size and the SHA-256 of its file.
+
+    A font loaded from memory (Pillow's default) has no file: its size stands alone, and the Pillow
+    version in the key stands for its glyphs.
+    """
+    fingerprint = []
+    for font in fonts:
+        path = getattr(font, "path", None)
+        digest = None
+        if isinstance(path, str):
+            with contextlib.suppress(OSError):
+                digest = hashlib.sha256(Path(path).read_bytes()).hexdigest()
+        fingerprint.append([getattr(font, "size", None), digest])
+    return fingerprint
+
+
+#: What the pool costs before it draws anything: spawning its workers, which import the rendering
+#: stack again, side by side. Measured on the demo mission at 0.4 to 0.6 s, against 0.22 s to draw a
+#: kneeboard page and 0.05 s a checklist image inline.
+_POOL_STARTUP_SECONDS = 0.6
+
+
+def render_through(render: Callable[[Any], bytes], jobs: Mapping[str, Any]) -> dict[str, bytes]:
+    """Return ``render(job)`` for each ``key → job`` of *jobs*, served from the cache where possible.
+
+    The first miss is drawn inline, and its time decides the others: they are drawn in a process
+    pool, one worker per CPU, only when that is faster than drawing them inline once the pool's
+    start-up (:data:`_POOL_STARTUP_SECONDS`) is paid — from five kneeboard pages with a CPU per
+    page (seven on two CPUs), from fifteen checklist images. *render* must therefore be a
+    module-level function and each job picklable. A process that is itself a pool worker (``veaf-tools build-all``, whose
+    siblings already occupy the CPUs) always draws inline. Every miss is then stored.
+    """
+    rendered = {key: data for key in jobs if (data := load(key)) is not None}
+    missing = [key for key in jobs if key not in rendered]
+    if missing:
+        started = time.perf_counter()
+        rendered[missing[0]] = render(jobs[missing[0]])
+        seconds = time.perf_counter() - started
+        rest = missing[1:]
+        workers = min(len(rest), os.cpu_count() or 1)
+        pooled = _POOL_STARTUP_SECONDS + math.ceil(len(rest) / workers) * seconds if workers else 0.0
+        if workers > 1 and multiprocessing.parent_process() is None and pooled < len(rest) * seconds:
+            # `spawn` everywhere, as the build's other pools: forking a process that holds threads and
+            # open files (the logger's, the console's) is unsafe, and Windows only has `spawn`.
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+                rendered.update(zip(rest, pool.map(render, [jobs[key] for key in rest]), strict=True))
+        else:
+            rendered.update((key, render(jobs[key])) for key in rest)
+    for key in missing:
+        store(key, rendered[key])
+    return rendered
+
+
+def load(key: str) -> bytes | None:
+    """Return the image cached under *key*, or ``None`` on a miss or when the cache is off."""
+    if not is_enabled():
+        return None
+    try:
+        directory = cache_dir()
+    except OSError:
+        return None
+    return disk_cache.load(directory, _SUFFIX, key)
+
+
+def store(key: str, data: bytes) -> None:
+    """Cache *data* under *key* atomically, then evict down to the size bound. Never raises."""
+    if not is_enabled():
+        return
+    try:
+        disk_cache.store(cache_dir(), _SUFFIX, key, data, MAX_BYTES)
+    except OSError as error:
+        logger.debug(f"image cache: could not store {key}: {error}")
+
+
+def evict(limit: int) -> int:
+    """Delete least recently used entries until the cache holds at most *limit* bytes.
+
+    Returns:
+        The number of entries deleted.
+    """
+    return disk_cache.evict(cache_dir(), _SUFFIX, limit)
+
+
+def stats() -> disk_cache.CacheStats:
+    """Return the size and state of the cache."""
+    return disk_cache.stats(cache_dir(), _SUFFIX, MAX_BYTES, is_enabled())
+
+
+def clear() -> int:
+    """Delete every cache entry.
+
+    Returns:
+        The number of entries deleted.
+    """
+    return disk_cache.clear(cache_dir(), _SUFFIX)
@@ -39,6 +39,9 @@ WARNING = "warning"
 #: Trigger-zone name prefixes TheUniversalMission expects (one per coalition territory).
 _TUM_ZONE_PREFIXES = ("BLUFOR", "REDFOR")
 _GROUP_CATEGORIES = ("plane", "helicopter")
+#: The ``mission`` keys the checks read (the sequence-hole check walks the last two as well).
+#: The source mission is parsed down to these: `trig`, `trigrules` and the rest are skipped unparsed.
+_VALIDATED_MISSION_KEYS = frozenset({"coalition", "coalitions", "triggers", "theatre", "drawings"})
 
 
 @dataclass(frozen=True)
@@ -378,7 +381,9 @@ def _read_source_mission(folder: Path) -> tuple[dict | None, str | None]:
     try:
         import luadata  # type: ignore[import-untyped]
 
-        content = luadata.unserialize(mission_file.read_text(encoding="utf-8"), keep_as_dict=["trig", "trigrules"])
+        content = luadata.unserialize(
+            mission_file.read_text(encoding="utf-8"), keep_as_dict=["trig", "trigrules"], only=_VALIDATED_MISSION_KEYS
+        )
     except Exception as exc:  # noqa: BLE001 - reported to the caller rather than silently skipped
         return None, str(exc) or exc.__class__.__name__
     if not isinstance(content, dict):
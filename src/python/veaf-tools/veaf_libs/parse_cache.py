@@ -0,0 +1,196 @@
+"""On-disk cache of parsed Lua tables, keyed by content hash.
+
+One ``veaf-tools build`` reads the same ``mission`` / ``options`` / ``warehouses`` / ``l10n`` tables
+up to six times — builder, presets, waypoints, aircraft, warehouses, spawn data — and again for every
+weather variant, and each read parses megabytes of Lua. The bytes are the same every time, so the
+parse result is too: this module keeps it in VEAF_HOME (``cache/luadata/``) and hands it back on the
+next read of the same bytes. On ``test/mission`` a hit costs ~15 ms against ~450 ms to parse.
+
+The cache is **opt-in** — ``parse_cache: true`` in the user config, or ``VEAF_PARSE_CACHE=1`` — and
+must never change what a read returns:
+
+- The key is the SHA-256 of the member's bytes plus :data:`luadata.serializer.unserialize.PARSER_VERSION`,
+  the Python version and the parse options (``keep_as_dict``, ``only``…). A parser change that alters
+  its output bumps ``PARSER_VERSION``, which orphans every old entry instead of serving it.
+- Entries are stored with :mod:`marshal`: it loads as fast as pickle for plain data, and unlike pickle
+  it cannot run code on load — a cache file is never more than data.
+- Every hit is unmarshalled afresh, so callers may mutate what they get without touching the cache.
+- Any cache failure (unreadable directory, corrupt or truncated entry, full disk) degrades to a normal
+  parse. A corrupt entry is deleted on the way.
+
+The directory is bounded: after each store, the least recently used entries (a hit refreshes an
+entry's mtime) are evicted until the total is under ``parse_cache_max_mb`` (default 512 MB). The
+storage itself is :mod:`veaf_libs.disk_cache`'s, shared with the image cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import marshal
+import os
+import sys
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import luadata
+from luadata.serializer.unserialize import PARSER_VERSION
+
+from veaf_libs import disk_cache, resident_cache
+from veaf_libs.logger import Logger
+
+logger = Logger("parse-cache")
+
+_ENV_SWITCH = "VEAF_PARSE_CACHE"
+_CACHE_DIR = Path("cache") / "luadata"
+_SUFFIX = ".marshal"
+
+#: Default size bound of the cache directory, when ``parse_cache_max_mb`` is not set.
+DEFAULT_MAX_MB = 512
+
+
+def is_enabled() -> bool:
+    """Return whether reads should go through the cache.
+
+    ``VEAF_PARSE_CACHE`` (``1``/``0``) wins over the ``parse_cache`` user-config key, so a single run
+    can be switched either way without editing the config.
+    """
+    env = os.environ.get(_ENV_SWITCH, "").strip().lower()
+    if env:
+        return env in ("1", "true", "yes", "on")
+    from veaf_libs.user_config import get_parse_cache
+
+    return get_parse_cache()
+
+
+def cache_dir() -> Path:
+    """Return the cache directory under VEAF_HOME (not created)."""
+    from veaf_libs.veaf_home import get_veaf_home
+
+    return get_veaf_home() / _CACHE_DIR
+
+
+def max_bytes() -> int:
+    """Return the configured size bound of the cache directory, in bytes."""
+    from veaf_libs.user_config import get_parse_cache_max_mb
+
+    return get_parse_cache_max_mb(DEFAULT_MAX_MB) * 1024 * 1024
+
+
+def decode(raw: bytes) -> str:
+    """Decode a Lua member the way ``read_miz`` always has: UTF-8, universal newlines."""
+    with io.TextIOWrapper(io.BytesIO(raw), encoding="utf-8") as wrapper:
+        return wrapper.read()
+
+
+def cache_key(
+    raw: bytes,
+    keep_as_dict: list[str] | None = None,
+    all_is_dict: bool = False,
+    only: Iterable[str] | None = None,
+) -> str:
+    """Return the cache key of *raw* parsed with these options."""
+    digest = hashlib.sha256(raw)
+    options = (
+        PARSER_VERSION,
+        marshal.version,
+        sys.version_info[:2],
+        sorted(keep_as_dict or ()),
+        all_is_dict,
+        None if only is None else sorted(only),
+    )
+    digest.update(repr(options).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def unserialize(
+    raw: bytes,
+    keep_as_dict: list[str] | None = None,
+    all_is_dict: bool = False,
+    only: Iterable[str] | None = None,
+) -> Any:
+    """Parse the Lua member *raw*, through the cache when it is enabled.
+
+    Returns exactly what ``luadata.unserialize(decode(raw), ...)`` returns, and raises what it raises.
+    In a resident build (see :mod:`veaf_libs.resident_cache`) the parse is also kept in memory.
+    """
+    if resident_cache.is_enabled():
+        key = cache_key(raw, keep_as_dict=keep_as_dict, all_is_dict=all_is_dict, only=only)
+        return resident_cache.memoize(
+            ("luadata", key),
+            lambda: _unserialize(raw, keep_as_dict=keep_as_dict, all_is_dict=all_is_dict, only=only),
+        )
+    return _unserialize(raw, keep_as_dict=keep_as_dict, all_is_dict=all_is_dict, only=only)
+
+
+def _unserialize(
+    raw: bytes,
+    keep_as_dict: list[str] | None = None,
+    all_is_dict: bool = False,
+    only: Iterable[str] | None = None,
+) -> Any:
+    if not is_enabled():
+        return luadata.unserialize(decode(raw), keep_as_dict=keep_as_dict, all_is_dict=all_is_dict, only=only)
+
+    key = cache_key(raw, keep_as_dict=keep_as_dict, all_is_dict=all_is_dict, only=only)
+    try:
+        directory = cache_dir()
+    except OSError:
+        return luadata.unserialize(decode(raw), keep_as_dict=keep_as_dict, all_is_dict=all_is_dict, only=only)
+
+    hit = _load(directory, key)
+    if hit is not None:
+        return hit[0]
+
+    value = luadata.unserialize(decode(raw), keep_as_dict=keep_as_dict, all_is_dict=all_is_dict, only=only)
+    _store(directory, key, value)
+    return value
+
+
+def _load(directory: Path, key: str) -> tuple[Any] | None:
+    """Return ``(value,)`` for a readable entry, or ``None`` on a miss."""
+    data = disk_cache.load(directory, _SUFFIX, key)
+    if data is None:
+        return None
+    try:
+        return (marshal.loads(data),)
+    except (EOFError, ValueError, TypeError):
+        logger.debug(f"parse cache: dropping unreadable entry {key}{_SUFFIX}")
+        disk_cache.discard(directory, _SUFFIX, key)
+        return None
+
+
+def _store(directory: Path, key: str, value: Any) -> None:
+    """Write *value* under *key*, then evict down to the size bound. Never raises."""
+    try:
+        data = marshal.dumps(value)
+    except ValueError:
+        return  # not plain data — cannot happen with luadata, but never worth failing a read over
+    try:
+        disk_cache.store(directory, _SUFFIX, key, data, max_bytes())
+    except OSError as error:
+        logger.debug(f"parse cache: could not store {key}{_SUFFIX}: {error}")
+
+
+def evict(limit: int) -> int:
+    """Delete least recently used entries until the cache holds at most *limit* bytes.
+
+    Returns:
+        The number of entries deleted.
+    """
+    return disk_cache.evict(cache_dir(), _SUFFIX, limit)
+
+
+def stats() -> disk_cache.CacheStats:
+    """Return the size and state of the cache."""
+    return disk_cache.stats(cache_dir(), _SUFFIX, max_bytes(), is_enabled())
+
+
+def clear() -> int:
+    """Delete every cache entry.
+
+    Returns:
+        The number of entries deleted.
+    """
+    return disk_cache.clear(cache_dir(), _SUFFIX)
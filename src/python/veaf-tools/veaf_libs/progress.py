@@ -11,6 +11,7 @@ from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeRe
 from rich.spinner import Spinner
 from rich.text import Text
 
+from . import build_profiler
 from .i18n import t
 from .logger import console, logger
 
@@ -43,6 +44,23 @@ def spinner_context(
     done_color: str = "bold blue",
 ):
     """Context manager for work-in-progress spinner with done message"""
+    # Each block is a stage of `build --timings` (see veaf_libs.build_profiler), shown or not.
+    with (
+        build_profiler.stage(message.removesuffix("...")),
+        _spinner(message, done_message, silent, msg_color, spinner_color, done_color) as control,
+    ):
+        yield control
+
+
+@contextmanager
+def _spinner(
+    message: str,
+    done_message: str | None,
+    silent: bool,
+    msg_color: str,
+    spinner_color: str,
+    done_color: str,
+):
     if silent:
         control = SpinnerControl(done_message=done_message)
         yield control
@@ -103,6 +121,24 @@ def progress_context(
     done_color: str = "bold blue",
 ):
     """Context manager for iterating over a collection with a progress bar."""
+    with (
+        build_profiler.stage(message.removesuffix("...")),
+        _progress(collection, message, done_message, silent, total, msg_color, bar_color, done_color) as items,
+    ):
+        yield items
+
+
+@contextmanager
+def _progress(
+    collection: Iterable[Any],
+    message: str,
+    done_message: str | None,
+    silent: bool,
+    total: int | None,
+    msg_color: str,
+    bar_color: str,
+    done_color: str,
+):
     if silent:
         yield iter(collection)
     else:
@@ -0,0 +1,135 @@
+"""What a resident ``veaf-tools build --watch`` keeps in memory from one rebuild to the next.
+
+A one-shot build starts from nothing, so parsing is the bulk of it: the Lua tables of the mission,
+``spawnables.yaml`` (read three times per build, ~2 s a read for the demo mission's), and the few
+hundred scripts collected into the ``.miz``. A watching build runs again seconds later on mostly the
+same files, so this module keeps what those reads returned and hands it back while they are the same:
+
+- :func:`read_bytes` and :func:`load_yaml` are keyed by the file's path, size and mtime — the stat
+  bargain the build manifest strikes too (see :mod:`veaf_libs.build_manifest`);
+- :func:`memoize` is keyed by whatever the caller says identifies the value; :mod:`veaf_libs.parse_cache`
+  uses the content hash of the Lua member.
+
+The cache is off until :func:`enable` is called, and reads are then what they would have been:
+values are kept pickled and every hit is unpickled afresh, so callers may mutate what they get.
+It is bounded to :data:`MAX_BYTES`, dropping the least recently used entries first.
+
+``veaf-tools build-all`` uses it the other way round: :func:`preload` reads the files every mission
+shares before the build processes are forked, and :func:`read_bytes` serves them from then on, in
+every process, whether the cache is enabled or not.
+"""
+
+from __future__ import annotations
+
+import pickle
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+#: Bound of the cache, in bytes of kept (pickled) data.
+MAX_BYTES = 512 * 1024 * 1024
+
+_enabled = False
+_entries: OrderedDict[Hashable, bytes] = OrderedDict()
+_size = 0
+
+
+def enable(enabled: bool = True) -> None:
+    """Switch the cache on (or off, which also empties it)."""
+    global _enabled
+    _enabled = enabled
+    if not enabled:
+        clear()
+
+
+def is_enabled() -> bool:
+    """Return whether reads go through the cache."""
+    return _enabled
+
+
+def clear() -> None:
+    """Forget everything kept so far."""
+    global _size
+    _entries.clear()
+    _size = 0
+
+
+def _recall(key: Hashable) -> bytes | None:
+    data = _entries.get(key)
+    if data is not None:
+        _entries.move_to_end(key)
+    return data
+
+
+def _remember(key: Hashable, data: bytes) -> None:
+    global _size
+    if len(data) > MAX_BYTES:
+        return
+    previous = _entries.pop(key, None)
+    if previous is not None:
+        _size -= len(previous)
+    _entries[key] = data
+    _size += len(data)
+    while _size > MAX_BYTES:
+        _, dropped = _entries.popitem(last=False)
+        _size -= len(dropped)
+
+
+def memoize(key: Hashable, compute: Callable[[], Any]) -> Any:
+    """Return ``compute()``, or a fresh copy of what it returned for *key* before.
+
+    An exception from *compute* is not kept: the next call computes again.
+    """
+    if not _enabled:
+        return compute()
+    data = _recall(key)
+    if data is not None:
+        return pickle.loads(data)
+    value = compute()
+    try:
+        _remember(key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except (pickle.PicklingError, TypeError, AttributeError):
+        pass  # not plain data: served, just not kept
+    return value
+
+
+def _stat_key(kind: str, path: Path) -> tuple:
+    stat = path.stat()
+    return (kind, str(path), stat.st_size, stat.st_mtime_ns)
+
+
+def preload(paths: Iterable[Path]) -> None:
+    """Keep the content of each of *paths*, for :func:`read_bytes` to serve even while the cache is off.
+
+    Preloaded entries are bounded, and emptied by :func:`clear`, like any other.
+    """
+    for path in paths:
+        _remember(_stat_key("bytes", path), path.read_bytes())
+
+
+def read_bytes(path: Path) -> bytes:
+    """Return the content of *path*, as ``Path.read_bytes`` does."""
+    if not (_enabled or _entries):
+        return path.read_bytes()
+    key = _stat_key("bytes", path)
+    data = _recall(key)
+    if data is None:
+        data = path.read_bytes()
+        if _enabled:
+            _remember(key, data)
+    return data
+
+
+def load_yaml(path: Path) -> Any:
+    """Return ``yaml.safe_load`` of the UTF-8 file *path*, and raise what reading or parsing it raises."""
+    if not _enabled:
+        return _load_yaml(path)
+    return memoize(_stat_key("yaml", path), lambda: _load_yaml(path))
+
+
+def _load_yaml(path: Path) -> Any:
+    with open(path, encoding="utf-8") as f:
+        return yaml.safe_load(f)
@@ -98,6 +98,13 @@ COMMANDS: list[CommandSpec] = [
             ArgPrompt("mission_folder", t("tui.arg.mission_folder"), default=".", is_option=False, resolve_path=True),
         ],
     ),
+    CommandSpec(
+        cli_name="build-all",
+        description=t("tui.cmd.build_all.description"),
+        prompts=[
+            ArgPrompt("root", t("tui.arg.build_all_root"), default=".", is_option=False),
+        ],
+    ),
     CommandSpec(
         cli_name="inject-presets",
         description=t("tui.cmd.inject_presets.description"),
@@ -298,6 +305,15 @@ COMMANDS: list[CommandSpec] = [
         description=t("tui.cmd.user_config.description"),
         prompts=[],
     ),
+    CommandSpec(
+        cli_name="cache",
+        description=t("tui.cmd.cache.description"),
+        prompts=[
+            ArgPrompt(
+                "action", t("tui.arg.cache_action"), default="stats", is_option=False, choices=["stats", "clear"]
+            ),
+        ],
+    ),
     CommandSpec(
         cli_name="ask",
         description=t("tui.cmd.ask.description"),
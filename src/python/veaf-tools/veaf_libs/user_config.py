@@ -24,6 +24,15 @@ Supported keys
     when neither the CLI ``--scripts-path`` flag nor ``mission.yaml`` provides a value.
     Default: ``null`` (auto-detect).
 
+``parse_cache``
+    Keep parsed mission tables in VEAF_HOME (``cache/luadata/``) so the next read of the same
+    bytes skips the Lua parse — see ``veaf_libs.parse_cache``. Overridden by the
+    ``VEAF_PARSE_CACHE`` env var. Default: ``false``.
+
+``parse_cache_max_mb``
+    Size bound of that cache; least recently used entries are evicted beyond it.
+    Default: ``512``.
+
 Example ``~/veafmct.yaml``::
 
     lang: fr
@@ -129,6 +138,20 @@ def get_scripts_path() -> Path | None:
     return None
 
 
+def get_parse_cache() -> bool:
+    """Return whether the on-disk parse cache is enabled (default: ``False``)."""
+    val = get("parse_cache")
+    return val if isinstance(val, bool) else False
+
+
+def get_parse_cache_max_mb(default: int) -> int:
+    """Return the parse cache size bound in MB, or *default* if unset or invalid."""
+    val = get("parse_cache_max_mb")
+    if isinstance(val, int) and not isinstance(val, bool) and val >= 0:
+        return val
+    return default
+
+
 def config_file_path() -> Path | None:
     """Return the path of the active config file, or ``None`` if none exists."""
     return _find_config_file()
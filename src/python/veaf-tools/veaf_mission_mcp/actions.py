@@ -52,6 +52,12 @@ from veaf_mission_mcp.set_unit_properties import set_unit_properties
 def register_default_actions(catalog: ActionCatalog) -> None:
     """Register every action shipped by this server into `catalog`.
 
+    The actions registered ``batchable`` read and write their mission only through
+    :mod:`veaf_mission_mcp.mission_folder`, so ``run_actions`` can run them in one transaction. The
+    composites (they write ``mission.yaml`` as they go) and the actions editing the `.miz` archive
+    directly are not. The actions registered ``read_only`` write nothing, so they may run alongside
+    one another on the same mission.
+
     Args:
         catalog: The catalog to populate.
     """
@@ -71,6 +77,7 @@ def register_default_actions(catalog: ActionCatalog) -> None:
             },
         ),
         handler=lambda params: describe_mission(Path(params["miz_path"])),
+        read_only=True,
     )
     catalog.register(
         ActionSpec(
@@ -124,6 +131,7 @@ def register_default_actions(catalog: ActionCatalog) -> None:
             limit=params.get("limit"),
             include_route=params.get("include_route", True),
         ),
+        read_only=True,
     )
     catalog.register(
         ActionSpec(
@@ -197,6 +205,7 @@ def register_default_actions(catalog: ActionCatalog) -> None:
             },
         ),
         handler=_handle_set_unit_properties,
+        batchable=True,
     )
     catalog.register(
         ActionSpec(
@@ -268,6 +277,7 @@ def register_default_actions(catalog: ActionCatalog) -> None:
             },
         ),
         handler=_handle_set_group_properties,
+        batchable=True,
     )
     catalog.register(
         ActionSpec(
@@ -357,6 +367,7 @@ def register_default_actions(catalog: ActionCatalog) -> None:
             },
         ),
         handler=_handle_edit_route,
+        batchable=True,
     )
     catalog.register(
         ActionSpec(
@@ -422,6 +433,7 @@ def register_default_actions(catalog: ActionCatalog) -> None:
             },
         ),
         handler=_handle_edit_zone,
+        batchable=True,
     )
     catalog.register(
         ActionSpec(
@@ -492,6 +504,7 @@ def register_default_actions(catalog: ActionCatalog) -> None:
             },
         ),
         handler=_handle_add_map_drawing,
+        batchable=True,
     )
     catalog.register(
         ActionSpec(
@@ -533,6 +546,7 @@ def register_default_actions(catalog: ActionCatalog) -> None:
             },
         ),
         handler=_handle_edit_map_drawing,
+        batchable=True,
     )
     catalog.register(
         ActionSpec(
@@ -627,6 +641,7 @@ def register_default_actions(catalog: ActionCatalog) -> None:
             },
         ),
         handler=_handle_add_group,
+        batchable=True,
     )
     catalog.register(
         ActionSpec(
@@ -734,6 +749,7 @@ def register_default_actions(catalog: ActionCatalog) -> None:
             },
         ),
         handler=_handle_add_player_slot,
+        batchable=True,
     )
     catalog.register(
         ActionSpec(
@@ -815,6 +831,7 @@ def register_default_actions(catalog: ActionCatalog) -> None:
             },
         ),
         handler=_handle_add_air_group,
+        batchable=True,
     )
     catalog.register(
         ActionSpec(
@@ -847,6 +864,7 @@ def register_default_actions(catalog: ActionCatalog) -> None:
             },
         ),
         handler=_handle_remove_group,
+        batchable=True,
     )
     catalog.register(
         ActionSpec(
@@ -887,6 +905,7 @@ def register_default_actions(catalog: ActionCatalog) -> None:
             },
         ),
         handler=_handle_add_trigger_zone,
+        batchable=True,
     )
     catalog.register(
         ActionSpec(
@@ -1031,6 +1050,7 @@ def register_default_actions(catalog: ActionCatalog) -> None:
             },
         ),
         handler=lambda p: describe_mission_config(Path(p["mission_yaml_path"])),
+        read_only=True,
     )
     catalog.register(
         ActionSpec(
@@ -1064,6 +1084,8 @@ def register_default_actions(catalog: ActionCatalog) -> None:
             miz_path=Path(p["miz_path"]) if p.get("miz_path") else None,
             expected_combat_zone=p.get("expected_combat_zone"),
         ),
+        batchable=True,
+        read_only=True,
     )
     catalog.register(
         ActionSpec(
@@ -1230,6 +1252,7 @@ def register_default_actions(catalog: ActionCatalog) -> None:
             },
         ),
         handler=lambda p: validate_mission(Path(p["folder_path"])),
+        read_only=True,
     )
     catalog.register(
         ActionSpec(
@@ -1273,6 +1296,7 @@ def register_default_actions(catalog: ActionCatalog) -> None:
             },
         ),
         handler=lambda p: set_airbase_coalition(Path(p["folder_path"]), name=p["name"], coalition=p["coalition"]),
+        batchable=True,
     )
     catalog.register(
         ActionSpec(
@@ -1453,6 +1477,7 @@ def register_default_actions(catalog: ActionCatalog) -> None:
             },
         ),
         handler=lambda p: describe_map(Path(p["mission_path"])),
+        read_only=True,
     )
     catalog.register(
         ActionSpec(
@@ -1485,6 +1510,7 @@ def register_default_actions(catalog: ActionCatalog) -> None:
             },
         ),
         handler=lambda p: resolve_coordinates(Path(p["mission_path"]), p["position"]),
+        read_only=True,
     )
     catalog.register(
         ActionSpec(
@@ -1521,24 +1547,37 @@ def register_default_actions(catalog: ActionCatalog) -> None:
             bearing=p.get("bearing"),
             distance_km=p.get("distance_km"),
         ),
+        read_only=True,
     )
     catalog.register(
         ActionSpec(
             name="list_unit_types",
             description=(
                 "List DCS unit types from the canonical generated database (the same the build "
-                "ships). Filter by category and/or a name substring. Read-only knowledge for the "
-                "LLM to pick concrete unit types."
+                "ships). Filter by category, kind, DCS attribute and/or a name substring. Read-only "
+                "knowledge for the LLM to pick concrete unit types."
             ),
             parameters_schema={
                 "type": "object",
                 "properties": {
                     "category": {"type": "string", "description": "Exact category, e.g. 'Plane', 'Armor'."},
                     "name_contains": {"type": "string", "description": "Case-insensitive substring on id+name."},
+                    "kind": {
+                        "type": "string",
+                        "enum": ["air", "vehicle", "infantry", "naval", "static"],
+                        "description": "Exact kind.",
+                    },
+                    "attribute": {"type": "string", "description": "Exact DCS attribute, e.g. 'SAM', 'Tankers'."},
                 },
             },
         ),
-        handler=lambda p: list_unit_types(category=p.get("category"), name_contains=p.get("name_contains")),
+        handler=lambda p: list_unit_types(
+            category=p.get("category"),
+            name_contains=p.get("name_contains"),
+            kind=p.get("kind"),
+            attribute=p.get("attribute"),
+        ),
+        read_only=True,
     )
     catalog.register(
         ActionSpec(
@@ -1555,6 +1594,7 @@ def register_default_actions(catalog: ActionCatalog) -> None:
             },
         ),
         handler=lambda p: list_shortcuts(name_contains=p.get("name_contains")),
+        read_only=True,
     )
     catalog.register(
         ActionSpec(
@@ -1567,6 +1607,7 @@ def register_default_actions(catalog: ActionCatalog) -> None:
             parameters_schema={"type": "object", "properties": {}},
         ),
         handler=lambda _p: describe_naming_conventions(),
+        read_only=True,
     )
     catalog.register(
         ActionSpec(
@@ -1591,6 +1632,7 @@ def register_default_actions(catalog: ActionCatalog) -> None:
             p["module_id"],
             mission_yaml_path=Path(p["mission_yaml_path"]) if p.get("mission_yaml_path") else None,
         ),
+        read_only=True,
     )
 
 
@@ -23,16 +23,15 @@ import math
 from pathlib import Path
 from typing import Any
 
+from mission_tools.group_index import AIR_CATEGORIES, GroupIndex
 from mission_tools.group_insertion import add_group as insert_group
 from mission_tools.group_insertion import air_category_for_type_verbose
-from mission_tools.miz_backup import backup_before_write
-from mission_tools.miz_tools import read_miz, write_miz
 from veaf_libs.dcs_airdromes import airdrome_id_for_name
 from veaf_libs.dcs_parking import ParkingStand, aircraft_stands_for_airbase, has_theatre, stands_for_airbase
 from veaf_libs.mission_table import indexed
 
 from veaf_mission_mcp.aircraft_payload import build_aircraft_payload
-from veaf_mission_mcp.mission_folder import load_folder_mission, save_folder_mission
+from veaf_mission_mcp.mission_folder import commit_mission, open_mission
 
 #: Unit conversions (mission file stores metres and m/s; the caller speaks feet and knots).
 _M_PER_FT = 0.3048
@@ -113,11 +112,7 @@ def add_air_group(
     if count < 1:
         raise ValueError(f"count must be at least 1, got {count}")
 
-    is_folder = target.is_dir()
-    mission = load_folder_mission(target) if is_folder else read_miz(target)
-    if mission.mission_content is None:
-        raise ValueError(f"Not a valid DCS mission (missing 'mission' content): {target}")
-    content = mission.mission_content
+    mission, content = open_mission(target)
 
     # An explicit parking list is the authority on the flight size, so `count` and the number of
     # stands can never disagree (a mismatch would index past the chosen stands when building units).
@@ -131,7 +126,7 @@ def add_air_group(
     if start in _PARKING_MODES or start == "runway":
         airdrome_id = _resolve_airfield(content, airfield)
         if start in _PARKING_MODES:
-            stands = _select_stands(content, airfield, airdrome_id, count, parking)
+            stands = _select_stands(content, mission.group_index(), airfield, airdrome_id, count, parking)
         else:  # runway: anchor on the field without occupying a stand
             position = _runway_anchor(content, airfield, airdrome_id)
 
@@ -169,18 +164,15 @@ def add_air_group(
         country_name=country_name,
         category=category,
         group=group,
+        index=mission.group_index(),
     )
 
-    if is_folder:
-        save_folder_mission(mission, target)
-    else:
-        backup_before_write(target)
-        write_miz(mission, target)
+    durable = commit_mission(mission, target)["durable"]
 
     result: dict[str, Any] = {
         "group_id": group_id,
         "name": name,
-        "durable": is_folder,
+        "durable": durable,
         "start": start,
         "category": category,
         "airdrome_id": airdrome_id,
@@ -222,12 +214,18 @@ def _runway_anchor(content: dict[str, Any], airfield: str | None, airdrome_id: i
 
 
 def _select_stands(
-    content: dict[str, Any], airfield: str | None, airdrome_id: int, count: int, requested: list[str] | None
+    content: dict[str, Any],
+    index: GroupIndex,
+    airfield: str | None,
+    airdrome_id: int,
+    count: int,
+    requested: list[str] | None,
 ) -> list[ParkingStand]:
     """Pick `count` aircraft stands at the airbase, avoiding those the mission already occupies.
 
     Args:
-        content: The parsed mission table (to read occupied stands).
+        content: The parsed mission table (for its theatre).
+        index: The mission's group index (to read occupied stands).
         airfield: The airfield name, for error messages.
         airdrome_id: The resolved airdrome id.
         count: How many stands are needed.
@@ -249,7 +247,7 @@ def _select_stands(
     all_stands = aircraft_stands_for_airbase(theatre, airdrome_id)
     if not all_stands:
         raise ValueError(f"airfield {airfield!r} (id {airdrome_id}) has no aircraft parking stands in the capture")
-    occupied = _occupied_stands(content, airdrome_id)
+    occupied = _occupied_stands(index, airdrome_id)
     by_number = {s.parking: s for s in all_stands}
 
     if requested is not None:
@@ -271,28 +269,23 @@ def _select_stands(
     return free[:count]
 
 
-def _occupied_stands(content: dict[str, Any], airdrome_id: int) -> dict[str, str]:
+def _occupied_stands(index: GroupIndex, airdrome_id: int) -> dict[str, str]:
     """Return ``{stand number: group name}`` for stands already used at this airbase.
 
     A stand is occupied when an aircraft group's first waypoint targets this airdrome and one of its
     units declares that ``parking``. Placing a second aircraft there merges them into one another.
     """
     occupied: dict[str, str] = {}
-    for coalition in (content.get("coalition") or {}).values():
-        if not isinstance(coalition, dict):
+    for entry in index.groups:
+        if entry.category not in AIR_CATEGORIES:
+            continue
+        points = indexed((entry.group.get("route") or {}).get("points"))
+        if not points or points[0].get("airdromeId") != airdrome_id:
             continue
-        for country in indexed(coalition.get("country")):
-            if not isinstance(country, dict):
-                continue
-            for category in ("plane", "helicopter"):
-                for group in indexed((country.get(category) or {}).get("group")):
-                    points = indexed((group.get("route") or {}).get("points"))
-                    if not points or points[0].get("airdromeId") != airdrome_id:
-                        continue
-                    for unit in indexed(group.get("units")):
-                        spot = unit.get("parking")
-                        if spot is not None:
-                            occupied[str(spot)] = str(group.get("name", ""))
+        for unit in entry.units:
+            spot = unit.get("parking")
+            if spot is not None:
+                occupied[str(spot)] = entry.name
     return occupied
 
 
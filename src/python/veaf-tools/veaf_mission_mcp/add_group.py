@@ -11,12 +11,11 @@ in the DCS Mission Editor: not deduplicated, calling this twice creates two grou
 from pathlib import Path
 from typing import Any
 
+from mission_tools.group_index import GroupIndex
 from mission_tools.group_insertion import add_group as insert_group
-from mission_tools.miz_backup import backup_before_write
-from mission_tools.miz_tools import read_miz, write_miz
 
 from veaf_mission_mcp.group_naming import resolve_group_name, validate_group_name
-from veaf_mission_mcp.mission_folder import load_folder_mission, save_folder_mission
+from veaf_mission_mcp.mission_folder import commit_mission, open_mission
 
 _UNIT_SPACING_METERS = 20
 _DEFAULT_SPEED_MPS = 5.5555555555556  # ~20 km/h, a typical DCS ground-group cruise speed
@@ -83,13 +82,11 @@ def add_group(
         ValueError: If the target is not a valid mission, or `units` yields no units.
     """
     is_folder = target.is_dir()
-    mission = load_folder_mission(target) if is_folder else read_miz(target)
-    if mission.mission_content is None:
-        raise ValueError(f"Not a valid DCS mission (missing 'mission' content): {target}")
+    mission, content = open_mission(target)
 
     name = resolve_group_name(name, for_combat_zone=for_combat_zone, as_spawn_template=as_spawn_template)
     group_id = insert_group_into_content(
-        mission.mission_content,
+        content,
         coalition=coalition,
         country_id=country_id,
         country_name=country_name,
@@ -100,6 +97,7 @@ def add_group(
         route=route,
         patrol=patrol,
         late_activation=late_activation,
+        index=mission.group_index(),
     )
 
     # A folder has no single `.miz` to scan for the combat-zone capture trap, so validate names-only
@@ -107,13 +105,9 @@ def add_group(
     validate_kwargs = {} if is_folder else {"miz_path": target}
     warnings = validate_group_name(name, expected_combat_zone=for_combat_zone, **validate_kwargs)["warnings"]
 
-    if is_folder:
-        save_folder_mission(mission, target)  # writes src/mission/, backed up
-    else:
-        backup_before_write(target)
-        write_miz(mission, target)
+    durable = commit_mission(mission, target)["durable"]  # a folder's src/mission/, or the .miz; backed up
 
-    return {"group_id": group_id, "name": name, "durable": is_folder, "warnings": warnings}
+    return {"group_id": group_id, "name": name, "durable": durable, "warnings": warnings}
 
 
 def insert_group_into_content(
@@ -129,6 +123,7 @@ def insert_group_into_content(
     route: list[dict[str, float]] | None = None,
     patrol: bool = False,
     late_activation: bool = False,
+    index: GroupIndex | None = None,
 ) -> int:
     """Build a group and insert it into `mission_content` in place; return its fresh `groupId`.
 
@@ -148,6 +143,7 @@ def insert_group_into_content(
         route: Optional waypoints; defaults to a stationary point at `position`.
         patrol: Loop the route back to its start.
         late_activation: Mark the group late-activation.
+        index: The mission's group index, kept up to date with the insertion.
 
     Returns:
         The fresh ``groupId`` assigned to the inserted group.
@@ -165,6 +161,7 @@ def insert_group_into_content(
         country_name=country_name,
         category=category,
         group=group,
+        index=index,
     )
 
 
@@ -1,12 +1,19 @@
 """Registry of MCP actions exposed by the mission-editing server."""
 
 from collections.abc import Callable
+from pathlib import Path
+from time import perf_counter
 from typing import Any
 
+from veaf_mission_mcp import mission_folder
 from veaf_mission_mcp.models import ActionSpec
+from veaf_mission_mcp.workers import mission_locks
 
 ActionHandler = Callable[[dict[str, Any]], Any]
 
+#: The parameters through which an action names the mission (or folder) it works on.
+TARGET_PARAMETERS = ("miz_path", "folder_path", "mission_path", "mission_yaml_path", "target", "target_folder")
+
 
 class ActionNotFoundError(Exception):
     """Raised by ``describe_action``/``run_action`` for an unregistered action name."""
@@ -16,22 +23,48 @@ class ActionNotFoundError(Exception):
         self.name = name
 
 
+class ActionBatchError(Exception):
+    """Raised by ``run_actions`` when a step fails; the step's own error is chained as the cause."""
+
+    def __init__(self, index: int, name: str, error: Exception) -> None:
+        super().__init__(f"Step {index} ({name}) failed, nothing was written: {error}")
+        self.index = index
+        self.name = name
+
+
 class ActionCatalog:
     """Registers and dispatches the actions exposed by the mission-editing MCP server."""
 
     def __init__(self) -> None:
         self._specs: dict[str, ActionSpec] = {}
         self._handlers: dict[str, ActionHandler] = {}
+        self._batchable: set[str] = set()
+        self._read_only: set[str] = set()
 
-    def register(self, spec: ActionSpec, handler: ActionHandler) -> None:
+    def register(
+        self, spec: ActionSpec, handler: ActionHandler, *, batchable: bool = False, read_only: bool = False
+    ) -> None:
         """Register an action under its spec's name.
 
         Args:
             spec: The action's name, description and parameter JSON Schema.
             handler: Callable invoked by ``run_action`` with the ``params`` dict.
+            batchable: Whether ``run_actions`` may run it: the action reads and writes its mission only
+                through :mod:`veaf_mission_mcp.mission_folder`, so a transaction can hold its write back.
+            read_only: Whether the action only reads the missions it names, so it may run alongside
+                other reads of them; any other action has them to itself while it runs.
         """
         self._specs[spec.name] = spec
         self._handlers[spec.name] = handler
+        for flag, names in ((batchable, self._batchable), (read_only, self._read_only)):
+            if flag:
+                names.add(spec.name)
+            else:
+                names.discard(spec.name)
+
+    def batchable_actions(self) -> list[str]:
+        """Return the names ``run_actions`` accepts, in registration order."""
+        return [name for name in self._specs if name in self._batchable]
 
     def list_catalog(self) -> list[ActionSpec]:
         """Return every registered action's spec, in registration order.
@@ -61,6 +94,9 @@ class ActionCatalog:
     def run_action(self, name: str, params: dict[str, Any]) -> Any:
         """Dispatch to a registered action's handler.
 
+        The missions the action names (see :data:`TARGET_PARAMETERS`) are locked while it runs: shared
+        with other reads for a ``read_only`` action, exclusive otherwise.
+
         Args:
             name: The action's registered name.
             params: Parameters forwarded to the handler as-is.
@@ -75,4 +111,69 @@ class ActionCatalog:
             handler = self._handlers[name]
         except KeyError:
             raise ActionNotFoundError(name) from None
-        return handler(params)
+        with mission_locks.hold(_targets(params), write=name not in self._read_only):
+            return handler(params)
+
+    def run_actions(self, steps: list[dict[str, Any]]) -> dict[str, Any]:
+        """Run several actions as one transaction: each mission read once, written and backed up once.
+
+        The steps run in order against the same in-memory mission per target (see
+        :func:`veaf_mission_mcp.mission_folder.transaction`), so a step sees the edits of the steps
+        before it. When every step succeeds, each edited mission is backed up and written once; when a
+        step fails, the batch stops there and nothing is written. Every mission a step names is locked
+        exclusive for the whole batch.
+
+        Args:
+            steps: ``[{"name": <action>, "params": {...}}, ...]``, each a batchable action.
+
+        Returns:
+            ``{"results": [{"name", "result", "seconds"}, ...], "written": [<target>, ...],
+            "commit_seconds", "seconds"}`` — each step's result as ``run_action`` would return it and
+            how long it took, the targets written, and how long the writes and the whole batch took.
+
+        Raises:
+            ValueError: If ``steps`` is empty, or a step is malformed or names an action that cannot be
+                batched — checked for every step before any runs.
+            ActionNotFoundError: If a step names no registered action.
+            ActionBatchError: If a step fails; its error is the cause.
+        """
+        if not steps:
+            raise ValueError("run_actions needs at least one step.")
+        plan: list[tuple[str, ActionHandler, dict[str, Any]]] = []
+        for index, step in enumerate(steps):
+            if not isinstance(step, dict) or not isinstance(step.get("name"), str):
+                raise ValueError(f"Step {index} must be an object with a 'name' and optional 'params'.")
+            name, params = step["name"], step.get("params") or {}
+            if name not in self._handlers:
+                raise ActionNotFoundError(name)
+            if name not in self._batchable:
+                raise ValueError(
+                    f"Step {index}: '{name}' cannot run in a batch. Batchable actions: "
+                    f"{', '.join(self.batchable_actions())}."
+                )
+            plan.append((name, self._handlers[name], params))
+
+        started = perf_counter()
+        results: list[dict[str, Any]] = []
+        targets = [target for _, _, params in plan for target in _targets(params)]
+        with mission_locks.hold(targets, write=True), mission_folder.transaction() as transaction:
+            for index, (name, handler, params) in enumerate(plan):
+                step_started = perf_counter()
+                try:
+                    result = handler(params)
+                except Exception as exc:
+                    raise ActionBatchError(index, name, exc) from exc
+                results.append({"name": name, "result": result, "seconds": perf_counter() - step_started})
+            committing = perf_counter()
+        finished = perf_counter()
+        return {
+            "results": results,
+            "written": [str(target) for target, _ in transaction.pending.values()],
+            "commit_seconds": finished - committing,
+            "seconds": finished - started,
+        }
+
+
+def _targets(params: dict[str, Any]) -> list[Path]:
+    """Return the missions *params* name through :data:`TARGET_PARAMETERS`."""
+    return [Path(value) for key in TARGET_PARAMETERS if isinstance(value := params.get(key), str) and value]
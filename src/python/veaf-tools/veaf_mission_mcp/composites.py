@@ -77,6 +77,7 @@ def create_combat_zone(
             name=group_name,
             position=spec.get("position", position),
             units=spec["units"],
+            index=mission.group_index(),
         )
         created.append(group_name)
         warnings += validate_group_name(group_name, expected_combat_zone=zone_name)["warnings"]
@@ -176,6 +177,7 @@ def create_qra(
             position=spec.get("position", position),
             units=spec["units"],
             late_activation=True,
+            index=mission.group_index(),
         )
         group_names.append(group_name)
         warnings += validate_group_name(group_name)["warnings"]
@@ -276,6 +278,7 @@ def create_cap_mission(
         position=position,
         units=units,
         late_activation=True,
+        index=mission.group_index(),
     )
     save_folder_mission(mission, folder_path)
 
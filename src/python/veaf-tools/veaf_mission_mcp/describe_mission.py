@@ -13,6 +13,8 @@ from typing import Any
 from mission_tools.miz_tools import read_miz
 
 _GROUP_CATEGORIES: tuple[str, ...] = ("plane", "helicopter", "vehicle", "ship", "static")
+#: The only ``mission`` keys the summary reads; the rest of the table is skipped unparsed.
+_DESCRIBED_KEYS: tuple[str, ...] = ("coalition", "triggers")
 
 
 def describe_mission(miz_path: Path) -> dict[str, Any]:
@@ -28,7 +30,7 @@ def describe_mission(miz_path: Path) -> dict[str, Any]:
     Raises:
         ValueError: If the archive has no `mission` file (not a valid mission archive).
     """
-    mission = read_miz(miz_path)
+    mission = read_miz(miz_path, only=_DESCRIBED_KEYS)
     if mission.mission_content is None:
         raise ValueError(f"Not a valid DCS mission archive (missing 'mission' file): {miz_path}")
     return {
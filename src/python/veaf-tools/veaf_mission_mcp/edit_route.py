@@ -123,7 +123,7 @@ def edit_route(
 
     mission, content = open_mission(miz_path)
 
-    group = find_group(content, group_name)
+    group = find_group(content, group_name, mission.group_index())
     points = _points_list(group, group_name)
 
     changed: dict[str, Any] = {}
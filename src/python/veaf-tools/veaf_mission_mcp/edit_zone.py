@@ -31,8 +31,10 @@ makes every reference ambiguous).
 from pathlib import Path
 from typing import Any
 
+from mission_tools.group_index import GroupIndex
+
 from veaf_mission_mcp.mission_folder import commit_mission, open_mission
-from veaf_mission_mcp.mission_table import CATEGORIES, indexed, listed
+from veaf_mission_mcp.mission_table import indexed, listed
 
 #: DCS zone types. The VEAF runtime handles exactly these two, and nothing else.
 _ZONE_CIRCULAR, _ZONE_POLYGON = 0, 2
@@ -116,7 +118,7 @@ def edit_zone(
         if radius is not None:
             _apply_radius(zone, radius, changed)
         if link_unit is not None:
-            _apply_link(zone, content, link_unit, changed)
+            _apply_link(zone, mission.group_index(), link_unit, changed)
 
     durable = commit_mission(mission, miz_path)["durable"]
 
@@ -295,7 +297,7 @@ def _apply_radius(zone: dict[str, Any], radius: float, changed: dict[str, Any])
     zone["radius"] = radius
 
 
-def _apply_link(zone: dict[str, Any], mission_content: dict[str, Any], link_unit: str, changed: dict[str, Any]) -> None:
+def _apply_link(zone: dict[str, Any], index: GroupIndex, link_unit: str, changed: dict[str, Any]) -> None:
     """Link the zone to a unit so it follows it, or unlink it when given an empty name.
 
     DCS links by ``unitId``, not by name, so the id is resolved here. A **missing** unit is refused
@@ -304,7 +306,7 @@ def _apply_link(zone: dict[str, Any], mission_content: dict[str, Any], link_unit
 
     Args:
         zone: The zone to mutate.
-        mission_content: The parsed mission, to resolve the unit's id.
+        index: The mission's group index, to resolve the unit's id.
         link_unit: The unit's name, or ``""`` to unlink.
         changed: The report to record the change in.
 
@@ -315,40 +317,25 @@ def _apply_link(zone: dict[str, Any], mission_content: dict[str, Any], link_unit
         changed["link_unit"] = {"from": zone.get("linkUnit"), "to": None}
         zone.pop("linkUnit", None)
         return
-    unit_id, names = _find_unit_id(mission_content, link_unit)
+    unit_id, names = _find_unit_id(index, link_unit)
     if unit_id is None:
         raise ValueError(f"No unit named {link_unit!r} in this mission. Units present: {listed(names)}")
     changed["link_unit"] = {"from": zone.get("linkUnit"), "to": {"name": link_unit, "unit_id": unit_id}}
     zone["linkUnit"] = unit_id
 
 
-def _find_unit_id(mission_content: dict[str, Any], unit_name: str) -> tuple[int | None, list[str]]:
+def _find_unit_id(index: GroupIndex, unit_name: str) -> tuple[int | None, list[str]]:
     """Return the ``unitId`` of the unit named `unit_name`, and every unit name in the mission.
 
     Args:
-        mission_content: The parsed ``mission`` table.
+        index: The mission's group index.
         unit_name: The exact unit name to find.
 
     Returns:
         ``(unit id or None, all unit names)``.
     """
-    names: list[str] = []
-    found: int | None = None
-    for coalition in (mission_content.get("coalition") or {}).values():
-        if not isinstance(coalition, dict):
-            continue
-        for country in indexed(coalition.get("country")):
-            if not isinstance(country, dict):
-                continue
-            for category in CATEGORIES:
-                for group in indexed((country.get(category) or {}).get("group")):
-                    if not isinstance(group, dict):
-                        continue
-                    for unit in indexed(group.get("units")):
-                        if not isinstance(unit, dict):
-                            continue
-                        name = str(unit.get("name", ""))
-                        names.append(name)
-                        if name == unit_name and unit.get("unitId") is not None:
-                            found = int(unit["unitId"])
-    return found, names
+    found = index.unit_by_name(unit_name)
+    unit_id = found[0].get("unitId") if found is not None else None
+    if unit_id is not None:
+        return int(unit_id), []
+    return None, [str(unit.get("name", "")) for entry in index.groups for unit in entry.units]
@@ -128,7 +128,7 @@ def _trigger_zone_names(miz_path: Path) -> list[str]:
     no zones, i.e. lose the capture check rather than fail it.
     """
     try:
-        _, content = open_mission(miz_path)
+        _, content = open_mission(miz_path, only=["triggers"])
     except (OSError, ValueError):
         return []
     if not isinstance(content, dict):
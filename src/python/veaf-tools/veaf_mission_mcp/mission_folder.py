@@ -5,8 +5,19 @@ zones and groups) and `mission.yaml` (module config) — so a later `veaf-tools
 `.miz` (David's chosen model). This module wraps the folder's `.miz`-side read/save with a
 timestamped backup, reusing the pure-Python `mission_tools` folder helpers (no Lua execution, no
 zip). The `mission.yaml` side is handled by `edit_mission_yaml` / `mission_yaml_editor`.
+
+Reads and writes go through :mod:`veaf_mission_mcp.mission_sessions`, so while the server runs a
+mission is parsed once and then served from memory until its files change.
+
+Inside a :func:`transaction` (the ``run_actions`` batch), the actions share one in-memory mission per
+target and their commits are held back: the transaction backs up and writes each edited mission once,
+when every action has succeeded, and writes nothing when one fails.
 """
 
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -19,6 +30,52 @@ from mission_tools.miz_tools import (
     write_miz,
 )
 
+from veaf_mission_mcp import mission_sessions
+
+
+@dataclass
+class Transaction:
+    """The missions a batch of actions opened, and those it edited, while its commits are held back."""
+
+    opened: dict[Path, DcsMission] = field(default_factory=dict)
+    """Every mission read in the transaction, by resolved target path."""
+    pending: dict[Path, tuple[Path, DcsMission]] = field(default_factory=dict)
+    """The missions committed by an action, by resolved target path: the target as given, and the mission."""
+
+
+_transaction: ContextVar[Transaction | None] = ContextVar("mission_transaction", default=None)
+
+
+@contextmanager
+def transaction() -> Iterator[Transaction]:
+    """Hold back every commit made in the block, then write each edited mission once.
+
+    Inside the block, :func:`open_mission` and :func:`load_folder_mission` return the same mission for
+    a target every time (read whole on first use, ``only`` ignored), and :func:`commit_mission` and
+    :func:`save_folder_mission` only record it as edited. When the block ends normally, each edited
+    mission is backed up and written, in the order it was first committed; when it raises, nothing is
+    written, and the half-edited missions are not served again (their in-memory tables no longer match
+    what was read, see :mod:`veaf_mission_mcp.mission_sessions`).
+
+    The writes are per target: a batch editing two missions whose second write fails leaves the first
+    one written. A transaction opened inside another joins it.
+
+    Yields:
+        The :class:`Transaction`; after the block, ``pending`` holds what was written.
+    """
+    current = _transaction.get()
+    if current is not None:
+        yield current
+        return
+    current = Transaction()
+    token = _transaction.set(current)
+    try:
+        yield current
+    finally:
+        _transaction.reset(token)
+    for target, mission in current.pending.values():
+        commit_mission(mission, target)
+
 
 def _mission_file(folder_path: Path) -> Path:
     """Locate the folder's loose ``mission`` file (root or ``src/mission/``)."""
@@ -59,7 +116,12 @@ def load_folder_mission(folder_path: Path) -> DcsMission:
     Raises:
         FileNotFoundError: when no ``mission`` file can be located.
     """
-    return read_mission_folder(folder_path)
+
+    def load() -> DcsMission:
+        return mission_sessions.load(folder_path, lambda: read_mission_folder(folder_path))
+
+    current = _transaction.get()
+    return load() if current is None else _opened_in(current, folder_path, load)
 
 
 def save_folder_mission(mission: DcsMission, folder_path: Path) -> dict[str, Any]:
@@ -70,22 +132,30 @@ def save_folder_mission(mission: DcsMission, folder_path: Path) -> dict[str, Any
         folder_path: The mission folder to write into.
 
     Returns:
-        `{"mission_file": <path str>, "backup": <path str>}`.
+        `{"mission_file": <path str>, "backup": <path str>}`; inside a :func:`transaction`, the write
+        and its backup come when the transaction ends, and ``backup`` is ``None``.
 
     Raises:
         FileNotFoundError: when no ``mission`` file can be located.
         ValueError: when `mission.mission_content` is ``None``.
     """
+    current = _transaction.get()
+    if current is not None:
+        current.pending.setdefault(folder_path.resolve(), (folder_path, mission))
+        return {"mission_file": str(_mission_file(folder_path)), "backup": None}
     backup = backup_before_write(_mission_file(folder_path))
     written = write_mission_folder(mission, folder_path)
+    mission_sessions.keep(folder_path, mission)
     return {"mission_file": str(written), "backup": str(backup)}
 
 
-def open_mission(target: Path) -> tuple[DcsMission, dict[str, Any]]:
+def open_mission(target: Path, only: Iterable[str] | None = None) -> tuple[DcsMission, dict[str, Any]]:
     """Read a mission from a `.miz` **or** a mission folder, whichever the caller pointed at.
 
     Args:
         target: A `.miz` archive, or a mission folder (root, or one holding ``src/mission/``).
+        only: When given, parse only these keys of the ``mission`` table — for a read-only query.
+            The mission then cannot be committed back. A mission kept parsed is served whole instead.
 
     Returns:
         ``(mission, mission_content)``. The content is returned rather than left to the caller to
@@ -97,9 +167,35 @@ def open_mission(target: Path) -> tuple[DcsMission, dict[str, Any]]:
             not a readable mission — said in those words. Reading a folder as a zip raises
             ``[Errno 13] Permission denied``, which names neither the cause nor the fix.
     """
+    current = _transaction.get()
+    if current is not None:
+        mission = _opened_in(current, target, lambda: _read(target, only=None))
+    else:
+        mission = _read(target, only)
+    # `_read` refuses a mission without one, but the one a transaction already opened was read
+    # by an earlier action, which may have left it without.
+    if mission.mission_content is None:
+        raise ValueError(f"Not a valid DCS mission (missing 'mission' content): {target}")
+    return mission, mission.mission_content
+
+
+def _opened_in(current: Transaction, target: Path, read: Callable[[], DcsMission]) -> DcsMission:
+    """Return the mission *current* already opened for *target*, else ``read()``'s, recorded."""
+    key = target.resolve()
+    mission = current.opened.get(key)
+    if mission is None:
+        mission = current.opened[key] = read()
+    return mission
+
+
+def _read(target: Path, only: Iterable[str] | None) -> DcsMission:
+    """Read *target* for :func:`open_mission`: the kept mission if it is still valid, else from disk."""
+    mission = mission_sessions.cached(target)
+    if mission is not None:
+        return mission
     if target.is_dir():
         try:
-            mission = read_mission_folder(target)
+            mission = read_mission_folder(target, only=only)
         except FileNotFoundError as exc:
             raise ValueError(
                 f"{target} is a directory but not a mission folder: no 'mission' file in it or in "
@@ -108,10 +204,10 @@ def open_mission(target: Path) -> tuple[DcsMission, dict[str, Any]]:
     else:
         if not target.is_file():
             raise ValueError(f"No such mission: {target}")
-        mission = read_miz(target)
+        mission = read_miz(target, only=only)
     if mission.mission_content is None:
         raise ValueError(f"Not a valid DCS mission (missing 'mission' content): {target}")
-    return mission, mission.mission_content
+    return mission_sessions.keep(target, mission)
 
 
 def commit_mission(mission: DcsMission, target: Path) -> dict[str, Any]:
@@ -123,11 +219,17 @@ def commit_mission(mission: DcsMission, target: Path) -> dict[str, Any]:
 
     Returns:
         ``{"durable": <bool>}`` — true when the edit went into a folder's source, so it survives the
-        next ``veaf-tools build``; false for a `.miz`, which the next build overwrites.
+        next ``veaf-tools build``; false for a `.miz`, which the next build overwrites. Inside a
+        :func:`transaction`, the write comes when the transaction ends.
     """
+    current = _transaction.get()
+    if current is not None:
+        current.pending.setdefault(target.resolve(), (target, mission))
+        return {"durable": target.is_dir()}
     if target.is_dir():
         save_folder_mission(mission, target)
         return {"durable": True}
     backup_before_write(target)
     write_miz(mission, target)
+    mission_sessions.keep(target, mission)
     return {"durable": False}
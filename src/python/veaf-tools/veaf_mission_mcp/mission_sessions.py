@@ -0,0 +1,115 @@
+"""The missions a running ``veaf-mission-mcp`` keeps parsed from one action to the next.
+
+Every action used to read its mission from scratch — unzip, parse every Lua table — and an editing
+session sends dozens of them at the same mission, so parsing was most of the latency. While the
+server runs (:func:`enable`), the mission an action read or wrote is kept here, and the next action
+on the same `.miz` or folder gets that same :class:`~mission_tools.miz_tools.DcsMission` back,
+already parsed, with its group index.
+
+A kept mission is only handed out while :meth:`DcsMission.is_unchanged
+<mission_tools.miz_tools.DcsMission.is_unchanged>` holds: no file it came from changed on disk (a
+build, the Mission Editor, an action writing the archive by hand), and nothing changed in memory
+that was not written — an action that failed half-way through its edits leaves a mission that is
+dropped here rather than served. Anything else is read again.
+
+At most :data:`MAX_MISSIONS` are kept, the least recently used dropped first. The cache is off until
+:func:`enable` is called, so the library and the tests read from disk every time.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from mission_tools.miz_tools import DcsMission
+
+#: How many missions are kept parsed. A parsed mission takes several times the size of its Lua text.
+MAX_MISSIONS = 4
+
+_enabled = False
+_missions: OrderedDict[Path, DcsMission] = OrderedDict()
+_lock = threading.Lock()
+_hits = 0
+_misses = 0
+
+
+@dataclass(frozen=True)
+class SessionStats:
+    """How the kept missions served the actions so far."""
+
+    missions: int
+    hits: int
+    misses: int
+
+
+def enable(enabled: bool = True) -> None:
+    """Switch the cache on (or off, which also empties it)."""
+    global _enabled
+    _enabled = enabled
+    if not enabled:
+        clear()
+
+
+def is_enabled() -> bool:
+    """Return whether missions are kept between actions."""
+    return _enabled
+
+
+def clear() -> None:
+    """Forget every kept mission, and the counts."""
+    global _hits, _misses
+    with _lock:
+        _missions.clear()
+        _hits = _misses = 0
+
+
+def _key(target: Path) -> Path:
+    return target.resolve()
+
+
+def cached(target: Path) -> DcsMission | None:
+    """Return the mission kept for *target* if it still is what the files hold, else ``None``."""
+    global _hits, _misses
+    if not _enabled:
+        return None
+    key = _key(target)
+    with _lock:
+        mission = _missions.get(key)
+        if mission is not None:
+            _missions.move_to_end(key)
+    fresh = mission is not None and mission.is_unchanged()
+    with _lock:
+        if fresh:
+            _hits += 1
+            return mission
+        if mission is not None and _missions.get(key) is mission:
+            del _missions[key]
+        _misses += 1
+    return None
+
+
+def keep(target: Path, mission: DcsMission) -> DcsMission:
+    """Keep *mission*, just read from or written to *target*, and return it. A projected one is not kept."""
+    if not _enabled or mission.projection is not None:
+        return mission
+    key = _key(target)
+    with _lock:
+        _missions[key] = mission
+        _missions.move_to_end(key)
+        while len(_missions) > MAX_MISSIONS:
+            _missions.popitem(last=False)
+    return mission
+
+
+def load(target: Path, read: Callable[[], DcsMission]) -> DcsMission:
+    """Return the mission kept for *target*, or ``read()``'s, then kept."""
+    return cached(target) or keep(target, read())
+
+
+def stats() -> SessionStats:
+    """Return how many missions are kept, and how many reads they spared or did not."""
+    with _lock:
+        return SessionStats(missions=len(_missions), hits=_hits, misses=_misses)
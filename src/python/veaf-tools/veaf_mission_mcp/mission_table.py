@@ -14,6 +14,8 @@ code receives half the fixes. Three quirks, each of which has already produced a
 
 from typing import Any
 
+from mission_tools.group_index import GroupIndex
+
 # The three quirk readers moved to `veaf_libs.mission_table` when the mission validator needed
 # them too: the dependency runs MCP -> veaf_libs, and a second copy would receive half the fixes.
 # Re-exported here so every existing import keeps working.
@@ -38,30 +40,20 @@ def listed(names: list[str], limit: int = 20) -> str:
     return shown if len(names) <= limit else f"{shown}, ... ({len(names)} total)"
 
 
-def group_names(mission_content: dict[str, Any]) -> list[str]:
+def group_names(mission_content: dict[str, Any], index: GroupIndex | None = None) -> list[str]:
     """Return every group name in the mission, in table order.
 
     Args:
         mission_content: The parsed ``mission`` table.
+        index: The mission's group index (``DcsMission.group_index()``), when the caller has one.
 
     Returns:
         The names, including duplicates if the mission holds any.
     """
-    names: list[str] = []
-    for coalition in (mission_content.get("coalition") or {}).values():
-        if not isinstance(coalition, dict):
-            continue
-        for country in indexed(coalition.get("country")):
-            if not isinstance(country, dict):
-                continue
-            for category in CATEGORIES:
-                for group in indexed((country.get(category) or {}).get("group")):
-                    if isinstance(group, dict):
-                        names.append(str(group.get("name", "")))
-    return names
-
-
-def find_group(mission_content: dict[str, Any], group_name: str) -> dict[str, Any]:
+    return (index or GroupIndex(mission_content)).group_names()
+
+
+def find_group(mission_content: dict[str, Any], group_name: str, index: GroupIndex | None = None) -> dict[str, Any]:
     """Return the group named `group_name`, or raise naming what exists.
 
     The group's own dict is returned, so a caller mutates the mission rather than a copy. The name
@@ -71,6 +63,7 @@ def find_group(mission_content: dict[str, Any], group_name: str) -> dict[str, An
     Args:
         mission_content: The parsed ``mission`` table.
         group_name: The exact group name to find.
+        index: The mission's group index (``DcsMission.group_index()``), when the caller has one.
 
     Returns:
         The group table.
@@ -78,16 +71,8 @@ def find_group(mission_content: dict[str, Any], group_name: str) -> dict[str, An
     Raises:
         ValueError: If no group carries that exact name.
     """
-    for coalition in (mission_content.get("coalition") or {}).values():
-        if not isinstance(coalition, dict):
-            continue
-        for country in indexed(coalition.get("country")):
-            if not isinstance(country, dict):
-                continue
-            for category in CATEGORIES:
-                for group in indexed((country.get(category) or {}).get("group")):
-                    if isinstance(group, dict) and str(group.get("name", "")) == group_name:
-                        return group
-    raise ValueError(
-        f"No group named {group_name!r} in this mission. Groups present: {listed(group_names(mission_content))}"
-    )
+    index = index or GroupIndex(mission_content)
+    found = index.group(group_name)
+    if found is not None:
+        return found.group
+    raise ValueError(f"No group named {group_name!r} in this mission. Groups present: {listed(index.group_names())}")
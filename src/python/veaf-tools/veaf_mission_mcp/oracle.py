@@ -10,9 +10,9 @@ module scanner — so the oracle cannot drift from what the tooling actually shi
 from pathlib import Path
 from typing import Any
 
-import yaml
 from mission_tools.mission_yaml_editor import load_yaml
-from veaf_libs.bundled_data import read_bundled_text
+from veaf_libs.bundled_data import load_bundled_data
+from veaf_libs.dcs_units_data import unit_catalog
 from veaf_libs.lua_module_scanner import get_modules
 from veaf_libs.veaf_shortcuts_scanner import get_shortcuts
 
@@ -21,43 +21,33 @@ _DOC_SCRIPTS_DIR = "doc/mission-maker/scripts"
 
 def _load_bundled_data_yaml(filename: str) -> dict[str, Any]:
     """Load a bundled `veaf_libs/data/<filename>` YAML (source or PyInstaller run)."""
-    return yaml.safe_load(read_bundled_text("veaf_libs", "data", filename)) or {}
+    return load_bundled_data("veaf_libs", "data", filename) or {}
 
 
 def list_unit_types(
     category: str | None = None,
     name_contains: str | None = None,
+    kind: str | None = None,
+    attribute: str | None = None,
 ) -> dict[str, Any]:
     """List DCS unit types from the canonical generated database.
 
     Reads the same `veaf_libs/data/dcsUnits.yaml` the build ships (`update-dcs-data`), so the
-    LLM sees exactly the types available in-game.
+    LLM sees exactly the types available in-game. The file is parsed and indexed once per process
+    (:func:`veaf_libs.dcs_units_data.unit_catalog`); a query is answered from the indexes.
 
     Args:
         category: Optional exact category filter (e.g. ``"Plane"``, ``"Armor"``).
         name_contains: Optional case-insensitive substring matched against type id + name.
+        kind: Optional exact kind filter (``"air"``, ``"vehicle"``, ``"infantry"``, ``"naval"``,
+            ``"static"``).
+        attribute: Optional exact DCS attribute filter (e.g. ``"SAM"``, ``"Tankers"``).
 
     Returns:
         `{"units": [{"type", "name", "category", "kind", "description", "attributes"}, ...]}`.
     """
-    raw = _load_bundled_data_yaml("dcsUnits.yaml").get("units") or []
-    units: list[dict[str, Any]] = []
-    needle = name_contains.lower() if name_contains else None
-    for entry in raw:
-        unit = {
-            "type": entry.get("type", ""),
-            "name": entry.get("name", ""),
-            "category": entry.get("category", ""),
-            "kind": entry.get("kind", ""),
-            "description": entry.get("description", ""),
-            "attributes": list(entry.get("attributes") or []),
-        }
-        if category is not None and unit["category"] != category:
-            continue
-        if needle is not None and needle not in f"{unit['type']}{unit['name']}".lower():
-            continue
-        units.append(unit)
-    return {"units": units}
+    units = unit_catalog().search(category=category, kind=kind, attribute=attribute, name_contains=name_contains)
+    return {"units": [unit.as_dict() for unit in units]}
 
 
 #: Ordered (category, keywords) rules to classify a `#command` alias — first match wins, so more
@@ -28,11 +28,9 @@ from typing import Any
 
 from mission_tools.group_insertion import add_group as insert_group
 from mission_tools.group_insertion import air_category_for_type_verbose
-from mission_tools.miz_backup import backup_before_write
-from mission_tools.miz_tools import read_miz, write_miz
 
 from veaf_mission_mcp.aircraft_payload import build_aircraft_payload
-from veaf_mission_mcp.mission_folder import load_folder_mission, save_folder_mission
+from veaf_mission_mcp.mission_folder import commit_mission, open_mission
 
 #: Unit conversions (mission file stores metres and m/s; the caller speaks feet and knots).
 _M_PER_FT = 0.3048
@@ -115,10 +113,7 @@ def add_player_slot(
             "Use an 'air' start, or supply the spot."
         )
 
-    is_folder = target.is_dir()
-    mission = load_folder_mission(target) if is_folder else read_miz(target)
-    if mission.mission_content is None:
-        raise ValueError(f"Not a valid DCS mission (missing 'mission' content): {target}")
+    mission, content = open_mission(target)
 
     payload, fuel_warning = build_aircraft_payload(unit_type, fuel=fuel, fuel_fraction=fuel_fraction)
 
@@ -143,24 +138,21 @@ def add_player_slot(
     # sign of it (FIX-MCP-AIRCRAFT-CATEGORY).
     category, category_warning = air_category_for_type_verbose(unit_type)
     group_id = insert_group(
-        mission.mission_content,
+        content,
         coalition=coalition,
         country_id=country_id,
         country_name=country_name,
         category=category,
         group=group,
+        index=mission.group_index(),
     )
 
-    if is_folder:
-        save_folder_mission(mission, target)
-    else:
-        backup_before_write(target)
-        write_miz(mission, target)
+    durable = commit_mission(mission, target)["durable"]
 
     result: dict[str, Any] = {
         "group_id": group_id,
         "name": name,
-        "durable": is_folder,
+        "durable": durable,
         "start": start,
         "category": category,
     }
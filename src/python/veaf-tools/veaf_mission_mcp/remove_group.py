@@ -29,7 +29,8 @@ from pathlib import Path
 from typing import Any
 
 import yaml
-from veaf_libs.mission_table import CATEGORIES, indexed
+from mission_tools.group_index import GroupIndex
+from veaf_libs.mission_table import indexed
 
 from veaf_mission_mcp.mission_folder import commit_mission, open_mission
 from veaf_mission_mcp.mission_table import group_names, listed
@@ -52,23 +53,26 @@ def remove_group(target: Path, *, group_name: str) -> dict[str, Any]:
     """
     mission, content = open_mission(target)
 
-    found = _locate(content, group_name)
+    index = mission.group_index()
+    found = index.group(group_name)
     if found is None:
         raise ValueError(
-            f"No group named {group_name!r} in this mission. Groups present: {listed(group_names(content))}"
+            f"No group named {group_name!r} in this mission. Groups present: {listed(group_names(content, index))}"
         )
-    coalition_name, country, category, group = found
-    group_id = group.get("groupId")
+    group_id = found.group.get("groupId")
 
-    warnings = _reference_warnings(content, target, group_name, group_id)
-    remaining = _remove_and_renumber(country, category, group_name)
+    warnings = _reference_warnings(content, index, target, group_name, group_id)
+    # The container is rebuilt rather than patched, since a hole is the whole defect this action
+    # exists to prevent: survivors keep their order, re-keyed from 1, and an emptied category loses
+    # its `group` key instead of holding an empty table a downstream reader mistakes for a list.
+    remaining = index.remove(found)
     durable = commit_mission(mission, target)["durable"]
 
     return {
         "group": group_name,
-        "category": category,
-        "coalition": coalition_name,
-        "country": country.get("name"),
+        "category": found.category,
+        "coalition": found.coalition,
+        "country": found.country.get("name"),
         "group_id": group_id,
         "remaining": remaining,
         "durable": durable,
@@ -76,65 +80,14 @@ def remove_group(target: Path, *, group_name: str) -> dict[str, Any]:
     }
 
 
-def _locate(content: dict[str, Any], group_name: str) -> tuple[str, dict[str, Any], str, dict[str, Any]] | None:
-    """Find the group and the country/category that hold it.
-
-    Args:
-        content: The parsed ``mission`` table.
-        group_name: The exact group name.
-
-    Returns:
-        ``(coalition_name, country, category, group)``, or ``None`` when the name is absent.
-    """
-    for coalition_name, coalition in (content.get("coalition") or {}).items():
-        if not isinstance(coalition, dict):
-            continue
-        for country in indexed(coalition.get("country")):
-            if not isinstance(country, dict):
-                continue
-            for category in CATEGORIES:
-                for group in indexed((country.get(category) or {}).get("group")):
-                    if isinstance(group, dict) and str(group.get("name", "")) == group_name:
-                        return str(coalition_name), country, category, group
-    return None
-
-
-def _remove_and_renumber(country: dict[str, Any], category: str, group_name: str) -> int:
-    """Drop the named group and rewrite the container's keys as a contiguous ``1..n``.
-
-    A hole is the whole defect this action exists to prevent, so the container is rebuilt rather than
-    patched: the survivors keep their table order and are re-keyed from 1. When nothing is left, the
-    ``group`` key goes away instead of holding an empty table — the shape a downstream reader mistakes
-    for a list.
-
-    Args:
-        country: The country table holding the category.
-        category: The category key (``plane``, ``vehicle``, …).
-        group_name: The group to drop.
-
-    Returns:
-        How many groups the category still holds.
-    """
-    category_table = country.get(category)
-    if not isinstance(category_table, dict):
-        return 0
-    survivors = [
-        group
-        for group in indexed(category_table.get("group"))
-        if not (isinstance(group, dict) and str(group.get("name", "")) == group_name)
-    ]
-    if survivors:
-        category_table["group"] = {index: group for index, group in enumerate(survivors, start=1)}
-    else:
-        category_table.pop("group", None)
-    return len(survivors)
-
-
-def _reference_warnings(content: dict[str, Any], target: Path, group_name: str, group_id: Any) -> list[str]:
+def _reference_warnings(
+    content: dict[str, Any], index: GroupIndex, target: Path, group_name: str, group_id: Any
+) -> list[str]:
     """Name every reference to the group that will survive its removal, in silence.
 
     Args:
         content: The parsed ``mission`` table.
+        index: The mission's group index.
         target: The mission folder or `.miz`, so `mission.yaml` can be read when there is one.
         group_name: The group being removed.
         group_id: Its `groupId`, for the task references that point by id.
@@ -150,7 +103,7 @@ def _reference_warnings(content: dict[str, Any], target: Path, group_name: str,
             "check the zone still has the members it needs."
         )
 
-    for holder, task_id in _tasks_pointing_at(content, group_id):
+    for holder, task_id in _tasks_pointing_at(index, group_id):
         warnings.append(
             f"Group {holder!r} has a {task_id} task pointing at group id {group_id}, which no longer "
             "exists — the task will do nothing."
@@ -170,27 +123,15 @@ def _capturing_zone_names(content: dict[str, Any], group_name: str) -> list[str]
     ]
 
 
-def _tasks_pointing_at(content: dict[str, Any], group_id: Any) -> list[tuple[str, str]]:
+def _tasks_pointing_at(index: GroupIndex, group_id: Any) -> list[tuple[str, str]]:
     """Every ``(holder group name, task id)`` whose task params name `group_id`."""
     if group_id is None:
         return []
     hits: list[tuple[str, str]] = []
-    for coalition in (content.get("coalition") or {}).values():
-        if not isinstance(coalition, dict):
-            continue
-        for country in indexed(coalition.get("country")):
-            if not isinstance(country, dict):
-                continue
-            for category in CATEGORIES:
-                for group in indexed((country.get(category) or {}).get("group")):
-                    if not isinstance(group, dict):
-                        continue
-                    for point in indexed((group.get("route") or {}).get("points")):
-                        if isinstance(point, dict):
-                            hits.extend(
-                                (str(group.get("name", "")), task_id)
-                                for task_id in _task_ids_naming(point.get("task"), group_id)
-                            )
+    for entry in index.groups:
+        for point in indexed((entry.group.get("route") or {}).get("points")):
+            if isinstance(point, dict):
+                hits.extend((entry.name, task_id) for task_id in _task_ids_naming(point.get("task"), group_id))
     return hits
 
 
@@ -2,24 +2,33 @@
 
 Exposes a fixed discovery surface — ``capabilities``, ``list_catalog``,
 ``describe_action``, ``run_action`` — instead of one MCP tool per mission-editing
-action, mirroring the existing ``dcs-bridge`` MCP tool's shape. Concrete actions are
-registered by :func:`veaf_mission_mcp.actions.register_default_actions`.
+action, mirroring the existing ``dcs-bridge`` MCP tool's shape, plus ``run_actions`` to
+run several actions as one transaction and ``server_stats`` to see how they are served.
+Concrete actions are registered by :func:`veaf_mission_mcp.actions.register_default_actions`.
+
+Actions run on the :class:`~veaf_mission_mcp.workers.WorkerPool`, not on the event loop, so a
+slow one holds up neither the discovery tools nor actions on other missions.
 """
 
+from dataclasses import asdict
 from typing import Any
 
 from mcp.server import MCPServer
 from veaf_libs.logger import logger
 from veaf_tools.app import VERSION
 
+from veaf_mission_mcp import mission_sessions
 from veaf_mission_mcp.actions import register_default_actions
 from veaf_mission_mcp.catalog import ActionCatalog
+from veaf_mission_mcp.workers import WorkerPool
 
 SERVER_NAME = "veaf-mission-mcp"
 
 CATALOG = ActionCatalog()
 register_default_actions(CATALOG)
 
+POOL = WorkerPool()
+
 mcp = MCPServer(SERVER_NAME)
 
 
@@ -57,8 +66,8 @@ def describe_action(name: str) -> dict[str, Any]:
 
 
 @mcp.tool()
-def run_action(name: str, params: dict[str, Any] | None = None) -> Any:
-    """Run a registered action.
+async def run_action(name: str, params: dict[str, Any] | None = None) -> Any:
+    """Run a registered action on a worker thread.
 
     Args:
         name: The action's registered name.
@@ -67,7 +76,35 @@ def run_action(name: str, params: dict[str, Any] | None = None) -> Any:
     Returns:
         Whatever the action's handler returns.
     """
-    return CATALOG.run_action(name, params or {})
+    return await POOL.run(name, lambda: CATALOG.run_action(name, params or {}))
+
+
+@mcp.tool()
+async def run_actions(steps: list[dict[str, Any]]) -> dict[str, Any]:
+    """Run several editing actions as one transaction.
+
+    Each mission is read once, every step edits the same in-memory tables, and each edited mission is
+    backed up and written once at the end. A failing step aborts the batch: nothing is written.
+
+    Args:
+        steps: ``[{"name": <action>, "params": {...}}, ...]``, run in order.
+
+    Returns:
+        Each step's result and duration, the targets written, and the commit and total durations.
+    """
+    return await POOL.run("run_actions", lambda: CATALOG.run_actions(steps))
+
+
+@mcp.tool()
+def server_stats() -> dict[str, Any]:
+    """Report how the server is serving actions.
+
+    Returns:
+        ``workers``, the actions ``running`` and ``queued`` now, per action (``handlers``) the calls,
+        errors, mean and max duration and mean time queued, and the parsed-mission cache
+        (``mission_cache``: missions kept, hits, misses).
+    """
+    return {**POOL.stats(), "mission_cache": asdict(mission_sessions.stats())}
 
 
 def main() -> None:
@@ -77,6 +114,8 @@ def main() -> None:
     # file / logging handlers (stderr).
     logger.mute_console()
     logger.info(f"Starting {SERVER_NAME} v{VERSION}")
+    # One session edits the same few missions action after action: keep them parsed in between.
+    mission_sessions.enable()
     mcp.run()
 
 
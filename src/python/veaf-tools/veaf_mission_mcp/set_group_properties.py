@@ -109,13 +109,16 @@ def set_group_properties(
 
     mission, content = open_mission(miz_path)
 
-    group = find_group(content, group_name)
-    existing_names = group_names(content)
+    index = mission.group_index()
+    group = find_group(content, group_name, index)
+    existing_names = group_names(content, index)
 
     changed: dict[str, Any] = {}
     warnings: list[str] = []
     if new_name is not None:
         _apply_rename(group, new_name, existing_names, miz_path, acknowledge_conventions, changed, warnings)
+        # The index still files the group under its old name.
+        mission.invalidate_group_index()
     if move_to is not None or move_bearing is not None:
         _apply_move(
             group,
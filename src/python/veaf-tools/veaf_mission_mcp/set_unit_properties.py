@@ -29,7 +29,7 @@ import math
 from pathlib import Path
 from typing import Any
 
-from veaf_libs.mission_table import CATEGORIES
+from mission_tools.group_index import GroupIndex
 
 from veaf_mission_mcp.mission_folder import commit_mission, open_mission
 from veaf_mission_mcp.mission_table import find_group, indexed, listed
@@ -105,7 +105,8 @@ def set_unit_properties(
 
     mission, content = open_mission(miz_path)
 
-    group = find_group(content, group_name)
+    index = mission.group_index()
+    group = find_group(content, group_name, index)
     unit = _find_unit(group, group_name, unit_name)
 
     # Everything is validated before anything is stored, so a refusal cannot half-write a mission.
@@ -122,7 +123,7 @@ def set_unit_properties(
         )
     if heading_deg is not None:
         _apply_heading(unit, heading_deg, changed)
-        if _heading_will_be_recalculated(content, group_name, group):
+        if _heading_will_be_recalculated(index, group_name, group):
             warnings.append(
                 "heading on an airborne aircraft has a lifetime of one save: DCS recomputes it from "
                 "the route's first leg (measured 2026-08-15 — a set heading came back as the bearing "
@@ -176,36 +177,22 @@ def _find_unit(group: dict[str, Any], group_name: str, unit_name: str) -> dict[s
     raise ValueError(f"No unit named {unit_name!r} in group {group_name!r}. Units in that group: {listed(names)}")
 
 
-def _group_category(mission_content: dict[str, Any], group_name: str) -> str | None:
-    """Return the category (`plane`, `vehicle`, ...) the group sits under, or None if not found."""
-    for coalition in (mission_content.get("coalition") or {}).values():
-        if not isinstance(coalition, dict):
-            continue
-        for country in indexed(coalition.get("country")):
-            if not isinstance(country, dict):
-                continue
-            for category in CATEGORIES:
-                for group in indexed((country.get(category) or {}).get("group")):
-                    if isinstance(group, dict) and str(group.get("name", "")) == group_name:
-                        return category
-    return None
-
-
-def _heading_will_be_recalculated(mission_content: dict[str, Any], group_name: str, group: dict[str, Any]) -> bool:
+def _heading_will_be_recalculated(index: GroupIndex, group_name: str, group: dict[str, Any]) -> bool:
     """Whether DCS will overwrite a set heading — an airborne aircraft with a route of 2+ waypoints.
 
     Scoped to the measured case: a parked aircraft (a ``TakeOff*`` first waypoint) was not tested, so
     it does not warn. A ground unit's heading is meaningful and never recomputed.
 
     Args:
-        mission_content: The parsed ``mission`` table (to read the group's category).
+        index: The mission's group index (to read the group's category).
         group_name: The group's name.
         group: The group table (to read its route).
 
     Returns:
         True when the heading would be recomputed from the route on save.
     """
-    if _group_category(mission_content, group_name) not in _AIRCRAFT_CATEGORIES:
+    found = index.group(group_name)
+    if found is None or found.category not in _AIRCRAFT_CATEGORIES:
         return False
     points = indexed((group.get("route") or {}).get("points"))
     if len(points) < 2 or not isinstance(points[0], dict):
@@ -0,0 +1,187 @@
+"""Where ``veaf-mission-mcp`` runs its actions: a bounded pool of worker threads, and a lock per mission.
+
+The MCP tools that run actions hand them to a :class:`WorkerPool`, so a slow ``describe_units`` on a
+mission with thousands of units neither holds up the discovery tools (which never enter the pool) nor
+the queries other clients send meanwhile — up to :data:`WORKERS` actions run at once, the rest wait
+their turn in the pool's queue.
+
+Actions running side by side must not edit the same mission at once: each one reads the mission,
+changes it in memory and writes it back, and two such edits interleaved lose one of them (and, with
+:mod:`veaf_mission_mcp.mission_sessions`, they share the same parsed tables). :data:`mission_locks`
+holds a readers-writer lock per mission: read-only actions on a mission run together, an edit waits
+for them and runs alone.
+
+Threads rather than processes: the parsed missions are kept in this process, and an action in another
+process would parse its mission again for every call — the cost the cache exists to remove.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+#: How many actions run at once. Parsing is mostly pure Python, so more threads would mostly queue on the GIL.
+WORKERS = 4
+
+
+class ReadWriteLock:
+    """Any number of readers, or one writer. A waiting writer goes before readers arriving after it."""
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._readers = 0
+        self._writing = False
+        self._writers_waiting = 0
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """Hold the lock shared for the block."""
+        with self._condition:
+            while self._writing or self._writers_waiting:
+                self._condition.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """Hold the lock exclusive for the block."""
+        with self._condition:
+            self._writers_waiting += 1
+            try:
+                while self._writing or self._readers:
+                    self._condition.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writing = True
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writing = False
+                self._condition.notify_all()
+
+
+def mission_key(target: Path) -> Path:
+    """Return the path a mission is locked under: *target* resolved, a ``mission.yaml`` as its folder."""
+    resolved = target.resolve()
+    return resolved.parent if resolved.name == "mission.yaml" else resolved
+
+
+class MissionLocks:
+    """A :class:`ReadWriteLock` per mission, created on first use."""
+
+    def __init__(self) -> None:
+        self._locks: dict[Path, ReadWriteLock] = {}
+        self._lock = threading.Lock()
+
+    def _lock_for(self, key: Path) -> ReadWriteLock:
+        with self._lock:
+            return self._locks.setdefault(key, ReadWriteLock())
+
+    @contextmanager
+    def hold(self, targets: Iterable[Path], *, write: bool) -> Iterator[None]:
+        """Hold the locks of every mission in *targets* for the block, exclusive when *write*.
+
+        The locks are taken in path order, so two actions holding the same missions cannot each wait
+        for the other.
+        """
+        with ExitStack() as stack:
+            for key in sorted({mission_key(target) for target in targets}):
+                lock = self._lock_for(key)
+                stack.enter_context(lock.write() if write else lock.read())
+            yield
+
+
+#: The locks every action of the server takes on the missions it names.
+mission_locks = MissionLocks()
+
+
+@dataclass
+class HandlerStats:
+    """How the calls under one label went so far."""
+
+    calls: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    waited_seconds: float = 0.0
+    """Time spent in the queue before a worker took the call."""
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "mean_seconds": self.total_seconds / self.calls if self.calls else 0.0,
+            "max_seconds": self.max_seconds,
+            "mean_wait_seconds": self.waited_seconds / self.calls if self.calls else 0.0,
+        }
+
+
+class WorkerPool:
+    """Run blocking calls on at most *workers* threads, and keep their queue depth and latency."""
+
+    def __init__(self, workers: int = WORKERS) -> None:
+        self.workers = workers
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="veaf-mission-mcp")
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._handlers: dict[str, HandlerStats] = {}
+
+    async def run(self, label: str, call: Callable[[], T]) -> T:
+        """Run *call* on a worker thread and return its result; its time is counted under *label*."""
+        submitted = perf_counter()
+        with self._lock:
+            self._queued += 1
+        context = contextvars.copy_context()
+
+        def work() -> T:
+            started = perf_counter()
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+            failed = True
+            try:
+                result = context.run(call)
+                failed = False
+                return result
+            finally:
+                self._record(label, waited=started - submitted, seconds=perf_counter() - started, failed=failed)
+
+        return await asyncio.wrap_future(self._executor.submit(work))
+
+    def _record(self, label: str, *, waited: float, seconds: float, failed: bool) -> None:
+        with self._lock:
+            self._running -= 1
+            stats = self._handlers.setdefault(label, HandlerStats())
+            stats.calls += 1
+            stats.errors += failed
+            stats.total_seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            stats.waited_seconds += waited
+
+    def stats(self) -> dict[str, Any]:
+        """Return the pool's size, the calls running and queued now, and each label's latency."""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "running": self._running,
+                "queued": self._queued,
+                "handlers": {label: stats.as_dict() for label, stats in sorted(self._handlers.items())},
+            }
@@ -1,3 +1,4 @@
+import multiprocessing
 import sys
 from importlib.metadata import PackageNotFoundError
 from importlib.metadata import version as _pkg_version
@@ -47,6 +48,9 @@ def main_callback(
 
 
 def main() -> None:
+    # A frozen executable must dispatch `build --jobs` worker processes before anything else.
+    multiprocessing.freeze_support()
+
     # Parse --lang early so --help is rendered in the right language.
     for _i, _a in enumerate(sys.argv[1:]):
         if _a == "--lang" and _i + 1 < len(sys.argv) - 1:
@@ -57,7 +57,7 @@ class CommandGroup:
 #: constraint a reader must know **before** choosing, not a theme, which is why it earns a group of
 #: its own in an otherwise subject-based tree.
 COMMAND_GROUPS: tuple[CommandGroup, ...] = (
-    CommandGroup("mission", ("prepare", "validate", "build", "extract", "export")),
+    CommandGroup("mission", ("prepare", "validate", "build", "build-all", "extract", "export")),
     CommandGroup("convert", ("convert-v5", "convert-other", "migrate-config", "generate-config")),
     CommandGroup(
         "content",
@@ -76,7 +76,7 @@ COMMAND_GROUPS: tuple[CommandGroup, ...] = (
 
 #: Commands that stay at the root, because grouping them would be filing for filing's sake: they are
 #: about the tool itself rather than about a mission.
-ROOT_COMMANDS: tuple[str, ...] = ("about", "ask", "user-config", "mcp")
+ROOT_COMMANDS: tuple[str, ...] = ("about", "ask", "user-config", "cache", "mcp")
 
 #: The wizard has no root: every entry needs a heading, so the root commands get one. The CLI keeps
 #: them at the top level — same placement, expressed the way each interface can express it.
@@ -189,7 +189,7 @@ def build_cli_tree(app: typer.Typer) -> None:
 
     for group in COMMAND_GROUPS:
         # Two panels rather than one list: Typer renders root commands before sub-apps, so without
-        # this the four tool commands would sit above the five groups a reader is actually looking for.
+        # this the tool commands would sit above the five groups a reader is actually looking for.
         app.add_typer(
             groups[group.id],
             name=group.id,
@@ -1,15 +1,38 @@
+import dataclasses
+import io
+import json
+import multiprocessing
+import os
 import re
-from datetime import datetime
+import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field
+from datetime import date, datetime
 from pathlib import Path
 
 import typer
 import yaml
 from aircrafts_injector import AircraftGroupsInjectorWorker, AircraftGroupsYAMLValidator
 from mission_builder import MissionBuilderREADME, MissionBuilderWorker
+from mission_tools import DcsMission, InMemoryMission
 from presets_injector import PresetsInjectorWorker
+from rich.live import Live
 from rich.markdown import Markdown
+from rich.markup import MarkupError
+from rich.table import Table
+from rich.text import Text
 from spawn_data_injector import SpawnDataInjectorWorker
+from veaf_libs import build_profiler, resident_cache
+from veaf_libs.build_manifest import BuildManifest, FileHashes, manifest_path
 from veaf_libs.build_profiles import canonical_profile_name, pipeline_step_subflag
+from veaf_libs.config_override import OVERRIDE_SCRIPT_NAME
+from veaf_libs.ctld_config import CTLD_USER_CONFIG_FILENAME
+from veaf_libs.dcs_countries import all_country_ids
+from veaf_libs.dcs_units_data import get_unit_category, get_unit_fuel_capacity
+from veaf_libs.i18n import current_language, set_language
 from veaf_libs.paths import resolve_path
 from veaf_libs.yaml_validator import validate_yaml_file
 from warehouses_injector import WarehousesInjectorWorker
@@ -189,145 +212,323 @@ def resolve_pipeline_step_file(pipeline_cfg: dict, mission_folder: Path, key: st
     return None
 
 
-@app.command(help=t("cmd.build.help"))
-def build(
-    readme: bool = typer.Option(False, help=README_HELP),
-    verbose: bool = typer.Option(False, help=VERBOSE_HELP),
-    no_veaf_triggers: bool = typer.Option(False, help=t("cmd.build.opt.no_veaf_triggers")),
-    dynamic_mode: bool | None = typer.Option(
-        None,
-        "--dynamic-mode/--no-dynamic-mode",
-        help=t("cmd.build.opt.dynamic_mode"),
-    ),
-    dev_mode: bool | None = typer.Option(
-        None,
-        "--dev-mode/--no-dev-mode",
-        help=t("cmd.build.opt.dev_mode"),
-    ),
-    scripts_path: str = typer.Option(
-        None,
-        help=t("cmd.build.opt.scripts_path"),
-    ),
-    profile: str | None = typer.Option(
-        None,
-        "--profile",
-        "-p",
-        help=t("cmd.build.opt.profile"),
-    ),
-    migrate_from_v5: bool = typer.Option(True, help=t("cmd.build.opt.migrate_from_v5")),
-    log_modules: str | None = typer.Option(
-        None,
-        help=t("cmd.build.opt.log_modules_detail"),
-    ),
-    mission_name_or_file: str | None = typer.Argument(
-        DEFAULT_MISSION_FILE,
-        help=t("cmd.build.opt.mission_name_or_file"),
-    ),
-    mission_folder: str | None = typer.Argument(".", help=t("cmd.build.opt.folder")),
-    pause: bool = typer.Option(False, help=PAUSE_HELP),
-) -> None:
+#: Each pipeline step's default input files, tried in order (see :func:`resolve_pipeline_step_file`).
+_PIPELINE_STEP_CANDIDATES: dict[str, tuple[str, ...]] = {
+    "presets": ("src/presets.yaml",),
+    "waypoints": ("src/waypoints.yaml", "waypoints.yaml"),
+    "spawnable_aircrafts": ("src/spawnables.yaml",),
+    "dynamic_slot_templates": ("src/dynamic-slot-templates.yaml",),
+    "warehouses": ("src/warehouses.yaml", "warehouses.yaml"),
+    "spawn_data": ("src/spawn-groups.yaml",),
+    "weather": ("src/versions.yaml", "versions.yaml"),
+}
 
-    logger.set_verbose(verbose)
+#: What the builder writes into ``src/scripts`` itself: outputs of a build, not inputs of the next one.
+_GENERATED_SCRIPTS = frozenset(
+    {"veaf-config.lua", "veafDynamicConfig.lua", CTLD_USER_CONFIG_FILENAME, OVERRIDE_SCRIPT_NAME}
+)
 
-    # Set the title and version
-    console.print(t("cmd.build.title", version=VERSION))
 
-    if readme:
-        if typer.confirm(t("help.confirm_doc")):
-            md_render = Markdown(MissionBuilderREADME)
-            console.print(md_render)
-        raise typer.Exit()
+@dataclass(frozen=True)
+class _BuildOptions:
+    """The ``build`` options every variant of one build runs with."""
 
-    # Resolve input mission folder
-    p_mission_folder = resolve_path(path=mission_folder, default_path=Path.cwd(), should_exist=True)
-    if not p_mission_folder.exists():
-        logger.error(t("cmd.build.folder_not_found", path=p_mission_folder), exception_type=FileNotFoundError)
+    mission_folder: Path
+    dynamic_mode: bool | None
+    dev_mode: bool | None
+    scripts_path: str | None
+    log_modules: str | None
+    migrate_from_v5: bool
+    no_veaf_triggers: bool
+    force: bool = False
+    timings: bool = False
+    persist_settings: bool = True
+    """Whether ``--dev-mode`` / ``--scripts-path`` are written back to ``mission.yaml``."""
 
-    # Resolve the output mission path and base name (mission.yaml-aware).
-    p_output_mission, mission_base_name = _resolve_output_mission(
-        mission_name_or_file, p_mission_folder, DEFAULT_MISSION_FILE
+
+@dataclass
+class _VariantRun:
+    """How one variant build went: its timing and, from a ``--jobs`` process, its console output."""
+
+    profile: str | None
+    output: Path
+    seconds: float = 0.0
+    log: str = ""
+    error: Exception | None = None
+
+
+def _files_under(folder: Path) -> list[Path]:
+    """Every file below *folder*, or none when it does not exist."""
+    return [path for path in folder.rglob("*") if path.is_file()] if folder.is_dir() else []
+
+
+def _source_files(folder: Path) -> list[Path]:
+    """Every file below the ``src/`` of mission *folder* but the scripts the builder generates there."""
+    return [
+        path
+        for path in _files_under(folder / "src")
+        if not (path.parent == folder / "src" / "scripts" and path.name in _GENERATED_SCRIPTS)
+    ]
+
+
+def _weather_is_live(weather_path: Path) -> bool:
+    """Return whether a variant of *weather_path* fetches a live METAR, so is never the same twice."""
+    try:
+        with weather_path.open("r", encoding="utf-8") as fh:
+            versions = (yaml.safe_load(fh) or {}).get("versions") or []
+    except (OSError, yaml.YAMLError, AttributeError):
+        return True
+    return any(isinstance(version, dict) and version.get("airport_icao") for version in versions)
+
+
+def _stage_hashes(
+    worker: MissionBuilderWorker,
+    options: _BuildOptions,
+    variant_profile: str | None,
+    variant_output: Path,
+    hashes: FileHashes,
+) -> dict[str, str]:
+    """Hash the settings and inputs of each stage of one variant build (see :mod:`veaf_libs.build_manifest`).
+
+    ``build`` reads ``mission.yaml``, everything under ``src/`` but the scripts the builder generates
+    there, the step files kept outside it, and the published scripts. ``weather`` reads its
+    ``versions.yaml``, and today's date: ``date: tomorrow`` is another day tomorrow.
+    """
+    folder = options.mission_folder
+    weather_path = resolve_pipeline_step_file(
+        worker.pipeline_cfg, folder, "weather", *_PIPELINE_STEP_CANDIDATES["weather"]
     )
+    scripts_folder = worker.scripts_path or folder / "published"
+    build_files = [
+        folder / "mission.yaml",
+        *_files_under(scripts_folder / "src"),
+        *_files_under(scripts_folder / "build"),
+    ]
+    build_files += _source_files(folder)
+    for key, candidates in _PIPELINE_STEP_CANDIDATES.items():
+        if path := resolve_pipeline_step_file(worker.pipeline_cfg, folder, key, *candidates):
+            build_files.append(path)
+    build_settings = {
+        "version": VERSION,
+        "profile": variant_profile,
+        "output": variant_output,
+        "scripts_path": scripts_folder,
+        "dynamic_mode": worker.dynamic_mode,
+        "dev_mode": worker.dev_mode,
+        "log_modules": options.log_modules,
+        "migrate_from_v5": options.migrate_from_v5,
+        "no_veaf_triggers": options.no_veaf_triggers,
+    }
+    build = hashes.stage(build_settings, [path for path in build_files if path != weather_path])
 
-    mission_yaml_path = p_mission_folder / "mission.yaml"
+    weather_settings: dict = {"today": date.today().isoformat()}
+    if weather_path and _weather_is_live(weather_path):
+        weather_settings["live"] = time.time_ns()
+    return {"build": build, "weather": hashes.stage(weather_settings, [weather_path] if weather_path else [])}
+
+
+def _run_variant(
+    options: _BuildOptions,
+    variant_profile: str | None,
+    variant_output: Path,
+    variant_base_name: str,
+    folder_lock: AbstractContextManager = nullcontext(),
+) -> None:
+    """Run the build pipeline once, producing one ``.miz`` for *variant_profile*.
 
-    def _run_variant(variant_profile: str | None, variant_output: Path, variant_base_name: str) -> None:
-        """Run the full build pipeline once, producing one ``.miz`` for *variant_profile*."""
-        # Build the mission
-        logger.step(t("pipeline.console.build"))
+    With ``--timings``, the build is profiled (see :mod:`veaf_libs.build_profiler`): its stages are
+    printed as a table and written as a Chrome trace next to the ``.miz``, whether it succeeds or not.
+    """
+    if not options.timings:
+        _build_variant(options, variant_profile, variant_output, variant_base_name, folder_lock)
+        return
+    with build_profiler.profiling() as profiler:
+        try:
+            with build_profiler.stage(variant_output.name):
+                _build_variant(options, variant_profile, variant_output, variant_base_name, folder_lock)
+        finally:
+            console.print(profiler.table(t("cmd.build.timings_title", file=variant_output.name)))
+            trace = build_profiler.trace_path(variant_output)
+            metadata = {"version": VERSION, "output": variant_output, "profile": variant_profile}
+            try:
+                profiler.write_trace(trace, metadata)
+                logger.tech(t("cmd.build.timings_written", path=trace))
+            except OSError as e:
+                logger.warning(t("cmd.build.timings_not_written", path=trace, error=e))
+
+
+def _build_variant(
+    options: _BuildOptions,
+    variant_profile: str | None,
+    variant_output: Path,
+    variant_base_name: str,
+    folder_lock: AbstractContextManager,
+) -> None:
+    """Build the ``.miz`` of *variant_profile*: the body of :func:`_run_variant`.
+
+    *folder_lock* is held while the builder writes into and collects from the mission folder (the
+    generated ``veaf-config.lua`` differs between variants) and while the settings are persisted to
+    ``mission.yaml``; the steps after it only touch the variant's own ``.miz``.
+
+    The manifest of the previous build (see :mod:`veaf_libs.build_manifest`) decides where to start:
+    nowhere when no input changed, at the weather variants when only theirs did, and from the
+    beginning otherwise or with ``--force``.
+    """
+    p_mission_folder = options.mission_folder
+    mission_yaml_path = p_mission_folder / "mission.yaml"
+    manifest_file = manifest_path(variant_output)
+    previous = None if options.force else BuildManifest.load(manifest_file)
+    hashes = FileHashes(previous.files if previous else None)
+    # Build the mission
+    logger.step(t("pipeline.console.build"))
+    with folder_lock:
         worker = MissionBuilderWorker(
-            dynamic_mode=dynamic_mode,
-            dev_mode_override=dev_mode,
-            scripts_path_override=scripts_path,
-            log_modules_filter=log_modules,
+            dynamic_mode=options.dynamic_mode,
+            dev_mode_override=options.dev_mode,
+            scripts_path_override=options.scripts_path,
+            log_modules_filter=options.log_modules,
             mission_folder=p_mission_folder,
             output_mission=variant_output,
-            migrate_from_v5=migrate_from_v5,
-            no_veaf_triggers=no_veaf_triggers,
+            migrate_from_v5=options.migrate_from_v5,
+            no_veaf_triggers=options.no_veaf_triggers,
             profile_name=variant_profile,
         )
-        worker.work()
+        with build_profiler.stage("manifest"):
+            stages = _stage_hashes(worker, options, variant_profile, variant_output, hashes)
+            start = previous.first_stale_stage(stages, hashes) if previous else "build"
+        if start is None:
+            logger.tech(t("cmd.build.up_to_date", file=variant_output.name))
+            return
+        if start == "build":
+            with build_profiler.stage("build"):
+                worker.work()
 
         # Persist build settings to mission.yaml when relevant CLI flags were explicitly given
-        if mission_yaml_path.exists() and (dev_mode is not None or scripts_path is not None):
-            _update_build_config_in_yaml(
+        if (
+            options.persist_settings
+            and mission_yaml_path.exists()
+            and (options.dev_mode is not None or options.scripts_path is not None)
+            and _update_build_config_in_yaml(
                 mission_yaml_path,
                 dev_mode=worker.dev_mode,
                 scripts_path=worker.scripts_path,
             )
+        ):
             logger.info(t("cmd.build.settings_persisted", path=mission_yaml_path))
+            # mission.yaml is an input of the build stage: record it as written, or the next build
+            # would find it changed and start over.
+            with build_profiler.stage("manifest"):
+                stages = _stage_hashes(worker, options, variant_profile, variant_output, hashes)
 
-        # ── Auto-pipeline: run optional injection steps ───────────────────────────
-        # Each step is auto-enabled when its config file is found in src/.
-        # Override in mission.yaml under the `pipeline:` key.
-        #   pipeline:
-        #     presets: false                 # disable even if src/presets.yaml exists
-        #     waypoints:
-        #       file: custom/wp.yaml         # use a non-default path
-        #     spawnable_aircrafts:
-        #       mode: replace                # add (default) or replace
-        #     dynamic_slot_templates: false  # disable dynamic-slot-templates.yaml injection
-        #     weather: false
-
-        def _step_file(key: str, *candidates: str) -> Path | None:
-            """Return the resolved file for a pipeline step, or None to skip."""
-            return resolve_pipeline_step_file(worker.pipeline_cfg, p_mission_folder, key, *candidates)
-
-        presets_path = _step_file("presets", "src/presets.yaml")
-        if presets_path:
-            logger.info(t("pipeline.injecting_presets", path=presets_path))
-            logger.step(t("pipeline.console.presets", file=presets_path.name))
-            generate_kneeboards = pipeline_step_subflag(worker.pipeline_cfg, "presets", "kneeboards", True)
-            presets_worker = PresetsInjectorWorker(
-                presets_file=presets_path,
-                input_mission=variant_output,
-                output_mission=variant_output,
-                generate_kneeboards=generate_kneeboards,
-            )
+    if start == "build":
+        mission = _run_injection_steps(worker, p_mission_folder, variant_output, folder_lock)
+        base_mission: DcsMission | None = mission.mission
+    else:
+        logger.tech(t("cmd.build.resume_at_weather", file=variant_output.name))
+        base_mission = None
+
+    weather_path = resolve_pipeline_step_file(
+        worker.pipeline_cfg, p_mission_folder, "weather", *_PIPELINE_STEP_CANDIDATES["weather"]
+    )
+    created_files: list[Path] = []
+    if weather_path:
+        logger.info(t("pipeline.injecting_weather", path=weather_path))
+        logger.step(t("pipeline.console.weather", file=weather_path.name))
+        weather_worker = WeatherInjectorWorker(
+            config_file=weather_path,
+            mission_file=variant_output,
+            output_dir=p_mission_folder / "missions",
+            mission_base_name=variant_base_name,
+            base_mission=base_mission,
+        )
+        with build_profiler.stage("weather"):
+            created_files = weather_worker.work()
+        if created_files:
+            logger.detail(tn("pipeline.console.weather_done", len(created_files)))
+        if weather_worker.config is None or len(created_files) < len(weather_worker.config.versions):
+            # A variant failed: leave the stage unrecorded, so the next build tries it again.
+            del stages["weather"]
+
+    BuildManifest(
+        stages=stages,
+        outputs={"build": hashes.outputs([variant_output]), "weather": hashes.outputs(created_files)},
+        files=hashes.entries,
+    ).save(manifest_file)
+    logger.tech(t("msg.work_done"))
+
+
+def _run_injection_steps(
+    worker: MissionBuilderWorker, p_mission_folder: Path, variant_output: Path, folder_lock: AbstractContextManager
+) -> InMemoryMission:
+    """Run the injection steps on the mission *worker* built, and write it to *variant_output*.
+
+    Returns:
+        The written mission, which the weather variants branch from.
+    """
+    # ── Auto-pipeline: run optional injection steps ───────────────────────────
+    # Each step is auto-enabled when its config file is found in src/.
+    # Override in mission.yaml under the `pipeline:` key.
+    #   pipeline:
+    #     presets: false                 # disable even if src/presets.yaml exists
+    #     waypoints:
+    #       file: custom/wp.yaml         # use a non-default path
+    #     spawnable_aircrafts:
+    #       mode: replace                # add (default) or replace
+    #     dynamic_slot_templates: false  # disable dynamic-slot-templates.yaml injection
+    #     weather: false
+    #
+    # The injection steps share the mission the builder parsed and the .miz is written once, after
+    # the last of them: run one by one, each step would read, parse, serialize and zip the whole
+    # file again.
+    mission = worker.in_memory
+    assert mission is not None
+
+    def _step_file(key: str) -> Path | None:
+        """Return the resolved file for a pipeline step, or None to skip."""
+        return resolve_pipeline_step_file(worker.pipeline_cfg, p_mission_folder, key, *_PIPELINE_STEP_CANDIDATES[key])
+
+    presets_path = _step_file("presets")
+    if presets_path:
+        logger.info(t("pipeline.injecting_presets", path=presets_path))
+        logger.step(t("pipeline.console.presets", file=presets_path.name))
+        generate_kneeboards = pipeline_step_subflag(worker.pipeline_cfg, "presets", "kneeboards", True)
+        presets_worker = PresetsInjectorWorker(
+            presets_file=presets_path,
+            input_mission=variant_output,
+            output_mission=variant_output,
+            generate_kneeboards=generate_kneeboards,
+            in_memory=mission,
+        )
+        with build_profiler.stage("presets"):
             presets_worker.work()
-            report_path = p_mission_folder / "presets-validation-report.md"
+        report_path = p_mission_folder / "presets-validation-report.md"
+        with folder_lock:
             issue_count = presets_worker.generate_validation_report(report_path)
             if issue_count == 0 and report_path.exists():
                 report_path.unlink()
 
-        waypoints_path = _step_file("waypoints", "src/waypoints.yaml", "waypoints.yaml")
-        if waypoints_path:
-            logger.info(t("pipeline.injecting_waypoints", path=waypoints_path))
-            logger.step(t("pipeline.console.waypoints", file=waypoints_path.name))
+    waypoints_path = _step_file("waypoints")
+    if waypoints_path:
+        logger.info(t("pipeline.injecting_waypoints", path=waypoints_path))
+        logger.step(t("pipeline.console.waypoints", file=waypoints_path.name))
+        with build_profiler.stage("waypoints"):
             WaypointsInjectorWorker(
                 waypoints_file=waypoints_path,
                 input_mission=variant_output,
                 output_mission=variant_output,
+                in_memory=mission,
             ).work()
 
-        def _inject_aircraft_step(step_key: str, candidate: str) -> None:
-            """Inject one aircraft-group family file (spawnables or dynamic-slot templates)."""
-            path = _step_file(step_key, candidate)
-            if not path:
-                return
-            mode = "add"
-            step_cfg = worker.pipeline_cfg.get(step_key)
-            if isinstance(step_cfg, dict):
-                mode = step_cfg.get("mode", "add")
+    def _inject_aircraft_step(step_key: str) -> None:
+        """Inject one aircraft-group family file (spawnables or dynamic-slot templates)."""
+        path = _step_file(step_key)
+        if not path:
+            return
+        mode = "add"
+        step_cfg = worker.pipeline_cfg.get(step_key)
+        if isinstance(step_cfg, dict):
+            mode = step_cfg.get("mode", "add")
+        with build_profiler.stage(step_key):
             validator = AircraftGroupsYAMLValidator(path)
             is_valid, _ = validator.validate()
             if is_valid:
@@ -337,6 +538,7 @@ def build(
                     input_yaml=path,
                     target_mission=variant_output,
                     output_mission=variant_output,
+                    in_memory=mission,
                 ).inject(mode=mode, silent=False)
                 logger.detail(tn("pipeline.console.aircraft_done", result.groups_injected))
                 if result.groups_skipped:
@@ -345,77 +547,260 @@ def build(
                 logger.warning(t("cmd.build.aircraft_validation_failed", path=path))
                 console.print(t("pipeline.console.aircraft_invalid"))
 
-        # Two independent steps (ADR 0002): spawnable aircraft groups and dynamic-slot templates.
-        _inject_aircraft_step("spawnable_aircrafts", "src/spawnables.yaml")
-        _inject_aircraft_step("dynamic_slot_templates", "src/dynamic-slot-templates.yaml")
-
-        # Warn about pre-v6 files that are no longer injected (hard break — see ADR 0002).
-        for _legacy in ("src/aircraft-templates.yaml", "src/templates.yaml"):
-            if (p_mission_folder / _legacy).exists():
-                logger.warning(t("cmd.build.orphan_aircraft_file", file=_legacy))
-
-        # Dynamic-Slot warehouse wiring — must run after aircraft injection so the
-        # dynSpawnTemplate groups (and their groupIds) exist for linkDynTempl.
-        warehouses_path = _step_file("warehouses", "src/warehouses.yaml", "warehouses.yaml")
-        if warehouses_path:
-            logger.info(t("pipeline.injecting_warehouses", path=warehouses_path))
-            logger.step(t("pipeline.console.warehouses", file=warehouses_path.name))
+    # Two independent steps (ADR 0002): spawnable aircraft groups and dynamic-slot templates.
+    _inject_aircraft_step("spawnable_aircrafts")
+    _inject_aircraft_step("dynamic_slot_templates")
+
+    # Warn about pre-v6 files that are no longer injected (hard break — see ADR 0002).
+    for _legacy in ("src/aircraft-templates.yaml", "src/templates.yaml"):
+        if (p_mission_folder / _legacy).exists():
+            logger.warning(t("cmd.build.orphan_aircraft_file", file=_legacy))
+
+    # Dynamic-Slot warehouse wiring — must run after aircraft injection so the
+    # dynSpawnTemplate groups (and their groupIds) exist for linkDynTempl.
+    warehouses_path = _step_file("warehouses")
+    if warehouses_path:
+        logger.info(t("pipeline.injecting_warehouses", path=warehouses_path))
+        logger.step(t("pipeline.console.warehouses", file=warehouses_path.name))
+        with build_profiler.stage("warehouses"):
             wh_result = WarehousesInjectorWorker(
                 config_file=warehouses_path,
                 input_mission=variant_output,
                 output_mission=variant_output,
+                in_memory=mission,
             ).work()
-            logger.detail(
-                t(
-                    "pipeline.console.warehouses_done",
-                    airports=tn("pipeline.console.warehouses_airports", wh_result.airports_configured),
-                    templates=tn("pipeline.console.warehouses_templates", wh_result.templates_linked),
-                )
+        logger.detail(
+            t(
+                "pipeline.console.warehouses_done",
+                airports=tn("pipeline.console.warehouses_airports", wh_result.airports_configured),
+                templates=tn("pipeline.console.warehouses_templates", wh_result.templates_linked),
             )
-
-        # Spawn-data injection — always on (the framework spawn DB must ship), unless
-        # explicitly disabled. Merges an optional per-mission src/spawn-groups.yaml
-        # (which may hold both `units:` and `groups:`) over the framework data. Runs
-        # before weather so every weather variant embeds the data. See ADR 0005.
-        spawn_step_cfg = worker.pipeline_cfg.get("spawn_data")
-        spawn_disabled = spawn_step_cfg is False or (
-            isinstance(spawn_step_cfg, dict) and spawn_step_cfg.get("enabled") is False
         )
-        if not spawn_disabled:
-            spawn_data_path = _step_file("spawn_data", "src/spawn-groups.yaml")
-            # Name the merged file in the header (like every other step); the step
-            # still runs on the shipped framework data even when the file is absent.
-            spawn_file_suffix = f" ({spawn_data_path.name})" if spawn_data_path else ""
-            logger.step(t("pipeline.console.spawn_data", file=spawn_file_suffix))
+
+    # Spawn-data injection — always on (the framework spawn DB must ship), unless
+    # explicitly disabled. Merges an optional per-mission src/spawn-groups.yaml
+    # (which may hold both `units:` and `groups:`) over the framework data. Runs
+    # before weather so every weather variant embeds the data. See ADR 0005.
+    spawn_step_cfg = worker.pipeline_cfg.get("spawn_data")
+    spawn_disabled = spawn_step_cfg is False or (
+        isinstance(spawn_step_cfg, dict) and spawn_step_cfg.get("enabled") is False
+    )
+    if not spawn_disabled:
+        spawn_data_path = _step_file("spawn_data")
+        # Name the merged file in the header (like every other step); the step
+        # still runs on the shipped framework data even when the file is absent.
+        spawn_file_suffix = f" ({spawn_data_path.name})" if spawn_data_path else ""
+        logger.step(t("pipeline.console.spawn_data", file=spawn_file_suffix))
+        with build_profiler.stage("spawn_data"):
             spawn_result = SpawnDataInjectorWorker(
                 input_mission=variant_output,
                 output_mission=variant_output,
                 mission_data_file=spawn_data_path,
+                in_memory=mission,
             ).work()
-            if spawn_data_path:
-                logger.info(t("pipeline.injecting_spawn_data", path=spawn_data_path))
-            logger.detail(
-                t(
-                    "pipeline.console.spawn_data_done",
-                    units=tn("pipeline.console.spawn_data_units", spawn_result.units),
-                    groups=tn("pipeline.console.spawn_data_groups", spawn_result.groups),
-                )
+        if spawn_data_path:
+            logger.info(t("pipeline.injecting_spawn_data", path=spawn_data_path))
+        logger.detail(
+            t(
+                "pipeline.console.spawn_data_done",
+                units=tn("pipeline.console.spawn_data_units", spawn_result.units),
+                groups=tn("pipeline.console.spawn_data_groups", spawn_result.groups),
             )
+        )
 
-        weather_path = _step_file("weather", "src/versions.yaml", "versions.yaml")
-        if weather_path:
-            logger.info(t("pipeline.injecting_weather", path=weather_path))
-            logger.step(t("pipeline.console.weather", file=weather_path.name))
-            weather_worker = WeatherInjectorWorker(
-                config_file=weather_path,
-                mission_file=variant_output,
-                output_dir=p_mission_folder / "missions",
-                mission_base_name=variant_base_name,
-            )
-            if created_files := weather_worker.work():
-                logger.detail(tn("pipeline.console.weather_done", len(created_files)))
+    # The weather variants are copies of the finished mission, so it must be on disk first: they share
+    # its parsed tables and copy from the file every member they leave untouched.
+    with build_profiler.stage("write"):
+        mission.write()
+    return mission
+
+
+#: The mission-folder lock of a ``--jobs`` process, shared with its siblings (see :func:`_init_variant_process`).
+_process_folder_lock: AbstractContextManager = nullcontext()
+
+
+def _init_variant_process(folder_lock: AbstractContextManager, language: str, verbose: bool, width: int) -> None:
+    """Set up a ``--jobs`` process: the shared folder lock, the parent's language, and a recording console.
+
+    Several variants printing to one terminal at once would interleave line by line, so each process
+    records its output instead and the parent prints it, variant by variant, in plan order.
+    """
+    global _process_folder_lock
+    _process_folder_lock = folder_lock
+    set_language(language)
+    console.file = io.StringIO()
+    console.width = width
+    console.record = True
+    # Not a terminal any more, so this also turns the transient status line off.
+    logger.set_verbose(verbose)
+
+
+def _run_variant_captured(
+    options: _BuildOptions, variant_profile: str | None, variant_output: Path, variant_base_name: str
+) -> _VariantRun:
+    """Build one variant in a ``--jobs`` process; the failure, if any, is returned with the output."""
+    run = _VariantRun(profile=variant_profile, output=variant_output)
+    started = time.perf_counter()
+    try:
+        _run_variant(options, variant_profile, variant_output, variant_base_name, _process_folder_lock)
+    except Exception as e:
+        run.error = e
+    run.seconds = time.perf_counter() - started
+    run.log = console.export_text(clear=True, styles=True)
+    return run
+
+
+def _run_variants_in_parallel(
+    options: _BuildOptions, plan: list[tuple[str | None, Path, str]], jobs: int
+) -> list[_VariantRun]:
+    """Build the variants of *plan* in up to *jobs* processes, printing each one's output in plan order.
+
+    A variant's output is printed once it and every variant before it are done. A failed variant does
+    not stop the others; the caller decides what its failure means.
+    """
+    # `spawn` everywhere: it is the only start method on Windows, where most builds run.
+    context = multiprocessing.get_context("spawn")
+    runs: list[_VariantRun] = []
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(plan)),
+        mp_context=context,
+        initializer=_init_variant_process,
+        initargs=(context.Lock(), current_language(), logger.verbose, console.width),
+    ) as pool:
+        futures = [pool.submit(_run_variant_captured, options, *entry) for entry in plan]
+        for future in futures:
+            run = future.result()
+            logger.step(t("cmd.build.variant_output", variant=run.profile, file=run.output.name))
+            console.print(Text.from_ansi(run.log), soft_wrap=True)
+            runs.append(run)
+    return runs
+
+
+def _report_variant_timings(runs: list[_VariantRun], wall_seconds: float) -> None:
+    """Print how long each variant took, and the whole build."""
+    logger.tech(t("cmd.build.variant_timings", seconds=f"{wall_seconds:.1f}"))
+    for run in runs:
+        key = "cmd.build.variant_timing_failed" if run.error else "cmd.build.variant_timing"
+        logger.detail(t(key, variant=run.profile, file=run.output.name, seconds=f"{run.seconds:.1f}"))
+
+
+def _run_plan(options: _BuildOptions, plan: list[tuple[str | None, Path, str]], jobs: int) -> None:
+    """Build every variant of *plan*, in up to *jobs* processes; raise the first variant failure."""
+    started = time.perf_counter()
+    if jobs > 1 and len(plan) > 1:
+        runs = _run_variants_in_parallel(options, plan, jobs)
+    else:
+        runs = []
+        for variant_profile, v_output, v_base in plan:
+            variant_started = time.perf_counter()
+            _run_variant(options, variant_profile, v_output, v_base)
+            runs.append(_VariantRun(variant_profile, v_output, time.perf_counter() - variant_started))
+    if len(plan) > 1:
+        _report_variant_timings(runs, time.perf_counter() - started)
+    if failure := next((run.error for run in runs if run.error), None):
+        raise failure
+
+
+#: How often ``--watch`` looks at the inputs, in seconds; a change must then hold for as long to count.
+_WATCH_POLL_SECONDS = 0.5
+
+
+def _build_inputs(plan: list[tuple[str | None, Path, str]]) -> set[Path]:
+    """Every input file the last builds of *plan* recorded in their manifests."""
+    inputs: set[Path] = set()
+    for _, output, _ in plan:
+        if manifest := BuildManifest.load(manifest_path(output)):
+            written = {path for files in manifest.outputs.values() for path in files}
+            inputs.update(Path(path) for path in manifest.files if path not in written)
+    return inputs
 
-        logger.tech(t("msg.work_done"))
+
+def _watch_snapshot(folder: Path, inputs: set[Path]) -> dict[str, tuple[int, int]]:
+    """Return ``path -> (size, mtime_ns)`` of ``mission.yaml``, the ``src/`` files and *inputs*.
+
+    Listing ``src/`` again on every look is what catches a file being added to it.
+    """
+    snapshot = {}
+    for path in {folder / "mission.yaml", *_source_files(folder), *inputs}:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        snapshot[str(path)] = (stat.st_size, stat.st_mtime_ns)
+    return snapshot
+
+
+def _wait_for_change(
+    take: Callable[[], dict[str, tuple[int, int]]], snapshot: dict[str, tuple[int, int]], poll: float
+) -> dict[str, tuple[int, int]]:
+    """Wait until *take* returns something other than *snapshot*, then until it holds for one *poll*.
+
+    An editor saving several files, or one file in several writes, is then one rebuild, not several.
+
+    Returns:
+        The settled snapshot.
+    """
+    current = snapshot
+    while current == snapshot:
+        time.sleep(poll)
+        current = take()
+    while True:
+        time.sleep(poll)
+        settled = take()
+        if settled == current:
+            return settled
+        current = settled
+
+
+def _build_once(options: _BuildOptions, plan: list[tuple[str | None, Path, str]]) -> None:
+    """Build *plan* for ``--watch``: report a failure instead of raising it, and how long the build took."""
+    started = time.perf_counter()
+    try:
+        _run_plan(options, plan, jobs=1)
+    except Exception as e:
+        logger.warning(t("cmd.build.watch_failed", error=e))
+    logger.tech(t("cmd.build.watch_rebuilt", seconds=f"{time.perf_counter() - started:.1f}"))
+
+
+def _watch(options: _BuildOptions, plan: list[tuple[str | None, Path, str]]) -> None:
+    """Build *plan*, then build it again whenever its inputs change, until Ctrl+C.
+
+    The process stays up between builds, so what they parse stays in memory (see
+    :mod:`veaf_libs.resident_cache`) — which is also why the variants are built in this process, one
+    after the other, rather than in ``--jobs`` processes. Each build's manifest skips the stages whose
+    inputs did not change; ``--force`` only applies to the first build. A failed build is reported
+    and the watch goes on.
+    """
+    resident_cache.enable()
+    folder = options.mission_folder
+    try:
+        _build_once(options, plan)
+        options = dataclasses.replace(options, force=False)
+        inputs = _build_inputs(plan)
+        snapshot = _watch_snapshot(folder, inputs)
+        logger.tech(t("cmd.build.watching", path=folder))
+        while True:
+            snapshot = _wait_for_change(lambda: _watch_snapshot(folder, inputs), snapshot, _WATCH_POLL_SECONDS)
+            _build_once(options, plan)
+            inputs = _build_inputs(plan)
+            # Files keep the stat they had before the build, so an edit made while it ran triggers the
+            # next one; only the inputs the build added to its manifest are taken as they are now.
+            after = _watch_snapshot(folder, inputs)
+            snapshot = {path: snapshot.get(path, stat) for path, stat in after.items()}
+    except KeyboardInterrupt:
+        logger.tech(t("cmd.build.watch_stopped"))
+
+
+def _mission_plan(
+    p_mission_folder: Path, mission_name_or_file: str | None, profile: str | None
+) -> list[tuple[str | None, Path, str]]:
+    """Return the build plan of the mission in *p_mission_folder* (see :func:`_build_plan`)."""
+    # Resolve the output mission path and base name (mission.yaml-aware).
+    p_output_mission, mission_base_name = _resolve_output_mission(
+        mission_name_or_file, p_mission_folder, DEFAULT_MISSION_FILE
+    )
+
+    mission_yaml_path = p_mission_folder / "mission.yaml"
 
     # ── Variant selection (FOOTHOLD-V6-006) ───────────────────────────────────
     # One mission folder can yield several .miz in a single build — one per build
@@ -424,12 +809,315 @@ def build(
     if mission_yaml_path.exists():
         with mission_yaml_path.open("r", encoding="utf-8") as fh:
             peek_yaml = yaml.safe_load(fh) or {}
-    plan = _build_plan(peek_yaml, profile, p_output_mission, mission_base_name)
+    return _build_plan(peek_yaml, profile, p_output_mission, mission_base_name)
+
+
+@app.command(help=t("cmd.build.help"))
+def build(
+    readme: bool = typer.Option(False, help=README_HELP),
+    verbose: bool = typer.Option(False, help=VERBOSE_HELP),
+    no_veaf_triggers: bool = typer.Option(False, help=t("cmd.build.opt.no_veaf_triggers")),
+    dynamic_mode: bool | None = typer.Option(
+        None,
+        "--dynamic-mode/--no-dynamic-mode",
+        help=t("cmd.build.opt.dynamic_mode"),
+    ),
+    dev_mode: bool | None = typer.Option(
+        None,
+        "--dev-mode/--no-dev-mode",
+        help=t("cmd.build.opt.dev_mode"),
+    ),
+    scripts_path: str = typer.Option(
+        None,
+        help=t("cmd.build.opt.scripts_path"),
+    ),
+    profile: str | None = typer.Option(
+        None,
+        "--profile",
+        "-p",
+        help=t("cmd.build.opt.profile"),
+    ),
+    migrate_from_v5: bool = typer.Option(True, help=t("cmd.build.opt.migrate_from_v5")),
+    log_modules: str | None = typer.Option(
+        None,
+        help=t("cmd.build.opt.log_modules_detail"),
+    ),
+    mission_name_or_file: str | None = typer.Argument(
+        DEFAULT_MISSION_FILE,
+        help=t("cmd.build.opt.mission_name_or_file"),
+    ),
+    mission_folder: str | None = typer.Argument(".", help=t("cmd.build.opt.folder")),
+    jobs: int = typer.Option(1, "--jobs", "-j", min=1, help=t("cmd.build.opt.jobs")),
+    force: bool = typer.Option(False, "--force", help=t("cmd.build.opt.force")),
+    watch: bool = typer.Option(False, "--watch", help=t("cmd.build.opt.watch")),
+    timings: bool = typer.Option(False, "--timings", help=t("cmd.build.opt.timings")),
+    pause: bool = typer.Option(False, help=PAUSE_HELP),
+) -> None:
+
+    logger.set_verbose(verbose)
+
+    # Set the title and version
+    console.print(t("cmd.build.title", version=VERSION))
+
+    if readme:
+        if typer.confirm(t("help.confirm_doc")):
+            md_render = Markdown(MissionBuilderREADME)
+            console.print(md_render)
+        raise typer.Exit()
+
+    # Resolve input mission folder
+    p_mission_folder = resolve_path(path=mission_folder, default_path=Path.cwd(), should_exist=True)
+    if not p_mission_folder.exists():
+        logger.error(t("cmd.build.folder_not_found", path=p_mission_folder), exception_type=FileNotFoundError)
+
+    plan = _mission_plan(p_mission_folder, mission_name_or_file, profile)
 
     if len(plan) > 1:
         logger.info(tn("cmd.build.multivariant", len(plan), variants=", ".join(str(p) for p, _, _ in plan)))
-    for variant_profile, v_output, v_base in plan:
-        _run_variant(variant_profile, v_output, v_base)
+    options = _BuildOptions(
+        mission_folder=p_mission_folder,
+        dynamic_mode=dynamic_mode,
+        dev_mode=dev_mode,
+        scripts_path=scripts_path,
+        log_modules=log_modules,
+        migrate_from_v5=migrate_from_v5,
+        no_veaf_triggers=no_veaf_triggers,
+        force=force,
+        timings=timings,
+    )
+    if watch:
+        _watch(options, plan)
+    else:
+        _run_plan(options, plan, jobs)
+
+    if pause:
+        input(t("help.pause_msg"))
+
+
+# ── build-all ─────────────────────────────────────────────────────────────────
+
+#: Folders ``build-all`` never looks for missions in: a mission's own sub-folders, and tool noise.
+_NOT_MISSION_FOLDERS = frozenset({"src", "published", "missions", "node_modules", "__pycache__"})
+
+#: Where ``build-all`` writes its summary, under the root, unless ``--summary`` says otherwise.
+BUILD_ALL_SUMMARY = "build-all-summary.json"
+
+
+@dataclass
+class _MissionRun:
+    """How one mission of ``build-all`` went, with its console output."""
+
+    folder: Path
+    outputs: list[Path] = field(default_factory=list)
+    seconds: float = 0.0
+    log: str = ""
+    error: str | None = None
+
+
+def find_mission_folders(root: Path) -> list[Path]:
+    """Return every folder under *root* (itself included) holding a ``mission.yaml``, sorted.
+
+    A mission folder is not searched further, and neither are hidden folders nor the sub-folders a
+    mission folder holds (``src``, ``published``, ``missions``…) wherever they are.
+    """
+    found = []
+    for folder, subfolders, files in os.walk(root):
+        if "mission.yaml" in files:
+            found.append(Path(folder))
+            subfolders.clear()
+        else:
+            subfolders[:] = [
+                name for name in subfolders if not name.startswith(".") and name not in _NOT_MISSION_FOLDERS
+            ]
+    return sorted(found)
+
+
+def _build_mission(options: _BuildOptions) -> _MissionRun:
+    """Build every variant of one ``build-all`` mission, in a pool process; a failure is returned, not raised."""
+    run = _MissionRun(folder=options.mission_folder)
+    started = time.perf_counter()
+    try:
+        plan = _mission_plan(options.mission_folder, DEFAULT_MISSION_FILE, None)
+        run.outputs = [output for _, output, _ in plan]
+        _run_plan(options, plan, jobs=1)
+    except Exception as e:
+        run.error = _plain(str(e)) or type(e).__name__
+    run.seconds = time.perf_counter() - started
+    run.log = console.export_text(clear=True, styles=True)
+    return run
+
+
+def _plain(message: str) -> str:
+    """*message* without the Rich markup ``logger.error`` messages carry, for the JSON summary."""
+    try:
+        return Text.from_markup(message).plain
+    except MarkupError:
+        return message
+
+
+def _load_shared_data(scripts_path: Path | None) -> None:
+    """Load what every mission build reads the same, once, before the pool processes start.
+
+    On Linux the processes are forked, so they share these pages with this one (copy-on-write) rather
+    than each parsing the bundled tables again and reading its own copy of the shared scripts. On
+    Windows, where processes can only be spawned, each loads its own, as a single build does.
+    """
+    # Each lookup loads, and caches for the process, the bundled table behind it.
+    get_unit_category("")
+    get_unit_fuel_capacity("")
+    all_country_ids()
+    if scripts_path:
+        # What a build reads of the scripts folder (see _stage_hashes), not its .git or node_modules.
+        resident_cache.preload([*_files_under(scripts_path / "src"), *_files_under(scripts_path / "build")])
+
+
+def _missions_table(
+    root: Path, runs: dict[Path, _MissionRun], started: dict[Path, float], folders: list[Path]
+) -> Table:
+    """The live ``build-all`` table: one row per mission, with its state and time."""
+    table = Table(title=t("cmd.build_all.table_title", root=root), title_justify="left")
+    table.add_column(t("cmd.build_all.column.mission"), no_wrap=True, overflow="ellipsis")
+    table.add_column(t("cmd.build_all.column.state"))
+    table.add_column(t("cmd.build_all.column.seconds"), justify="right")
+    now = time.perf_counter()
+    for folder in folders:
+        name = folder.relative_to(root).as_posix() if folder != root else "."
+        if run := runs.get(folder):
+            state = t("cmd.build_all.state.failed") if run.error else t("cmd.build_all.state.built")
+            seconds = f"{run.seconds:.1f}"
+        elif folder in started:
+            state, seconds = t("cmd.build_all.state.building"), f"{now - started[folder]:.1f}"
+        else:
+            state, seconds = t("cmd.build_all.state.queued"), ""
+        table.add_row(name, state, seconds)
+    return table
+
+
+def _build_missions(root: Path, options: list[_BuildOptions], jobs: int) -> list[_MissionRun]:
+    """Build the missions of *options* in up to *jobs* processes, showing their progress as they go."""
+    folders = [option.mission_folder for option in options]
+    # Forked where it can be, to share what _load_shared_data loaded; `spawn` elsewhere (see above).
+    context = multiprocessing.get_context("fork" if sys.platform == "linux" else "spawn")
+    runs: dict[Path, _MissionRun] = {}
+    started: dict[Path, float] = {}
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(options)),
+        mp_context=context,
+        initializer=_init_variant_process,
+        initargs=(nullcontext(), current_language(), logger.verbose, console.width),
+    ) as pool:
+        queued = iter(options)
+        futures: dict[Future, Path] = {}
+        pending: set[Future] = set()
+
+        def submit_next() -> None:
+            # One mission per process at a time: a mission submitted is a mission building, which is
+            # what the table says and times (the pool would otherwise hand out one more than it runs).
+            if option := next(queued, None):
+                future = pool.submit(_build_mission, option)
+                futures[future] = option.mission_folder
+                pending.add(future)
+                started[option.mission_folder] = time.perf_counter()
+
+        for _ in range(min(jobs, len(options))):
+            submit_next()
+        # Redrawn in place on a terminal; a log (a CI build server's) only gets the final table.
+        live = Live(console=console, refresh_per_second=4) if console.is_terminal else None
+        with logger.status.suspend() if logger.status else nullcontext(), live or nullcontext():
+            while pending:
+                if live:
+                    live.update(_missions_table(root, runs, started, folders))
+                done, _ = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+                    folder = futures[future]
+                    try:
+                        runs[folder] = future.result()
+                    except Exception as e:  # the process itself died: no run came back
+                        runs[folder] = _MissionRun(folder=folder, error=str(e) or type(e).__name__)
+                    submit_next()
+            if live:
+                live.update(_missions_table(root, runs, started, folders))
+    if not live:
+        console.print(_missions_table(root, runs, started, folders))
+    return [runs[folder] for folder in folders]
+
+
+def _write_summary(path: Path, root: Path, jobs: int, runs: list[_MissionRun], seconds: float) -> None:
+    """Write the ``build-all`` summary: per mission, its outputs, outcome and duration."""
+    summary = {
+        "version": VERSION,
+        "root": str(root),
+        "jobs": jobs,
+        "seconds": round(seconds, 3),
+        "missions": [
+            {
+                "folder": str(run.folder),
+                "outcome": "failed" if run.error else "built",
+                "seconds": round(run.seconds, 3),
+                "outputs": [str(output) for output in run.outputs],
+                "error": run.error,
+            }
+            for run in runs
+        ],
+    }
+    path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+
+
+@app.command(name="build-all", help=t("cmd.build_all.help"))
+def build_all(
+    root: str = typer.Argument(".", help=t("cmd.build_all.opt.root")),
+    jobs: int = typer.Option(1, "--jobs", "-j", min=1, help=t("cmd.build_all.opt.jobs")),
+    scripts_path: str | None = typer.Option(None, help=t("cmd.build_all.opt.scripts_path")),
+    summary: str | None = typer.Option(None, help=t("cmd.build_all.opt.summary")),
+    force: bool = typer.Option(False, "--force", help=t("cmd.build.opt.force")),
+    verbose: bool = typer.Option(False, help=VERBOSE_HELP),
+    pause: bool = typer.Option(False, help=PAUSE_HELP),
+) -> None:
+    logger.set_verbose(verbose)
+    console.print(t("cmd.build_all.title", version=VERSION))
+
+    p_root = resolve_path(path=root, default_path=Path.cwd(), should_exist=True)
+    if not p_root.is_dir():
+        logger.error(t("cmd.build.folder_not_found", path=p_root), exception_type=FileNotFoundError)
+    folders = find_mission_folders(p_root)
+    if not folders:
+        logger.error(t("cmd.build_all.no_missions", root=p_root), exception_type=FileNotFoundError)
+    logger.info(tn("cmd.build_all.found", len(folders), root=p_root))
+
+    p_scripts = resolve_path(path=scripts_path, should_exist=True) if scripts_path else None
+    options = [
+        _BuildOptions(
+            mission_folder=folder,
+            dynamic_mode=None,
+            dev_mode=None,
+            scripts_path=str(p_scripts) if p_scripts else None,
+            log_modules=None,
+            migrate_from_v5=True,
+            no_veaf_triggers=False,
+            force=force,
+            # A shared --scripts-path is this batch's, not each mission's own setting.
+            persist_settings=False,
+        )
+        for folder in folders
+    ]
+    _load_shared_data(p_scripts)
+    started = time.perf_counter()
+    runs = _build_missions(p_root, options, jobs)
+    seconds = time.perf_counter() - started
+
+    for run in runs:
+        if run.error:
+            logger.step(t("cmd.build_all.failed_output", folder=run.folder))
+            console.print(Text.from_ansi(run.log), soft_wrap=True)
+    summary_path = Path(summary) if summary else p_root / BUILD_ALL_SUMMARY
+    _write_summary(summary_path, p_root, jobs, runs, seconds)
+    failed = sum(1 for run in runs if run.error)
+    logger.tech(
+        t("cmd.build_all.done", built=len(runs) - failed, failed=failed, seconds=f"{seconds:.1f}", summary=summary_path)
+    )
 
     if pause:
         input(t("help.pause_msg"))
+    if failed:
+        raise typer.Exit(1)
@@ -0,0 +1,44 @@
+import typer
+from veaf_libs import image_cache, parse_cache
+
+from veaf_tools.app import PAUSE_HELP, VERBOSE_HELP, VERSION, app, console, logger, t
+
+_ACTIONS = ("stats", "clear")
+
+
+def _mb(size: int) -> str:
+    return f"{size / (1024 * 1024):.1f}"
+
+
+@app.command(help=t("cmd.cache.help"))
+def cache(
+    action: str = typer.Argument("stats", help=t("cmd.cache.opt.action")),
+    verbose: bool = typer.Option(False, help=VERBOSE_HELP),
+    pause: bool = typer.Option(False, help=PAUSE_HELP),
+) -> None:
+    logger.set_verbose(verbose)
+    console.print(t("cmd.cache.banner", version=VERSION))
+
+    if action not in _ACTIONS:
+        console.print(f"[bold red]{t('cmd.cache.unknown_action', action=action)}[/bold red]")
+        raise typer.Exit(1)
+
+    if action == "clear":
+        removed = parse_cache.clear()
+        console.print(t("cmd.cache.cleared", count=removed, path=parse_cache.cache_dir()))
+        removed = image_cache.clear()
+        console.print(t("cmd.cache.images_cleared", count=removed, path=image_cache.cache_dir()))
+    else:
+        for state_key, stats in (
+            ("cmd.cache.state", parse_cache.stats()),
+            ("cmd.cache.images_state", image_cache.stats()),
+        ):
+            state = t("cmd.user_config.state_on") if stats.enabled else t("cmd.user_config.state_off")
+            console.print(t(state_key, state=state))
+            console.print(t("cmd.cache.directory", path=stats.directory))
+            console.print(
+                t("cmd.cache.usage", count=stats.entries, size=_mb(stats.size_bytes), limit=_mb(stats.max_bytes))
+            )
+
+    if pause:
+        input(t("help.pause_msg"))
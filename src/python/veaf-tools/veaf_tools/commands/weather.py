@@ -24,6 +24,7 @@ def inject_weather(
     mission_name_or_file: str | None = typer.Argument(DEFAULT_MISSION_FILE, help=t("cmd.inject_weather.opt.mission")),
     config_file: str = typer.Option("versions.yaml", help=t("cmd.inject_weather.opt.config_file")),
     convert_lua: bool = typer.Option(False, "--convert-lua", help=t("cmd.inject_weather.opt.convert_lua")),
+    jobs: int = typer.Option(1, "--jobs", "-j", min=1, help=t("cmd.inject_weather.opt.jobs")),
     pause: bool = typer.Option(False, help=PAUSE_HELP),
 ) -> None:
 
@@ -65,7 +66,7 @@ def inject_weather(
     p_mission_file = resolve_path(path=mission_name_or_file, should_exist=True)
 
     # Call the worker class
-    worker = WeatherInjectorWorker(config_file=p_config_file, mission_file=p_mission_file)
+    worker = WeatherInjectorWorker(config_file=p_config_file, mission_file=p_mission_file, jobs=jobs)
     if created_files := worker.work():
         console.print(tn("cmd.inject_weather.done", len(created_files)))
         for file_path in created_files:
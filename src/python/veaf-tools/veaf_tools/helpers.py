@@ -218,7 +218,7 @@ def _ask_replace(relative_path: Path) -> tuple[bool, bool]:
     return choice
 
 
-def _update_build_config_in_yaml(yaml_path: Path, dev_mode: bool, scripts_path: Path | None) -> None:
+def _update_build_config_in_yaml(yaml_path: Path, dev_mode: bool, scripts_path: Path | None) -> bool:
     """Update (or append) the ``build:`` section in *mission.yaml*, touching nothing else.
 
     Uses a text-based replacement so every comment in the file is preserved — a load/mutate/dump
@@ -231,10 +231,16 @@ def _update_build_config_in_yaml(yaml_path: Path, dev_mode: bool, scripts_path:
     ``security:`` block with its password hashes, and the maker's trailing comment, all gone in one
     call.
 
+    The file is only written when its text changes: ``build --watch`` watches ``mission.yaml``, and a
+    build that rewrote it with the same settings every time started the next one.
+
     Args:
         yaml_path: The ``mission.yaml`` to update in place.
         dev_mode: The persisted ``dev_mode`` flag.
         scripts_path: The persisted scripts path, omitted from the section when ``None``.
+
+    Returns:
+        Whether the file was written.
     """
     lines: list[str] = [
         "",
@@ -252,17 +258,19 @@ def _update_build_config_in_yaml(yaml_path: Path, dev_mode: bool, scripts_path:
     content = yaml_path.read_text(encoding="utf-8")
     span = _build_section_span(content)
     if span is None:
-        yaml_path.write_text(content.rstrip("\n") + "\n" + new_section, encoding="utf-8", newline="\n")
-        return
-
-    start, end = span
-    head = content[:start].rstrip("\n")
-    tail = content[end:].lstrip("\n")
-    rebuilt = head + "\n" + new_section
-    if tail:
-        # The section carries its own leading blank line, so one separating blank is enough here too.
-        rebuilt += "\n" + tail
+        rebuilt = content.rstrip("\n") + "\n" + new_section
+    else:
+        start, end = span
+        head = content[:start].rstrip("\n")
+        tail = content[end:].lstrip("\n")
+        rebuilt = head + "\n" + new_section
+        if tail:
+            # The section carries its own leading blank line, so one separating blank is enough here too.
+            rebuilt += "\n" + tail
+    if rebuilt == content:
+        return False
     yaml_path.write_text(rebuilt, encoding="utf-8", newline="\n")
+    return True
 
 
 def _build_section_span(content: str) -> tuple[int, int] | None:
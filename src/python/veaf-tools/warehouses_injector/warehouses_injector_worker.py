@@ -29,7 +29,8 @@ from dataclasses import dataclass
 from pathlib import Path
 
 import yaml
-from mission_tools import read_miz, write_miz
+from mission_tools import InMemoryMission, read_miz, write_miz
+from mission_tools.group_index import AIR_CATEGORIES, IndexedGroup
 from mission_tools.miz_tools import DcsMission
 from veaf_libs.base_worker import BaseWorker
 from veaf_libs.dcs_airdromes import airdrome_id_for_name
@@ -78,17 +79,11 @@ def _build_mission_categories(mission: DcsMission) -> dict[str, str]:
     under both categories (planes and helicopters) depending on iteration order.
     """
     index: dict[str, str] = {}
-    for group in mission.iter_groups():
+    for group in _template_groups(mission):
         # Only single-unit templates: a multi-unit group's reported unit_type is
         # just its last unit, which would file the same type under both categories.
-        if (
-            group.unit_type
-            and group.group_dcs.get("dynSpawnTemplate") is True
-            and len(group.group_dcs.get("units") or []) == 1
-        ):
-            index[group.unit_type.lower()] = _CATEGORY_TO_WAREHOUSE.get(
-                (group.aircraft_type or "").lower(), _DEFAULT_WAREHOUSE_CATEGORY
-            )
+        if group.unit_type and len(group.group.get("units") or []) == 1:
+            index[group.unit_type.lower()] = _CATEGORY_TO_WAREHOUSE.get(group.category, _DEFAULT_WAREHOUSE_CATEGORY)
     return index
 
 
@@ -124,13 +119,11 @@ def _build_template_index(mission: DcsMission) -> dict[tuple[str, str, str], int
         A lookup mapping. The first template wins per (coalition, type).
     """
     index: dict[tuple[str, str, str], int] = {}
-    for group in mission.iter_groups():
-        if group.group_dcs.get("dynSpawnTemplate") is not True:
-            continue
-        group_id = group.group_dcs.get("groupId")
+    for group in _template_groups(mission):
+        group_id = group.group.get("groupId")
         if group_id is None:
             continue
-        coalition = (group.coalition or "").lower()
+        coalition = group.coalition.lower()
         if group.name:
             index.setdefault((coalition, "name", group.name.lower()), int(group_id))
         if group.unit_type:
@@ -138,6 +131,16 @@ def _build_template_index(mission: DcsMission) -> dict[tuple[str, str, str], int
     return index
 
 
+def _template_groups(mission: DcsMission) -> list[IndexedGroup]:
+    """Return the aircraft groups that are dynamic-spawn templates, in the order the mission walks them."""
+    templates = [group for group in mission.group_index().templates() if group.category in AIR_CATEGORIES]
+    # iter_groups order, each country's helicopters before its planes: the order types are stocked in.
+    countries: dict[int, int] = {}
+    for group in templates:
+        countries.setdefault(id(group.country), len(countries))
+    return sorted(templates, key=lambda group: (countries[id(group.country)], group.category != "helicopter"))
+
+
 def _resolve_template_group_id(
     index: dict[tuple[str, str, str], int],
     coalition_key: str,
@@ -186,12 +189,10 @@ def _coalition_template_types(mission: DcsMission) -> dict[str, list[str]]:
     keys) because they become DCS warehouse `aircrafts` keys, which are case-sensitive.
     """
     types: dict[str, list[str]] = {}
-    for group in mission.iter_groups():
-        if group.group_dcs.get("dynSpawnTemplate") is not True:
-            continue
-        if group.group_dcs.get("groupId") is None or not group.unit_type:
+    for group in _template_groups(mission):
+        if group.group.get("groupId") is None or not group.unit_type:
             continue
-        bucket = types.setdefault((group.coalition or "").lower(), [])
+        bucket = types.setdefault(group.coalition.lower(), [])
         if group.unit_type not in bucket:
             bucket.append(group.unit_type)
     return types
@@ -312,28 +313,39 @@ def apply_warehouses(mission: DcsMission, config: dict) -> WarehousesResult:
 class WarehousesInjectorWorker(BaseWorker):
     """Apply a ``warehouses.yaml`` config to a ``.miz`` (Dynamic-Slot wiring)."""
 
-    def __init__(self, config_file: Path, input_mission: Path, output_mission: Path) -> None:
+    def __init__(
+        self,
+        config_file: Path,
+        input_mission: Path,
+        output_mission: Path,
+        in_memory: InMemoryMission | None = None,
+    ) -> None:
         """Initialize the worker.
 
         Args:
             config_file: Path to ``warehouses.yaml``.
             input_mission: Source ``.miz``.
             output_mission: Destination ``.miz`` (may equal the source).
+            in_memory: A mission to edit in place instead of the two files; its owner writes it.
         """
         self.config_file = config_file
         self.input_mission = input_mission
         self.output_mission = output_mission
+        self.in_memory = in_memory
 
     def work(self) -> WarehousesResult:
-        """Read the mission, apply the config, write it back.
+        """Read the mission, apply the config, write it back (or just apply it, in memory).
 
         Returns:
             The run result (airports configured, templates linked).
         """
         config = yaml.safe_load(self.config_file.read_text(encoding="utf-8")) or {}
-        mission = read_miz(self.input_mission)
-        result = apply_warehouses(mission, config)
-        write_miz(mission=mission, miz_file_path=self.output_mission)
+        if self.in_memory is not None:
+            result = apply_warehouses(self.in_memory.mission, config)
+        else:
+            mission = read_miz(self.input_mission)
+            result = apply_warehouses(mission, config)
+            write_miz(mission=mission, miz_file_path=self.output_mission)
         logger.info(
             t(
                 "warehouses.done",
@@ -10,7 +10,7 @@ from typing import Any
 
 import luadata
 import yaml
-from mission_tools import DcsMission, Group, read_miz, write_miz
+from mission_tools import DcsMission, Group, InMemoryMission, as_read_back, read_miz, write_miz
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
@@ -31,7 +31,13 @@ class WaypointsInjectorWorker(GroupInjectorWorker):
     Worker class that injects waypoints into aircraft groups from a YAML file.
     """
 
-    def __init__(self, waypoints_file: Path | None, input_mission: Path | None, output_mission: Path | None):
+    def __init__(
+        self,
+        waypoints_file: Path | None,
+        input_mission: Path | None,
+        output_mission: Path | None,
+        in_memory: InMemoryMission | None = None,
+    ):
         """
         Initialize the worker.
 
@@ -39,11 +45,14 @@ class WaypointsInjectorWorker(GroupInjectorWorker):
             waypoints_file: Path to the YAML file with waypoint definitions
             input_mission: Path to the input .miz mission file
             output_mission: Path to the output .miz mission file
+            in_memory: A mission to edit in place instead of reading and writing the .miz files
         """
         self.waypoints_file = waypoints_file
         self.groups: dict[str, Group] = {}
         self.waypoints_manager: WaypointsManager | None = None
-        super().__init__(config_file=waypoints_file, input_mission=input_mission, output_mission=output_mission)
+        super().__init__(
+            config_file=waypoints_file, input_mission=input_mission, output_mission=output_mission, in_memory=in_memory
+        )
 
     def load_config(self) -> WaypointsManager | None:
         """Load waypoint configuration from YAML file."""
@@ -71,11 +80,14 @@ class WaypointsInjectorWorker(GroupInjectorWorker):
         self.add_group(group)
 
     def read_mission(self, silent: bool = False) -> None:
-        """Load the mission and collect all groups."""
-        if not silent:
-            logger.info(t("group_injector.reading_mission", path=self.input_mission))
-        assert self.input_mission is not None
-        self.dcs_mission = read_miz(self.input_mission)
+        """Load the mission (or take the in-memory one) and collect all groups."""
+        if self.in_memory is not None:
+            self.dcs_mission = self.in_memory.mission
+        else:
+            if not silent:
+                logger.info(t("group_injector.reading_mission", path=self.input_mission))
+            assert self.input_mission is not None
+            self.dcs_mission = read_miz(self.input_mission)
         logger.debug("Searching for all aircraft groups")
         for group in self.dcs_mission.iter_groups():
             self.process_group(group)
@@ -136,6 +148,8 @@ class WaypointsInjectorWorker(GroupInjectorWorker):
 
         for waypoint in waypoints:
             wp_dict = waypoint.to_dict()
+            if self.in_memory is not None:
+                wp_dict = as_read_back(wp_dict)  # as the next step would have read it from the .miz
             name = wp_dict.get("name")
             if name and name in index_by_name:
                 points[index_by_name[name]] = wp_dict  # replace the same-named waypoint in place
@@ -158,7 +172,9 @@ class WaypointsInjectorWorker(GroupInjectorWorker):
         group.group_dcs["route"] = route
 
     def write_mission(self, silent: bool = False) -> None:
-        """Write the mission file."""
+        """Write the mission file (nothing to do for an in-memory mission)."""
+        if self.in_memory is not None:
+            return
         if not silent:
             logger.info(t("group_injector.writing_mission"))
 
@@ -1,6 +1,9 @@
 """Main worker for creating mission versions with weather and time modifications."""
 
+import multiprocessing
 import re
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import nullcontext
 from datetime import date as dt_date
 from datetime import timedelta
 from pathlib import Path
@@ -21,6 +24,17 @@ from .weather.dcs_weather_converter import fetch_metar_string
 
 _INVALID_FILENAME_CHARS = re.compile(r'[\\/:*?"<>|\x00-\x1f]')
 
+#: What a variant may change in place (see :meth:`DcsMission.branch`): the rest of the mission is shared.
+#: ``start_time`` and the briefing fields are replaced, not edited, so they need no copy of their own.
+_VARIANT_MISSION_KEYS = ("weather", "date")
+_VARIANT_COMPONENTS = ("dictionary",)
+
+
+def _write_variant(mission: DcsMission, output_path: Path) -> Path:
+    """Write one variant, in a ``jobs`` process."""
+    write_miz(mission=mission, miz_file_path=output_path)
+    return output_path
+
 
 class WeatherInjectorWorker(BaseWorker):
     """
@@ -28,12 +42,13 @@ class WeatherInjectorWorker(BaseWorker):
 
     Workflow:
     1. Load configuration from YAML file
-    2. For each version config:
-       a. Load base mission
+    2. Load the base mission, once
+    3. For each version config:
+       a. Branch the base mission (only what a variant changes is copied)
        b. Calculate solar times if position specified
        c. Parse and apply time/date modifications
        d. Apply weather modifications
-       e. Write output mission file
+       e. Write output mission file, copying the members it left untouched
     """
 
     def __init__(
@@ -42,6 +57,8 @@ class WeatherInjectorWorker(BaseWorker):
         mission_file: Path,
         output_dir: Path | None = None,
         mission_base_name: str | None = None,
+        base_mission: DcsMission | None = None,
+        jobs: int = 1,
     ):
         """
         Initialize worker.
@@ -52,6 +69,9 @@ class WeatherInjectorWorker(BaseWorker):
             output_dir: Output directory for mission files (defaults to config directory)
             mission_base_name: Base name prefix for output files (e.g. "VEAF-Demo-Mission");
                                if provided, output files are named ``{base}_{version}.miz``
+            base_mission: The base mission already parsed, as the build holds it; read from
+                          ``mission_file`` when not given
+            jobs: How many processes write the variants; 1 writes them in this one
         """
         self.config_file = Path(config_file)
         self.mission_file = Path(mission_file)
@@ -61,7 +81,10 @@ class WeatherInjectorWorker(BaseWorker):
             _INVALID_FILENAME_CHARS.sub("_", mission_base_name).strip(" .") if mission_base_name else None
         )
 
+        self.jobs = jobs
+
         self.config: MissionConfig | None = None
+        self.base_mission: DcsMission | None = base_mission
         self.mission_data: DcsMission | None = None
         self.solar_times: dict[str, int] = {}
 
@@ -90,16 +113,32 @@ class WeatherInjectorWorker(BaseWorker):
         # progress bar provides the live, transient feedback.
         created_files = []
         total = len(self.config.versions)
-        with progress_context(self.config.versions, t("weather.creating_variants")) as versions:
+        writes: list[tuple[VersionConfig, Future[Path]]] = []
+        with (
+            self._variant_writers() as pool,
+            progress_context(self.config.versions, t("weather.creating_variants")) as versions,
+        ):
             for i, version in enumerate(versions, 1):
                 try:
                     logger.info(t("weather.creating_version", index=i, total=total, name=version.name))
-                    output_path = self._create_mission_version(version)
+                    if pool is None:
+                        output_path = self._create_mission_version(version)
+                        created_files.append(output_path)
+                        logger.info(t("weather.created", path=output_path))
+                    else:
+                        variant, output_path = self._prepare_mission_version(version)
+                        writes.append((version, pool.submit(_write_variant, variant, output_path)))
+                except Exception as e:
+                    logger.error(t("weather.error.version_failed", name=version.name, error=str(e)))
+                    continue
+
+            for version, write in writes:
+                try:
+                    output_path = write.result()
                     created_files.append(output_path)
                     logger.info(t("weather.created", path=output_path))
                 except Exception as e:
                     logger.error(t("weather.error.version_failed", name=version.name, error=str(e)))
-                    continue
 
         logger.info(tn("weather.done", len(created_files)))
         return created_files
@@ -140,6 +179,28 @@ class WeatherInjectorWorker(BaseWorker):
             logger.error(t("weather.injector.solar_times_failed", error=str(e)))
             self.solar_times = {}
 
+    def _variant_writers(self) -> "ProcessPoolExecutor | nullcontext[None]":
+        """The processes writing the variants, or nothing when this one writes them (``jobs`` of 1)."""
+        if self.jobs <= 1 or not self.config or len(self.config.versions) <= 1:
+            return nullcontext()
+        # `spawn` everywhere: it is the only start method on Windows, where most builds run.
+        return ProcessPoolExecutor(
+            max_workers=min(self.jobs, len(self.config.versions)), mp_context=multiprocessing.get_context("spawn")
+        )
+
+    def _load_base_mission(self) -> DcsMission:
+        """Return the base mission, parsed on the first call only."""
+        if self.base_mission is None:
+            base_mission_path = (
+                self.mission_file if self.mission_file.is_absolute() else self.config_file.parent / self.mission_file
+            )
+            if not base_mission_path.exists():
+                raise FileNotFoundError(f"Base mission not found: {base_mission_path}")
+
+            logger.debug(f"Loading base mission: {base_mission_path}")
+            self.base_mission = read_miz(base_mission_path)
+        return self.base_mission
+
     def _create_mission_version(self, version: VersionConfig) -> Path:
         """
         Create a single mission version.
@@ -150,15 +211,22 @@ class WeatherInjectorWorker(BaseWorker):
         Returns:
             Path to created mission file
         """
-        # Load base mission
-        base_mission_path = (
-            self.mission_file if self.mission_file.is_absolute() else self.config_file.parent / self.mission_file
-        )
-        if not base_mission_path.exists():
-            raise FileNotFoundError(f"Base mission not found: {base_mission_path}")
+        mission, output_path = self._prepare_mission_version(version)
+        logger.debug(f"Writing mission to: {output_path}")
+        write_miz(mission=mission, miz_file_path=output_path)
+        return output_path
 
-        logger.debug(f"Loading base mission: {base_mission_path}")
-        self.mission_data = read_miz(base_mission_path)
+    def _prepare_mission_version(self, version: VersionConfig) -> tuple[DcsMission, Path]:
+        """
+        Apply a version's changes to its own branch of the base mission.
+
+        Args:
+            version: Version configuration
+
+        Returns:
+            The variant mission, and the path it is to be written to
+        """
+        self.mission_data = self._load_base_mission().branch(_VARIANT_MISSION_KEYS, _VARIANT_COMPONENTS)
 
         # Debug: Log the structure of start_time
         st = self.mission_data.mission_content.get("start_time") if self.mission_data.mission_content else None
@@ -182,15 +250,11 @@ class WeatherInjectorWorker(BaseWorker):
         # inside the loop body rather than once around it.
         self._substitute_briefing_variables(version)
 
-        # Write output
         if self.mission_base_name:
             output_path = self.output_dir / f"{self.mission_base_name}_{version.name}.miz"
         else:
             output_path = self.output_dir / f"{version.name}.miz"
-        logger.debug(f"Writing mission to: {output_path}")
-        write_miz(mission=self.mission_data, miz_file_path=output_path)  # type: ignore[arg-type]
-
-        return output_path
+        return self.mission_data, output_path
 
     def _substitute_briefing_variables(self, version: VersionConfig) -> None:
         """Replace ``${…}`` tokens in this variant's briefing.
@@ -38,7 +38,7 @@ import unittest
 from pathlib import Path
 
 from aircrafts_injector.aircrafts_injector_worker import AircraftGroupsInjectorWorker, InjectionResult
-from mission_tools.miz_tools import DcsMission
+from mission_tools.miz_tools import DcsMission, InMemoryMission
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -399,5 +399,26 @@ class TestInjectGroupsDictContainer(unittest.TestCase):
         self.assertIn("new-group", names)
 
 
+class TestInMemoryInjection(unittest.TestCase):
+    """In-memory injection leaves groups in the shape a .miz round trip would give."""
+
+    def test_injected_group_matches_a_read_back(self) -> None:
+        mission = _mission_with_groups([])
+        dummy = Path("/dev/null")
+        worker = AircraftGroupsInjectorWorker(
+            input_yaml=dummy, target_mission=dummy, output_mission=dummy, in_memory=InMemoryMission(mission)
+        )
+        worker.dcs_mission = mission
+        worker.yaml_data = _yaml_data(["tmpl-a10"])
+        source = worker.yaml_data["airplanes"]["coalitions"]["blue"]["USA"]["tmpl-a10"]
+        source["units"] = {1: {"type": "FA-18C_hornet"}}
+
+        worker.inject_groups(mode="add", silent=True)
+
+        injected = next(g for g in _get_groups(worker) if g["name"] == "tmpl-a10")
+        self.assertEqual(injected["units"], [{"type": "FA-18C_hornet"}])
+        self.assertNotIn("hiddenOnPlanner", source)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,17 @@
+"""Fixtures shared by every test.
+
+The kneeboard image cache (``veaf_libs.image_cache``) is on by default and lives in VEAF_HOME, so any
+test drawing a kneeboard page would otherwise fill the developer's own cache and, worse, be served
+pages drawn by an earlier run instead of drawing them. It is off for every test here; the tests of the
+cache itself turn it back on, in a VEAF_HOME of their own.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _no_image_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Draw every kneeboard page a test asks for."""
+    monkeypatch.setenv("VEAF_IMAGE_CACHE", "0")
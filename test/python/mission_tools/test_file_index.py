@@ -0,0 +1,65 @@
+"""Tests for mission_tools.file_index — one listing per folder, matched as Path.glob does."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from mission_tools.file_index import FileIndex
+
+
+class TestFileIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base = Path(self._tmp.name)
+        for name in (
+            "src/scripts/mission-script.lua",
+            "src/scripts/.hidden.lua",
+            "src/scripts/notes.txt",
+            "src/scripts/veaf/veaf-scripts.lua",
+            "src/mission/mission",
+            "src/mission/l10n/DEFAULT/dictionary",
+            "src/mission/l10n/DEFAULT/beacon.ogg",
+            "src/options",
+        ):
+            (self.base / name).parent.mkdir(parents=True, exist_ok=True)
+            (self.base / name).write_bytes(b"x")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_matches_what_path_glob_matches(self) -> None:
+        index = FileIndex()
+        for pattern in (
+            "src/scripts/*.lua",
+            "src/scripts/mission-script.lua",
+            "src/mission/**",
+            "src/**/*.ogg",
+            "src/*/veaf/*.lua",
+            "src/options",
+            "src/scripts",
+            "no/such/*.lua",
+        ):
+            expected = {path for path in self.base.glob(pattern) if path.is_file()}
+            self.assertEqual(set(index.glob(self.base, pattern)), expected, pattern)
+
+    def test_each_folder_is_listed_once(self) -> None:
+        index = FileIndex()
+        list(index.glob(self.base, "src/scripts/*.lua"))
+        scans = index.scans
+        list(index.glob(self.base, "src/scripts/mission-script.lua"))
+        list(index.glob(self.base, "src/scripts/*.txt"))
+        self.assertEqual(index.scans, scans)
+
+    @unittest.skipIf(os.name == "nt", "creating symlinks needs privileges on Windows")
+    def test_double_star_does_not_follow_symlinked_folders(self) -> None:
+        (self.base / "src" / "mission" / "linked").symlink_to(self.base / "src" / "scripts")
+        found = set(FileIndex().glob(self.base, "src/mission/**"))
+        self.assertEqual(found, {path for path in (self.base / "src" / "mission").rglob("**") if path.is_file()})
+        self.assertNotIn(self.base / "src" / "mission" / "linked" / "notes.txt", found)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+"""Tests for mission_tools.group_index."""
+
+from pathlib import Path
+from typing import Any
+
+from mission_tools.group_index import GroupIndex
+from mission_tools.group_insertion import add_group, max_ids
+from mission_tools.miz_tools import DcsMission
+
+
+def _unit(unit_id: int, name: str, unit_type: str, skill: str = "Average") -> dict[str, Any]:
+    return {"unitId": unit_id, "name": name, "type": unit_type, "skill": skill}
+
+
+def _mission() -> dict[str, Any]:
+    return {
+        "coalition": {
+            "blue": {
+                "country": {
+                    1: {
+                        "id": 2,
+                        "name": "USA",
+                        "plane": {
+                            "group": {
+                                1: {
+                                    "groupId": 1,
+                                    "name": "Viper",
+                                    "units": {1: _unit(1, "Viper-1", "F-16C_50", "Client")},
+                                },
+                                2: {
+                                    "groupId": 2,
+                                    "name": "Tanker",
+                                    "dynSpawnTemplate": True,
+                                    "units": {1: _unit(2, "Tanker-1", "KC-135")},
+                                },
+                            }
+                        },
+                        "helicopter": {
+                            "group": [{"groupId": 3, "name": "Huey", "units": [_unit(3, "Huey-1", "UH-1H")]}]
+                        },
+                    },
+                }
+            },
+            "red": {
+                "country": [
+                    {
+                        "id": 0,
+                        "name": "Russia",
+                        "vehicle": {
+                            "group": [
+                                {"groupId": 7, "name": "Armor", "units": [_unit(9, "Armor-1", "T-72B")]},
+                                {"groupId": 8, "name": "Armor", "units": [_unit(10, "Armor-2", "T-72B")]},
+                            ]
+                        },
+                    }
+                ]
+            },
+        }
+    }
+
+
+class TestLookups:
+    def test_finds_groups_and_units_by_name_id_and_type(self) -> None:
+        index = GroupIndex(_mission())
+
+        assert index.group("Viper").category == "plane"
+        assert index.group("Huey").coalition == "blue"
+        assert index.group("Nope") is None
+        assert index.group_by_id(3).name == "Huey"
+        unit, entry = index.unit(9)
+        assert unit["name"] == "Armor-1" and entry.country_name == "Russia"
+        assert index.unit_by_name("Tanker-1")[1].name == "Tanker"
+        assert [entry.name for entry in index.groups_of_type("T-72B")] == ["Armor", "Armor"]
+        assert [entry.name for entry in index.groups_in("blue")] == ["Viper", "Tanker", "Huey"]
+        assert [entry.name for entry in index.templates()] == ["Tanker"]
+        assert index.group("Viper").human_pilot and not index.group("Tanker").human_pilot
+
+    def test_a_repeated_name_resolves_to_the_first_group_in_table_order(self) -> None:
+        index = GroupIndex(_mission())
+
+        assert index.group("Armor").group["groupId"] == 7
+
+    def test_max_ids_agree_with_a_walk_of_the_table(self) -> None:
+        mission = _mission()
+        red_only = {"coalition": {"red": mission["coalition"]["red"]}}
+
+        assert GroupIndex(mission).max_ids() == (8, 10)
+        assert GroupIndex(red_only).max_ids() == max_ids(red_only) == (8, 10)
+
+    def test_a_mission_without_coalitions_has_no_groups(self) -> None:
+        assert GroupIndex({}).groups == []
+
+
+class TestChanges:
+    def test_add_group_with_an_index_takes_the_same_ids_and_indexes_the_group(self) -> None:
+        mission = _mission()
+        index = GroupIndex(mission)
+        group = {
+            "name": "Scout",
+            "units": [{"name": "Scout-1", "type": "BRDM-2"}, {"name": "Scout-2", "type": "BRDM-2"}],
+        }
+
+        group_id = add_group(
+            mission, coalition="red", country_id=0, country_name="Russia", category="vehicle", group=group, index=index
+        )
+
+        inserted = index.group("Scout").group
+        assert group_id == inserted["groupId"] == 9
+        assert [unit["unitId"] for unit in inserted["units"]] == [11, 12]
+        assert inserted in mission["coalition"]["red"]["country"][0]["vehicle"]["group"]
+        assert index.unit_by_name("Scout-2")[0] is inserted["units"][1]
+        assert index.max_ids() == (9, 12)
+
+    def test_remove_renumbers_the_container_and_uncovers_a_shadowed_name(self) -> None:
+        mission = _mission()
+        index = GroupIndex(mission)
+
+        remaining = index.remove(index.group("Armor"))
+
+        assert remaining == 1
+        assert mission["coalition"]["red"]["country"][0]["vehicle"]["group"] == {
+            1: {"groupId": 8, "name": "Armor", "units": [_unit(10, "Armor-2", "T-72B")]}
+        }
+        assert index.group("Armor").group["groupId"] == 8
+        assert index.unit(9) is None
+        assert index.max_ids() == (8, 10)
+
+    def test_removing_the_last_group_drops_the_group_key(self) -> None:
+        mission = _mission()
+        index = GroupIndex(mission)
+
+        assert index.remove(index.group("Huey")) == 0
+
+        assert "group" not in mission["coalition"]["blue"]["country"][1]["helicopter"]
+        assert index.group("Huey") is None
+
+
+class TestDcsMissionIndex:
+    def test_iter_groups_yields_helicopters_then_planes_country_by_country(self) -> None:
+        mission = DcsMission(file_path=Path("dummy.miz"), mission_content=_mission())
+
+        groups = [(group.name, group.aircraft_type, group.unit_type) for group in mission.iter_groups()]
+
+        assert groups == [
+            ("Huey", "helicopter", "UH-1H"),
+            ("Viper", "plane", "F-16C_50"),
+            ("Tanker", "plane", "KC-135"),
+        ]
+
+    def test_the_index_is_kept_until_the_content_is_replaced_or_invalidated(self) -> None:
+        mission = DcsMission(file_path=Path("dummy.miz"), mission_content=_mission())
+        index = mission.group_index()
+
+        assert mission.group_index() is index
+        mission.invalidate_group_index()
+        assert mission.group_index() is not index
+        mission.mission_content = {"coalition": {}}
+        assert mission.group_index().groups == []
+
+    def test_a_branch_builds_its_own_index(self) -> None:
+        mission = DcsMission(file_path=Path("dummy.miz"), mission_content=_mission())
+        index = mission.group_index()
+
+        branch = mission.branch(mission_keys=("coalition",))
+
+        assert branch.group_index() is not index
+        assert branch.group_index().group("Viper").group is not index.group("Viper").group
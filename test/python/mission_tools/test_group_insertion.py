@@ -247,9 +247,9 @@ class TestAirCategoryIsRobustToTheDatabase:
     def test_a_malformed_database_yields_no_category_rather_than_raising(self, monkeypatch: pytest.MonkeyPatch) -> None:
         import veaf_libs.dcs_units_data as dud
 
-        dud._categories.cache_clear()
-        monkeypatch.setattr(dud, "read_bundled_text", lambda *_a: "- not: a mapping\n")
+        dud.unit_catalog.cache_clear()
+        monkeypatch.setattr(dud, "load_bundled_data", lambda *_a: [{"not": "a mapping"}])
         try:
             assert dud.get_unit_category("UH-1H") is None
         finally:
-            dud._categories.cache_clear()
+            dud.unit_catalog.cache_clear()
@@ -5,7 +5,9 @@ from __future__ import annotations
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
+from mission_tools.file_index import FileIndex
 from mission_tools.mission_constants import (
     collect_files_from_globs,
     get_community_script_files,
@@ -155,6 +157,36 @@ class TestCollectFilesFromGlobs(unittest.TestCase):
             result = collect_files_from_globs(base, patterns)
             self.assertTrue(len(result) >= 1)
 
+    def test_each_collected_file_is_read_once(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            base = Path(td)
+            self._setup_tree(base)
+            patterns = [("src/scripts/mission.lua", "l10n/DEFAULT"), ("src/scripts/*.lua", "l10n/DEFAULT")]
+            with patch("mission_tools.mission_constants.resident_cache.read_bytes", wraps=Path.read_bytes) as read:
+                result = collect_files_from_globs(base, patterns)
+        self.assertEqual(sorted(result), ["l10n/DEFAULT/helper.lua", "l10n/DEFAULT/mission.lua"])
+        self.assertEqual(read.call_count, 2)
+
+    def test_calls_sharing_an_index_list_each_folder_once(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            base = Path(td)
+            self._setup_tree(base)
+            index = FileIndex()
+            collect_files_from_globs(base, [("src/scripts/*.lua", "l10n/DEFAULT")], index=index)
+            scans = index.scans
+            result = collect_files_from_globs(base, [("src/scripts/helper.lua", "l10n/DEFAULT")], index=index)
+        self.assertEqual(result, {"l10n/DEFAULT/helper.lua": b"-- helper"})
+        self.assertEqual(index.scans, scans)
+
+    def test_double_star_keys_keep_the_sub_folders(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            base = Path(td)
+            (base / "src" / "mission" / "l10n" / "DEFAULT").mkdir(parents=True)
+            (base / "src" / "mission" / "l10n" / "DEFAULT" / "dictionary").write_bytes(b"d")
+            (base / "src" / "mission" / "mission").write_bytes(b"m")
+            result = collect_files_from_globs(base, [("src/mission/**", "")])
+        self.assertEqual(result, {"mission": b"m", "l10n/DEFAULT/dictionary": b"d"})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -90,9 +90,14 @@ class TestTheNormalisationAddsNoChange:
         # add nothing on top of that.
         folder = _copy_mission(source, tmp_path)
         mission_file = folder / "src" / "mission" / "mission"
-        write_mission_folder(read_mission_folder(folder), folder)
+        # Marked dirty, or the unchanged table would simply be left alone.
+        first = read_mission_folder(folder)
+        first.mark_dirty()
+        write_mission_folder(first, folder)
         after_first = mission_file.read_bytes()
-        write_mission_folder(read_mission_folder(folder), folder)
+        second = read_mission_folder(folder)
+        second.mark_dirty()
+        write_mission_folder(second, folder)
         assert mission_file.read_bytes() == after_first
 
 
@@ -1,5 +1,6 @@
 """Tests for mission_tools.miz_tools member helpers (list/read/rewrite)."""
 
+import io
 import zipfile
 from pathlib import Path
 
@@ -68,6 +69,41 @@ class TestRewriteMizMembers:
 
         assert read_member(miz, "mission") == quirky
 
+    def test_copies_members_written_with_a_data_descriptor(self, tmp_path: Path) -> None:
+        # A zip streamed to a non-seekable output puts CRC and sizes after the data; the raw copy
+        # must still carry the member over intact.
+        class _Unseekable(io.BytesIO):
+            def seek(self, *_args: object) -> int:
+                raise io.UnsupportedOperation("seek")
+
+        buffer = _Unseekable()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+            with zf.open("l10n/DEFAULT/script.lua", "w") as member:
+                member.write(b"-- streamed\n" * 50)
+            zf.writestr("options", b"options = {\n}\n")
+        miz = tmp_path / "streamed.miz"
+        miz.write_bytes(buffer.getvalue())
+        with zipfile.ZipFile(miz) as zf:
+            assert zf.getinfo("l10n/DEFAULT/script.lua").flag_bits & 0x08
+
+        rewrite_miz_members(miz, {"options": b"options = {new}\n"})
+
+        with zipfile.ZipFile(miz) as zf:
+            assert zf.testzip() is None
+        assert read_member(miz, "l10n/DEFAULT/script.lua") == b"-- streamed\n" * 50
+
+    def test_a_member_whose_header_disagrees_with_the_directory_is_refused(self, tmp_path: Path) -> None:
+        miz = _make_miz(tmp_path)
+        data = bytearray(miz.read_bytes())
+        # Rename the first local header only; the central directory still says `mission`.
+        at = data.index(b"mission")
+        data[at : at + 7] = b"mISSION"
+        miz.write_bytes(bytes(data))
+
+        with pytest.raises(zipfile.BadZipFile):
+            rewrite_miz_members(miz, {"options": b"options = {new}\n"})
+        assert not list(tmp_path.glob("veaf_mission_*.miz"))
+
 
 class TestRewriteSurvivesATransientLock:
     """The second atomic write of the same kind needs the same guard as `write_miz`."""
@@ -4,13 +4,16 @@ import io
 import zipfile
 from pathlib import Path
 
+import luadata
 import pytest
 from mission_tools.miz_tools import (
     DcsMission,
     Group,
+    InMemoryMission,
     create_miz,
     extract_resources,
     normalize_warehouses_airports,
+    read_members,
     read_mission_folder,
     read_miz,
     write_mission_folder,
@@ -140,6 +143,10 @@ class TestNormalizeWarehousesAirports:
         (base / "warehouses").write_bytes(POPULATED_WAREHOUSES_LUA)
         mission = read_mission_folder(base)
         write_mission_folder(mission, base)
+        assert (base / "warehouses").read_bytes() == POPULATED_WAREHOUSES_LUA
+        # Forced through the serializer, the normalised dict still comes out as the list it was.
+        mission.mark_dirty("warehouses")
+        write_mission_folder(mission, base)
         text = (base / "warehouses").read_text(encoding="utf-8")
         assert 'coalition = "RED"' in text
         assert 'coalition = "BLUE"' in text
@@ -242,6 +249,22 @@ class TestReadMiz:
         result = read_miz(miz)
         assert result.missing_components == []
 
+    def test_read_only_parses_the_selected_keys(self, tmp_path: Path) -> None:
+        mission = read_miz(_make_mission_with_groups(tmp_path), only=["coalition"])
+        assert mission.mission_content is not None
+        assert list(mission.mission_content) == ["coalition"]
+        assert mission.projection == frozenset({"coalition"})
+        assert {group.name for group in mission.iter_groups()} == {"Enfield 1-1", "Huey Flight", "Flanker 1"}
+
+    def test_a_projected_mission_cannot_be_written_back(self, tmp_path: Path) -> None:
+        original = _make_minimal_miz(tmp_path)
+        mission = read_miz(original, only=["name"])
+        with pytest.raises(ValueError, match="read-only"):
+            write_miz(mission, tmp_path / "out.miz")
+        folder = read_mission_folder(_make_mission_folder(tmp_path), only=["name"])
+        with pytest.raises(ValueError, match="read-only"):
+            write_mission_folder(folder, tmp_path / "proj")
+
     def test_read_notes_missing_file(self, tmp_path: Path) -> None:
         miz_path = tmp_path / "sparse.miz"
         with zipfile.ZipFile(miz_path, "w") as zf:
@@ -324,6 +347,70 @@ class TestWriteMiz:
         # File should have been updated
         assert original.exists()
 
+    def test_streamed_member_is_the_serialized_table(self, tmp_path: Path) -> None:
+        # The Lua tables are streamed into the archive; the bytes must be what `serialize` returns.
+        original = _make_minimal_miz(tmp_path)
+        mission = read_miz(original)
+        assert mission.mission_content is not None
+        mission.mission_content["text"] = "é\nline"
+        output = tmp_path / "streamed.miz"
+        write_miz(mission, output)
+        expected = luadata.serialize(
+            mission.mission_content, indent="  ", indent_level=0, always_provide_keyname=True, sort=True
+        )
+        with zipfile.ZipFile(output) as zf:
+            assert zf.read("mission").decode("utf-8") == f"mission = \n{expected}"
+            info = zf.getinfo("mission")
+        assert info.compress_type == zipfile.ZIP_DEFLATED
+        assert info.date_time != (1980, 1, 1, 0, 0, 0)
+
+    def test_untouched_members_are_copied_still_compressed(self, tmp_path: Path) -> None:
+        # Resources are moved as their stored bytes — same compression, CRC and date — not re-deflated.
+        original = _make_miz_with_resources(tmp_path)
+        with zipfile.ZipFile(original, "a") as zf:
+            zf.writestr(zipfile.ZipInfo("l10n/DEFAULT/stored.png", (2020, 5, 6, 7, 8, 10)), b"PNG" * 100)
+        mission = read_miz(original)
+        output = tmp_path / "copied.miz"
+        write_miz(mission, output)
+        with zipfile.ZipFile(original) as before, zipfile.ZipFile(output) as after:
+            assert after.testzip() is None
+            for name in ("l10n/DEFAULT/veaf-scripts.lua", "l10n/DEFAULT/beacon.ogg", "l10n/DEFAULT/stored.png"):
+                old, new = before.getinfo(name), after.getinfo(name)
+                assert (new.compress_type, new.CRC, new.compress_size, new.date_time) == (
+                    old.compress_type,
+                    old.CRC,
+                    old.compress_size,
+                    old.date_time,
+                )
+                assert after.read(name) == before.read(name)
+            assert after.getinfo("l10n/DEFAULT/stored.png").compress_type == zipfile.ZIP_STORED
+
+    def test_an_unchanged_mission_is_written_back_byte_identical(self, tmp_path: Path) -> None:
+        # Every member is clean, so every one goes through the raw copy: the archive comes out as it went in.
+        original = _make_miz_with_resources(tmp_path)
+        with zipfile.ZipFile(original, "a", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("l10n/DEFAULT/deflated.lua", b"-- deflated\n" * 200)
+        output = tmp_path / "copied.miz"
+        write_miz(read_miz(original), output)
+        assert output.read_bytes() == original.read_bytes()
+
+    def test_without_the_zipfile_internals_members_are_still_copied(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # On a Python whose zipfile renamed what the raw copy drives, the public writestr takes over.
+        from mission_tools import miz_tools
+
+        monkeypatch.setattr(miz_tools, "_RAW_COPY_INTERNALS", ("_no_such_internal",))
+        original = _make_miz_with_resources(tmp_path)
+        output = tmp_path / "copied.miz"
+        write_miz(read_miz(original), output)
+        with zipfile.ZipFile(original) as before, zipfile.ZipFile(output) as after:
+            assert after.namelist() == before.namelist()
+            for old in before.infolist():
+                new = after.getinfo(old.filename)
+                assert (new.compress_type, new.date_time, new.CRC) == (old.compress_type, old.date_time, old.CRC)
+                assert after.read(old.filename) == before.read(old.filename)
+
 
 # ---------------------------------------------------------------------------
 # iter_groups (DEEP-001)
@@ -582,6 +669,30 @@ class TestWriteMissionFolderPersistsWarehouses:
         assert read_mission_folder(folder).mission_content["theatre"] == "Kola"
         assert not (folder / "src" / "mission" / "warehouses").exists()
 
+    def test_a_failing_write_leaves_the_source_file_intact(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # The source is the user's own `src/mission/mission`: it must not be truncated before
+        # the new table is fully serialized.
+        from mission_tools import miz_tools
+
+        folder = self._folder(tmp_path)
+        root = folder / "src" / "mission"
+        before = (root / "mission").read_bytes()
+        mission = read_mission_folder(folder)
+        mission.mission_content["theatre"] = "Kola"
+
+        def half_written(stream, content, variable_name=None) -> None:
+            stream.write("mission = \n{\n")
+            raise RuntimeError("serializer failed")
+
+        monkeypatch.setattr(miz_tools, "_dump_lua", half_written)
+        with pytest.raises(RuntimeError):
+            write_mission_folder(mission, folder)
+
+        assert (root / "mission").read_bytes() == before
+        assert sorted(path.name for path in root.iterdir()) == ["mission", "warehouses"]
+
 
 # ---------------------------------------------------------------------------
 # The transient Windows lock on the final rename (FIX-WRITE-MIZ-REPLACE-FLAKE)
@@ -636,3 +747,243 @@ class TestWriteSurvivesATransientLock:
             write_miz(mission, miz)
 
         assert not list(tmp_path.glob("veaf_mission_*.miz")), "a failed write littered the folder"
+
+
+# ---------------------------------------------------------------------------
+# Dirty tracking: clean tables are copied, not serialized again
+# ---------------------------------------------------------------------------
+
+#: Valid Lua the serializer would never write: a clean copy keeps it byte for byte.
+QUIRKY_OPTIONS_LUA = b'options={["a"]=1,   ["b"]={2,3}}\n'
+
+
+class TestDirtyTracking:
+    def _miz(self, tmp_path: Path) -> Path:
+        miz = tmp_path / "quirky.miz"
+        with zipfile.ZipFile(miz, "w") as zf:
+            zf.writestr("mission", MINIMAL_MISSION_LUA)
+            zf.writestr("options", QUIRKY_OPTIONS_LUA)
+            zf.writestr("warehouses", MINIMAL_WAREHOUSES_LUA)
+            zf.writestr("theatre", b"Caucasus")
+        return miz
+
+    def test_a_freshly_read_mission_is_clean(self, tmp_path: Path) -> None:
+        mission = read_miz(self._miz(tmp_path))
+        assert not any(mission.is_dirty(component) for component in ("mission", "options", "warehouses"))
+
+    def test_clean_tables_are_copied_verbatim(self, tmp_path: Path) -> None:
+        mission = read_miz(self._miz(tmp_path))
+        mission.mission_content["name"] = "Renamed"
+        output = tmp_path / "out.miz"
+        write_miz(mission, output)
+        with zipfile.ZipFile(output) as zf:
+            assert zf.read("options") == QUIRKY_OPTIONS_LUA
+            assert b"Renamed" in zf.read("mission")
+
+    def test_an_unmarked_change_is_still_written(self, tmp_path: Path) -> None:
+        # Nobody called mark_dirty: the fingerprint taken at load time catches the change.
+        mission = read_miz(self._miz(tmp_path))
+        mission.options_content["b"].append(4)
+        assert mission.is_dirty("options")
+        output = tmp_path / "out.miz"
+        write_miz(mission, output)
+        assert read_miz(output).options_content["b"] == [2, 3, 4]
+
+    def test_mark_dirty_forces_a_rewrite(self, tmp_path: Path) -> None:
+        mission = read_miz(self._miz(tmp_path))
+        mission.mark_dirty("options")
+        output = tmp_path / "out.miz"
+        write_miz(mission, output)
+        with zipfile.ZipFile(output) as zf:
+            assert zf.read("options").startswith(b"options = \n")
+
+    def test_mark_dirty_refuses_an_unknown_component(self) -> None:
+        with pytest.raises(ValueError, match="Unknown mission component"):
+            DcsMission(file_path=Path("dummy.miz")).mark_dirty("mision")
+
+    def test_accessors_mark_their_table(self, tmp_path: Path) -> None:
+        mission = read_miz(self._miz(tmp_path))
+        mission.set_options(dict(mission.options_content))
+        mission.set_weather(dict(mission.get_weather() or {}))
+        assert mission._dirty == {"mission", "options"}
+
+    def test_closed_sequence_holes_make_the_mission_dirty(self, tmp_path: Path) -> None:
+        miz = tmp_path / "holes.miz"
+        with zipfile.ZipFile(miz, "w") as zf:
+            zf.writestr(
+                "mission",
+                b'mission = { ["coalition"] = { ["blue"] = { ["country"] = { [1] = { ["plane"] = '
+                b'{ ["group"] = { [1] = { ["name"] = "A" }, [3] = { ["name"] = "C" } } } } } } } }\n',
+            )
+        mission = read_miz(miz)
+        assert mission.sequence_holes
+        assert mission.is_dirty("mission")
+
+    def test_a_source_changed_on_disk_is_never_copied(self, tmp_path: Path) -> None:
+        miz = self._miz(tmp_path)
+        mission = read_miz(miz)
+        with zipfile.ZipFile(miz, "a") as zf:
+            zf.writestr("extra.txt", b"touched")
+        assert mission.is_dirty("options")
+
+    def test_a_hand_built_mission_is_dirty(self) -> None:
+        mission = DcsMission(file_path=Path("dummy.miz"), mission_content={"name": "x"})
+        assert mission.is_dirty("mission")
+
+    def test_an_in_place_write_leaves_the_mission_clean(self, tmp_path: Path) -> None:
+        miz = self._miz(tmp_path)
+        mission = read_miz(miz)
+        mission.mission_content["name"] = "Renamed"
+        write_miz(mission, miz)
+        assert not mission.is_dirty("mission")
+        assert not mission.is_dirty("options")
+
+    def test_write_mission_folder_skips_a_clean_file(self, tmp_path: Path) -> None:
+        folder = _make_mission_folder(tmp_path)
+        (folder / "mission").write_bytes(b'mission={["name"]="TestMission"}\n')
+        mission = read_mission_folder(folder)
+        write_mission_folder(mission, folder)
+        assert (folder / "mission").read_bytes() == b'mission={["name"]="TestMission"}\n'
+
+        mission.mission_content["name"] = "Renamed"
+        write_mission_folder(mission, folder)
+        assert read_mission_folder(folder).mission_content["name"] == "Renamed"
+        assert not mission.is_dirty("mission")
+
+
+class TestBranch:
+    def _mission(self, tmp_path: Path) -> DcsMission:
+        miz = tmp_path / "base.miz"
+        with zipfile.ZipFile(miz, "w") as zf:
+            zf.writestr(
+                "mission",
+                b'mission = { ["start_time"] = 0, ["weather"] = { ["wind"] = { ["speed"] = 1 } }, '
+                b'["coalition"] = { ["blue"] = { ["name"] = "blue" } } }\n',
+            )
+            zf.writestr("options", QUIRKY_OPTIONS_LUA)
+            zf.writestr("theatre", b"Caucasus")
+            zf.writestr("l10n/DEFAULT/dictionary", b'dictionary = { ["DictKey_1"] = "Brief" }\n')
+        return read_miz(miz)
+
+    def test_edits_to_a_branch_never_reach_the_original(self, tmp_path: Path) -> None:
+        base = self._mission(tmp_path)
+        variant = base.branch(["weather"], ["dictionary"])
+        variant.mission_content["start_time"] = 3600
+        variant.mission_content["weather"]["wind"]["speed"] = 9
+        variant.dictionary_content["DictKey_1"] = "Edited"
+        assert base.mission_content["start_time"] == 0
+        assert base.mission_content["weather"]["wind"]["speed"] == 1
+        assert base.dictionary_content["DictKey_1"] == "Brief"
+        assert not base.is_dirty("mission")
+
+    def test_what_is_not_named_is_shared_not_copied(self, tmp_path: Path) -> None:
+        base = self._mission(tmp_path)
+        variant = base.branch(["weather"])
+        assert variant.mission_content["coalition"] is base.mission_content["coalition"]
+        assert variant.options_content is base.options_content
+        assert variant.mission_content["weather"] is not base.mission_content["weather"]
+
+    def test_a_branch_writes_what_it_left_alone_verbatim(self, tmp_path: Path) -> None:
+        variant = self._mission(tmp_path).branch(["weather"])
+        variant.mission_content["weather"]["wind"]["speed"] = 9
+        output = tmp_path / "variant.miz"
+        write_miz(variant, output)
+        with zipfile.ZipFile(output) as zf:
+            assert zf.read("options") == QUIRKY_OPTIONS_LUA
+            assert zf.read("l10n/DEFAULT/dictionary") == b'dictionary = { ["DictKey_1"] = "Brief" }\n'
+        assert read_miz(output).mission_content["weather"]["wind"]["speed"] == 9
+
+    def test_branch_refuses_an_unknown_component(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="Unknown mission component"):
+            self._mission(tmp_path).branch(components=["dictonary"])
+
+
+# ---------------------------------------------------------------------------
+# InMemoryMission: several steps, one write
+# ---------------------------------------------------------------------------
+
+
+class TestInMemoryMission:
+    def test_nothing_reaches_the_disk_before_write(self, tmp_path: Path) -> None:
+        miz = _make_minimal_miz(tmp_path)
+        before = miz.read_bytes()
+        in_memory = InMemoryMission.read(miz)
+        in_memory.mission.mission_content["name"] = "Edited"
+        in_memory.add_files({"l10n/DEFAULT/a.lua": b"-- a"})
+        assert miz.read_bytes() == before
+
+        assert in_memory.write() == miz
+        reread = read_miz(miz)
+        assert reread.mission_content["name"] == "Edited"
+        with zipfile.ZipFile(miz) as zf:
+            assert zf.read("l10n/DEFAULT/a.lua") == b"-- a"
+
+    def test_a_later_step_s_member_wins(self, tmp_path: Path) -> None:
+        in_memory = InMemoryMission.read(_make_minimal_miz(tmp_path))
+        in_memory.add_files({"KNEEBOARD/IMAGES/p.png": b"first"})
+        in_memory.add_files({"KNEEBOARD/IMAGES/p.png": b"second"})
+        output = in_memory.write(tmp_path / "out.miz")
+        with zipfile.ZipFile(output) as zf:
+            assert zf.read("KNEEBOARD/IMAGES/p.png") == b"second"
+        # Written elsewhere: the source still lacks the member, so it stays queued.
+        assert in_memory.additional_files
+
+    def test_an_in_place_write_empties_the_queue(self, tmp_path: Path) -> None:
+        in_memory = InMemoryMission.read(_make_minimal_miz(tmp_path))
+        in_memory.add_files({"l10n/DEFAULT/a.lua": b"-- a"})
+        in_memory.write()
+        assert in_memory.additional_files == {}
+        in_memory.write()
+        with zipfile.ZipFile(in_memory.file_path) as zf:
+            assert zf.read("l10n/DEFAULT/a.lua") == b"-- a"
+
+
+def _members() -> dict[str, bytes]:
+    """The members of a minimal .miz, as the mission builder collects them."""
+    return {
+        "l10n/DEFAULT/script.lua": b"-- script",
+        "mission": MINIMAL_MISSION_LUA,
+        "options": MINIMAL_OPTIONS_LUA,
+        "theatre": b"Caucasus",
+        "warehouses": MINIMAL_WAREHOUSES_LUA,
+    }
+
+
+class TestBuildFromMembers:
+    def test_read_members_parses_what_read_miz_parses(self, tmp_path: Path) -> None:
+        miz = tmp_path / "created.miz"
+        create_miz(miz, _members())
+        from_file = read_miz(miz)
+        from_members = read_members(_members(), miz)
+        assert from_members.mission_content == from_file.mission_content
+        assert from_members.theatre_content == "Caucasus"
+        assert from_members.missing_components == from_file.missing_components
+
+    def test_nothing_reaches_the_disk_before_write(self, tmp_path: Path) -> None:
+        miz = tmp_path / "built.miz"
+        in_memory = InMemoryMission.from_members(miz, _members())
+        in_memory.mission.mission_content["name"] = "Edited"
+        assert not miz.exists()
+
+        in_memory.write()
+        with zipfile.ZipFile(miz) as zf:
+            assert zf.namelist() == list(_members())
+            # Edited tables are serialized; the others keep the bytes they were collected with.
+            assert zf.read("options") == MINIMAL_OPTIONS_LUA
+            assert zf.read("l10n/DEFAULT/script.lua") == b"-- script"
+        assert read_miz(miz).mission_content["name"] == "Edited"
+
+    def test_the_written_archive_is_the_source_of_the_next_write(self, tmp_path: Path) -> None:
+        miz = tmp_path / "built.miz"
+        in_memory = InMemoryMission.from_members(miz, _members())
+        in_memory.mission.mission_content["name"] = "Edited"
+        in_memory.write()
+        assert in_memory.pending_members is None
+        assert not in_memory.mission.is_dirty("mission")
+
+        in_memory.add_files({"KNEEBOARD/IMAGES/p.png": b"png"})
+        in_memory.write()
+        with zipfile.ZipFile(miz) as zf:
+            assert zf.read("KNEEBOARD/IMAGES/p.png") == b"png"
+            assert zf.read("l10n/DEFAULT/script.lua") == b"-- script"
+        assert read_miz(miz).mission_content["name"] == "Edited"
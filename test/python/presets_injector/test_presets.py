@@ -1,6 +1,7 @@
 import textwrap
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 from presets_injector.presets_manager import (
     Channel,
@@ -499,6 +500,28 @@ class TestPresetAssignmentCollectionPatternMatching(unittest.TestCase):
         result = col.get_preset_for("blue", "plane", "F-16C_50")
         self.assertIsNone(result)
 
+    def test_invalid_pattern_only_matches_exactly(self) -> None:
+        col = self._make_collection({"blue": {"plane": {"F-16[": "std"}}})
+        self.assertIsNone(col.get_preset_for("blue", "plane", "F-16C_50"))
+        self.assertIsNotNone(col.get_preset_for("blue", "plane", "F-16["))
+
+    def test_patterns_are_compiled_once_and_lookups_remembered(self) -> None:
+        col = self._make_collection({"blue": {"plane": {"F[-]16.*": "std"}}})
+        first = col.get_preset_for("blue", "plane", "F-16C_50")
+        with patch("presets_injector.presets_manager.re") as re_module:
+            self.assertIs(col.get_preset_for("blue", "plane", "F-16C_50"), first)
+        re_module.compile.assert_not_called()
+        re_module.fullmatch.assert_not_called()
+
+    def test_compile_picks_up_an_in_place_change(self) -> None:
+        col = self._make_collection({"blue": {"plane": {"F-16C_50": "std"}}})
+        self.assertIsNone(col.get_preset_for("blue", "plane", "A-10C"))
+        col.preset_assignments_dict["blue"]["plane"]["A-10C"] = PresetAssignment(
+            coalition="blue", aircraft_type="plane", unit_type="A-10C", preset_definition=None
+        )
+        col.compile()
+        self.assertIsNotNone(col.get_preset_for("blue", "plane", "A-10C"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -260,6 +260,25 @@ class TestGetRadiosForOverrideAndFallback(unittest.TestCase):
         preset = self.manager.get_radios_for("blue", "plane", "F-16C_50")
         self.assertIs(preset, bespoke)
 
+    def test_each_type_is_resolved_and_packed_once(self):
+        with patch("presets_injector.presets_manager.pack_preset_for_type", wraps=pack_preset_for_type) as packer:
+            first = self.manager.get_radios_for("blue", "plane", "F-16C_50")
+            second = self.manager.get_radios_for("blue", "plane", "F-16C_50")
+            self.manager.get_radios_for("blue", "plane", "A-10C_2")
+
+        self.assertIs(first, second)
+        self.assertEqual(packer.call_count, 2)
+
+    def test_replaced_channel_lists_are_resolved_again(self):
+        packed = self.manager.get_radios_for("blue", "plane", "F-16C_50")
+
+        data = {"blue": {"primary_1": {"01": "Overlord", "02": "Overlord"}}}
+        self.manager.channel_lists, _ = parse_channel_lists(data, self.manager.channel_collections)
+
+        repacked = self.manager.get_radios_for("blue", "plane", "F-16C_50")
+        self.assertIsNot(repacked, packed)
+        self.assertEqual(repacked.to_dict()[1]["channels"], {1: 280.0, 2: 280.0})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -5,7 +5,7 @@ from __future__ import annotations
 import zipfile
 from pathlib import Path
 
-from mission_tools.miz_tools import DcsMission, read_miz
+from mission_tools.miz_tools import DcsMission, InMemoryMission, read_miz
 from spawn_data_injector import SpawnDataInjectorWorker, inject_spawn_data, merge_spawn_data
 from spawn_data_injector.spawn_data_injector_worker import _MAP_KEY, _RESOURCE_FILENAME
 
@@ -154,6 +154,26 @@ class TestWorkerEndToEnd:
             lua = zf.read(_RESOURCE_ARCNAME).decode("utf-8")
         assert "CUSTOM_SHILKA" in lua
 
+    def test_in_memory_mode_leaves_the_file_to_its_owner(self, tmp_path: Path) -> None:
+        # The build pipeline: the worker edits the shared mission and queues the module; the file
+        # is only written once, and then matches what file mode produces.
+        miz = _make_miz(tmp_path)
+        before = miz.read_bytes()
+        in_memory = InMemoryMission.read(miz)
+        SpawnDataInjectorWorker(input_mission=miz, output_mission=miz, in_memory=in_memory).work()
+        assert miz.read_bytes() == before
+        assert list(in_memory.additional_files) == [_RESOURCE_ARCNAME]
+
+        in_memory.write()
+        file_mode = tmp_path / "file-mode" / "m.miz"
+        file_mode.parent.mkdir()
+        file_mode.write_bytes(before)
+        SpawnDataInjectorWorker(input_mission=file_mode, output_mission=file_mode).work()
+        with zipfile.ZipFile(miz) as written, zipfile.ZipFile(file_mode) as expected:
+            assert sorted(written.namelist()) == sorted(expected.namelist())
+            for name in expected.namelist():
+                assert written.read(name) == expected.read(name), name
+
 
 # --------------------------------------------------------------------------------------------
 # SECREV-2 / VMR-056 — `int(k) for k in trigrules` raised ValueError on the first non-numeric
@@ -0,0 +1,158 @@
+"""The token-level scanner must parse exactly what the byte-by-byte state machine parses.
+
+`luadata.unserialize` has two engines. ``"state"`` is the historical state machine that steps once per
+byte; ``"scanner"`` matches whole tokens with one compiled regex and is the default. The scanner only
+earned that default by producing the same Python data — same list/dict shapes, same key order, same
+values — on the repository's real missions, which is what the differential tests below pin.
+
+Inputs outside the well-formed grammar are handed back to the state machine, so malformed text keeps
+the state machine's quirks and its error messages; the edge cases check that too.
+"""
+
+from __future__ import annotations
+
+import pickle
+import zipfile
+from pathlib import Path
+
+import luadata
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+_TEST_ROOT = _REPO_ROOT / "test"
+
+#: The Lua tables `read_miz` parses out of an archive.
+_MEMBERS = ("mission", "options", "warehouses", "l10n/DEFAULT/dictionary", "l10n/DEFAULT/mapResource")
+
+
+def _fixtures() -> list[tuple[str, str]]:
+    """`test/mission`, then every Lua member of every `.miz` under `test/`."""
+    fixtures: list[tuple[str, str]] = []
+    mission = _TEST_ROOT / "mission"
+    if mission.is_file():
+        fixtures.append(("test/mission", mission.read_text(encoding="utf-8")))
+    for miz in sorted(_TEST_ROOT.rglob("*.miz")):
+        with zipfile.ZipFile(miz) as archive:
+            names = set(archive.namelist())
+            for member in _MEMBERS:
+                if member in names:
+                    label = f"{miz.relative_to(_REPO_ROOT).as_posix()}:{member}"
+                    fixtures.append((label, archive.read(member).decode("utf-8")))
+    return fixtures
+
+
+_FIXTURES = _fixtures()
+
+
+def _both(text: str, **kwargs: object) -> tuple[object, object]:
+    return (
+        luadata.unserialize(text, engine="state", **kwargs),
+        luadata.unserialize(text, engine="scanner", **kwargs),
+    )
+
+
+@pytest.mark.parametrize(("label", "text"), _FIXTURES, ids=[label for label, _ in _FIXTURES])
+def test_fixture_output_is_identical(label: str, text: str) -> None:
+    state, scanner = _both(text, keep_as_dict=["trig", "trigrules"])
+    # `==` ignores dict order; pickling does not, so this also pins key order.
+    assert pickle.dumps(scanner) == pickle.dumps(state), label
+
+
+def test_the_scanner_is_the_default() -> None:
+    assert luadata.serializer.unserialize.DEFAULT_ENGINE == "scanner"
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "mission = { a = 1, b = { 2, 3 }, ['c'] = \"x\" }",
+        "return { 1, 2, 3 }",
+        "__c = { [3]='c', [1]='a', [2]='b' }",
+        "__c = { [1]='a', [3]='c', name = 'n' }",
+        "__c = { true, false, x = true, }",
+        "__c = { a = nil, b = 1, [2] = nil }",
+        "__c = { -1, 2.5, .5, -0.25, 1e5, 1e-3, 3.0e+2, 007 }",
+        '__c = { s = "a \\"q\\" \\\\ back", t = \'it\\\'s\', u = "line\\\nnext" }',
+        '__c = { s = "crlf\\\r\nnext", t = "é 乗 ünïcode" }',
+        "__c = { -- inline\n a = 1, --[[ multi\n line ]] b = { --[[x]] 2 }, -- tail\n}",
+        "__c = {\n\t[\"key with spaces\"] = { [1.5] = 'f', [-2] = 'n' },\n}",
+        "__c = { {}, { {} }, x = {} }",
+        "__c = { a = 1, a = 2 }",
+        "__c = { [1] = 'a', [1] = 'b' }",
+    ],
+)
+def test_well_formed_input_is_identical(text: str) -> None:
+    state, scanner = _both(text)
+    assert pickle.dumps(scanner) == pickle.dumps(state)
+
+
+def test_multival_is_identical() -> None:
+    state = luadata.unserialize("return 1, 'two', { 3 }", multival=True, engine="state")
+    assert luadata.unserialize("return 1, 'two', { 3 }", multival=True, engine="scanner") == state
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        # Quirks the state machine tolerates: the scanner defers to it.
+        "mission2 = { a = 1 }",
+        "__c = { a b = 1 }",
+        "__c = { 1E5 }",
+        "__c = { [1] = 'a' } trailing",
+    ],
+)
+def test_quirky_input_defers_to_the_state_machine(text: str) -> None:
+    try:
+        state = luadata.unserialize(text, engine="state")
+    except ValueError as exc:
+        with pytest.raises(ValueError, match="Unserialize luadata failed"):
+            luadata.unserialize(text, engine="scanner")
+        assert str(exc)
+    else:
+        assert luadata.unserialize(text, engine="scanner") == state
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["__c = { a = 1", "__c = { a = 'unterminated }", "__c = { [true] = 1 }", "__c = nil", "__c = { a = 1 }}"],
+)
+def test_malformed_input_reports_the_state_machine_error(text: str) -> None:
+    with pytest.raises(ValueError) as state_error:
+        luadata.unserialize(text, engine="state")
+    with pytest.raises(ValueError) as scanner_error:
+        luadata.unserialize(text, engine="scanner")
+    assert str(scanner_error.value) == str(state_error.value)
+
+
+def test_unknown_engine_is_refused() -> None:
+    with pytest.raises(ValueError, match="Unknown luadata engine"):
+        luadata.unserialize("__c = { 1 }", engine="lupa")
+
+
+# ---------------------------------------------------------------------------
+# only= — projection of the root table
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("engine", ["scanner", "state"])
+@pytest.mark.parametrize("only", [["coalition", "triggers"], ["triggers"], ["date", "coalition"], ["nonexistent"]])
+def test_only_keeps_exactly_the_selected_branches(engine: str, only: list[str]) -> None:
+    text = (_TEST_ROOT / "mission").read_text(encoding="utf-8")
+    full = luadata.unserialize(text, keep_as_dict=["trig", "trigrules"])
+    projected = luadata.unserialize(text, keep_as_dict=["trig", "trigrules"], only=only, engine=engine)
+    expected = {key: value for key, value in full.items() if key in only}
+    assert pickle.dumps(projected) == pickle.dumps(expected)
+
+
+def test_only_skips_braces_and_comments_inside_strings() -> None:
+    text = (
+        "mission = { skipped = { a = 'has } and { braces', b = \"--[[ not a comment\", -- a } in a comment\n"
+        " c = { -1, -2, { } }, --[[ } ]] }, kept = { x = 1 }, scalar = 'gone' }"
+    )
+    assert luadata.unserialize(text, only=["kept"]) == {"kept": {"x": 1}}
+
+
+def test_only_on_malformed_input_falls_back_and_still_projects() -> None:
+    # `a b = 1` is a quirk only the state machine reads; the projection must survive the fallback.
+    text = "mission = { keep = { a b = 1 }, drop = 2 }"
+    assert luadata.unserialize(text, only=["keep"]) == luadata.unserialize(text, only=["keep"], engine="state")
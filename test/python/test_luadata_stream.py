@@ -0,0 +1,57 @@
+"""`luadata.iter_serialize` / `luadata.dump` stream exactly what `luadata.serialize` returns.
+
+`write_miz` and `write_mission_folder` write the multi-megabyte Lua tables of a mission chunk by chunk
+instead of building the whole text first. That is only safe if the streamed text is the serialized
+text, byte for byte, whatever the settings and however the chunks fall.
+"""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+import luadata
+import pytest
+
+_MISSION = Path(__file__).resolve().parents[2] / "test" / "mission"
+
+#: The exact call `write_miz` / `write_mission_folder` make, then the library defaults.
+_SETTINGS = [
+    dict(indent="  ", indent_level=0, always_provide_keyname=True, sort=True),
+    dict(),
+    dict(indent="\t", indent_level=2),
+]
+
+_VALUES = [
+    None,
+    42,
+    'a "quoted"\nline \\ back',
+    [None, 2],
+    {1: "a", 3: "b", "and": 1, "with space": 2, 2.5: 3},
+    {"country": [{"id": 3}, {"id": 1}], "empty": {}, "nested": [[], [[1]]]},
+    (1, [2], {"x": {}}),
+]
+
+
+@pytest.mark.parametrize("settings", _SETTINGS)
+@pytest.mark.parametrize("value", _VALUES)
+def test_chunks_join_to_the_serialized_text(value: object, settings: dict) -> None:
+    expected = luadata.serialize(value, **settings)
+    assert "".join(luadata.iter_serialize(value, chunk_size=1, **settings)) == expected
+    assert "".join(luadata.iter_serialize(value, **settings)) == expected
+
+
+@pytest.mark.parametrize("settings", _SETTINGS)
+def test_dump_writes_the_serialized_mission(settings: dict) -> None:
+    mission = luadata.unserialize(_MISSION.read_text(encoding="utf-8"), keep_as_dict=["trig", "trigrules"])
+    stream = io.StringIO()
+    luadata.dump(mission, stream, **settings)
+    assert stream.getvalue() == luadata.serialize(mission, **settings)
+
+
+def test_chunks_are_bounded() -> None:
+    mission = luadata.unserialize(_MISSION.read_text(encoding="utf-8"))
+    chunks = list(luadata.iter_serialize(mission, indent="  ", chunk_size=4096))
+    assert len(chunks) > 1
+    # A chunk closes as soon as it reaches the size, so it overshoots by at most one part.
+    assert max(len(chunk) for chunk in chunks[:-1]) < 4096 + 1024
@@ -22,6 +22,7 @@ from pathlib import Path
 from typing import Any
 
 from mission_builder.mission_builder_worker import MissionBuilderWorker
+from mission_tools import FileIndex
 
 
 def init_field_defaults() -> dict[str, Any]:
@@ -43,11 +44,14 @@ def init_field_defaults() -> dict[str, Any]:
         "no_veaf_triggers": False,
         # Mission content, filled in during work()
         "dcs_mission": None,
+        "in_memory": None,
+        "mission_files": None,
         "collected_community_script_files": None,
         "collected_community_sound_files": None,
         "collected_veaf_script_files": None,
         "collected_mission_script_files": None,
         "collected_mission_data_files": None,
+        "file_index": FileIndex(),
         # Configuration resolved from mission.yaml
         "mission_yaml": {},
         "pipeline_cfg": {},
@@ -32,6 +32,7 @@ def _recording_worker(
     monkeypatch.setattr(worker, "_scan_lua_modules", lambda: None)
     monkeypatch.setattr(worker, "_write_version_py", lambda path: None)
     monkeypatch.setattr(worker, "_restore_version_py", lambda path: None)
+    monkeypatch.setattr(worker, "_compile_bundled_data", lambda extra_data: extra_data)
 
     calls: list[dict[str, object]] = []
 
@@ -138,6 +139,22 @@ def test_veaf_tools_extra_data_bundles_third_party_mods(tmp_path: Path) -> None:
     assert ("third_party_mods.json", "mission_builder/data") in bundled
 
 
+def test_every_bundled_yaml_file_ships_with_its_compiled_sidecar(tmp_path: Path) -> None:
+    from veaf_libs.bundled_data import COMPILED_SUFFIX
+
+    worker = BuildAndReleaseWorker(version=_TEST_VERSION, output_path=tmp_path)
+    worker.dist_dir = tmp_path / "dist"
+    extra_data = worker._veaf_tools_extra_data(None)
+
+    bundled = worker._compile_bundled_data(extra_data)
+
+    yaml_files = [(src.name, dest) for src, dest in extra_data if src.is_file() and src.suffix == ".yaml"]
+    assert ("dcsUnits.yaml", "veaf_libs/data") in yaml_files
+    sidecars = {(src.name, dest) for src, dest in bundled[len(extra_data) :]}
+    assert all(src.is_relative_to(tmp_path) for src, _dest in bundled[len(extra_data) :])
+    assert sidecars == {(name + COMPILED_SUFFIX, dest) for name, dest in yaml_files}
+
+
 def _lazy_packages_on_disk(worker: BuildAndReleaseWorker) -> set[str]:
     """Return the shipped packages whose `__init__.py` resolves its exports lazily.
 
@@ -0,0 +1,106 @@
+"""Tests for veaf_libs.build_manifest — what a build consumed, to skip the next one when nothing changed."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from veaf_libs.build_manifest import MANIFEST_VERSION, BuildManifest, FileHashes, manifest_path
+
+
+@pytest.fixture
+def inputs(tmp_path: Path) -> list[Path]:
+    files = [tmp_path / "mission.yaml", tmp_path / "presets.yaml"]
+    for index, path in enumerate(files):
+        path.write_text(f"content {index}\n", encoding="utf-8")
+    return files
+
+
+def _touch_same_size(path: Path, text: str) -> None:
+    """Rewrite *path* with content of the same size, keeping its mtime."""
+    stat = path.stat()
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+
+class TestFileHashes:
+    def test_an_unchanged_stat_is_trusted_without_reading(self, inputs: list[Path]) -> None:
+        first = FileHashes()
+        digest = first.digest(inputs[0])
+        _touch_same_size(inputs[0], "CONTENT 0\n")
+        assert FileHashes(first.entries).digest(inputs[0]) == digest
+
+    def test_a_changed_file_is_hashed_again(self, inputs: list[Path]) -> None:
+        first = FileHashes()
+        digest = first.digest(inputs[0])
+        inputs[0].write_text("another content\n", encoding="utf-8")
+        assert FileHashes(first.entries).digest(inputs[0]) != digest
+
+    def test_a_missing_file_has_no_digest(self, tmp_path: Path) -> None:
+        assert FileHashes().digest(tmp_path / "absent.yaml") is None
+
+    def test_a_stage_changes_with_its_settings_and_its_files(self, inputs: list[Path], tmp_path: Path) -> None:
+        hashes = FileHashes()
+        stage = hashes.stage({"profile": "MODERN"}, inputs)
+        assert hashes.stage({"profile": "MODERN"}, reversed(inputs)) == stage
+        assert hashes.stage({"profile": "WW2"}, inputs) != stage
+        assert hashes.stage({"profile": "MODERN"}, [*inputs, tmp_path / "new.yaml"]) != stage
+        inputs[1].write_text("edited\n", encoding="utf-8")
+        assert FileHashes().stage({"profile": "MODERN"}, inputs) != stage
+
+
+class TestManifest:
+    def test_it_lives_next_to_the_output(self, tmp_path: Path) -> None:
+        assert manifest_path(tmp_path / "Foo.miz") == tmp_path / "Foo.miz.manifest.json"
+
+    def test_save_and_load_round_trip(self, inputs: list[Path], tmp_path: Path) -> None:
+        hashes = FileHashes()
+        manifest = BuildManifest(
+            stages={"build": hashes.stage({}, inputs)}, outputs={"build": hashes.outputs(inputs)}, files=hashes.entries
+        )
+        manifest.save(tmp_path / "out.miz.manifest.json")
+        assert BuildManifest.load(tmp_path / "out.miz.manifest.json") == manifest
+
+    @pytest.mark.parametrize("content", ["not json", "[]", json.dumps({"version": MANIFEST_VERSION + 1})])
+    def test_an_unusable_manifest_is_no_manifest(self, tmp_path: Path, content: str) -> None:
+        path = tmp_path / "out.miz.manifest.json"
+        path.write_text(content, encoding="utf-8")
+        assert BuildManifest.load(path) is None
+
+    def test_a_manifest_that_cannot_be_written_is_not_an_error(self, tmp_path: Path) -> None:
+        BuildManifest().save(tmp_path / "missing-folder" / "out.miz.manifest.json")
+
+
+class TestFirstStaleStage:
+    def _manifest(self, inputs: list[Path], output: Path) -> tuple[BuildManifest, dict[str, str]]:
+        hashes = FileHashes()
+        stages = {"build": hashes.stage({}, inputs[:1]), "weather": hashes.stage({}, inputs[1:])}
+        output.write_bytes(b"PK")
+        return BuildManifest(stages=stages, outputs={"build": hashes.outputs([output])}, files=hashes.entries), stages
+
+    def test_nothing_changed_is_up_to_date(self, inputs: list[Path], tmp_path: Path) -> None:
+        manifest, stages = self._manifest(inputs, tmp_path / "out.miz")
+        assert manifest.first_stale_stage(stages, FileHashes(manifest.files)) is None
+
+    def test_a_late_stage_change_restarts_there(self, inputs: list[Path], tmp_path: Path) -> None:
+        manifest, stages = self._manifest(inputs, tmp_path / "out.miz")
+        hashes = FileHashes(manifest.files)
+        inputs[1].write_text("weather edited\n", encoding="utf-8")
+        current = {"build": hashes.stage({}, inputs[:1]), "weather": hashes.stage({}, inputs[1:])}
+        assert manifest.first_stale_stage(current, hashes) == "weather"
+
+    def test_an_early_stage_change_restarts_from_it(self, inputs: list[Path], tmp_path: Path) -> None:
+        manifest, stages = self._manifest(inputs, tmp_path / "out.miz")
+        assert manifest.first_stale_stage({**stages, "build": "changed"}, FileHashes(manifest.files)) == "build"
+
+    @pytest.mark.parametrize("damage", ["delete", "edit"])
+    def test_a_damaged_output_makes_its_stage_stale(self, inputs: list[Path], tmp_path: Path, damage: str) -> None:
+        output = tmp_path / "out.miz"
+        manifest, stages = self._manifest(inputs, output)
+        if damage == "delete":
+            output.unlink()
+        else:
+            output.write_bytes(b"PK edited by hand")
+        assert manifest.first_stale_stage(stages, FileHashes(manifest.files)) == "build"
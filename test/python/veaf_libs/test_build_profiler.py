@@ -0,0 +1,89 @@
+"""Tests for veaf_libs.build_profiler — the stages of ``veaf-tools build --timings``."""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import tracemalloc
+from pathlib import Path
+
+import pytest
+from veaf_libs import build_profiler
+from veaf_libs.progress import progress_context, spinner_context
+
+
+def test_stages_outside_profiling_record_nothing() -> None:
+    with build_profiler.stage("build"):
+        pass
+    assert build_profiler._active is None
+
+
+def test_stages_nest_and_bank_their_peaks() -> None:
+    with build_profiler.profiling() as profiler:
+        with build_profiler.stage("build"):
+            with build_profiler.stage("read"):
+                buffer = bytearray(8 * 1024 * 1024)
+                del buffer
+            with build_profiler.stage("write"):
+                pass
+    build, read, write = profiler.records
+    assert [(r.name, r.depth) for r in profiler.records] == [("build", 0), ("read", 1), ("write", 1)]
+    assert read.peak_bytes >= 8 * 1024 * 1024
+    # The parent's peak includes its children's, although tracemalloc's peak was reset for each.
+    assert build.peak_bytes >= read.peak_bytes > write.peak_bytes
+    assert build.wall >= read.wall + write.wall
+    assert not tracemalloc.is_tracing()
+
+
+def test_a_failed_stage_is_recorded_and_raises() -> None:
+    with build_profiler.profiling() as profiler, pytest.raises(ValueError):
+        with build_profiler.stage("presets"):
+            raise ValueError("bad preset")
+    assert profiler.records[0].failed
+
+
+def test_spinners_and_progress_bars_are_stages() -> None:
+    with build_profiler.profiling() as profiler:
+        with spinner_context("Reading mission...", silent=True):
+            with progress_context([1, 2], "Rendering...", silent=True) as items:
+                list(items)
+    assert [(r.name, r.depth) for r in profiler.records] == [("Reading mission", 0), ("Rendering", 1)]
+
+
+def test_other_threads_are_not_recorded() -> None:
+    def elsewhere() -> None:
+        with build_profiler.stage("elsewhere"):
+            pass
+
+    with build_profiler.profiling() as profiler:
+        thread = threading.Thread(target=elsewhere)
+        thread.start()
+        thread.join()
+    assert profiler.records == []
+
+
+@pytest.mark.skipif(sys.platform not in ("linux", "win32"), reason="I/O counters are read on Linux and Windows")
+def test_bytes_read_are_counted(tmp_path: Path) -> None:
+    data = tmp_path / "data.bin"
+    data.write_bytes(b"x" * 100_000)
+    with build_profiler.profiling() as profiler:
+        with build_profiler.stage("read"):
+            data.read_bytes()
+    assert profiler.records[0].read_bytes >= 100_000
+
+
+def test_the_trace_is_a_chrome_trace(tmp_path: Path) -> None:
+    with build_profiler.profiling() as profiler:
+        with build_profiler.stage("build"):
+            with build_profiler.stage("write"):
+                pass
+    path = build_profiler.trace_path(tmp_path / "Foo.miz")
+    assert path.name == "Foo.miz.trace.json"
+    profiler.write_trace(path, {"version": "6.0.0"})
+    trace = json.loads(path.read_text(encoding="utf-8"))
+    assert trace["otherData"] == {"version": "6.0.0"}
+    build, write = (event for event in trace["traceEvents"] if event["ph"] == "X")
+    assert (build["name"], write["name"]) == ("build", "write")
+    assert build["ts"] <= write["ts"] and write["ts"] + write["dur"] <= build["ts"] + build["dur"]
+    assert {"cpu_ms", "peak_bytes"} <= set(build["args"])
@@ -0,0 +1,83 @@
+"""Tests for veaf_libs.bundled_data: packaged data lookup and compiled YAML sidecars."""
+
+from __future__ import annotations
+
+import marshal
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+from veaf_libs import bundled_data
+from veaf_libs.bundled_data import COMPILED_SUFFIX, compile_bundled_yaml, load_bundled_data
+
+_YAML = "theatres:\n  Caucasus:\n    1: [Batumi, 131.0]\n"
+
+
+@pytest.fixture
+def bundle(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """A PyInstaller-style bundle root holding ``veaf_libs/data/x.yaml``; return the YAML's path."""
+    monkeypatch.setattr(sys, "_MEIPASS", str(tmp_path), raising=False)
+    source = tmp_path / "veaf_libs" / "data" / "x.yaml"
+    source.parent.mkdir(parents=True)
+    source.write_text(_YAML, encoding="utf-8")
+    return source
+
+
+def _sidecar(source: Path) -> Path:
+    return source.with_name(source.name + COMPILED_SUFFIX)
+
+
+def _no_yaml_parse(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(_text: str) -> None:
+        raise AssertionError("the YAML was parsed although a valid sidecar sits beside it")
+
+    monkeypatch.setattr(bundled_data.yaml, "safe_load", fail)
+
+
+def test_without_a_sidecar_the_yaml_is_parsed(bundle: Path) -> None:
+    assert load_bundled_data("veaf_libs", "data", "x.yaml") == yaml.safe_load(_YAML)
+
+
+def test_a_matching_sidecar_is_loaded_instead_of_the_yaml(bundle: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    compile_bundled_yaml(bundle, _sidecar(bundle))
+    _no_yaml_parse(monkeypatch)
+
+    data = load_bundled_data("veaf_libs", "data", "x.yaml")
+
+    assert data == {"theatres": {"Caucasus": {1: ["Batumi", 131.0]}}}  # int keys survive, unlike JSON
+    assert load_bundled_data("veaf_libs", "data", "x.yaml") is not data
+
+
+def test_a_sidecar_compiled_from_other_text_is_ignored(bundle: Path) -> None:
+    compile_bundled_yaml(bundle, _sidecar(bundle))
+    bundle.write_text("theatres: {}\n", encoding="utf-8")
+
+    assert load_bundled_data("veaf_libs", "data", "x.yaml") == {"theatres": {}}
+
+
+@pytest.mark.parametrize("content", [b"", b"not marshal", b"\xe9\x00"])
+def test_an_unreadable_sidecar_is_ignored(bundle: Path, content: bytes) -> None:
+    _sidecar(bundle).write_bytes(content)
+
+    assert load_bundled_data("veaf_libs", "data", "x.yaml") == yaml.safe_load(_YAML)
+
+
+def test_a_sidecar_of_another_format_is_ignored(bundle: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(bundled_data, "COMPILED_FORMAT", bundled_data.COMPILED_FORMAT + 1)
+    compile_bundled_yaml(bundle, _sidecar(bundle))
+    monkeypatch.undo()
+    monkeypatch.setattr(sys, "_MEIPASS", str(bundle.parents[2]), raising=False)
+
+    assert load_bundled_data("veaf_libs", "data", "x.yaml") == yaml.safe_load(_YAML)
+
+
+def test_every_shipped_yaml_file_compiles_to_what_it_parses_to(tmp_path: Path) -> None:
+    data_dirs = [
+        Path(bundled_data.__file__).parent / "data",
+        Path(bundled_data.__file__).parents[1] / "presets_injector" / "data",
+    ]
+    for source in sorted(path for directory in data_dirs for path in directory.glob("*.yaml")):
+        target = compile_bundled_yaml(source, tmp_path / (source.name + COMPILED_SUFFIX))
+        expected = yaml.safe_load(source.read_text(encoding="utf-8"))
+        assert marshal.loads(target.read_bytes())[-1] == expected, source.name
@@ -1,8 +1,10 @@
 """Tests for the checklist image generator and the runtime-catalogue reader."""
 
+import os
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
 from veaf_libs.checklist_images import (
     _TICK_COLOR,
@@ -225,6 +227,41 @@ class TestRendering(unittest.TestCase):
         self.assertEqual([], render_all([], {}, "en"))
 
 
+class TestRenderCache(unittest.TestCase):
+    """States are drawn once, then served from the image cache (the suite turns it off elsewhere)."""
+
+    def setUp(self):
+        home = TemporaryDirectory()
+        self.addCleanup(home.cleanup)
+        env = patch.dict(os.environ, {"VEAF_HOME": home.name, "VEAF_IMAGE_CACHE": "1"})
+        env.start()
+        self.addCleanup(env.stop)
+        self.catalog = parse_runtime_catalog(CATALOG_LUA)
+
+    def test_a_cached_state_is_not_drawn_again(self):
+        drawn = render_all([_checklist(3)], self.catalog, "en")
+        with patch("veaf_libs.checklist_images.render_state") as render:
+            cached = render_all([_checklist(3)], self.catalog, "en")
+        render.assert_not_called()
+        self.assertEqual(cached, drawn)
+
+    def test_a_changed_label_draws_again(self):
+        render_all([_checklist(2)], self.catalog, "en")
+        french = render_all([_checklist(2)], self.catalog, "fr")[0]
+        with patch.dict(os.environ, {"VEAF_IMAGE_CACHE": "0"}):
+            self.assertEqual(french, render_all([_checklist(2)], self.catalog, "fr")[0])
+
+    def test_states_drawn_in_a_pool_are_the_states_drawn_inline(self):
+        with patch.dict(os.environ, {"VEAF_IMAGE_CACHE": "0"}):
+            inline = render_all([_checklist(3)], self.catalog, "en")
+            with (
+                patch("veaf_libs.image_cache.os.cpu_count", return_value=2),
+                patch("veaf_libs.image_cache._POOL_STARTUP_SECONDS", 0.0),
+            ):
+                pooled = render_all([_checklist(3)], self.catalog, "en")
+        self.assertEqual(pooled, inline)
+
+
 class TestImageKeysEmission(unittest.TestCase):
     """The resource keys reach the Lua the engine reads."""
 
@@ -0,0 +1,67 @@
+"""Tests for the indexed DCS unit catalog (``veaf_libs.dcs_units_data``)."""
+
+from veaf_libs.dcs_units_data import parse_unit_catalog, unit_catalog
+
+_YAML = """
+units:
+- type: UH-1H
+  name: UH-1H Huey
+  kind: air
+  category: Helicopter
+  attributes: [Transport helicopters, All]
+  fuel_capacity: 631
+- type: KC-135
+  name: KC-135
+  kind: air
+  category: Plane
+  attributes: [Tankers, All]
+  fuel_capacity: 90700
+- type: M-1 Abrams
+  name: M1A2 Abrams
+  kind: vehicle
+  category: Armor
+  attributes: [Tanks, All]
+- not an entry
+"""
+
+
+def _types(units) -> list[str]:
+    return [unit.type for unit in units]
+
+
+class TestSearch:
+    def test_filters_combine_and_keep_file_order(self) -> None:
+        catalog = parse_unit_catalog(_YAML)
+
+        assert _types(catalog.search()) == ["UH-1H", "KC-135", "M-1 Abrams"]
+        assert _types(catalog.search(kind="air", attribute="All")) == ["UH-1H", "KC-135"]
+        assert _types(catalog.search(category="Armor", kind="air")) == []
+
+    def test_name_contains_matches_a_substring_of_type_and_name_run_together(self) -> None:
+        catalog = parse_unit_catalog(_YAML)
+
+        assert _types(catalog.search(name_contains="ABRAMS")) == ["M-1 Abrams"]
+        assert _types(catalog.search(name_contains="hUH")) == ["UH-1H"]  # across "UH-1H" + "UH-1H Huey"
+        assert _types(catalog.search(name_contains="-1")) == ["UH-1H", "KC-135", "M-1 Abrams"]  # under a trigram
+        assert _types(catalog.search(name_contains="zzz")) == []
+
+    def test_the_trigram_search_agrees_with_a_scan_of_the_shipped_database(self) -> None:
+        catalog = unit_catalog()
+
+        for needle in ("sa-", "f-1", "abrams", "t-72", "hawk"):
+            expected = [u.type for u in catalog.units if needle in f"{u.type}{u.name}".lower()]
+            assert _types(catalog.search(name_contains=needle)) == expected
+
+
+class TestLookups:
+    def test_get_ignores_case_and_spacing_and_skips_malformed_entries(self) -> None:
+        catalog = parse_unit_catalog(_YAML)
+
+        assert catalog.get(" uh-1h ").fuel_capacity == 631
+        assert catalog.get("M-1 Abrams").fuel_capacity is None
+        assert catalog.get("") is None
+        assert len(catalog.units) == 3
+        assert catalog.kinds() == ["air", "vehicle"]
+
+    def test_a_malformed_file_yields_an_empty_catalog(self) -> None:
+        assert parse_unit_catalog("- not: a mapping\n").units == ()
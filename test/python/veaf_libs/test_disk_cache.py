@@ -0,0 +1,45 @@
+"""Tests for veaf_libs.disk_cache — the storage the parse and image caches share."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+from veaf_libs import disk_cache
+
+_LIMIT = 1024 * 1024
+
+
+def test_a_stored_entry_is_loaded_back(tmp_path: Path) -> None:
+    assert disk_cache.load(tmp_path, ".bin", "k") is None
+    disk_cache.store(tmp_path, ".bin", "k", b"data", _LIMIT)
+    assert disk_cache.load(tmp_path, ".bin", "k") == b"data"
+
+
+def test_only_files_with_the_suffix_are_entries(tmp_path: Path) -> None:
+    disk_cache.store(tmp_path, ".bin", "k", b"data", _LIMIT)
+    (tmp_path / "other.png").write_bytes(b"x" * 100)
+    stats = disk_cache.stats(tmp_path, ".bin", _LIMIT, enabled=True)
+    assert (stats.entries, stats.size_bytes) == (1, 4)
+    assert disk_cache.clear(tmp_path, ".bin") == 1
+    assert (tmp_path / "other.png").exists()
+
+
+def test_eviction_drops_the_least_recently_used_first(tmp_path: Path) -> None:
+    for age, key in enumerate("abc"):
+        disk_cache.store(tmp_path, ".bin", key, b"x" * 100, _LIMIT)
+        os.utime(tmp_path / f"{key}.bin", (1_000_000 + age, 1_000_000 + age))
+    disk_cache.load(tmp_path, ".bin", "a")
+    assert disk_cache.evict(tmp_path, ".bin", 250) == 1
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["a.bin", "c.bin"]
+
+
+def test_a_failed_store_leaves_no_temp_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def refuse(source: object, target: object) -> None:
+        raise PermissionError("locked")
+
+    monkeypatch.setattr(disk_cache, "atomic_replace", refuse)
+    with pytest.raises(PermissionError):
+        disk_cache.store(tmp_path, ".bin", "k", b"data", _LIMIT)
+    assert list(tmp_path.iterdir()) == []
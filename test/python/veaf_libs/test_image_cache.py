@@ -0,0 +1,124 @@
+"""Tests for veaf_libs.image_cache — the on-disk cache of rendered kneeboard pages."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from presets_injector.presets_manager import Channel, PresetDefinition, RadioDefinition, RadioPresetsImageGenerator
+from veaf_libs import image_cache
+
+
+@pytest.fixture
+def home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("VEAF_HOME", str(tmp_path))
+    monkeypatch.setenv("VEAF_IMAGE_CACHE", "1")
+    return tmp_path
+
+
+def _entries(home: Path) -> list[Path]:
+    directory = home / "cache" / "images"
+    return sorted(directory.glob("*.png")) if directory.is_dir() else []
+
+
+def _preset(freq: float = 251.0) -> PresetDefinition:
+    radio = RadioDefinition(name="r", radio_type="uhf", title="UHF")
+    radio.add_channel(Channel(1, freq))
+    preset = PresetDefinition(name="p", title="t")
+    preset.add_radio(radio)
+    return preset
+
+
+def _images(injected: dict[tuple[str, str], PresetDefinition]) -> dict[str, bytes]:
+    generated = RadioPresetsImageGenerator(preset_collections={}).generate_type_images(injected)
+    return {path: buffer.getvalue() for path, buffer in generated.items()}
+
+
+class TestStore:
+    def test_a_stored_image_is_loaded_back(self, home: Path) -> None:
+        key = image_cache.image_key("page", 1)
+        assert image_cache.load(key) is None
+        image_cache.store(key, b"png")
+        assert image_cache.load(key) == b"png"
+        assert len(_entries(home)) == 1
+
+    def test_disabled_cache_stores_and_serves_nothing(self, home: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        key = image_cache.image_key("page", 1)
+        image_cache.store(key, b"png")
+        monkeypatch.setenv("VEAF_IMAGE_CACHE", "0")
+        assert image_cache.load(key) is None
+        image_cache.store(image_cache.image_key("page", 2), b"png")
+        assert len(_entries(home)) == 1
+
+    def test_every_part_is_in_the_key(self) -> None:
+        assert image_cache.image_key("page", 1) != image_cache.image_key("page", 2)
+        assert image_cache.image_key({"a": 1, "b": 2}) == image_cache.image_key({"b": 2, "a": 1})
+
+    def test_eviction_drops_the_least_recently_used_first(self, home: Path) -> None:
+        keys = [image_cache.image_key("page", value) for value in range(3)]
+        entries = []
+        for age, key in enumerate(keys):
+            image_cache.store(key, b"x" * 100)
+            entry = home / "cache" / "images" / f"{key}.png"
+            os.utime(entry, (1_000_000 + age, 1_000_000 + age))
+            entries.append(entry)
+        # A hit refreshes the oldest entry, so the next oldest is the one to go.
+        image_cache.load(keys[0])
+        assert image_cache.evict(250) == 1
+        assert [entry.exists() for entry in entries] == [True, False, True]
+
+    def test_stats_and_clear(self, home: Path) -> None:
+        image_cache.store(image_cache.image_key("page", 1), b"png")
+        stats = image_cache.stats()
+        assert stats.enabled
+        assert stats.entries == 1
+        assert stats.size_bytes == 3
+        assert image_cache.clear() == 1
+        assert image_cache.stats().entries == 0
+
+
+class TestKneeboardPages:
+    def test_an_unchanged_page_is_not_drawn_again(self, home: Path) -> None:
+        injected = {("blue", "AJS37"): _preset()}
+        drawn = _images(injected)
+        with patch.object(RadioPresetsImageGenerator, "render_page") as render:
+            assert _images(injected) == drawn
+        render.assert_not_called()
+
+    def test_a_changed_page_is_drawn_again(self, home: Path) -> None:
+        first = _images({("blue", "AJS37"): _preset(251.0)})
+        second = _images({("blue", "AJS37"): _preset(252.0)})
+        assert first != second
+        assert len(_entries(home)) == 2
+
+    def test_a_new_drawing_code_version_misses(self, home: Path) -> None:
+        injected = {("blue", "AJS37"): _preset()}
+        _images(injected)
+        with patch("presets_injector.presets_manager.KNEEBOARD_RENDER_VERSION", 2):
+            _images(injected)
+        assert len(_entries(home)) == 2
+
+
+class TestRenderPool:
+    def test_misses_are_drawn_in_spawned_processes(self, home: Path) -> None:
+        # Forking the build process (its threads, its open log files) is unsafe; the pool spawns.
+        with (
+            patch.object(image_cache, "ProcessPoolExecutor", wraps=image_cache.ProcessPoolExecutor) as pool,
+            patch.object(image_cache.os, "cpu_count", return_value=2),
+            patch.object(image_cache, "_POOL_STARTUP_SECONDS", 0.0),
+        ):
+            rendered = image_cache.render_through(bytes, {"a": [1], "b": [2], "c": [3]})
+        assert rendered == {"a": b"\x01", "b": b"\x02", "c": b"\x03"}
+        assert pool.call_args.kwargs["mp_context"].get_start_method() == "spawn"
+
+    def test_a_few_quick_misses_are_drawn_inline(self, home: Path) -> None:
+        # Spawning workers that import the rendering stack again costs more than drawing them here.
+        with (
+            patch.object(image_cache, "ProcessPoolExecutor") as pool,
+            patch.object(image_cache.os, "cpu_count", return_value=8),
+        ):
+            rendered = image_cache.render_through(bytes, {key: [value] for value, key in enumerate("abcd")})
+        assert rendered == {"a": b"\x00", "b": b"\x01", "c": b"\x02", "d": b"\x03"}
+        pool.assert_not_called()
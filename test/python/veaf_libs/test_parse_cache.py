@@ -0,0 +1,111 @@
+"""Tests for veaf_libs.parse_cache — the on-disk cache of parsed Lua tables."""
+
+from __future__ import annotations
+
+import os
+import pickle
+from pathlib import Path
+
+import luadata
+import pytest
+from mission_tools.miz_tools import read_miz
+from veaf_libs import parse_cache
+
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+_MISSION = (_REPO_ROOT / "test" / "mission").read_bytes()
+_SMALL = b"mission = { a = 1, b = { 2, 3 }, ['c'] = \"x\" }"
+
+
+@pytest.fixture
+def home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("VEAF_HOME", str(tmp_path))
+    monkeypatch.setenv("VEAF_PARSE_CACHE", "1")
+    return tmp_path
+
+
+def _entries(home: Path) -> list[Path]:
+    directory = home / "cache" / "luadata"
+    return sorted(directory.glob("*.marshal")) if directory.is_dir() else []
+
+
+class TestOptIn:
+    def test_disabled_cache_writes_nothing(self, home: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("VEAF_PARSE_CACHE", "0")
+        assert parse_cache.unserialize(_SMALL) == {"a": 1, "b": [2, 3], "c": "x"}
+        assert _entries(home) == []
+
+    def test_enabled_cache_stores_one_entry_per_member(self, home: Path) -> None:
+        parse_cache.unserialize(_SMALL)
+        parse_cache.unserialize(_SMALL)
+        assert len(_entries(home)) == 1
+
+
+class TestHitsAreTheParse:
+    def test_a_hit_returns_exactly_what_the_parser_returns(self, home: Path) -> None:
+        expected = luadata.unserialize(parse_cache.decode(_MISSION), keep_as_dict=["trig", "trigrules"])
+        miss = parse_cache.unserialize(_MISSION, keep_as_dict=["trig", "trigrules"])
+        hit = parse_cache.unserialize(_MISSION, keep_as_dict=["trig", "trigrules"])
+        # Pickle pins key order and list/dict shapes, which `==` alone would not.
+        assert pickle.dumps(miss) == pickle.dumps(expected)
+        assert pickle.dumps(hit) == pickle.dumps(expected)
+
+    def test_a_hit_is_a_fresh_copy(self, home: Path) -> None:
+        first = parse_cache.unserialize(_SMALL)
+        first["b"].append(99)
+        assert parse_cache.unserialize(_SMALL)["b"] == [2, 3]
+
+    def test_options_are_part_of_the_key(self, home: Path) -> None:
+        parse_cache.unserialize(_SMALL)
+        assert parse_cache.unserialize(_SMALL, only=["a"]) == {"a": 1}
+        assert parse_cache.unserialize(_SMALL, all_is_dict=True)["b"] == {1: 2, 2: 3}
+        assert len(_entries(home)) == 3
+
+    def test_the_parser_version_is_part_of_the_key(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        before = parse_cache.cache_key(_SMALL)
+        monkeypatch.setattr(parse_cache, "PARSER_VERSION", parse_cache.PARSER_VERSION + 1)
+        assert parse_cache.cache_key(_SMALL) != before
+
+    def test_a_corrupt_entry_is_a_miss_and_is_replaced(self, home: Path) -> None:
+        parse_cache.unserialize(_SMALL)
+        (entry,) = _entries(home)
+        entry.write_bytes(b"\x00garbage")
+        assert parse_cache.unserialize(_SMALL) == {"a": 1, "b": [2, 3], "c": "x"}
+        assert parse_cache.unserialize(_SMALL) == {"a": 1, "b": [2, 3], "c": "x"}
+
+    def test_a_parse_error_is_not_cached(self, home: Path) -> None:
+        with pytest.raises(ValueError):
+            parse_cache.unserialize(b"mission = { a = ")
+        assert _entries(home) == []
+
+    def test_read_miz_goes_through_the_cache(self, home: Path) -> None:
+        miz = _REPO_ROOT / "test" / "veaf-tools" / "presets-injector" / "test.miz"
+        cold = read_miz(miz)
+        warm = read_miz(miz)
+        assert _entries(home)
+        assert pickle.dumps(warm.mission_content) == pickle.dumps(cold.mission_content)
+        assert warm.warehouses_content == cold.warehouses_content
+
+
+class TestBounds:
+    def test_eviction_drops_the_least_recently_used_first(self, home: Path) -> None:
+        sources = [f"__c = {{ {value} }}".encode() for value in range(3)]
+        entries = []
+        for age, source in enumerate(sources):
+            parse_cache.unserialize(source)
+            entry = home / "cache" / "luadata" / f"{parse_cache.cache_key(source)}.marshal"
+            os.utime(entry, (1_000_000 + age, 1_000_000 + age))
+            entries.append(entry)
+        # A hit refreshes the oldest entry, so the next oldest is the one to go.
+        parse_cache.unserialize(sources[0])
+        limit = sum(entry.stat().st_size for entry in entries) - 1
+        assert parse_cache.evict(limit) == 1
+        assert [entry.exists() for entry in entries] == [True, False, True]
+
+    def test_stats_and_clear(self, home: Path) -> None:
+        parse_cache.unserialize(_SMALL)
+        stats = parse_cache.stats()
+        assert stats.enabled
+        assert stats.entries == 1
+        assert stats.size_bytes == _entries(home)[0].stat().st_size
+        assert parse_cache.clear() == 1
+        assert parse_cache.stats().entries == 0
@@ -0,0 +1,96 @@
+"""Tests for veaf_libs.resident_cache — what ``build --watch`` keeps in memory between builds."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from veaf_libs import parse_cache, resident_cache
+
+
+@pytest.fixture
+def cache() -> Iterator[None]:
+    resident_cache.enable()
+    yield
+    resident_cache.enable(False)
+
+
+def _touch(path: Path, text: str, mtime_ns: int) -> None:
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_a_disabled_cache_keeps_nothing() -> None:
+    calls = []
+    for _ in range(2):
+        resident_cache.memoize("key", lambda: calls.append(1))
+    assert len(calls) == 2
+
+
+def test_a_hit_is_a_fresh_copy(cache: None) -> None:
+    first = resident_cache.memoize("key", lambda: {"groups": [1, 2]})
+    first["groups"].append(3)
+    assert resident_cache.memoize("key", lambda: pytest.fail("computed again")) == {"groups": [1, 2]}
+
+
+def test_a_failure_is_not_kept(cache: None) -> None:
+    def fail() -> None:
+        raise ValueError("bad")
+
+    with pytest.raises(ValueError):
+        resident_cache.memoize("key", fail)
+    assert resident_cache.memoize("key", lambda: 1) == 1
+
+
+def test_a_file_is_read_again_once_its_size_or_mtime_changed(cache: None, tmp_path: Path) -> None:
+    path = tmp_path / "spawnables.yaml"
+    _touch(path, "a: 1\n", 1_000_000_000)
+    assert resident_cache.load_yaml(path) == {"a": 1}
+    assert resident_cache.read_bytes(path) == b"a: 1\n"
+    # Same size and mtime: the stat says unchanged, so the kept parse is served.
+    _touch(path, "a: 2\n", 1_000_000_000)
+    assert resident_cache.load_yaml(path) == {"a": 1}
+    _touch(path, "a: 2\n", 2_000_000_000)
+    assert resident_cache.load_yaml(path) == {"a": 2}
+    assert resident_cache.read_bytes(path) == b"a: 2\n"
+
+
+def test_a_missing_file_raises(cache: None, tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        resident_cache.load_yaml(tmp_path / "missing.yaml")
+
+
+def test_the_cache_is_bounded(cache: None, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(resident_cache, "MAX_BYTES", 200)
+    for key in range(3):
+        resident_cache.memoize(key, lambda: "x" * 80)
+    calls = []
+    resident_cache.memoize(0, lambda: calls.append(0) or "x" * 80)
+    resident_cache.memoize(2, lambda: calls.append(2) or "x" * 80)
+    assert calls == [0]
+
+
+def test_lua_parses_are_kept(cache: None, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("VEAF_PARSE_CACHE", "0")
+    source = b"mission = { a = 1, b = { 2, 3 } }"
+    first = parse_cache.unserialize(source)
+    first["b"].append(4)
+    monkeypatch.setattr(parse_cache, "luadata", None)  # a second parse would fail
+    assert parse_cache.unserialize(source) == {"a": 1, "b": [2, 3]}
+
+
+def test_preloaded_files_are_served_while_disabled(tmp_path: Path) -> None:
+    shared, other = tmp_path / "veaf-scripts.lua", tmp_path / "other.lua"
+    _touch(shared, "-- shared\n", 1_000_000_000)
+    _touch(other, "-- other\n", 1_000_000_000)
+    try:
+        resident_cache.preload([shared])
+        _touch(shared, "-- edited\n", 1_000_000_000)
+        assert resident_cache.read_bytes(shared) == b"-- shared\n"
+        assert resident_cache.read_bytes(other) == b"-- other\n"
+        _touch(other, "-- again\n", 1_000_000_000)
+        assert resident_cache.read_bytes(other) == b"-- again\n"  # not kept: the cache is off
+    finally:
+        resident_cache.clear()
@@ -1,5 +1,5 @@
 import pytest
-from veaf_mission_mcp.catalog import ActionCatalog, ActionNotFoundError
+from veaf_mission_mcp.catalog import ActionBatchError, ActionCatalog, ActionNotFoundError
 from veaf_mission_mcp.models import ActionSpec
 
 
@@ -62,3 +62,45 @@ def test_run_action_raises_for_unknown_name() -> None:
 
     with pytest.raises(ActionNotFoundError):
         catalog.run_action("does_not_exist", {})
+
+
+def test_run_actions_runs_the_steps_in_order_and_times_each() -> None:
+    catalog = ActionCatalog()
+    catalog.register(_spec(), handler=lambda params: params["n"], batchable=True)
+
+    result = catalog.run_actions([{"name": "add_group", "params": {"n": 1}}, {"name": "add_group", "params": {"n": 2}}])
+
+    assert [step["result"] for step in result["results"]] == [1, 2]
+    assert all(step["seconds"] >= 0 for step in result["results"])
+    assert result["written"] == []
+
+
+def test_run_actions_refuses_an_action_not_registered_batchable_before_running_any() -> None:
+    catalog = ActionCatalog()
+    ran: list[str] = []
+    catalog.register(_spec(), handler=lambda params: ran.append("add_group"), batchable=True)
+    catalog.register(_spec("build_mission"), handler=lambda params: ran.append("build_mission"))
+
+    with pytest.raises(ValueError, match="Batchable actions: add_group"):
+        catalog.run_actions([{"name": "add_group"}, {"name": "build_mission"}])
+    with pytest.raises(ActionNotFoundError):
+        catalog.run_actions([{"name": "add_group"}, {"name": "does_not_exist"}])
+    assert ran == []
+
+
+def test_run_actions_stops_at_the_failing_step_and_names_it() -> None:
+    catalog = ActionCatalog()
+    ran: list[int] = []
+
+    def handler(params: dict[str, object]) -> None:
+        if params["n"] == 1:
+            raise ValueError("boom")
+        ran.append(params["n"])
+
+    catalog.register(_spec(), handler=handler, batchable=True)
+
+    with pytest.raises(ActionBatchError, match=r"Step 1 \(add_group\) failed") as raised:
+        catalog.run_actions([{"name": "add_group", "params": {"n": n}} for n in range(3)])
+
+    assert ran == [0]
+    assert isinstance(raised.value.__cause__, ValueError)
@@ -1,5 +1,6 @@
 """End-to-end scenario driving the full v1 action catalog against a real .miz."""
 
+import asyncio
 from pathlib import Path
 
 from veaf_mission_mcp import server
@@ -21,13 +22,13 @@ def _add_group_params(miz_path: Path, name: str, y_offset: float) -> dict:
 
 
 def test_describe_then_add_group_twice_then_describe_again(sample_miz: Path) -> None:
-    before = server.run_action("describe_mission", {"miz_path": str(sample_miz)})
+    before = asyncio.run(server.run_action("describe_mission", {"miz_path": str(sample_miz)}))
     before_names = {g["name"] for g in before["groups"]}
 
-    server.run_action("add_group", _add_group_params(sample_miz, "Red Armor Section 1", 0))
-    server.run_action("add_group", _add_group_params(sample_miz, "Red Armor Section 2", 100))
+    asyncio.run(server.run_action("add_group", _add_group_params(sample_miz, "Red Armor Section 1", 0)))
+    asyncio.run(server.run_action("add_group", _add_group_params(sample_miz, "Red Armor Section 2", 100)))
 
-    after = server.run_action("describe_mission", {"miz_path": str(sample_miz)})
+    after = asyncio.run(server.run_action("describe_mission", {"miz_path": str(sample_miz)}))
     after_names = {g["name"] for g in after["groups"]}
 
     assert after_names - before_names == {"Red Armor Section 1", "Red Armor Section 2"}
@@ -0,0 +1,125 @@
+"""Tests for the missions the MCP server keeps parsed between actions."""
+
+import zipfile
+from collections.abc import Iterator
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from veaf_mission_mcp import mission_folder, mission_sessions
+from veaf_mission_mcp.edit_zone import edit_zone
+from veaf_mission_mcp.mission_folder import commit_mission, load_folder_mission, open_mission
+
+
+@pytest.fixture(autouse=True)
+def sessions() -> Iterator[None]:
+    mission_sessions.enable()
+    yield
+    mission_sessions.enable(False)
+
+
+def _counting_reads():
+    return mock.patch.object(mission_folder, "read_miz", wraps=mission_folder.read_miz)
+
+
+def _rewrite_mission_member(miz: Path, lua: bytes) -> None:
+    with zipfile.ZipFile(miz) as archive:
+        members = {name: archive.read(name) for name in archive.namelist()}
+    members["mission"] = lua
+    with zipfile.ZipFile(miz, "w") as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+
+
+class TestOpenMission:
+    def test_a_second_action_gets_the_parsed_mission_back(self, sample_miz: Path) -> None:
+        with _counting_reads() as reads:
+            first, _ = open_mission(sample_miz)
+            second, _ = open_mission(sample_miz)
+
+        assert second is first
+        assert reads.call_count == 1
+        assert mission_sessions.stats().hits == 1
+
+    def test_a_committed_mission_is_served_as_written(self, sample_miz: Path) -> None:
+        mission, content = open_mission(sample_miz)
+        content["triggers"]["zones"][0]["radius"] = 1234
+        commit_mission(mission, sample_miz)
+
+        with _counting_reads() as reads:
+            again, content = open_mission(sample_miz)
+
+        assert again is mission
+        assert content["triggers"]["zones"][0]["radius"] == 1234
+        assert reads.call_count == 0
+
+    def test_a_file_changed_on_disk_is_read_again(self, sample_miz: Path) -> None:
+        first, _ = open_mission(sample_miz)
+        _rewrite_mission_member(sample_miz, b'mission = { ["triggers"] = { ["zones"] = {} } }\n')
+
+        second, content = open_mission(sample_miz)
+
+        assert second is not first
+        assert content["triggers"]["zones"] == []
+
+    def test_a_mission_a_failed_action_left_half_edited_is_dropped(self, sample_miz: Path) -> None:
+        first, _ = open_mission(sample_miz)
+
+        with pytest.raises(ValueError):
+            # The radius is applied, then the unknown unit refuses the edit before anything is written.
+            edit_zone(sample_miz, zone_name="combatZone_Test", radius=500, link_unit="Nobody")
+
+        second, content = open_mission(sample_miz)
+        assert second is not first
+        assert content["triggers"]["zones"][0]["radius"] == 3000
+
+    def test_a_read_only_query_is_served_whole_but_a_projection_is_not_kept(self, sample_miz: Path) -> None:
+        projected, _ = open_mission(sample_miz, only=["triggers"])
+        assert projected.projection is not None
+        assert mission_sessions.stats().missions == 0
+
+        full, _ = open_mission(sample_miz)
+        assert open_mission(sample_miz, only=["triggers"])[0] is full
+
+    def test_the_least_recently_used_mission_is_dropped(self, sample_miz: Path, tmp_path: Path) -> None:
+        copies = []
+        for number in range(mission_sessions.MAX_MISSIONS + 1):
+            copy = tmp_path / f"copy{number}.miz"
+            copy.write_bytes(sample_miz.read_bytes())
+            copies.append(copy)
+        kept = [open_mission(copy)[0] for copy in copies]
+
+        assert mission_sessions.stats().missions == mission_sessions.MAX_MISSIONS
+        assert open_mission(copies[-1])[0] is kept[-1]
+        assert open_mission(copies[0])[0] is not kept[0]
+
+    def test_nothing_is_kept_while_disabled(self, sample_miz: Path) -> None:
+        mission_sessions.enable(False)
+
+        assert open_mission(sample_miz)[0] is not open_mission(sample_miz)[0]
+
+
+class TestFolders:
+    def _folder(self, tmp_path: Path) -> Path:
+        exploded = tmp_path / "src" / "mission"
+        exploded.mkdir(parents=True)
+        (exploded / "mission").write_text('mission = { ["start_time"] = 0 }\n', encoding="utf-8")
+        return tmp_path
+
+    def test_a_folder_mission_is_kept_across_loads_and_saves(self, tmp_path: Path) -> None:
+        folder = self._folder(tmp_path)
+        mission = load_folder_mission(folder)
+        mission.mission_content["start_time"] = 42
+        mission_folder.save_folder_mission(mission, folder)
+
+        assert load_folder_mission(folder) is mission
+
+    def test_a_member_appearing_in_the_folder_is_read(self, tmp_path: Path) -> None:
+        folder = self._folder(tmp_path)
+        mission = load_folder_mission(folder)
+        (folder / "src" / "mission" / "options").write_text('options = { ["difficulty"] = {} }\n', encoding="utf-8")
+
+        again = load_folder_mission(folder)
+
+        assert again is not mission
+        assert again.options_content == {"difficulty": {}}
@@ -34,6 +34,19 @@ def test_list_unit_types_filters_by_name_substring() -> None:
     assert all(needle in (u["type"] + u["name"]).lower() for u in filtered)
 
 
+def test_list_unit_types_filters_by_kind_and_attribute() -> None:
+    tankers = list_unit_types(kind="air", attribute="Tankers")["units"]
+
+    assert "KC-135" in {u["type"] for u in tankers}
+    assert all(u["kind"] == "air" and "Tankers" in u["attributes"] for u in tankers)
+
+
+def test_list_unit_types_returns_entries_a_caller_may_modify() -> None:
+    list_unit_types(name_contains="KC-135")["units"][0]["attributes"].clear()
+
+    assert list_unit_types(name_contains="KC-135")["units"][0]["attributes"]
+
+
 def test_list_shortcuts_includes_known_unit_alias() -> None:
     shortcuts = list_shortcuts()
     assert any("shilka" in entry["aliases"] for entry in shortcuts["units"])
@@ -0,0 +1,67 @@
+"""Tests for ``run_actions``: several actions read, backed up and written as one transaction."""
+
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from veaf_mission_mcp import mission_folder
+from veaf_mission_mcp.actions import register_default_actions
+from veaf_mission_mcp.catalog import ActionBatchError, ActionCatalog
+from veaf_mission_mcp.mission_folder import open_mission
+
+
+@pytest.fixture
+def catalog() -> ActionCatalog:
+    catalog = ActionCatalog()
+    register_default_actions(catalog)
+    return catalog
+
+
+def _add_zone(miz: Path, name: str = "Target") -> dict:
+    return {
+        "name": "add_trigger_zone",
+        "params": {"miz_path": str(miz), "name": name, "position": {"x": 100, "y": 200}, "radius": 500},
+    }
+
+
+def _edit_zone(miz: Path, **params: object) -> dict:
+    return {"name": "edit_zone", "params": {"miz_path": str(miz), "zone_name": "Target", **params}}
+
+
+def test_the_mission_is_read_backed_up_and_written_once(catalog: ActionCatalog, sample_miz: Path) -> None:
+    with (
+        mock.patch.object(mission_folder, "read_miz", wraps=mission_folder.read_miz) as reads,
+        mock.patch.object(mission_folder, "backup_before_write", wraps=mission_folder.backup_before_write) as backups,
+        mock.patch.object(mission_folder, "write_miz", wraps=mission_folder.write_miz) as writes,
+    ):
+        result = catalog.run_actions([_add_zone(sample_miz), _edit_zone(sample_miz, radius=2000)])
+
+    assert (reads.call_count, backups.call_count, writes.call_count) == (1, 1, 1)
+    assert result["written"] == [str(sample_miz)]
+    assert [step["name"] for step in result["results"]] == ["add_trigger_zone", "edit_zone"]
+    assert all(step["seconds"] >= 0 for step in result["results"])
+    zones = {zone["name"]: zone for zone in open_mission(sample_miz)[1]["triggers"]["zones"]}
+    assert zones["Target"]["radius"] == 2000
+
+
+def test_a_failing_step_writes_nothing(catalog: ActionCatalog, sample_miz: Path) -> None:
+    before = sample_miz.read_bytes()
+
+    with pytest.raises(ActionBatchError, match=r"Step 1 \(edit_zone\)"):
+        catalog.run_actions([_add_zone(sample_miz), _edit_zone(sample_miz, link_unit="Nobody")])
+
+    assert sample_miz.read_bytes() == before
+    assert "Target" not in {zone["name"] for zone in open_mission(sample_miz)[1]["triggers"]["zones"]}
+
+
+def test_a_composite_is_refused(catalog: ActionCatalog, sample_miz: Path) -> None:
+    with pytest.raises(ValueError, match="cannot run in a batch"):
+        catalog.run_actions([_add_zone(sample_miz), {"name": "create_qra", "params": {}}])
+
+
+def test_a_mission_opened_in_the_transaction_without_content_is_refused(sample_miz: Path) -> None:
+    with mission_folder.transaction():
+        mission, _ = open_mission(sample_miz)
+        mission.mission_content = None
+        with pytest.raises(ValueError, match="missing 'mission' content"):
+            open_mission(sample_miz)
@@ -40,23 +40,25 @@ def test_describe_action_raises_a_clear_error_for_an_unknown_name() -> None:
 
 def test_run_action_raises_a_clear_error_for_an_unknown_name() -> None:
     with pytest.raises(ActionNotFoundError):
-        server.run_action("does_not_exist", {})
+        asyncio.run(server.run_action("does_not_exist", {}))
 
 
 def test_run_action_dispatches_describe_mission_end_to_end(sample_miz: Path) -> None:
-    result = server.run_action("describe_mission", {"miz_path": str(sample_miz)})
+    result = asyncio.run(server.run_action("describe_mission", {"miz_path": str(sample_miz)}))
 
     assert {g["name"] for g in result["groups"]} == {"Blue Recon Flight", "Red Armor Section"}
     assert result["zones"][0]["name"] == "combatZone_Test"
 
 
-def test_the_server_registers_the_four_discovery_tools() -> None:
+def test_the_server_registers_the_discovery_tools_the_batch_runner_and_its_stats() -> None:
     # Exact equality on purpose, not a subset: the module docstring commits to a **fixed** discovery
-    # surface rather than one MCP tool per mission-editing action, so a fifth tool appearing is a
+    # surface rather than one MCP tool per mission-editing action, so a new tool appearing is a
     # design change this test exists to surface. Relaxing this to a subset would let it through.
+    # `run_actions` and `server_stats` are such changes, made deliberately: they run and report on
+    # catalog actions, they add none.
     names = {tool.name for tool in asyncio.run(server.mcp.list_tools())}
 
-    assert names == {"capabilities", "list_catalog", "describe_action", "run_action"}
+    assert names == {"capabilities", "list_catalog", "describe_action", "run_action", "run_actions", "server_stats"}
 
 
 def test_calling_a_tool_through_the_server_returns_its_value() -> None:
@@ -64,3 +66,14 @@ def test_calling_a_tool_through_the_server_returns_its_value() -> None:
 
     assert not result.is_error
     assert result.structured_content == {"name": "veaf-mission-mcp", "version": server.VERSION}
+
+
+def test_server_stats_counts_the_actions_run(sample_miz: Path) -> None:
+    asyncio.run(server.run_action("describe_mission", {"miz_path": str(sample_miz)}))
+
+    stats = server.server_stats()
+
+    assert stats["workers"] == server.POOL.workers
+    assert stats["queued"] == stats["running"] == 0
+    assert stats["handlers"]["describe_mission"]["calls"] >= 1
+    assert set(stats["mission_cache"]) == {"missions", "hits", "misses"}
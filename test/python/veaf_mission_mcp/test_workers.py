@@ -0,0 +1,170 @@
+"""Tests for the worker pool and the per-mission locks of the MCP server."""
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from veaf_mission_mcp.catalog import ActionCatalog
+from veaf_mission_mcp.models import ActionSpec
+from veaf_mission_mcp.workers import MissionLocks, ReadWriteLock, WorkerPool, mission_key
+
+
+def _spec(name: str) -> ActionSpec:
+    return ActionSpec(name=name, description=name, parameters_schema={"type": "object", "properties": {}})
+
+
+def _run_together(*calls) -> list[float]:
+    """Run *calls* on threads at once; return when each one finished, relative to the start."""
+    start = time.perf_counter()
+    finished: list[float] = [0.0] * len(calls)
+
+    def run(position: int) -> None:
+        calls[position]()
+        finished[position] = time.perf_counter() - start
+
+    threads = [threading.Thread(target=run, args=(position,)) for position in range(len(calls))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    return finished
+
+
+class TestReadWriteLock:
+    def test_readers_hold_it_together(self) -> None:
+        lock = ReadWriteLock()
+        both_in = threading.Barrier(2, timeout=2)
+
+        def read() -> None:
+            with lock.read():
+                both_in.wait()
+
+        _run_together(read, read)  # a reader excluding the other would break the barrier
+
+        assert not both_in.broken
+
+    def test_a_writer_waits_for_the_reader_and_runs_alone(self) -> None:
+        lock = ReadWriteLock()
+        events: list[str] = []
+        reading = threading.Event()
+
+        def read() -> None:
+            with lock.read():
+                reading.set()
+                time.sleep(0.1)
+                events.append("read done")
+
+        def write() -> None:
+            reading.wait(timeout=2)
+            with lock.write():
+                events.append("write")
+
+        _run_together(read, write)
+
+        assert events == ["read done", "write"]
+
+
+class TestMissionLocks:
+    def test_a_mission_yaml_is_locked_as_its_folder(self, tmp_path: Path) -> None:
+        assert mission_key(tmp_path / "mission.yaml") == mission_key(tmp_path) == tmp_path.resolve()
+
+    def test_edits_to_different_missions_do_not_wait_for_each_other(self, tmp_path: Path) -> None:
+        locks = MissionLocks()
+        both_in = threading.Barrier(2, timeout=2)
+
+        def edit(target: Path):
+            def run() -> None:
+                with locks.hold([target], write=True):
+                    both_in.wait()
+
+            return run
+
+        _run_together(edit(tmp_path / "a.miz"), edit(tmp_path / "b.miz"))
+
+        assert not both_in.broken
+
+
+class TestCatalogLocking:
+    def test_edits_of_the_same_mission_run_one_at_a_time(self, tmp_path: Path) -> None:
+        catalog = ActionCatalog()
+        inside = 0
+        overlap = False
+
+        def edit(params: dict) -> None:
+            nonlocal inside, overlap
+            inside += 1
+            overlap |= inside > 1
+            time.sleep(0.05)
+            inside -= 1
+
+        catalog.register(_spec("edit_zone"), handler=edit)
+        params = {"miz_path": str(tmp_path / "m.miz")}
+
+        _run_together(*(lambda: catalog.run_action("edit_zone", params) for _ in range(3)))
+
+        assert not overlap
+
+    def test_reads_of_the_same_mission_run_together(self, tmp_path: Path) -> None:
+        catalog = ActionCatalog()
+        both_in = threading.Barrier(2, timeout=2)
+        catalog.register(_spec("describe_mission"), handler=lambda params: both_in.wait(), read_only=True)
+        params = {"miz_path": str(tmp_path / "m.miz")}
+
+        _run_together(*(lambda: catalog.run_action("describe_mission", params) for _ in range(2)))
+
+        assert not both_in.broken
+
+
+class TestWorkerPool:
+    def test_a_slow_call_does_not_hold_up_another(self) -> None:
+        pool = WorkerPool(workers=2)
+        release = threading.Event()
+
+        async def scenario() -> list[str]:
+            finished: list[str] = []
+
+            async def call(label: str, work) -> None:
+                await pool.run(label, work)
+                finished.append(label)
+
+            slow = asyncio.ensure_future(call("slow", lambda: release.wait(timeout=2)))
+            await call("fast", lambda: None)
+            release.set()
+            await slow
+            return finished
+
+        assert asyncio.run(scenario()) == ["fast", "slow"]
+
+    def test_stats_report_queue_depth_and_latency(self) -> None:
+        pool = WorkerPool(workers=1)
+        release = threading.Event()
+
+        async def scenario() -> dict:
+            first = asyncio.ensure_future(pool.run("slow", lambda: release.wait(timeout=2)))
+            second = asyncio.ensure_future(pool.run("slow", lambda: None))
+            await asyncio.sleep(0.05)
+            during = pool.stats()
+            release.set()
+            await asyncio.gather(first, second)
+            return during
+
+        during = asyncio.run(scenario())
+
+        assert (during["running"], during["queued"]) == (1, 1)
+        after = pool.stats()
+        assert (after["running"], after["queued"]) == (0, 0)
+        assert after["handlers"]["slow"]["calls"] == 2
+        assert after["handlers"]["slow"]["max_seconds"] > 0
+
+    def test_a_failing_call_raises_and_is_counted(self) -> None:
+        pool = WorkerPool(workers=1)
+
+        def fail() -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            asyncio.run(pool.run("fail", fail))
+
+        assert pool.stats()["handlers"]["fail"]["errors"] == 1
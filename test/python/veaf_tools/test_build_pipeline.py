@@ -1,7 +1,8 @@
-"""Tests for build.py pipeline legacy-file warnings (AIRCRAFT-INJECT) and output resolution."""
+"""Tests for build.py pipeline legacy-file warnings (AIRCRAFT-INJECT), output resolution and variant runs."""
 
 from __future__ import annotations
 
+import json
 import tempfile
 import unittest
 from pathlib import Path
@@ -243,5 +244,274 @@ class TestBuildPlan(unittest.TestCase):
         self.assertEqual(plan, [("CUSTOM", Path("/m/Foothold_20260618_CUSTOM.miz"), "Foothold_CUSTOM")])
 
 
+class TestParallelVariants(unittest.TestCase):
+    """`build --jobs N` builds the variants in processes and reports them in plan order."""
+
+    def _options(self, folder: Path):
+        from veaf_tools.commands.build import _BuildOptions
+
+        return _BuildOptions(
+            mission_folder=folder,
+            dynamic_mode=None,
+            dev_mode=None,
+            scripts_path=None,
+            log_modules=None,
+            migrate_from_v5=True,
+            no_veaf_triggers=False,
+        )
+
+    def test_a_failed_variant_comes_back_with_its_output(self) -> None:
+        from veaf_tools.app import console, logger
+        from veaf_tools.commands import build as build_module
+
+        def failing_variant(*_args) -> None:
+            logger.tech("building the COLD_WAR variant")
+            raise FileNotFoundError("no scripts")
+
+        console.record = True
+        try:
+            with patch.object(build_module, "_run_variant", failing_variant):
+                run = build_module._run_variant_captured(self._options(Path("/m")), "COLD_WAR", Path("/m/x.miz"), "x")
+        finally:
+            console.record = False
+
+        self.assertIsInstance(run.error, FileNotFoundError)
+        self.assertIn("building the COLD_WAR variant", run.log)
+        self.assertEqual(run.profile, "COLD_WAR")
+
+    def test_runs_come_back_in_plan_order(self) -> None:
+        from veaf_tools.commands.build import _run_variants_in_parallel
+
+        with tempfile.TemporaryDirectory() as td:
+            missing = Path(td) / "missing"
+            plan = [(name, Path(td) / f"{name}.miz", name) for name in ("MODERN", "COLD_WAR", "WW2")]
+            runs = _run_variants_in_parallel(self._options(missing), plan, jobs=2)
+
+        self.assertEqual([run.profile for run in runs], ["MODERN", "COLD_WAR", "WW2"])
+        # The folder does not exist: every variant fails in its own process, and says so.
+        self.assertTrue(all(run.error is not None for run in runs))
+        self.assertTrue(all(run.log for run in runs))
+
+
+class TestStageHashes(unittest.TestCase):
+    """The build manifest's stages read the right inputs (see ``veaf_libs.build_manifest``)."""
+
+    def _stages(self, folder: Path) -> dict[str, str]:
+        from types import SimpleNamespace
+
+        from veaf_libs.build_manifest import FileHashes
+        from veaf_tools.commands.build import _BuildOptions, _stage_hashes
+
+        options = _BuildOptions(
+            mission_folder=folder,
+            dynamic_mode=None,
+            dev_mode=None,
+            scripts_path=None,
+            log_modules=None,
+            migrate_from_v5=True,
+            no_veaf_triggers=False,
+        )
+        worker = SimpleNamespace(pipeline_cfg={}, scripts_path=None, dynamic_mode=False, dev_mode=False)
+        return _stage_hashes(worker, options, None, folder / "out.miz", FileHashes())
+
+    def _folder(self, td: str) -> Path:
+        folder = Path(td)
+        (folder / "src" / "scripts").mkdir(parents=True)
+        (folder / "mission.yaml").write_text("mission: {}\n", encoding="utf-8")
+        (folder / "src" / "presets.yaml").write_text("presets: {}\n", encoding="utf-8")
+        (folder / "src" / "versions.yaml").write_text("versions: []\n", encoding="utf-8")
+        return folder
+
+    def test_a_weather_change_only_touches_the_weather_stage(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            folder = self._folder(td)
+            before = self._stages(folder)
+            (folder / "src" / "versions.yaml").write_text("versions: [{name: dawn}]\n", encoding="utf-8")
+            after = self._stages(folder)
+        self.assertEqual(after["build"], before["build"])
+        self.assertNotEqual(after["weather"], before["weather"])
+
+    def test_a_step_file_change_touches_the_build_stage(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            folder = self._folder(td)
+            before = self._stages(folder)
+            (folder / "src" / "presets.yaml").write_text("presets: {a: 1}\n", encoding="utf-8")
+            self.assertNotEqual(self._stages(folder)["build"], before["build"])
+
+    def test_the_scripts_the_builder_generates_are_not_inputs(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            folder = self._folder(td)
+            before = self._stages(folder)
+            for name in ("veaf-config.lua", "veafDynamicConfig.lua"):
+                (folder / "src" / "scripts" / name).write_text("-- GENERATED\n", encoding="utf-8")
+            self.assertEqual(self._stages(folder), before)
+            (folder / "src" / "scripts" / "my-script.lua").write_text("-- mine\n", encoding="utf-8")
+            self.assertNotEqual(self._stages(folder)["build"], before["build"])
+
+    def test_persisted_settings_do_not_make_the_next_build_stale(self) -> None:
+        # The build persists --scripts-path to mission.yaml after hashing it: the manifest must hold
+        # the file as written, or a second identical build starts over.
+        from contextlib import nullcontext
+        from types import SimpleNamespace
+
+        from veaf_tools.commands.build import _build_variant, _BuildOptions
+
+        with tempfile.TemporaryDirectory() as td:
+            folder = self._folder(td)
+            output = folder / "out.miz"
+            options = _BuildOptions(
+                mission_folder=folder,
+                dynamic_mode=None,
+                dev_mode=None,
+                scripts_path=str(folder / "scripts"),
+                log_modules=None,
+                migrate_from_v5=True,
+                no_veaf_triggers=False,
+            )
+            worker = SimpleNamespace(
+                pipeline_cfg={}, scripts_path=folder / "scripts", dynamic_mode=False, dev_mode=False, work=lambda: None
+            )
+
+            def inject(*args: object) -> SimpleNamespace:
+                output.write_bytes(b"miz")
+                return SimpleNamespace(mission=None)
+
+            with (
+                patch("veaf_tools.commands.build.MissionBuilderWorker", return_value=worker),
+                patch("veaf_tools.commands.build._run_injection_steps", side_effect=inject) as injections,
+            ):
+                _build_variant(options, None, output, "out", nullcontext())
+                _build_variant(options, None, output, "out", nullcontext())
+        self.assertEqual(injections.call_count, 1)
+
+
+class TestWatch(unittest.TestCase):
+    """``build --watch`` looks at the right files and rebuilds once per settled change."""
+
+    def test_the_snapshot_covers_src_and_the_manifest_inputs_but_not_the_outputs(self) -> None:
+        from veaf_libs.build_manifest import BuildManifest, manifest_path
+        from veaf_tools.commands.build import _build_inputs, _watch_snapshot
+
+        with tempfile.TemporaryDirectory() as td:
+            folder = Path(td)
+            (folder / "src" / "scripts").mkdir(parents=True)
+            (folder / "mission.yaml").write_text("mission: {}\n", encoding="utf-8")
+            (folder / "src" / "scripts" / "veaf-config.lua").write_text("-- GENERATED\n", encoding="utf-8")
+            published = folder / "published.lua"
+            published.write_text("-- published\n", encoding="utf-8")
+            output = folder / "out.miz"
+            output.write_bytes(b"miz")
+            BuildManifest(
+                stages={"build": "x"},
+                outputs={"build": {str(output): "y"}},
+                files={str(published): [0, 0, "z"], str(output): [0, 0, "y"]},
+            ).save(manifest_path(output))
+
+            inputs = _build_inputs([(None, output, "out")])
+            self.assertEqual(inputs, {published})
+            before = _watch_snapshot(folder, inputs)
+            self.assertEqual(set(before), {str(folder / "mission.yaml"), str(published)})
+            (folder / "src" / "new.yaml").write_text("a: 1\n", encoding="utf-8")
+            self.assertIn(str(folder / "src" / "new.yaml"), _watch_snapshot(folder, inputs))
+
+    def test_a_burst_of_changes_is_waited_out(self) -> None:
+        from veaf_tools.commands.build import _wait_for_change
+
+        looks = iter([{"a": 1}, {"a": 1}, {"a": 2}, {"a": 3}, {"a": 3}])
+        with patch("veaf_tools.commands.build.time.sleep") as sleep:
+            settled = _wait_for_change(lambda: next(looks), {"a": 1}, 0.5)
+        self.assertEqual(settled, {"a": 3})
+        self.assertEqual(sleep.call_count, 5)
+
+    def test_persisting_the_settings_does_not_start_another_build(self) -> None:
+        # A build given --scripts-path persists it to mission.yaml, which the watch looks at: one edit
+        # is one rebuild, not a build that starts the next one forever.
+        from veaf_tools.commands.build import _BuildOptions, _watch
+        from veaf_tools.helpers import _update_build_config_in_yaml
+
+        with tempfile.TemporaryDirectory() as td:
+            folder = Path(td)
+            (folder / "src").mkdir()
+            (folder / "mission.yaml").write_text("mission: {}\n", encoding="utf-8")
+            options = _BuildOptions(
+                mission_folder=folder,
+                dynamic_mode=None,
+                dev_mode=None,
+                scripts_path="/scripts",
+                log_modules=None,
+                migrate_from_v5=True,
+                no_veaf_triggers=False,
+            )
+            builds = []
+
+            def build(options: _BuildOptions, plan: list) -> None:
+                builds.append(len(builds))
+                _update_build_config_in_yaml(folder / "mission.yaml", dev_mode=False, scripts_path=Path("/scripts"))
+
+            polls = iter(range(20))
+
+            def poll(seconds: float) -> None:
+                if next(polls, None) is None:
+                    raise KeyboardInterrupt
+                edited = folder / "src" / "edited.yaml"
+                if not edited.exists():
+                    edited.write_text("a: 1\n", encoding="utf-8")
+
+            with (
+                patch("veaf_tools.commands.build._build_once", side_effect=build),
+                patch("veaf_tools.commands.build.time.sleep", side_effect=poll),
+            ):
+                _watch(options, [(None, folder / "out.miz", "out")])
+        self.assertEqual(len(builds), 2)
+
+
+class TestBuildAll(unittest.TestCase):
+    """``build-all`` finds the missions under a root and sums up how their builds went."""
+
+    def test_mission_folders_are_found_but_not_searched_further(self) -> None:
+        from veaf_tools.commands.build import find_mission_folders
+
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            for folder in ("b", "a", "a/nested", "a/src/c", ".git/d", "theatres/e", "theatres/published/f"):
+                (root / folder).mkdir(parents=True, exist_ok=True)
+                (root / folder / "mission.yaml").write_text("mission: {}\n", encoding="utf-8")
+            self.assertEqual(find_mission_folders(root), [root / "a", root / "b", root / "theatres" / "e"])
+            (root / "mission.yaml").write_text("mission: {}\n", encoding="utf-8")
+            self.assertEqual(find_mission_folders(root), [root])
+
+    def test_the_summary_has_each_mission_outcome(self) -> None:
+        from veaf_tools.commands.build import _MissionRun, _write_summary
+
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            runs = [
+                _MissionRun(folder=root / "a", outputs=[root / "a" / "a.miz"], seconds=2.5),
+                _MissionRun(folder=root / "b", seconds=0.25, error="mission.yaml: bad"),
+            ]
+            _write_summary(root / "summary.json", root, 2, runs, 2.75)
+            summary = json.loads((root / "summary.json").read_text(encoding="utf-8"))
+        self.assertEqual(summary["jobs"], 2)
+        self.assertEqual(
+            [(m["folder"], m["outcome"], m["seconds"], m["error"]) for m in summary["missions"]],
+            [(str(root / "a"), "built", 2.5, None), (str(root / "b"), "failed", 0.25, "mission.yaml: bad")],
+        )
+        self.assertEqual(summary["missions"][0]["outputs"], [str(root / "a" / "a.miz")])
+
+    def test_only_the_scripts_a_build_reads_are_preloaded(self) -> None:
+        from veaf_tools.commands.build import _load_shared_data
+
+        with tempfile.TemporaryDirectory() as td:
+            scripts = Path(td)
+            for name in ("src/veaf.lua", "build/veaf-scripts.lua", ".git/objects/pack.bin", "node_modules/a.js"):
+                (scripts / name).parent.mkdir(parents=True, exist_ok=True)
+                (scripts / name).write_text("--\n", encoding="utf-8")
+            with patch("veaf_tools.commands.build.resident_cache.preload") as preload:
+                _load_shared_data(scripts)
+        self.assertEqual(
+            sorted(preload.call_args.args[0]), [scripts / "build" / "veaf-scripts.lua", scripts / "src" / "veaf.lua"]
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -201,7 +201,7 @@ class TestNoStutter(unittest.TestCase):
 
 class TestRootCommands(unittest.TestCase):
     def test_the_tool_about_itself_stays_at_the_root(self) -> None:
-        for command in ("about", "ask", "user-config", "mcp"):
+        for command in ("about", "ask", "user-config", "cache", "mcp"):
             self.assertIsNone(group_of(command), f"{command} is about the tool, not about a mission")
 
     def test_ask_is_no_longer_filed_as_configuration(self) -> None:
@@ -64,6 +64,16 @@ class TestUpdateBuildConfigInYaml(unittest.TestCase):
             # Only one build: section
             self.assertEqual(content.count("build:"), 1)
 
+    def test_unchanged_settings_leave_the_file_alone(self) -> None:
+        # `build --watch` watches mission.yaml: rewriting it with the same settings started another build.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yaml_file = Path(tmpdir) / "mission.yaml"
+            yaml_file.write_text("mission:\n  name: test\n", encoding="utf-8")
+            self.assertTrue(_update_build_config_in_yaml(yaml_file, dev_mode=True, scripts_path=Path("/s")))
+            os.utime(yaml_file, ns=(0, 0))
+            self.assertFalse(_update_build_config_in_yaml(yaml_file, dev_mode=True, scripts_path=Path("/s")))
+            self.assertEqual(yaml_file.stat().st_mtime_ns, 0)
+
 
 class TestShouldAutoPause(unittest.TestCase):
     """`VEAF_UPDATER_NO_PAUSE` must force no-pause so a programmatic caller never hangs."""
@@ -4,8 +4,10 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from mission_tools.miz_tools import DcsMission
-from warehouses_injector import apply_warehouses
+from aircrafts_injector.aircrafts_injector_worker import AircraftGroupsInjectorWorker
+from mission_tools.miz_tools import DcsMission, InMemoryMission
+from presets_injector import PresetsInjectorWorker
+from warehouses_injector import WarehousesInjectorWorker, apply_warehouses
 
 
 def _template_group(group_id: int, name: str, unit_type: str, dyn: bool = True) -> dict:
@@ -239,3 +241,39 @@ class TestHotStart:
         m.warehouses_content["airports"][99]["allowHotStart"] = False
         apply_warehouses(m, {"blue": {"defaults": {"aircrafts": {}}}})
         assert m.warehouses_content["airports"][99]["allowHotStart"] is False
+
+
+class TestAfterAircraftInjection:
+    """The build runs presets, then the aircraft injection, then the warehouses, on one mission.
+
+    The presets step builds the mission's group index; the dynamic-slot templates the aircraft
+    injection adds afterwards must still be found when the warehouses link them.
+    """
+
+    def test_a_template_injected_after_the_presets_is_linked(self, tmp_path: Path) -> None:
+        m = _mission(groups=[])
+        in_memory = InMemoryMission(m)
+        dummy = tmp_path / "mission.miz"
+        PresetsInjectorWorker(
+            presets_file=None, input_mission=dummy, output_mission=dummy, generate_kneeboards=False, in_memory=in_memory
+        ).work(silent=True)
+
+        aircraft = AircraftGroupsInjectorWorker(
+            input_yaml=dummy, target_mission=dummy, output_mission=dummy, in_memory=in_memory
+        )
+        aircraft.read_mission(silent=True)
+        aircraft.yaml_data = {
+            "helicopters": {
+                "coalitions": {"blue": {"USA": {"DST - UH-1H": _template_group(2114, "DST - UH-1H", "UH-1H")}}}
+            }
+        }
+        assert aircraft.inject_groups(mode="add", silent=True).groups_injected == 1
+
+        config = tmp_path / "warehouses.yaml"
+        config.write_text("blue:\n  defaults: {}\n  airports:\n    23: {}\n", encoding="utf-8")
+        result = WarehousesInjectorWorker(
+            config_file=config, input_mission=dummy, output_mission=dummy, in_memory=in_memory
+        ).work()
+
+        assert result.templates_linked == 1
+        assert m.warehouses_content["airports"][23]["aircrafts"]["helicopters"]["UH-1H"]["linkDynTempl"] == 2114
@@ -5,6 +5,7 @@ from __future__ import annotations
 import tempfile
 import unittest
 import unittest.mock
+import zipfile
 from datetime import date as dt_date
 from datetime import timedelta
 from pathlib import Path
@@ -12,7 +13,7 @@ from typing import Any
 
 import typer
 import yaml
-from mission_tools.miz_tools import DcsMission
+from mission_tools.miz_tools import DcsMission, read_miz
 from weather_injector.models import MissionConfig, Position, VersionConfig
 from weather_injector.weather_injector_worker import WeatherInjectorWorker
 
@@ -885,3 +886,77 @@ class TestIcaoOnlyVariantGetsItsWeather(unittest.TestCase):
                             with unittest.mock.patch.object(Path, "exists", return_value=True):
                                 worker._create_mission_version(VersionConfig(name="noon", time="12:00"))
             self.assertEqual(injected, [])
+
+
+# ---------------------------------------------------------------------------
+# Parse once, fan out: every variant is a branch of one parsed base mission
+# ---------------------------------------------------------------------------
+
+_BASE_MISSION_LUA = (
+    b'mission = { ["start_time"] = 0, ["date"] = { ["Day"] = 1, ["Month"] = 1, ["Year"] = 2024 }, '
+    b'["weather"] = { ["atmosphere_type"] = 0 }, ["descriptionText"] = "DictKey_descriptionText_1" }\n'
+)
+_BASE_OPTIONS_LUA = b'options={["a"]=1,   ["b"]={2,3}}\n'
+
+
+class TestParseOnce(unittest.TestCase):
+    def _worker(self, versions: list[dict[str, Any]], **kwargs: Any) -> WeatherInjectorWorker:
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        tmp_path = Path(tmp_dir.name)
+        config_file = tmp_path / "versions.yaml"
+        config_file.write_text(yaml.dump({"versions": versions}), encoding="utf-8")
+        mission_file = tmp_path / "base.miz"
+        with zipfile.ZipFile(mission_file, "w") as zf:
+            zf.writestr("mission", _BASE_MISSION_LUA)
+            zf.writestr("options", _BASE_OPTIONS_LUA)
+            zf.writestr("theatre", b"Caucasus")
+            zf.writestr("l10n/DEFAULT/dictionary", b'dictionary = { ["DictKey_descriptionText_1"] = "Brief" }\n')
+            zf.writestr("l10n/DEFAULT/script.lua", b"-- script")
+        return WeatherInjectorWorker(
+            config_file=config_file, mission_file=mission_file, output_dir=tmp_path / "out", **kwargs
+        )
+
+    def test_the_base_mission_is_read_once_for_all_variants(self) -> None:
+        worker = self._worker([{"name": "dawn", "time": "06:00"}, {"name": "noon", "time": "12:00"}])
+        with unittest.mock.patch("weather_injector.weather_injector_worker.read_miz", wraps=read_miz) as reader:
+            created = worker.work()
+        self.assertEqual(reader.call_count, 1)
+        self.assertEqual([read_miz(path).mission_content["start_time"] for path in created], [6 * 3600, 12 * 3600])
+
+    def test_a_variant_never_reaches_the_base_or_its_siblings(self) -> None:
+        worker = self._worker([])
+        worker.config = MissionConfig(versions=[])
+        worker._prepare_mission_version(VersionConfig(name="a", date="2024-06-15", weather={"temperature": 30}))
+        first = worker.mission_data
+        worker._prepare_mission_version(VersionConfig(name="b", time="08:00"))
+        assert first is not None and first.mission_content is not None
+        assert worker.base_mission is not None and worker.base_mission.mission_content is not None
+        self.assertEqual(first.mission_content["date"]["Day"], 15)
+        self.assertEqual(worker.base_mission.mission_content["date"]["Day"], 1)
+        self.assertEqual(worker.base_mission.mission_content["weather"], {"atmosphere_type": 0})
+        self.assertEqual(first.mission_content["start_time"], 0)
+
+    def test_a_parsed_base_mission_is_not_read_again(self) -> None:
+        worker = self._worker([{"name": "noon", "time": "12:00"}])
+        worker.base_mission = read_miz(worker.mission_file)
+        with unittest.mock.patch("weather_injector.weather_injector_worker.read_miz") as reader:
+            created = worker.work()
+        reader.assert_not_called()
+        self.assertEqual(len(created), 1)
+
+    def test_untouched_members_are_copied_verbatim(self) -> None:
+        worker = self._worker([{"name": "noon", "time": "12:00"}])
+        (created,) = worker.work()
+        with zipfile.ZipFile(created) as zf:
+            self.assertEqual(zf.read("options"), _BASE_OPTIONS_LUA)
+            self.assertEqual(zf.read("l10n/DEFAULT/script.lua"), b"-- script")
+
+    def test_jobs_write_the_same_variants_in_order(self) -> None:
+        versions = [{"name": "dawn", "time": "06:00"}, {"name": "noon", "time": "12:00"}, {"name": "late"}]
+        serial = self._worker(versions).work()
+        parallel = self._worker(versions, jobs=2).work()
+        self.assertEqual([path.name for path in parallel], [path.name for path in serial])
+        for one, other in zip(serial, parallel, strict=True):
+            with zipfile.ZipFile(one) as a, zipfile.ZipFile(other) as b:
+                self.assertEqual({n: a.read(n) for n in a.namelist()}, {n: b.read(n) for n in b.namelist()})
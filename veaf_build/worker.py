@@ -16,6 +16,7 @@ from typing import Any
 
 import typer
 from rich.table import Table
+from veaf_libs.bundled_data import COMPILED_SUFFIX, compile_bundled_yaml  # type: ignore[import-not-found]
 from veaf_libs.logger import console, logger  # type: ignore[import-not-found]
 from veaf_libs.progress import spinner_context  # type: ignore[import-not-found]
 
@@ -558,13 +559,31 @@ class BuildAndReleaseWorker:
         extra.extend((path, dest) for path, dest in bundled_data if path.exists())
         return extra
 
+    def _compile_bundled_data(self, extra_data: list[tuple[Path, str]]) -> list[tuple[Path, str]]:
+        """Add the compiled sidecar of every bundled YAML file to *extra_data*.
+
+        The executable parses its bundled YAML at startup of the commands that read it, and PyYAML
+        takes 1.6 s over these files; ``veaf_libs.bundled_data.load_bundled_data`` loads a sidecar in
+        milliseconds instead. Each one ships to the directory of its YAML, which still ships too: the
+        loader checks the sidecar against the YAML's hash and falls back to it. Directories (the
+        profiles, the checklists) are left as they are.
+        """
+        compiled_dir = self.dist_dir / "build" / "compiled-data"
+        compiled: list[tuple[Path, str]] = []
+        for source, dest in extra_data:
+            if source.is_file() and source.suffix == ".yaml":
+                target = compiled_dir / dest / f"{source.name}{COMPILED_SUFFIX}"
+                compiled.append((compile_bundled_yaml(source, target), dest))
+        return [*extra_data, *compiled]
+
     def _build_veaf_tools_exe(self, modules_json_path: Path | None, shortcuts_json_path: Path | None = None) -> None:
         """Build the main veaf-tools executable with its bundled data."""
+        extra_data = self._compile_bundled_data(self._veaf_tools_extra_data(modules_json_path, shortcuts_json_path))
         with spinner_context("Building veaf-tools executable..."):
             self._build_pyinstaller_executable(
                 "veaf-tools",
                 self.src_dir / "python" / "veaf-tools" / "veaf-tools.py",
-                extra_data=self._veaf_tools_extra_data(modules_json_path, shortcuts_json_path),
+                extra_data=extra_data,
                 collect_submodules=list(_LAZY_PACKAGES),
             )
 